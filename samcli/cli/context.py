@@ -7,10 +7,10 @@ import uuid
 from typing import List, Optional, cast
 
 import click
-from rich.console import Console
 
 from samcli.cli.formatters import RootCommandHelpTextFormatter
 from samcli.commands.exceptions import AWSServiceClientError
+from samcli.lib.utils.lazy_import import lazy_import
 from samcli.lib.utils.sam_logging import (
     LAMBDA_BULDERS_LOGGER_NAME,
     SAM_CLI_FORMATTER_WITH_TIMESTAMP,
@@ -18,6 +18,8 @@ from samcli.lib.utils.sam_logging import (
     SamCliLogger,
 )
 
+rich_console = lazy_import("rich.console")
+
 
 class Context:
     """
@@ -45,10 +47,13 @@ class Context:
         self._session_id = str(uuid.uuid4())
         self._experimental = False
         self._exception = None
-        self._console = Console()
+        self._console = None
 
     @property
     def console(self):
+        # rich is only loaded by the commands which print to the console through it
+        if self._console is None:
+            self._console = rich_console.Console()
         return self._console
 
     @property
@@ -34,4 +34,9 @@ SAM_CLI_HIDDEN_IMPORTS = list(samcli_modules) + [
     "jsonschema",
     "cfnlint",
     "networkx.generators",
+    # modules loaded on first use through samcli.lib.utils.lazy_import
+    "boto3",
+    "docker",
+    "requests",
+    "rich",
 ]
@@ -19,7 +19,6 @@ from samcli.lib.utils.sam_logging import (
     SAM_CLI_LOGGER_NAME,
     SamCliLogger,
 )
-from samcli.lib.utils.system_info import gather_additional_dependencies_info, gather_system_info
 
 LOG = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s", datefmt="%Y-%m-%d %H:%M:%S")
@@ -52,6 +51,8 @@ def print_info(ctx, param, value):
     if not value or ctx.resilient_parsing:
         return
 
+    from samcli.lib.utils.system_info import gather_additional_dependencies_info, gather_system_info
+
     info = {
         "version": __version__,
         "system": gather_system_info(),
@@ -134,6 +135,7 @@ def cli(ctx):
     import atexit
 
     from samcli.lib.telemetry.metric import emit_all_metrics, send_installed_metric
+    from samcli.lib.telemetry.metrics_sender import flush_metrics
 
     # if development version of SAM CLI is used, attach module proxy
     # to catch missing configuration for dynamic/hidden imports
@@ -166,6 +168,8 @@ def cli(ctx):
     lambda_builders_logger = logging.getLogger(LAMBDA_BULDERS_LOGGER_NAME)
     botocore_logger = logging.getLogger("botocore")
 
+    # exit handlers run in reverse order: the metrics are emitted, then the queued metrics are sent
+    atexit.register(flush_metrics)
     atexit.register(emit_all_metrics)
 
     SamCliLogger.configure_logger(sam_cli_logger, SAM_CLI_FORMATTER, logging.INFO)
@@ -5,7 +5,7 @@ Common CLI options shared by various commands
 import logging
 import os
 from functools import partial
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import click
 from click.types import FuncParamType
@@ -48,6 +48,8 @@ SUPPORTED_BUILD_IN_SOURCE_WORKFLOWS = [
 
 LOG = logging.getLogger(__name__)
 
+DEFAULT_WATCH_QUIET_WINDOW_MS = 1000
+
 
 def get_or_default_template_file_name(ctx, param, provided_value, include_build):
     """
@@ -295,6 +297,29 @@ def watch_exclude_option_callback(
     return resource_exclude_mappings
 
 
+def watch_quiet_window_option_callback(ctx: click.Context, param: click.Option, value: Optional[int]) -> Optional[int]:
+    """
+    Validates that the quiet window is not negative
+
+    Parameters
+    ----------
+    ctx: click.Context
+        The click context
+    param: click.Option
+        The parameter that was provided
+    value: Optional[int]
+        Number of milliseconds of the quiet window
+
+    Returns
+    -------
+    Optional[int]
+        The validated number of milliseconds
+    """
+    if value is not None and value < 0:
+        raise click.BadParameter(f"must not be negative, got {value}", ctx=ctx, param=param)
+    return value
+
+
 def template_common_option(f):
     """
     Common ClI option for template
@@ -723,6 +748,51 @@ def force_upload_option(f):
     return force_upload_click_option()(f)
 
 
+def s3_transfer_click_options():
+    return [
+        click.option(
+            "--s3-max-concurrency",
+            type=click.INT,
+            required=False,
+            help="Maximum number of parts uploaded to the AWS S3 bucket at the same time, for all the artifacts. "
+            "(default: 10)",
+        ),
+        click.option(
+            "--s3-multipart-threshold",
+            type=click.INT,
+            required=False,
+            help="Size in MiB from which artifacts are uploaded to the AWS S3 bucket in multiple parts. (default: 8)",
+        ),
+        click.option(
+            "--s3-multipart-chunksize",
+            type=click.INT,
+            required=False,
+            help="Size in MiB of each part of a multipart upload to the AWS S3 bucket, at least 5 MiB. (default: 8)",
+        ),
+    ]
+
+
+def s3_transfer_options(f):
+    for option in reversed(s3_transfer_click_options()):
+        option(f)
+
+    return f
+
+
+def package_jobs_click_option():
+    return click.option(
+        "--package-jobs",
+        type=click.INT,
+        required=False,
+        help="Maximum number of artifacts, and of nested stacks, packaged and uploaded at the same time. "
+        "Set it to 1 to package them one at a time. (default: the number of CPUs plus 4, up to 32)",
+    )
+
+
+def package_jobs_option(f):
+    return package_jobs_click_option()(f)
+
+
 def resolve_s3_click_option(guided):
     from samcli.commands.package.exceptions import PackageResolveS3AndS3NotSetError, PackageResolveS3AndS3SetError
 
@@ -1012,6 +1082,22 @@ def watch_exclude_click_option():
     )
 
 
+def watch_quiet_window_option(f):
+    return watch_quiet_window_click_option()(f)
+
+
+def watch_quiet_window_click_option():
+    return click.option(
+        "--watch-quiet-window",
+        help="Number of milliseconds without any file change after which the changes of a resource are synced. "
+        "All the file changes received for a resource during that time are synced together.",
+        type=click.INT,
+        default=DEFAULT_WATCH_QUIET_WINDOW_MS,
+        show_default=True,
+        callback=watch_quiet_window_option_callback,
+    )
+
+
 def container_env_var_file_click_option(cls):
     """
     Click option to --container-env-var-file option
@@ -6,7 +6,8 @@ import logging
 import os
 import pathlib
 import shutil
-from typing import Dict, List, Optional, Tuple
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
 
 import click
 
@@ -16,7 +17,11 @@ from samcli.commands._utils.template import (
     get_template_data,
     move_template,
 )
-from samcli.commands.build.exceptions import InvalidBuildDirException, MissingBuildMethodException
+from samcli.commands.build.exceptions import (
+    InvalidBuildDirException,
+    InvalidParallelJobsException,
+    MissingBuildMethodException,
+)
 from samcli.commands.build.utils import MountMode, prompt_user_to_enable_mount_with_write_if_needed
 from samcli.commands.exceptions import UserException
 from samcli.lib.bootstrap.nested_stack.nested_stack_manager import NestedStackManager
@@ -39,6 +44,7 @@ from samcli.lib.providers.sam_api_provider import SamApiProvider
 from samcli.lib.providers.sam_function_provider import SamFunctionProvider
 from samcli.lib.providers.sam_layer_provider import SamLayerProvider
 from samcli.lib.providers.sam_stack_provider import SamLocalStackProvider
+from samcli.lib.samlib.translated_template_cache import configure_translated_template_cache
 from samcli.lib.telemetry.event import EventName, EventTracker, UsedFeature
 from samcli.lib.utils.osutils import BUILD_DIR_PERMISSIONS
 from samcli.local.docker.manager import ContainerManager
@@ -49,6 +55,10 @@ from samcli.local.lambdafn.exceptions import (
 
 LOG = logging.getLogger(__name__)
 
+# Tells the Makefile rules generated by a hook package whether sam build builds all the resources ("1") or a single
+# one ("0"). The Terraform rules apply the sam metadata resources of all the functions at once in the first case.
+HOOK_BUILD_ALL_RESOURCES_ENV_VAR = "SAM_CLI_HOOK_BUILD_ALL_RESOURCES"
+
 
 class BuildContext:
     def __init__(
@@ -82,6 +92,7 @@ class BuildContext:
         hook_name: Optional[str] = None,
         build_in_source: Optional[bool] = None,
         mount_with: str = MountMode.READ.value,
+        parallel_jobs: Optional[int] = None,
     ) -> None:
         """
         Initialize the class
@@ -139,6 +150,9 @@ class BuildContext:
             Set to True to build in the source directory.
         mount_with:
             Mount mode of source code directory when building inside container, READ ONLY by default
+        parallel_jobs: Optional[int]
+            Maximum number of builds running at the same time when building in parallel. If it is not given, the
+            default worker count of ThreadPoolExecutor is used, which is min(32, number of CPUs + 4)
         """
 
         self._resource_identifier = resource_identifier
@@ -151,6 +165,9 @@ class BuildContext:
         self._build_dir = build_dir
         self._cache_dir = cache_dir
         self._parallel = parallel
+        if parallel_jobs is not None and parallel_jobs < 1:
+            raise InvalidParallelJobsException(f"Parallel jobs must be at least 1, got {parallel_jobs}")
+        self._parallel_jobs = parallel_jobs
         self._manifest_path = manifest_path
         self._clean = clean
         self._use_container = use_container
@@ -188,6 +205,10 @@ class BuildContext:
     def set_up(self) -> None:
         """Set up class members used for building
         This should be called each time before run() if stacks are changed."""
+        if self._cached:
+            # the templates translated while loading the stacks are cached with the other build caches
+            configure_translated_template_cache(self._cache_dir)
+
         self._stacks, remote_stack_full_paths = SamLocalStackProvider.get_stacks(
             self._template_file,
             parameter_overrides=self._parameter_overrides,
@@ -273,6 +294,7 @@ class BuildContext:
                 combine_dependencies=not self._create_auto_dependency_layer,
                 build_in_source=self._build_in_source,
                 mount_with_write=mount_with_write,
+                parallel_jobs=self._parallel_jobs,
             )
 
             self._check_exclude_warning()
@@ -281,7 +303,8 @@ class BuildContext:
             for f in self.get_resources_to_build().functions:
                 EventTracker.track_event(EventName.BUILD_FUNCTION_RUNTIME.value, f.runtime)
 
-            self._build_result = builder.build()
+            with self._hook_build_environment():
+                self._build_result = builder.build()
 
             self._handle_build_post_processing(builder, self._build_result)
 
@@ -613,6 +636,26 @@ Commands you can use next
         )
         return result
 
+    @contextmanager
+    def _hook_build_environment(self) -> Iterator[None]:
+        """
+        Sets the environment variable which tells the Makefile rules generated by the hook package whether all the
+        resources are built, for the duration of the build
+        """
+        if not self._hook_name:
+            yield
+            return
+
+        previous_value = os.environ.get(HOOK_BUILD_ALL_RESOURCES_ENV_VAR)
+        os.environ[HOOK_BUILD_ALL_RESOURCES_ENV_VAR] = "0" if self.is_building_specific_resource else "1"
+        try:
+            yield
+        finally:
+            if previous_value is None:
+                os.environ.pop(HOOK_BUILD_ALL_RESOURCES_ENV_VAR, None)
+            else:
+                os.environ[HOOK_BUILD_ALL_RESOURCES_ENV_VAR] = previous_value
+
     @property
     def is_building_specific_resource(self) -> bool:
         """
@@ -105,6 +105,15 @@ DESCRIPTION = """
 @click.option(
     "--parallel", "-p", is_flag=True, help="Enable parallel builds for AWS SAM template's functions and layers."
 )
+@click.option(
+    "--parallel-jobs",
+    type=click.INT,
+    default=None,
+    help="Maximum number of functions and layers built at the same time with --parallel, "
+    "in process or inside containers. "
+    "If it is not set, the default worker count of the thread pool is used, which is the number of CPUs plus 4, "
+    "up to 32.",
+)
 @click.option(
     "--mount-with",
     "-mw",
@@ -142,6 +151,7 @@ def cli(
     use_container: bool,
     cached: bool,
     parallel: bool,
+    parallel_jobs: Optional[int],
     manifest: Optional[str],
     docker_network: Optional[str],
     container_env_var: Optional[Tuple[str]],
@@ -189,6 +199,7 @@ def cli(
         hook_name,
         build_in_source,
         mount_with,
+        parallel_jobs,
     )  # pragma: no cover
 
 
@@ -215,6 +226,7 @@ def do_cli(  # pylint: disable=too-many-locals, too-many-statements
     hook_name: Optional[str],
     build_in_source: Optional[bool],
     mount_with: str,
+    parallel_jobs: Optional[int],
 ) -> None:
     """
     Implementation of the ``cli`` method
@@ -254,6 +266,7 @@ def do_cli(  # pylint: disable=too-many-locals, too-many-statements
         hook_name=hook_name,
         build_in_source=build_in_source,
         mount_with=mount_with,
+        parallel_jobs=parallel_jobs,
     ) as ctx:
         ctx.run()
 
@@ -9,6 +9,12 @@ class InvalidBuildDirException(UserException):
     """
 
 
+class InvalidParallelJobsException(UserException):
+    """
+    Value provided to --parallel-jobs is invalid
+    """
+
+
 class MissingBuildMethodException(UserException):
     """
     Exception to be thrown when a layer is tried to build without BuildMethod
@@ -3,12 +3,14 @@ Delete a SAM stack
 """
 
 import logging
+import os
 from typing import Optional
 
 import click
 from botocore.exceptions import NoCredentialsError, NoRegionError
 from click import confirm, prompt
 
+from samcli.commands._utils.constants import DEFAULT_CACHE_DIR
 from samcli.commands.delete.exceptions import CfDeleteFailedStatusError
 from samcli.commands.exceptions import AWSServiceClientError, RegionError
 from samcli.lib.bootstrap.companion_stack.companion_stack_builder import CompanionStack
@@ -17,6 +19,7 @@ from samcli.lib.package.artifact_exporter import Template
 from samcli.lib.package.ecr_uploader import ECRUploader
 from samcli.lib.package.local_files_utils import get_uploaded_s3_object_name
 from samcli.lib.package.s3_uploader import S3Uploader
+from samcli.lib.package.upload_manifest import UPLOAD_MANIFEST_FILE_NAME, UploadManifest
 from samcli.lib.package.uploaders import Uploaders
 from samcli.lib.utils.boto_utils import get_boto_client_provider_with_config
 
@@ -46,6 +49,7 @@ class DeleteContext:
         self.s3_prefix = s3_prefix
         self.cf_utils = None
         self.s3_uploader = None
+        self.upload_manifest = None
         self.ecr_uploader = None
         self.uploaders = None
         self.cf_template_file_name = None
@@ -70,7 +74,9 @@ class DeleteContext:
         return self
 
     def __exit__(self, *args):
-        pass
+        if self.upload_manifest:
+            # forget about the deleted artifacts, so that the next package uploads them again
+            self.upload_manifest.save()
 
     def init_clients(self):
         """
@@ -95,7 +101,13 @@ class DeleteContext:
                 "AWS_DEFAULT_REGION environment variable."
             ) from ex
 
-        self.s3_uploader = S3Uploader(s3_client=s3_client, bucket_name=self.s3_bucket, prefix=self.s3_prefix)
+        self.upload_manifest = UploadManifest(os.path.join(DEFAULT_CACHE_DIR, UPLOAD_MANIFEST_FILE_NAME))
+        self.s3_uploader = S3Uploader(
+            s3_client=s3_client,
+            bucket_name=self.s3_bucket,
+            prefix=self.s3_prefix,
+            upload_manifest=self.upload_manifest,
+        )
         self.ecr_uploader = ECRUploader(docker_client=None, ecr_client=ecr_client, ecr_repo=None, ecr_repo_multi=None)
         self.uploaders = Uploaders(self.s3_uploader, self.ecr_uploader)
         self.cf_utils = CfnUtils(cloudformation_client)
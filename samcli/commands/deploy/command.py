@@ -22,12 +22,14 @@ from samcli.commands._utils.options import (
     metadata_option,
     no_progressbar_option,
     notification_arns_option,
+    package_jobs_option,
     parameter_override_option,
     resolve_image_repos_option,
     resolve_s3_option,
     role_arn_option,
     s3_bucket_option,
     s3_prefix_option,
+    s3_transfer_options,
     signing_profiles_option,
     stack_name_option,
     tags_option,
@@ -158,6 +160,8 @@ LOG = logging.getLogger(__name__)
 @parameter_override_option
 @signing_profiles_option
 @no_progressbar_option
+@s3_transfer_options
+@package_jobs_option
 @capabilities_option
 @aws_creds_options
 @common_options
@@ -200,6 +204,10 @@ def cli(
     disable_rollback,
     on_failure,
     max_wait_duration,
+    s3_max_concurrency,
+    s3_multipart_threshold,
+    s3_multipart_chunksize,
+    package_jobs,
 ):
     """
     `sam deploy` command entry point
@@ -236,6 +244,10 @@ def cli(
         disable_rollback,
         on_failure,
         max_wait_duration,
+        s3_max_concurrency,
+        s3_multipart_threshold,
+        s3_multipart_chunksize,
+        package_jobs,
     )  # pragma: no cover
 
 
@@ -270,6 +282,10 @@ def do_cli(
     disable_rollback,
     on_failure,
     max_wait_duration,
+    s3_max_concurrency,
+    s3_multipart_threshold,
+    s3_multipart_chunksize,
+    package_jobs,
 ):
     """
     Implementation of the ``cli`` method
@@ -278,6 +294,9 @@ def do_cli(
     from samcli.commands.deploy.exceptions import DeployResolveS3AndS3SetError
     from samcli.commands.deploy.guided_context import GuidedContext
     from samcli.commands.package.package_context import PackageContext
+    from samcli.lib.package.s3_transfer import configure_s3_transfer
+
+    s3_transfer = configure_s3_transfer(s3_max_concurrency, s3_multipart_threshold, s3_multipart_chunksize)
 
     if guided:
         # Allow for a guided deploy to prompt and save those details.
@@ -318,7 +337,7 @@ def do_cli(
                 template_file, stack_name, region, s3_bucket, s3_prefix, image_repositories
             )
 
-    with osutils.tempfile_platform_independent() as output_template_file:
+    with s3_transfer, osutils.tempfile_platform_independent() as output_template_file:
         if guided:
             context_param_overrides = sanitize_parameter_overrides(guided_context.guided_parameter_overrides)
         else:
@@ -340,6 +359,7 @@ def do_cli(
             profile=profile,
             signing_profiles=guided_context.signing_profiles if guided else signing_profiles,
             parameter_overrides=context_param_overrides,
+            parallel_jobs=package_jobs,
         ) as package_context:
             package_context.run()
 
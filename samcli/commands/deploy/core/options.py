@@ -37,6 +37,10 @@ DEPLOYMENT_OPTIONS: List[str] = [
     "disable_rollback",
     "on_failure",
     "force_upload",
+    "s3_max_concurrency",
+    "s3_multipart_threshold",
+    "s3_multipart_chunksize",
+    "package_jobs",
     "max_wait_duration",
 ]
 
@@ -5,10 +5,12 @@ Display of the Endpoints of a SAM stack
 import logging
 from typing import Optional
 
+from samcli.commands._utils.constants import DEFAULT_CACHE_DIR
 from samcli.commands.list.cli_common.list_common_context import ListContext
 from samcli.lib.list.endpoints.endpoints_producer import EndpointsProducer
 from samcli.lib.list.list_interfaces import ProducersEnum
 from samcli.lib.list.mapper_consumer_factory import MapperConsumerFactory
+from samcli.lib.samlib.translated_template_cache import configure_translated_template_cache
 
 LOG = logging.getLogger(__name__)
 
@@ -57,6 +59,8 @@ class EndpointsContext(ListContext):
 
     def __enter__(self):
         self.init_clients()
+        # reuses the templates translated by the previous builds and local commands, once the project was built
+        configure_translated_template_cache(DEFAULT_CACHE_DIR, existing_only=True)
         return self
 
     def __exit__(self, *args):
@@ -5,10 +5,12 @@ Display the Resources of a SAM stack
 import logging
 from typing import Optional
 
+from samcli.commands._utils.constants import DEFAULT_CACHE_DIR
 from samcli.commands.list.cli_common.list_common_context import ListContext
 from samcli.lib.list.list_interfaces import ProducersEnum
 from samcli.lib.list.mapper_consumer_factory import MapperConsumerFactory
 from samcli.lib.list.resources.resource_mapping_producer import ResourceMappingProducer
+from samcli.lib.samlib.translated_template_cache import configure_translated_template_cache
 
 LOG = logging.getLogger(__name__)
 
@@ -34,6 +36,8 @@ class ResourcesContext(ListContext):
 
     def __enter__(self):
         self.init_clients()
+        # reuses the templates translated by the previous builds and local commands, once the project was built
+        configure_translated_template_cache(DEFAULT_CACHE_DIR, existing_only=True)
         return self
 
     def __exit__(self, *args):
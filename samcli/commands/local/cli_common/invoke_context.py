@@ -3,15 +3,18 @@ Reads CLI arguments and performs necessary preparation to be able to run the fun
 """
 
 import errno
+import io
 import json
 import logging
 import os
+import time
 from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, List, Optional, TextIO, Tuple, Type, cast
 
 from botocore.exceptions import ClientError, NoCredentialsError, TokenRetrievalError
 
+from samcli.commands._utils.constants import DEFAULT_CACHE_DIR
 from samcli.commands._utils.template import TemplateFailedParsingException, TemplateNotFoundException
 from samcli.commands.exceptions import ContainersInitializationException
 from samcli.commands.local.cli_common.user_exceptions import DebugContextException, InvokeContextException
@@ -20,6 +23,7 @@ from samcli.commands.local.lib.local_lambda import LocalLambdaRunner
 from samcli.lib.providers.provider import Function, Stack
 from samcli.lib.providers.sam_function_provider import RefreshableSamFunctionProvider, SamFunctionProvider
 from samcli.lib.providers.sam_stack_provider import SamLocalStackProvider
+from samcli.lib.samlib.translated_template_cache import configure_translated_template_cache
 from samcli.lib.utils import osutils
 from samcli.lib.utils.async_utils import AsyncContext
 from samcli.lib.utils.boto_utils import get_boto_client_provider_with_config
@@ -52,6 +56,18 @@ class NoFunctionIdentifierProvidedException(InvokeContextException):
     """
 
 
+class InvalidWarmContainersPoolSizeException(InvokeContextException):
+    """
+    User provided a warm containers pool size that can not hold any container
+    """
+
+
+class InvalidPrewarmConfigException(InvokeContextException):
+    """
+    User asked to prewarm the functions with options that can not be used
+    """
+
+
 class ContainersInitializationMode(Enum):
     EAGER = "EAGER"
     LAZY = "LAZY"
@@ -97,6 +113,10 @@ class InvokeContext:
         aws_region: Optional[str] = None,
         aws_profile: Optional[str] = None,
         warm_container_initialization_mode: Optional[str] = None,
+        warm_containers_pool_size: int = 1,
+        warm_containers_idle_ttl: Optional[int] = None,
+        prewarm: bool = False,
+        prewarm_event_file: Optional[str] = None,
         debug_function: Optional[str] = None,
         shutdown: bool = False,
         container_host: Optional[str] = None,
@@ -144,6 +164,17 @@ class InvokeContext:
             Two modes are available:
             "EAGER": Containers for every function are loaded at startup and persist between invocations.
             "LAZY": Containers are only loaded when the function is first invoked and persist for additional invocations
+        warm_containers_pool_size int
+            Maximum number of warm containers kept for each function, concurrent invocations of the same function
+            are dispatched across them
+        warm_containers_idle_ttl int
+            Number of seconds after which an idle warm container, other than the last one of a function, is terminated
+        prewarm bool
+            Invoke every function once with the prewarm event before the context is ready, only supported with warm
+            containers
+        prewarm_event_file str
+            Path to a file containing the JSON event used to prewarm the functions, an empty object is used if it is
+            not provided
         debug_function str
             The Lambda function logicalId that will have the debugging options enabled in case of warm containers
             option is enabled
@@ -197,6 +228,20 @@ class InvokeContext:
             self._containers_mode = ContainersMode.WARM
             self._containers_initializing_mode = ContainersInitializationMode(warm_container_initialization_mode)
 
+        if warm_containers_pool_size < 1:
+            raise InvalidWarmContainersPoolSizeException(
+                f"Warm containers pool size must be at least 1, got {warm_containers_pool_size}"
+            )
+        self._warm_containers_pool_size = warm_containers_pool_size
+        self._warm_containers_idle_ttl = warm_containers_idle_ttl
+
+        if prewarm_event_file and not prewarm:
+            raise InvalidPrewarmConfigException("--prewarm-event can only be used with --prewarm")
+        if prewarm and self._containers_mode != ContainersMode.WARM:
+            raise InvalidPrewarmConfigException("Prewarming the functions requires the --warm-containers option")
+        self._prewarm = prewarm
+        self._prewarm_event_file = prewarm_event_file
+
         self._debug_function = debug_function
 
         # Note(xinhol): despite self._function_provider and self._stacks are initialized as None
@@ -222,6 +267,8 @@ class InvokeContext:
         :returns InvokeContext: Returns this object
         """
 
+        # reuses the templates translated by the previous builds and local commands, once the project was built
+        configure_translated_template_cache(DEFAULT_CACHE_DIR, existing_only=True)
         self._stacks = self._get_stacks()
 
         _function_providers_class: Dict[ContainersMode, Type[SamFunctionProvider]] = {
@@ -239,8 +286,14 @@ class InvokeContext:
         if self._docker_volume_basedir:
             _function_providers_args[self._containers_mode].append(True)
 
+        _function_providers_kwargs: Dict[ContainersMode, Dict[str, Any]] = {
+            ContainersMode.WARM: {},
+            # the invoked function is known up front, only resolve it and the resources it references
+            ContainersMode.COLD: {"function_identifier": self._function_identifier},
+        }
+
         self._function_provider = _function_providers_class[self._containers_mode](
-            *_function_providers_args[self._containers_mode]
+            *_function_providers_args[self._containers_mode], **_function_providers_kwargs[self._containers_mode]
         )
 
         self._env_vars_value = self._get_env_vars_value(self._env_vars_file)
@@ -292,6 +345,9 @@ class InvokeContext:
                 )
                 break
 
+        if self._prewarm:
+            self._prewarm_all_functions()
+
         return self
 
     def __exit__(self, *args: Any) -> None:
@@ -341,6 +397,88 @@ class InvokeContext:
             self._clean_running_containers_and_related_resources()
             raise ContainersInitializationException("Lambda functions containers initialization failed") from ex
 
+    def _prewarm_all_functions(self) -> None:
+        """
+        Invoke every function once with the prewarm event, so that the runtime bootstrap and the function
+        initialization code already ran when the first request comes in. The function responses are discarded and
+        failures only produce a warning, the time spent on each function is printed once they are all done.
+        Only one container of each function is prewarmed, the other containers of its warm containers pool are
+        started on demand and pay for their initialization on their first request.
+        """
+        event = self._get_prewarm_event(self._prewarm_event_file)
+        functions = [
+            function
+            for function in self._function_provider.get_all()
+            if not (function.packagetype == ZIP and function.inlinecode)
+            # the debugged function waits for a debugger to attach, it can not be warmed up without blocking
+            and not (self._debug_context and function.name == self._debug_context.debug_function)
+        ]
+        if not functions:
+            return
+
+        LOG.info("Prewarming %d lambda functions.", len(functions))
+
+        def prewarm_function(function: Function) -> Tuple[str, float, Optional[Exception]]:
+            discarded_output = StreamWriter(io.StringIO(), io.BytesIO())
+            start = time.perf_counter()
+            error: Optional[Exception] = None
+            try:
+                self.local_lambda_runner.invoke(function.full_path, event, stdout=discarded_output, stderr=self.stderr)
+            except Exception as ex:  # pylint: disable=broad-except
+                error = ex
+            return function.full_path, time.perf_counter() - start, error
+
+        start = time.perf_counter()
+        try:
+            async_context = AsyncContext()
+            for function in functions:
+                async_context.add_async_task(prewarm_function, function)
+            results = async_context.run_async(default_executor=False)
+        except KeyboardInterrupt:
+            LOG.debug("Ctrl+C was pressed. Aborting functions prewarm")
+            self._clean_running_containers_and_related_resources()
+            raise
+
+        report = []
+        for function_path, duration, error in sorted(results, key=lambda result: result[1], reverse=True):
+            if error:
+                LOG.warning("Prewarming function %s failed because of %s", function_path, error)
+                report.append(f"  {function_path}: failed after {duration * 1000:.0f} ms")
+            else:
+                report.append(f"  {function_path}: {duration * 1000:.0f} ms")
+        LOG.info(
+            "Prewarmed %d lambda functions in %.0f ms:\n%s",
+            len(functions),
+            (time.perf_counter() - start) * 1000,
+            "\n".join(report),
+        )
+
+    @staticmethod
+    def _get_prewarm_event(filename: Optional[str]) -> str:
+        """
+        Reads the event used to prewarm the functions
+
+        Parameters
+        ----------
+        filename str
+            Path to the JSON file containing the prewarm event
+
+        Returns
+        -------
+        str
+            The prewarm event, an empty JSON object if no file is provided
+        """
+        if not filename:
+            return "{}"
+
+        try:
+            with open(filename, "r") as fp:
+                return json.dumps(json.load(fp))
+        except Exception as ex:
+            raise InvalidPrewarmConfigException(
+                "Could not read the prewarm event from file {}: {}".format(filename, str(ex))
+            ) from ex
+
     def _clean_running_containers_and_related_resources(self) -> None:
         """
         Clean the running containers and any other related open resources,
@@ -404,7 +542,12 @@ class InvokeContext:
                 layer_downloader, self._skip_pull_image, self._force_image_build, invoke_images=self._invoke_images
             )
             self._lambda_runtimes = {
-                ContainersMode.WARM: WarmLambdaRuntime(self._container_manager, image_builder),
+                ContainersMode.WARM: WarmLambdaRuntime(
+                    self._container_manager,
+                    image_builder,
+                    pool_size=self._warm_containers_pool_size,
+                    idle_ttl=self._warm_containers_idle_ttl,
+                ),
                 ContainersMode.COLD: LambdaRuntime(self._container_manager, image_builder),
             }
 
@@ -15,6 +15,7 @@ from samcli.commands._utils.options import (
 )
 from samcli.commands.local.cli_common.invoke_context import ContainersInitializationMode
 from samcli.local.docker.container import DEFAULT_CONTAINER_HOST_INTERFACE
+from samcli.local.services.server_config import DEFAULT_SERVER_BACKLOG, ServerEngine
 
 
 def get_application_dir():
@@ -140,6 +141,36 @@ def service_common_options(port):
             click.option(
                 "--port", "-p", default=port, help="Local port number to listen on (default: '{}')".format(str(port))
             ),
+            click.option(
+                "--server-engine",
+                help="""
+                \b
+                Optional. Specifies the HTTP server that 
+                serves the requests.
+                Two engines are available:
+                DEV: Flask development server, a new thread 
+                is started for every request.
+                POOLED: Fixed pool of worker threads with 
+                a bounded accept backlog.
+                """,
+                type=click.Choice(ServerEngine.__members__, case_sensitive=False),
+                default=ServerEngine.DEV.value,
+                show_default=True,
+            ),
+            click.option(
+                "--server-threads",
+                help="Optional. Number of worker threads of the POOLED server engine. "
+                "Defaults to the number of CPUs plus 4, up to 32.",
+                type=click.INT,
+                default=None,
+            ),
+            click.option(
+                "--server-backlog",
+                help="Optional. Maximum number of connections waiting to be accepted by the POOLED server engine.",
+                type=click.INT,
+                default=DEFAULT_SERVER_BACKLOG,
+                show_default=True,
+            ),
         ]
 
         # Reverse the list to maintain ordering of options in help text printed with --help
@@ -257,6 +288,39 @@ def warm_containers_common_options(f):
             type=click.STRING,
             multiple=False,
         ),
+        click.option(
+            "--warm-containers-pool-size",
+            help="Optional. Maximum number of warm containers kept for each function when --warm-containers is"
+            " specified. Concurrent requests to the same function are dispatched to the least busy container, and a"
+            " new container is started only when all the existing ones are busy.",
+            type=click.INT,
+            default=1,
+            show_default=True,
+        ),
+        click.option(
+            "--warm-containers-idle-ttl",
+            help="Optional. Number of seconds after which an idle warm container is terminated when the function"
+            " has more than one warm container. The last warm container of a function is always kept.",
+            type=click.INT,
+            default=None,
+        ),
+        click.option(
+            "--prewarm",
+            help="Optional. Invoke every function once with the prewarm event when the warm containers are started,"
+            " so that the first request does not pay for the runtime bootstrap and the function initialization."
+            " The server starts once all the functions are prewarmed. Only one container of each function is"
+            " prewarmed, the additional containers allowed by --warm-containers-pool-size are started on demand and"
+            " are not prewarmed. Requires --warm-containers.",
+            is_flag=True,
+            default=False,
+        ),
+        click.option(
+            "--prewarm-event",
+            help="Optional. JSON file that contains the event used to prewarm the functions when --prewarm is"
+            " specified. Defaults to an empty JSON object. Requires --prewarm.",
+            type=click.Path(exists=True),
+            default=None,
+        ),
     ]
 
     # Reverse the list to maintain ordering of options in help text printed with --help
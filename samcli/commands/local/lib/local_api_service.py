@@ -18,7 +18,9 @@ class LocalApiService:
     Lambda function.
     """
 
-    def __init__(self, lambda_invoke_context, port, host, static_dir, disable_authorizer, ssl_context):
+    def __init__(
+        self, lambda_invoke_context, port, host, static_dir, disable_authorizer, ssl_context, server_config=None
+    ):
         """
         Initialize the local API service.
 
@@ -30,12 +32,15 @@ class LocalApiService:
         :param bool disable_authorizer: Optional, flag for disabling the parsing of lambda authorizers
         :param tuple(string, string) ssl_context: Optional, path to ssl certificate and key files to start service
             in https
+        :param samcli.local.services.server_config.ServerConfig server_config: Optional, engine and sizing of the
+            HTTP server
         """
 
         self.port = port
         self.host = host
         self.static_dir = static_dir
         self.ssl_context = ssl_context
+        self.server_config = server_config
 
         self.cwd = lambda_invoke_context.get_cwd()
         self.disable_authorizer = disable_authorizer
@@ -71,6 +76,7 @@ class LocalApiService:
             host=self.host,
             ssl_context=self.ssl_context,
             stderr=self.stderr_stream,
+            server_config=self.server_config,
         )
 
         service.create()
@@ -15,7 +15,7 @@ class LocalLambdaService:
     that are defined in a SAM file.
     """
 
-    def __init__(self, lambda_invoke_context, port, host, ssl_context=None):
+    def __init__(self, lambda_invoke_context, port, host, ssl_context=None, server_config=None):
         """
         Initialize the Local Lambda Invoke service.
 
@@ -25,11 +25,14 @@ class LocalLambdaService:
         :param string host: Local hostname or IP address to bind to
         :param tuple(string, string) ssl_context: Optional, path to ssl certificate and key files to start service
             in https
+        :param samcli.local.services.server_config.ServerConfig server_config: Optional, engine and sizing of the
+            HTTP server
         """
 
         self.port = port
         self.host = host
         self.ssl_context = ssl_context
+        self.server_config = server_config
         self.lambda_runner = lambda_invoke_context.local_lambda_runner
         self.stderr_stream = lambda_invoke_context.stderr
 
@@ -52,6 +55,7 @@ class LocalLambdaService:
             host=self.host,
             ssl_context=self.ssl_context,
             stderr=self.stderr_stream,
+            server_config=self.server_config,
         )
 
         service.create()
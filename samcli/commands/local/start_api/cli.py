@@ -110,6 +110,9 @@ def cli(
     # start-api Specific Options
     host,
     port,
+    server_engine,
+    server_threads,
+    server_backlog,
     static_dir,
     disable_authorizer,
     # Common Options for Lambda Invoke
@@ -130,6 +133,10 @@ def cli(
     config_file,
     config_env,
     warm_containers,
+    warm_containers_pool_size,
+    warm_containers_idle_ttl,
+    prewarm,
+    prewarm_event,
     shutdown,
     debug_function,
     container_host,
@@ -176,6 +183,13 @@ def cli(
         hook_name,
         ssl_cert_file,
         ssl_key_file,
+        warm_containers_pool_size,
+        warm_containers_idle_ttl,
+        server_engine,
+        server_threads,
+        server_backlog,
+        prewarm,
+        prewarm_event,
     )  # pragma: no cover
 
 
@@ -208,6 +222,13 @@ def do_cli(  # pylint: disable=R0914
     hook_name,
     ssl_cert_file,
     ssl_key_file,
+    warm_containers_pool_size,
+    warm_containers_idle_ttl,
+    server_engine,
+    server_threads,
+    server_backlog,
+    prewarm,
+    prewarm_event,
 ):
     """
     Implementation of the ``cli`` method, just separated out for unit testing purposes
@@ -220,10 +241,12 @@ def do_cli(  # pylint: disable=R0914
     from samcli.commands.validate.lib.exceptions import InvalidSamDocumentException
     from samcli.lib.providers.exceptions import InvalidLayerReference
     from samcli.local.docker.lambda_debug_settings import DebuggingNotSupported
+    from samcli.local.services.server_config import get_server_config
 
     LOG.debug("local start-api command is called")
 
     processed_invoke_images = process_image_options(invoke_image)
+    server_config = get_server_config(server_engine, server_threads, server_backlog)
 
     # Pass all inputs to setup necessary context to invoke function locally.
     # Handler exception raised by the processor for invalid args and print errors
@@ -247,6 +270,10 @@ def do_cli(  # pylint: disable=R0914
             aws_region=ctx.region,
             aws_profile=ctx.profile,
             warm_container_initialization_mode=warm_containers,
+            warm_containers_pool_size=warm_containers_pool_size,
+            warm_containers_idle_ttl=warm_containers_idle_ttl,
+            prewarm=prewarm,
+            prewarm_event_file=prewarm_event,
             debug_function=debug_function,
             shutdown=shutdown,
             container_host=container_host,
@@ -262,6 +289,7 @@ def do_cli(  # pylint: disable=R0914
                 static_dir=static_dir,
                 disable_authorizer=disable_authorizer,
                 ssl_context=ssl_context,
+                server_config=server_config,
             )
             service.start()
             if not hook_name:
@@ -23,6 +23,9 @@ EXTENSION_OPTIONS: List[str] = ["hook_name", "skip_prepare_infra"]
 CONTAINER_OPTION_NAMES: List[str] = [
     "host",
     "port",
+    "server_engine",
+    "server_threads",
+    "server_backlog",
     "ssl_cert_file",
     "ssl_key_file",
     "env_vars",
@@ -36,6 +39,10 @@ CONTAINER_OPTION_NAMES: List[str] = [
     "docker_network",
     "force_image_build",
     "warm_containers",
+    "warm_containers_pool_size",
+    "warm_containers_idle_ttl",
+    "prewarm",
+    "prewarm_event",
     "shutdown",
     "container_host",
     "container_host_interface",
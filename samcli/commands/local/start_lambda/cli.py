@@ -74,6 +74,9 @@ def cli(
     # start-lambda Specific Options
     host,
     port,
+    server_engine,
+    server_threads,
+    server_backlog,
     # Common Options for Lambda Invoke
     template_file,
     env_vars,
@@ -92,6 +95,10 @@ def cli(
     config_file,
     config_env,
     warm_containers,
+    warm_containers_pool_size,
+    warm_containers_idle_ttl,
+    prewarm,
+    prewarm_event,
     shutdown,
     debug_function,
     container_host,
@@ -132,6 +139,13 @@ def cli(
         add_host,
         invoke_image,
         hook_name,
+        warm_containers_pool_size,
+        warm_containers_idle_ttl,
+        server_engine,
+        server_threads,
+        server_backlog,
+        prewarm,
+        prewarm_event,
     )  # pragma: no cover
 
 
@@ -160,6 +174,13 @@ def do_cli(  # pylint: disable=R0914
     add_host,
     invoke_image,
     hook_name,
+    warm_containers_pool_size,
+    warm_containers_idle_ttl,
+    server_engine,
+    server_threads,
+    server_backlog,
+    prewarm,
+    prewarm_event,
 ):
     """
     Implementation of the ``cli`` method, just separated out for unit testing purposes
@@ -172,10 +193,12 @@ def do_cli(  # pylint: disable=R0914
     from samcli.commands.validate.lib.exceptions import InvalidSamDocumentException
     from samcli.lib.providers.exceptions import InvalidLayerReference
     from samcli.local.docker.lambda_debug_settings import DebuggingNotSupported
+    from samcli.local.services.server_config import get_server_config
 
     LOG.debug("local start_lambda command is called")
 
     processed_invoke_images = process_image_options(invoke_image)
+    server_config = get_server_config(server_engine, server_threads, server_backlog)
 
     # Pass all inputs to setup necessary context to invoke function locally.
     # Handler exception raised by the processor for invalid args and print errors
@@ -199,6 +222,10 @@ def do_cli(  # pylint: disable=R0914
             aws_region=ctx.region,
             aws_profile=ctx.profile,
             warm_container_initialization_mode=warm_containers,
+            warm_containers_pool_size=warm_containers_pool_size,
+            warm_containers_idle_ttl=warm_containers_idle_ttl,
+            prewarm=prewarm,
+            prewarm_event_file=prewarm_event,
             debug_function=debug_function,
             shutdown=shutdown,
             container_host=container_host,
@@ -206,7 +233,9 @@ def do_cli(  # pylint: disable=R0914
             add_host=add_host,
             invoke_images=processed_invoke_images,
         ) as invoke_context:
-            service = LocalLambdaService(lambda_invoke_context=invoke_context, port=port, host=host)
+            service = LocalLambdaService(
+                lambda_invoke_context=invoke_context, port=port, host=host, server_config=server_config
+            )
             service.start()
             command_suggestions = generate_next_command_recommendation(
                 [
@@ -21,8 +21,15 @@ TEMPLATE_OPTIONS: List[str] = [
 CONTAINER_OPTION_NAMES: List[str] = [
     "host",
     "port",
+    "server_engine",
+    "server_threads",
+    "server_backlog",
     "env_vars",
     "warm_containers",
+    "warm_containers_pool_size",
+    "warm_containers_idle_ttl",
+    "prewarm",
+    "prewarm_event",
     "container_env_vars",
     "debug_function",
     "debug_port",
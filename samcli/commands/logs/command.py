@@ -79,6 +79,13 @@ DESCRIPTION = """
     "become available. If option --tail is provided without a --name, one will be pulled from all "
     "possible resources",
 )
+@click.option(
+    "--live-tail",
+    is_flag=True,
+    help="Tail events with CloudWatch Logs Live Tail sessions instead of polling each log group, "
+    "a session streams the events of up to 10 log groups. Live Tail sessions are billed per minute of session, "
+    "see the Amazon CloudWatch pricing. Can only be used with --tail.",
+)
 @click.option(
     "--include-traces",
     "-i",
@@ -108,6 +115,7 @@ def cli(
     stack_name,
     filter,
     tail,
+    live_tail,
     include_traces,
     start_time,
     end_time,
@@ -127,6 +135,7 @@ def cli(
         stack_name,
         filter,
         tail,
+        live_tail,
         include_traces,
         start_time,
         end_time,
@@ -142,6 +151,7 @@ def do_cli(
     stack_name,
     filter_pattern,
     tailing,
+    live_tail,
     include_tracing,
     start_time,
     end_time,
@@ -161,6 +171,9 @@ def do_cli(
     from samcli.lib.observability.util import OutputOption
     from samcli.lib.utils.boto_utils import get_boto_client_provider_with_config, get_boto_resource_provider_with_config
 
+    if live_tail and not tailing:
+        raise click.UsageError("--live-tail can only be used with --tail")
+
     if names and len(names) <= 1:
         click.echo(
             "You can now use 'sam logs' without --name parameter, "
@@ -185,6 +198,7 @@ def do_cli(
         cw_log_groups,
         OutputOption(output) if output else OutputOption.text,
         include_tracing,
+        live_tail,
     )
 
     if tailing:
@@ -20,6 +20,7 @@ from samcli.lib.observability.cw_logs.cw_log_formatters import (
     CWPrettyPrintFormatter,
 )
 from samcli.lib.observability.cw_logs.cw_log_group_provider import LogGroupProvider
+from samcli.lib.observability.cw_logs.cw_log_groups_puller import CWLogGroupsPuller
 from samcli.lib.observability.cw_logs.cw_log_puller import CWLogPuller
 from samcli.lib.observability.observability_info_puller import (
     ObservabilityCombinedPuller,
@@ -49,6 +50,7 @@ def generate_puller(
     additional_cw_log_groups: Optional[List[str]] = None,
     output: OutputOption = OutputOption.text,
     include_tracing: bool = False,
+    live_tail: bool = False,
 ) -> ObservabilityPuller:
     """
     This function will generate generic puller which can be used to
@@ -71,6 +73,8 @@ def generate_puller(
         between (default) text consumer or json consumer
     include_tracing: bool
         A flag to include the xray traces log or not
+    live_tail: bool
+        A flag to tail the CloudWatch log groups with Live Tail sessions instead of polling them
 
     Returns
     -------
@@ -79,6 +83,7 @@ def generate_puller(
     if additional_cw_log_groups is None:
         additional_cw_log_groups = []
     pullers: List[ObservabilityPuller] = []
+    cw_log_pullers: List[CWLogPuller] = []
 
     # populate all puller instances for given resources
     for resource_information in resource_information_list:
@@ -92,7 +97,7 @@ def generate_puller(
             continue
 
         consumer = generate_consumer(filter_pattern, output, resource_information.logical_resource_id)
-        pullers.append(
+        cw_log_pullers.append(
             CWLogPuller(
                 boto_client_provider("logs"),
                 consumer,
@@ -106,7 +111,7 @@ def generate_puller(
         consumer = generate_consumer(filter_pattern, output)
         logs_client = boto_client_provider("logs")
         _validate_cw_log_group_name(cw_log_group, logs_client)
-        pullers.append(
+        cw_log_pullers.append(
             CWLogPuller(
                 logs_client,
                 consumer,
@@ -114,6 +119,12 @@ def generate_puller(
             )
         )
 
+    # pull all the log groups together, so that their events are shown in order and tailed through a few sessions
+    if cw_log_pullers:
+        pullers.append(
+            CWLogGroupsPuller(boto_client_provider("logs"), boto_client_provider("sts"), cw_log_pullers, live_tail)
+        )
+
     # if tracing flag is set, add the xray traces puller to fetch debug traces
     if include_tracing:
         trace_puller = generate_trace_puller(boto_client_provider("xray"), output)
@@ -15,9 +15,11 @@ from samcli.commands._utils.options import (
     kms_key_id_option,
     metadata_option,
     no_progressbar_option,
+    package_jobs_option,
     resolve_s3_option,
     s3_bucket_option,
     s3_prefix_option,
+    s3_transfer_options,
     signing_profiles_option,
     template_click_option,
     use_json_option,
@@ -89,6 +91,8 @@ DESCRIPTION = """
 @metadata_option
 @signing_profiles_option
 @no_progressbar_option
+@s3_transfer_options
+@package_jobs_option
 @common_options
 @aws_creds_options
 @save_params_option
@@ -115,6 +119,10 @@ def cli(
     metadata,
     signing_profiles,
     resolve_s3,
+    s3_max_concurrency,
+    s3_multipart_threshold,
+    s3_multipart_chunksize,
+    package_jobs,
     save_params,
     config_file,
     config_env,
@@ -140,6 +148,10 @@ def cli(
         ctx.region,
         ctx.profile,
         resolve_s3,
+        s3_max_concurrency,
+        s3_multipart_threshold,
+        s3_multipart_chunksize,
+        package_jobs,
     )  # pragma: no cover
 
 
@@ -159,12 +171,19 @@ def do_cli(
     region,
     profile,
     resolve_s3,
+    s3_max_concurrency,
+    s3_multipart_threshold,
+    s3_multipart_chunksize,
+    package_jobs,
 ):
     """
     Implementation of the ``cli`` method
     """
 
     from samcli.commands.package.package_context import PackageContext
+    from samcli.lib.package.s3_transfer import configure_s3_transfer
+
+    s3_transfer = configure_s3_transfer(s3_max_concurrency, s3_multipart_threshold, s3_multipart_chunksize)
 
     if resolve_s3:
         s3_bucket = manage_stack(profile=profile, region=region)
@@ -172,7 +191,7 @@ def do_cli(
         click.echo("\t\tA different default S3 bucket can be set in samconfig.toml")
         click.echo("\t\tOr by specifying --s3-bucket explicitly.")
 
-    with PackageContext(
+    with s3_transfer, PackageContext(
         template_file=template_file,
         s3_bucket=s3_bucket,
         image_repository=image_repository,
@@ -187,5 +206,6 @@ def do_cli(
         region=region,
         profile=profile,
         signing_profiles=signing_profiles,
+        parallel_jobs=package_jobs,
     ) as package_context:
         package_context.run()
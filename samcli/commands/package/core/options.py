@@ -23,6 +23,10 @@ INFRASTRUCTURE_OPTION_NAMES: List[str] = [
 
 DEPLOYMENT_OPTIONS: List[str] = [
     "force_upload",
+    "s3_max_concurrency",
+    "s3_multipart_threshold",
+    "s3_multipart_chunksize",
+    "package_jobs",
 ]
 
 CONFIGURATION_OPTION_NAMES: List[str] = ["config_env", "config_file"] + SAVE_PARAMS_OPTIONS
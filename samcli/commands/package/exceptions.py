@@ -5,6 +5,12 @@ Exceptions that are raised by sam package
 from samcli.commands.exceptions import UserException
 
 
+class InvalidPackageJobsError(UserException):
+    def __init__(self, package_jobs):
+        self.package_jobs = package_jobs
+        super().__init__(message=f"Package jobs must be at least 1, got {package_jobs}")
+
+
 class InvalidLocalPathError(UserException):
     def __init__(self, resource_id, property_name, local_path):
         self.resource_id = resource_id
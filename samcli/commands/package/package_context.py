@@ -23,17 +23,21 @@ import boto3
 import click
 import docker
 
-from samcli.commands.package.exceptions import PackageFailedError
+from samcli.commands._utils.constants import DEFAULT_CACHE_DIR
+from samcli.commands.package.exceptions import InvalidPackageJobsError, PackageFailedError
 from samcli.lib.constants import DOCKER_MIN_API_VERSION
 from samcli.lib.intrinsic_resolver.intrinsics_symbol_table import IntrinsicsSymbolTable
 from samcli.lib.package.artifact_exporter import Template
 from samcli.lib.package.code_signer import CodeSigner
 from samcli.lib.package.ecr_uploader import ECRUploader
+from samcli.lib.package.export_executor import DEFAULT_EXPORT_JOBS, ExportExecutor
 from samcli.lib.package.s3_uploader import S3Uploader
+from samcli.lib.package.upload_manifest import UPLOAD_MANIFEST_FILE_NAME, UploadManifest
 from samcli.lib.package.uploaders import Uploaders
 from samcli.lib.providers.provider import ResourceIdentifier, Stack, get_resource_full_path_by_id
 from samcli.lib.providers.sam_stack_provider import SamLocalStackProvider
 from samcli.lib.utils.boto_utils import get_boto_config_with_user_agent
+from samcli.lib.utils.hash import FILE_CHECKSUM_CACHE_FILE_NAME, FileChecksumCache
 from samcli.lib.utils.preview_runtimes import PREVIEW_RUNTIMES
 from samcli.lib.utils.resources import AWS_LAMBDA_FUNCTION, AWS_SERVERLESS_FUNCTION
 from samcli.yamlhelper import yaml_dump
@@ -73,6 +77,7 @@ class PackageContext:
         parameter_overrides=None,
         on_deploy=False,
         signing_profiles=None,
+        parallel_jobs=None,
     ):
         self.template_file = template_file
         self.s3_bucket = s3_bucket
@@ -91,6 +96,10 @@ class PackageContext:
         self.code_signer = None
         self.signing_profiles = signing_profiles
         self.parameter_overrides = parameter_overrides
+        if parallel_jobs is not None and parallel_jobs < 1:
+            raise InvalidPackageJobsError(parallel_jobs)
+        # maximum number of artifacts, and of nested stacks, exported at the same time
+        self.parallel_jobs = parallel_jobs or DEFAULT_EXPORT_JOBS
         self._global_parameter_overrides = {IntrinsicsSymbolTable.AWS_REGION: region} if region else {}
 
     def __enter__(self):
@@ -126,8 +135,18 @@ class PackageContext:
 
         docker_client = docker.from_env(version=DOCKER_MIN_API_VERSION)
 
+        upload_manifest = UploadManifest(os.path.join(DEFAULT_CACHE_DIR, UPLOAD_MANIFEST_FILE_NAME))
+        checksum_cache = FileChecksumCache(os.path.join(DEFAULT_CACHE_DIR, FILE_CHECKSUM_CACHE_FILE_NAME))
         s3_uploader = S3Uploader(
-            s3_client, self.s3_bucket, self.s3_prefix, self.kms_key_id, self.force_upload, self.no_progressbar
+            s3_client,
+            self.s3_bucket,
+            self.s3_prefix,
+            self.kms_key_id,
+            self.force_upload,
+            self.no_progressbar,
+            upload_manifest=upload_manifest,
+            checksum_cache=checksum_cache,
+            parallel_uploads=self.parallel_jobs > 1,
         )
         # attach the given metadata to the artifacts to be uploaded
         s3_uploader.artifact_metadata = self.metadata
@@ -153,17 +172,23 @@ class PackageContext:
                 click.echo(msg)
         except OSError as ex:
             raise PackageFailedError(template_file=self.template_file, ex=str(ex)) from ex
+        finally:
+            # the artifacts uploaded before a failure are still recorded, they do not need to be uploaded again
+            upload_manifest.save()
+            checksum_cache.save()
 
     def _export(self, template_path, use_json):
-        template = Template(
-            template_path,
-            os.getcwd(),
-            self.uploaders,
-            self.code_signer,
-            normalize_template=True,
-            normalize_parameters=True,
-        )
-        exported_template = template.export()
+        with ExportExecutor(self.parallel_jobs) as export_executor:
+            template = Template(
+                template_path,
+                os.getcwd(),
+                self.uploaders,
+                self.code_signer,
+                normalize_template=True,
+                normalize_parameters=True,
+                export_executor=export_executor,
+            )
+            exported_template = template.export()
 
         if use_json:
             exported_str = json.dumps(exported_template, indent=4, ensure_ascii=False)
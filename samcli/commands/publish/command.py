@@ -3,7 +3,6 @@
 import json
 import logging
 
-import boto3
 import click
 
 from samcli.cli.cli_config_file import ConfigProvider, configuration_option, save_params_option
@@ -13,9 +12,12 @@ from samcli.commands._utils.command_exception_handler import command_exception_h
 from samcli.commands._utils.options import template_common_option
 from samcli.commands._utils.template import TemplateFailedParsingException, TemplateNotFoundException, get_template_data
 from samcli.lib.telemetry.metric import track_command
+from samcli.lib.utils.lazy_import import lazy_import
 from samcli.lib.utils.version_checker import check_newer_version
 from samcli.vendor.serverlessrepo.publish import CREATE_APPLICATION
 
+boto3 = lazy_import("boto3")
+
 LOG = logging.getLogger(__name__)
 
 SAM_PUBLISH_DOC = "https://docs.aws.amazon.com/serverless-application-model/latest/developerguide/serverless-sam-template-publishing-applications.html"  # pylint: disable=line-too-long # noqa
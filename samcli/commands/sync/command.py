@@ -31,15 +31,18 @@ from samcli.commands._utils.options import (
     kms_key_id_option,
     metadata_option,
     notification_arns_option,
+    package_jobs_option,
     parameter_override_option,
     role_arn_option,
     s3_bucket_option,
     s3_prefix_option,
+    s3_transfer_options,
     stack_name_option,
     tags_option,
     template_option_without_build,
     use_container_build_option,
     watch_exclude_option,
+    watch_quiet_window_option,
 )
 from samcli.commands.build.click_container import ContainerOptions
 from samcli.commands.build.command import _get_mode_value_from_envvar
@@ -57,7 +60,7 @@ from samcli.lib.providers.sam_stack_provider import SamLocalStackProvider
 from samcli.lib.sync.infra_sync_executor import InfraSyncExecutor, InfraSyncResult
 from samcli.lib.sync.sync_flow_executor import SyncFlowExecutor
 from samcli.lib.sync.sync_flow_factory import SyncCodeResources, SyncFlowFactory
-from samcli.lib.sync.watch_manager import WatchManager
+from samcli.lib.sync.watch_manager import DEFAULT_WAIT_TIME, WatchManager
 from samcli.lib.telemetry.event import EventTracker, track_long_event
 from samcli.lib.telemetry.metric import track_command, track_template_warnings
 from samcli.lib.utils.colors import Colored
@@ -161,6 +164,7 @@ DEFAULT_CAPABILITIES = ("CAPABILITY_NAMED_IAM", "CAPABILITY_AUTO_EXPAND")
 )
 @container_env_var_file_option(cls=ContainerOptions)
 @watch_exclude_option
+@watch_quiet_window_option
 @stack_name_option(required=True)  # pylint: disable=E1120
 @base_dir_option
 @use_container_build_option
@@ -170,6 +174,8 @@ DEFAULT_CAPABILITIES = ("CAPABILITY_NAMED_IAM", "CAPABILITY_AUTO_EXPAND")
 @image_repositories_option
 @s3_bucket_option(disable_callback=True)  # pylint: disable=E1120
 @s3_prefix_option
+@s3_transfer_options
+@package_jobs_option
 @kms_key_id_option
 @role_arn_option
 @parameter_override_option
@@ -219,6 +225,11 @@ def cli(
     build_image: Optional[Tuple[str]],
     build_in_source: Optional[bool],
     watch_exclude: Optional[Dict[str, List[str]]],
+    watch_quiet_window: int,
+    s3_max_concurrency: Optional[int],
+    s3_multipart_threshold: Optional[int],
+    s3_multipart_chunksize: Optional[int],
+    package_jobs: Optional[int],
 ) -> None:
     """
     `sam sync` command entry point
@@ -257,6 +268,11 @@ def cli(
         config_env,
         build_in_source,
         watch_exclude,
+        watch_quiet_window,
+        s3_max_concurrency,
+        s3_multipart_threshold,
+        s3_multipart_chunksize,
+        package_jobs,
     )  # pragma: no cover
 
 
@@ -291,6 +307,11 @@ def do_cli(
     config_env: str,
     build_in_source: Optional[bool],
     watch_exclude: Optional[Dict[str, List[str]]],
+    watch_quiet_window: int,
+    s3_max_concurrency: Optional[int],
+    s3_multipart_threshold: Optional[int],
+    s3_multipart_chunksize: Optional[int],
+    package_jobs: Optional[int],
 ) -> None:
     """
     Implementation of the ``cli`` method
@@ -299,8 +320,11 @@ def do_cli(
     from samcli.commands.build.build_context import BuildContext
     from samcli.commands.deploy.deploy_context import DeployContext
     from samcli.commands.package.package_context import PackageContext
+    from samcli.lib.package.s3_transfer import configure_s3_transfer
     from samcli.lib.utils import osutils
 
+    s3_transfer = configure_s3_transfer(s3_max_concurrency, s3_multipart_threshold, s3_multipart_chunksize)
+
     global_config = GlobalConfig()
     if not global_config.is_accelerate_opt_in_stack(template_file, stack_name):
         if not click.confirm(Colored().yellow(SYNC_INFO_TEXT + SYNC_CONFIRMATION_TEXT), default=True):
@@ -328,7 +352,7 @@ def do_cli(
 
     processed_build_images = process_image_options(build_image)
 
-    with BuildContext(
+    with s3_transfer, BuildContext(
         resource_identifier=None,
         template_file=template_file,
         base_dir=base_dir,
@@ -365,6 +389,7 @@ def do_cli(
                 profile=profile,
                 use_json=False,
                 force_upload=True,
+                parallel_jobs=package_jobs,
             ) as package_context:
                 # 500ms of sleep time between stack checks and describe stack events.
                 DEFAULT_POLL_DELAY = 0.5
@@ -417,6 +442,7 @@ def do_cli(
                                 auto_dependency_layer=dependency_layer,
                                 disable_infra_syncs=code,
                                 watch_exclude=watch_excludes_filter,
+                                watch_quiet_window=watch_quiet_window / 1000,
                             )
                         elif code:
                             execute_code_sync(
@@ -536,6 +562,7 @@ def execute_watch(
     auto_dependency_layer: bool,
     disable_infra_syncs: bool,
     watch_exclude: Dict[str, List[str]],
+    watch_quiet_window: float = DEFAULT_WAIT_TIME,
 ):
     """Start sync watch execution
 
@@ -555,6 +582,8 @@ def execute_watch(
         Boolean flag to whether enable certain sync flows for auto dependency layer feature.
     disable_infra_syncs: bool
         Boolean flag to determine if sam sync only executes code syncs.
+    watch_quiet_window: float
+        Number of seconds without file changes on a resource before it gets synced.
     """
     # Note: disable_infra_syncs  is different from skip_deploy_sync,
     # disable_infra_syncs completely disables infra syncs and
@@ -568,6 +597,7 @@ def execute_watch(
         auto_dependency_layer,
         disable_infra_syncs,
         watch_exclude,
+        watch_quiet_window,
     )
     watch_manager.start()
 
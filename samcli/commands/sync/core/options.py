@@ -27,6 +27,10 @@ INFRASTRUCTURE_OPTION_NAMES: List[str] = [
     "tags",
     "metadata",
     "build_image",
+    "s3_max_concurrency",
+    "s3_multipart_threshold",
+    "s3_multipart_chunksize",
+    "package_jobs",
 ]
 
 CONFIGURATION_OPTION_NAMES: List[str] = ["config_env", "config_file"] + SAVE_PARAMS_OPTIONS
@@ -42,6 +46,7 @@ ADDITIONAL_OPTIONS: List[str] = [
     "base_dir",
     "build_in_source",
     "watch_exclude",
+    "watch_quiet_window",
 ]
 OTHER_OPTIONS: List[str] = ["debug", "help"]
 
@@ -6,10 +6,7 @@ import logging
 import os
 from dataclasses import dataclass
 
-import boto3
 import click
-from botocore.exceptions import NoCredentialsError
-from samtranslator.translator.arn_generator import NoRegionFound
 
 from samcli.cli.cli_config_file import ConfigProvider, configuration_option, save_params_option
 from samcli.cli.context import Context
@@ -74,6 +71,9 @@ def do_cli(ctx, template, lint):
     """
     Implementation of the ``cli`` method, just separated out for unit testing purposes
     """
+    import boto3
+    from botocore.exceptions import NoCredentialsError
+    from samtranslator.translator.arn_generator import NoRegionFound
     from samtranslator.translator.managed_policy_translator import ManagedPolicyLoader
 
     from samcli.commands.exceptions import UserException
@@ -10,6 +10,10 @@ It consists of 5 steps:
 5. parse the output to locate the built artifact, and move it to the SAM CLI 
 build artifact directory (find_and_copy_assets)
 
+With --batch, when sam build builds all the functions, steps 1 to 4 run once for all
+the SAM CLI Metadata resources listed next to this script, and their output is shared
+by the builds of all the functions until the prepare hook runs again (load_batch_output).
+
 Note: This script intentionally does not use Python3 specific syntax.
 
 """
@@ -42,6 +46,7 @@ Note: This script intentionally does not use Python3 specific syntax.
 # pylint: skip-file
 
 import argparse
+import errno
 import json
 import logging
 import os
@@ -49,6 +54,7 @@ import re
 import shutil
 import subprocess
 import sys
+import time
 import zipfile
 
 from zip import unzip  # type: ignore
@@ -66,6 +72,16 @@ TF_ENVIRONMENT_VARIABLES = [
     "TF_CLI_ARGS_plan",
     "TF_CLI_ARGS_apply",
 ]
+TF_BATCH_TARGETS_FILENAME = "sam_metadata_targets.json"
+TF_BATCH_OUTPUT_FILENAME = "sam_metadata_batch_output.json"
+TF_BATCH_LOCK_FILENAME = "sam_metadata_batch.lock"
+# Set to 0 to apply the SAM CLI Metadata resource of each function separately
+TF_BATCH_BUILD_ENV_VAR = "SAM_CLI_TERRAFORM_BATCH_BUILD"
+# Set to 1 by sam build when it builds all the resources, and to 0 when it builds a single one
+HOOK_BUILD_ALL_RESOURCES_ENV_VAR = "SAM_CLI_HOOK_BUILD_ALL_RESOURCES"
+BATCH_LOCK_POLL_INTERVAL = 0.5
+# A lock older than this is left by a build which did not finish, and is removed
+BATCH_LOCK_STALE_AGE = 3600
 
 
 class ResolverException(Exception):
@@ -286,6 +302,175 @@ def create_backend_override():
         cli_exit()
 
 
+def apply_targets(targets):
+    """
+    Applies the given SAM CLI Metadata resources with the temporary TF backend, and returns the output of
+    `terraform show`.
+
+    Parameters:
+    -----------
+    targets: list
+        Terraform resource paths of the SAM CLI Metadata resources
+    """
+    LOG.info("Create TF backend override")
+    create_backend_override()
+
+    LOG.info("Running `terraform init` with backend override")
+    subprocess.check_call(["terraform", "init", "-reconfigure", "-input=false", "-force-copy"])
+
+    LOG.info("Running `terraform apply` on the targets %s", targets)
+    apply_command = ["terraform", "apply"]
+    for target in targets:
+        apply_command.extend(["-target", target, "-replace", target])
+    apply_command.append("-auto-approve")
+    subprocess.check_call(apply_command)
+
+    LOG.info("Generating terraform output")
+    return subprocess.check_output(["terraform", "show", "-json"])
+
+
+def read_json_file(path):
+    """
+    Returns the content of the given json file, or None if it does not exist or can not be parsed
+    """
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (IOError, OSError, ValueError):
+        return None
+
+
+def write_json_file(path, content):
+    with open(path, "w") as f:
+        json.dump(content, f)
+
+
+def select_targets_output(data_object, targets):
+    """
+    Returns the part of the `terraform show` output which locates the built artifacts of the given targets: the
+    modules containing the targets, and the address and built output path of each target. The expressions of the
+    targets resolve the same against it as against the whole output.
+
+    Parameters:
+    -----------
+    data_object: dict
+        the parsed output of `terraform show`
+    targets: list
+        Terraform resource paths of the SAM CLI Metadata resources
+    """
+
+    def select_module(module):
+        selected = {}
+        resources = []
+        for resource in module.get("resources") or []:
+            if resource.get("address") not in targets:
+                continue
+            triggers = (resource.get("values") or {}).get("triggers") or {}
+            selected_triggers = {}
+            if "built_output_path" in triggers:
+                selected_triggers["built_output_path"] = triggers["built_output_path"]
+            resources.append({"address": resource.get("address"), "values": {"triggers": selected_triggers}})
+        child_modules = [child for child in map(select_module, module.get("child_modules") or []) if child]
+        if resources:
+            selected["resources"] = resources
+        if child_modules:
+            selected["child_modules"] = child_modules
+        if selected and "address" in module:
+            selected["address"] = module["address"]
+        return selected
+
+    root_module = (data_object.get("values") or {}).get("root_module") or {}
+    return {"values": {"root_module": select_module(root_module)}}
+
+
+def acquire_batch_lock(lock_path):
+    """
+    Waits until no other build is applying the SAM CLI Metadata resources, and takes the lock.
+    The functions are built by separate processes which may run in parallel.
+    """
+    while True:
+        try:
+            lock_file = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            os.write(lock_file, str(os.getpid()).encode("utf-8"))
+            os.close(lock_file)
+            return
+        except OSError as ex:
+            if ex.errno != errno.EEXIST:
+                raise
+        try:
+            if time.time() - os.path.getmtime(lock_path) > BATCH_LOCK_STALE_AGE:
+                LOG.info("Removing the stale lock %s", lock_path)
+                os.remove(lock_path)
+                continue
+        except OSError:
+            # released in the meantime
+            continue
+        time.sleep(BATCH_LOCK_POLL_INTERVAL)
+
+
+def release_batch_lock(lock_path):
+    try:
+        os.remove(lock_path)
+    except OSError:
+        pass
+
+
+def load_batch_output(target):
+    """
+    Returns the output of `terraform show` after applying all the SAM CLI Metadata resources of the application.
+
+    The first build applies all the resources listed by the prepare hook in one `terraform apply`, and stores the
+    part of the output which locates their built artifacts next to this script, so that the builds of the other
+    functions only read it. The prepare hook removes
+    the stored output, so the resources are applied again by the next build. If applying all the resources fails,
+    the failure is stored as well, and the build of each function applies its own resource instead.
+
+    Parameters:
+    -----------
+    target: str
+        Terraform resource path of the SAM CLI Metadata resource of the function being built
+    """
+    metadata_directory = os.path.dirname(os.path.realpath(__file__))
+    output_path = os.path.join(metadata_directory, TF_BATCH_OUTPUT_FILENAME)
+    lock_path = os.path.join(metadata_directory, TF_BATCH_LOCK_FILENAME)
+
+    acquire_batch_lock(lock_path)
+    try:
+        batch_output = read_json_file(output_path)
+        if not isinstance(batch_output, dict) or target not in batch_output.get("targets", []):
+            targets = read_json_file(os.path.join(metadata_directory, TF_BATCH_TARGETS_FILENAME))
+            if not isinstance(targets, list):
+                targets = []
+            if target not in targets:
+                targets.append(target)
+            try:
+                terraform_out = apply_targets(targets)
+            except subprocess.CalledProcessError as ex:
+                LOG.error("Applying the SAM CLI Metadata resources %s together failed: %s", ", ".join(targets), ex)
+                # do not apply all the resources again for each of the remaining functions
+                batch_output = {"targets": targets, "failed": True}
+            else:
+                try:
+                    data_object = json.loads(terraform_out)
+                except ValueError:
+                    LOG.error("Parsing JSON from terraform out unsuccessful!", exc_info=True)
+                    cli_exit()
+                # the whole output contains every resource of the application, keep only what the builds look up
+                batch_output = {"targets": targets, "terraform_out": select_targets_output(data_object, targets)}
+            write_json_file(output_path, batch_output)
+        else:
+            LOG.info("Using the terraform output of the targets applied by a previous build")
+
+        if batch_output.get("failed"):
+            # still holding the lock, so that the functions do not run terraform at the same time
+            LOG.warning("Applying the SAM CLI Metadata resource %s alone", target)
+            return apply_targets([target])
+    finally:
+        release_batch_lock(lock_path)
+
+    return json.dumps(batch_output["terraform_out"])
+
+
 def validate_environment_variables():
     """
     Validate that the Terraform environment variables do not contain blocked arguments.
@@ -342,12 +527,23 @@ if __name__ == "__main__":
         required=False,
         help="Terraform output json body. This option is not to be used with --target.",
     )
+    argparser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Apply all the SAM CLI Metadata resources of the application with the --target one, and reuse "
+        "the output for the other targets, when sam build builds all the resources. Only used with --target.",
+    )
 
     arguments = argparser.parse_args()
     directory_path = os.path.abspath(arguments.directory)
     expression = arguments.expression
     target = arguments.target
     json_str = arguments.json
+    batch = (
+        arguments.batch
+        and os.environ.get(HOOK_BUILD_ALL_RESOURCES_ENV_VAR) == "1"
+        and os.environ.get(TF_BATCH_BUILD_ENV_VAR) != "0"
+    )
 
     # validate environment variables do not contain blocked arguments
     validate_environment_variables()
@@ -360,18 +556,10 @@ if __name__ == "__main__":
         LOG.error("One of --target and --json must be provided.")
         cli_exit()
 
-    if target:
-        LOG.info("Create TF backend override")
-        create_backend_override()
-
-        LOG.info("Running `terraform init` with backend override")
-        subprocess.check_call(["terraform", "init", "-reconfigure", "-input=false", "-force-copy"])
-
-        LOG.info("Running `terraform apply` on the target '%s'", target)
-        subprocess.check_call(["terraform", "apply", "-target", target, "-replace", target, "-auto-approve"])
-
-        LOG.info("Generating terraform output")
-        terraform_out = subprocess.check_output(["terraform", "show", "-json"])
+    if target and batch:
+        terraform_out = load_batch_output(target)
+    elif target:
+        terraform_out = apply_targets([target])
 
     if json_str:
         terraform_out = json_str
@@ -82,6 +82,7 @@ def enrich_resources_and_generate_makefile(
     }
 
     makefile_rules = []
+    batch_targets: List[str] = []
     for sam_metadata_resource in sam_metadata_resources:
         # enrich resource
         resource_type = get_sam_metadata_planned_resource_value_attribute(
@@ -114,10 +115,12 @@ def enrich_resources_and_generate_makefile(
                 sam_metadata_resource, logical_id, terraform_application_dir, python_command_name, output_directory_path
             )
             makefile_rules.append(makefile_rule)
+            if sam_metadata_resource_address and sam_metadata_resource_address not in batch_targets:
+                batch_targets.append(sam_metadata_resource_address)
 
     # generate makefile
     LOG.debug("Generate Makefile in %s", output_directory_path)
-    generate_makefile(makefile_rules, output_directory_path)
+    generate_makefile(makefile_rules, output_directory_path, batch_targets)
 
 
 def _enrich_zip_lambda_function(
@@ -12,6 +12,8 @@ from subprocess import CalledProcessError, run
 from typing import Any, Dict
 
 from samcli.hook_packages.terraform.hooks.prepare.constants import CFN_CODE_PROPERTIES
+from samcli.hook_packages.terraform.hooks.prepare.makefile_generator import remove_batch_build_output
+from samcli.hook_packages.terraform.hooks.prepare.prepare_cache import PREPARE_CACHE_ENV_VAR, PrepareCache
 from samcli.hook_packages.terraform.hooks.prepare.translate import translate_to_cfn
 from samcli.lib.hook.exceptions import (
     PrepareHookException,
@@ -98,10 +100,25 @@ def prepare(params: dict) -> dict:
 
     plan_file = params.get("PlanFile")
 
+    # the functions built after this command must not reuse the terraform output of the previous build
+    remove_batch_build_output(output_dir_path)
+
+    prepare_cache = PrepareCache(output_dir_path, terraform_application_dir, project_root_dir, plan_file)
+
     if skip_prepare_infra and os.path.exists(metadata_file_path):
         LOG.info("Skipping preparation stage, the metadata file already exists at %s", metadata_file_path)
+    elif prepare_cache.is_current(metadata_file_path):
+        LOG.info(
+            "Skipping preparation stage, the Terraform application did not change since the metadata file was "
+            "generated at %s. The state of remote backends, the values read by data sources and the files read by the "
+            "configuration are not checked, set %s=0 to prepare the application again.",
+            metadata_file_path,
+            PREPARE_CACHE_ENV_VAR,
+        )
     else:
         try:
+            prepare_cache.invalidate()
+
             # initialize terraform application
             if not plan_file:
                 tf_json = _generate_plan_file(skip_prepare_infra, terraform_application_dir)
@@ -129,6 +146,7 @@ def prepare(params: dict) -> dict:
             LOG.info("Finished generating metadata file. Storing in %s", metadata_file_path)
             with open(metadata_file_path, "w+") as metadata_file:
                 json.dump(cfn_dict, metadata_file)
+            prepare_cache.store()
 
         except OSError as e:
             raise PrepareHookException(f"OSError: {e}") from e
@@ -4,9 +4,11 @@ Terraform Makefile and make rule generation
 This module generates the Makefile for the project and the rules for each of the Lambda functions found
 """
 
+import json
 import logging
 import os
 import shutil
+import time
 import uuid
 from pathlib import Path
 from typing import List, Optional
@@ -21,6 +23,12 @@ LOG = logging.getLogger(__name__)
 TERRAFORM_BUILD_SCRIPT = "copy_terraform_built_artifacts.py"
 ZIP_UTILS_MODULE = "zip.py"
 TF_BACKEND_OVERRIDE_FILENAME = "z_samcli_backend_override"
+# the sam metadata resources applied together by the first function build, see copy_terraform_built_artifacts.py
+TF_BATCH_TARGETS_FILENAME = "sam_metadata_targets.json"
+TF_BATCH_OUTPUT_FILENAME = "sam_metadata_batch_output.json"
+TF_BATCH_LOCK_FILENAME = "sam_metadata_batch.lock"
+# A lock older than this is left by a build which did not finish
+TF_BATCH_LOCK_STALE_AGE = 3600
 
 
 def generate_makefile_rule_for_lambda_resource(
@@ -65,6 +73,7 @@ def generate_makefile_rule_for_lambda_resource(
 def generate_makefile(
     makefile_rules: List[str],
     output_directory_path: str,
+    batch_targets: Optional[List[str]] = None,
 ) -> None:
     """
     Generates a makefile with the given rules in the given directory
@@ -75,6 +84,8 @@ def generate_makefile(
         the list of rules to write in the Makefile
     output_directory_path: str
         the output directory path to write the generated makefile
+    batch_targets: Optional[List[str]]
+        the addresses of the sam metadata resources applied in one terraform run by the first function build
     """
 
     # create output directory if it doesn't exist
@@ -101,6 +112,36 @@ def generate_makefile(
     with open(makefile_path, "w+") as makefile:
         makefile.writelines(makefile_rules)
 
+    if batch_targets is not None:
+        batch_targets_path = os.path.join(output_directory_path, TF_BATCH_TARGETS_FILENAME)
+        with open(batch_targets_path, "w+") as batch_targets_file:
+            json.dump(batch_targets, batch_targets_file)
+
+
+def remove_batch_build_output(output_directory_path: str) -> None:
+    """
+    Removes the terraform output stored by the previous build of the functions, so that the next build applies the
+    sam metadata resources again. The lock of the build is only removed if it is stale, a recent one is held by a
+    build which is still running.
+
+    Parameters
+    ----------
+    output_directory_path: str
+        the output directory path of the generated makefile
+    """
+    try:
+        os.remove(os.path.join(output_directory_path, TF_BATCH_OUTPUT_FILENAME))
+    except FileNotFoundError:
+        pass
+
+    lock_path = os.path.join(output_directory_path, TF_BATCH_LOCK_FILENAME)
+    try:
+        if time.time() - os.path.getmtime(lock_path) > TF_BATCH_LOCK_STALE_AGE:
+            LOG.debug("Removing the stale lock %s", lock_path)
+            os.remove(lock_path)
+    except FileNotFoundError:
+        pass
+
 
 def _generate_backend_override_file(output_directory_path: str):
     """
@@ -149,7 +190,7 @@ def _build_makerule_python_command(
     """
     show_command_template = (
         '{python_command_name} "{terraform_built_artifacts_script_path}" '
-        '--expression "{jpath_string}" --directory "$(ARTIFACTS_DIR)" --target "{resource_address}"'
+        '--expression "{jpath_string}" --directory "$(ARTIFACTS_DIR)" --target "{resource_address}" --batch'
     )
     jpath_string = _build_jpath_string(sam_metadata_resource, resource_address)
     terraform_built_artifacts_script_path = convert_path_to_unix_path(
@@ -0,0 +1,248 @@
+"""
+Reuse of the metadata file and Makefile generated by a previous run of the prepare hook
+
+When it is enabled, the prepare hook fingerprints the Terraform files the generated files depend on, and skips the
+terraform plan and the translation when the fingerprint did not change since the files were generated.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from subprocess import CalledProcessError, run
+from typing import Dict, List, Optional
+
+from samcli import __version__ as samcli_version
+
+LOG = logging.getLogger(__name__)
+
+PREPARE_FINGERPRINT_FILENAME = "prepare_fingerprint.json"
+# Set to 1 to reuse the generated files while the Terraform application does not change. It is disabled by default,
+# the files read by the configuration, like the ones loaded with file() or templatefile(), are not fingerprinted.
+PREPARE_CACHE_ENV_VAR = "SAM_CLI_TERRAFORM_PREPARE_CACHE"
+
+TF_CONFIGURATION_SUFFIXES = (".tf", ".tf.json")
+TF_VARIABLES_SUFFIXES = (".tfvars", ".tfvars.json")
+# files of the root module directory which change the plan, besides the configuration and the variables
+TF_STATE_FILES = [
+    ".terraform.lock.hcl",
+    os.path.join(".terraform", "modules", "modules.json"),
+    os.path.join(".terraform", "environment"),
+    os.path.join(".terraform", "terraform.tfstate"),
+]
+# default locations of the state of the local backend, which is used when no backend is configured
+TF_DEFAULT_LOCAL_STATE_FILE = "terraform.tfstate"
+TF_DEFAULT_LOCAL_WORKSPACE_DIR = "terraform.tfstate.d"
+TF_DEFAULT_WORKSPACE = "default"
+# environment variables, besides the TF_ ones, which change the plan
+PLAN_ENVIRONMENT_VARIABLES = ["AWS_PROFILE", "AWS_REGION", "AWS_DEFAULT_REGION"]
+
+
+class PrepareCache:
+    """
+    Fingerprint of the inputs of the prepare hook, stored next to the files it generated.
+
+    When the hook generates the metadata file from a Terraform plan, the fingerprint covers the configuration files
+    of the root module and of every module installed by `terraform init`, the variable files of the root module, the
+    lock file, the selected workspace and backend, the state of the local backend, the Terraform environment variables
+    and the Terraform version. The state of remote backends, the values read by data sources and the files read by
+    functions like file() or templatefile() are not covered, so the cache is only used when it is enabled explicitly.
+    When a plan file is provided, it covers the plan file only.
+    """
+
+    def __init__(
+        self,
+        output_dir_path: str,
+        terraform_application_dir: str,
+        project_root_dir: str,
+        plan_file: Optional[str] = None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        output_dir_path: str
+            The directory where the metadata file and the Makefile are generated
+        terraform_application_dir: str
+            The terraform configuration root module directory
+        project_root_dir: str
+            The project root directory where terraform configurations, src code, and other modules exist
+        plan_file: Optional[str]
+            The plan file provided by the customer, if any
+        """
+        self._fingerprint_path = Path(output_dir_path, PREPARE_FINGERPRINT_FILENAME)
+        self._terraform_application_dir = terraform_application_dir
+        self._project_root_dir = project_root_dir
+        self._plan_file = plan_file
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return os.environ.get(PREPARE_CACHE_ENV_VAR) == "1"
+
+    def is_current(self, metadata_file_path: str) -> bool:
+        """
+        Returns True if the metadata file was generated from the same inputs as the current ones
+        """
+        if not self.is_enabled() or not os.path.exists(metadata_file_path):
+            return False
+        try:
+            stored = json.loads(self._fingerprint_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return False
+        fingerprint = self.fingerprint()
+        return bool(fingerprint) and isinstance(stored, dict) and stored.get("fingerprint") == fingerprint
+
+    def invalidate(self) -> None:
+        """
+        Removes the stored fingerprint, so that files left by a failed run are not reused
+        """
+        try:
+            self._fingerprint_path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def store(self) -> None:
+        """
+        Stores the fingerprint of the inputs the files were generated from
+        """
+        if not self.is_enabled():
+            return
+        fingerprint = self.fingerprint()
+        if not fingerprint:
+            return
+        try:
+            self._fingerprint_path.write_text(json.dumps({"fingerprint": fingerprint}), encoding="utf-8")
+        except OSError as ex:
+            LOG.debug("Failed to store the fingerprint of the Terraform application", exc_info=ex)
+
+    def fingerprint(self) -> Optional[str]:
+        """
+        Returns the fingerprint of the inputs of the prepare hook, or None if they can not be fingerprinted
+        """
+        inputs: Dict = {
+            "samcli_version": samcli_version,
+            "terraform_application_dir": self._terraform_application_dir,
+            "project_root_dir": self._project_root_dir,
+        }
+        if self._plan_file:
+            inputs["plan_file"] = _hash_file(Path(self._plan_file))
+        else:
+            terraform_version = self._get_terraform_version()
+            if terraform_version is None:
+                return None
+            inputs["terraform_version"] = terraform_version
+            inputs["files"] = {
+                str(path): _hash_file(Path(self._terraform_application_dir, path)) for path in self._get_input_files()
+            }
+            inputs["environment"] = {
+                name: value
+                for name, value in os.environ.items()
+                if name.startswith("TF_") or name in PLAN_ENVIRONMENT_VARIABLES
+            }
+        content = json.dumps(inputs, sort_keys=True)
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    def _get_input_files(self) -> List[Path]:
+        """
+        Returns the paths, relative to the root module directory, of the files the terraform plan depends on
+        """
+        root_dir = Path(self._terraform_application_dir)
+        files = [Path(path) for path in TF_STATE_FILES if root_dir.joinpath(path).is_file()]
+        local_state_file = self._get_local_state_file()
+        if local_state_file and root_dir.joinpath(local_state_file).is_file():
+            files.append(local_state_file)
+        files.extend(path.relative_to(root_dir) for path in _list_files(root_dir, TF_VARIABLES_SUFFIXES))
+        for module_dir in self._get_module_dirs():
+            files.extend(
+                Path(os.path.relpath(path, root_dir)) for path in _list_files(module_dir, TF_CONFIGURATION_SUFFIXES)
+            )
+        return sorted(set(files))
+
+    def _get_local_state_file(self) -> Optional[Path]:
+        """
+        Returns the path, relative to the root module directory unless the backend configures an absolute one, of the
+        state of the selected workspace when the application uses the local backend, or None when the state is stored
+        remotely
+        """
+        root_dir = Path(self._terraform_application_dir)
+        try:
+            backend_config = json.loads(root_dir.joinpath(TF_STATE_FILES[3]).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            # no backend is configured, or the application was not initialized yet
+            backend_config = {}
+        backend = backend_config.get("backend") if isinstance(backend_config, dict) else None
+        if not isinstance(backend, dict):
+            backend = {"type": "local"}
+        if backend.get("type") != "local":
+            return None
+
+        config = backend.get("config")
+        if not isinstance(config, dict):
+            config = {}
+        try:
+            workspace = root_dir.joinpath(TF_STATE_FILES[2]).read_text(encoding="utf-8").strip()
+        except OSError:
+            workspace = TF_DEFAULT_WORKSPACE
+        if workspace and workspace != TF_DEFAULT_WORKSPACE:
+            return Path(
+                config.get("workspace_dir") or TF_DEFAULT_LOCAL_WORKSPACE_DIR, workspace, TF_DEFAULT_LOCAL_STATE_FILE
+            )
+        return Path(config.get("path") or TF_DEFAULT_LOCAL_STATE_FILE)
+
+    def _get_module_dirs(self) -> List[Path]:
+        """
+        Returns the directories of the root module and of the modules installed by `terraform init`
+        """
+        root_dir = Path(self._terraform_application_dir)
+        module_dirs = [root_dir]
+        try:
+            manifest = json.loads(root_dir.joinpath(TF_STATE_FILES[1]).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            # the application has no module, or was not initialized yet
+            return module_dirs
+        for module in manifest.get("Modules", []) if isinstance(manifest, dict) else []:
+            module_dir = module.get("Dir") if isinstance(module, dict) else None
+            if module_dir:
+                module_dirs.append(root_dir.joinpath(module_dir))
+        return module_dirs
+
+    def _get_terraform_version(self) -> Optional[str]:
+        """
+        Returns the versions of Terraform and of the selected providers
+        """
+        try:
+            result = run(
+                ["terraform", "version", "-json"],
+                check=True,
+                capture_output=True,
+                cwd=self._terraform_application_dir,
+                # do not check online whether a newer version is available
+                env={**os.environ, "CHECKPOINT_DISABLE": "1"},
+            )
+            version = json.loads(result.stdout)
+        except (CalledProcessError, OSError, ValueError) as ex:
+            LOG.debug("Failed to get the Terraform version", exc_info=ex)
+            return None
+        if not isinstance(version, dict):
+            return None
+        return json.dumps(
+            [version.get("terraform_version"), version.get("platform"), version.get("provider_selections")],
+            sort_keys=True,
+        )
+
+
+def _list_files(directory: Path, suffixes: tuple) -> List[Path]:
+    """
+    Returns the files of the directory, not of its sub directories, ending with one of the suffixes
+    """
+    try:
+        return [path for path in directory.iterdir() if path.name.endswith(suffixes) and path.is_file()]
+    except OSError:
+        return []
+
+
+def _hash_file(path: Path) -> Optional[str]:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
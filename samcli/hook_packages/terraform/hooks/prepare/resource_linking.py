@@ -6,7 +6,7 @@ e.g. linking layers to functions
 import logging
 import re
 from dataclasses import dataclass
-from typing import Callable, Dict, List, Optional, Type, Union
+from typing import Callable, Dict, List, Optional, Tuple, Type, Union
 
 from samcli.hook_packages.terraform.hooks.prepare.constants import TF_AWS_API_GATEWAY_REST_API
 from samcli.hook_packages.terraform.hooks.prepare.exceptions import (
@@ -165,9 +165,12 @@ class ResourceLinkingPair:
 
 class ResourceLinker:
     _resource_pair: ResourceLinkingPair
+    # map between the destination resources linking field values, and their logical ids and types
+    _destination_index: Optional[Dict[str, Tuple[str, str]]]
 
     def __init__(self, resource_pair):
         self._resource_pair = resource_pair
+        self._destination_index = None
 
     def link_resources(self) -> None:
         """
@@ -331,6 +334,35 @@ class ResourceLinker:
             self._resource_pair.tf_destination_value_extractor_from_link_field_value_function(value) for value in values
         ]
 
+        child_resources_linking_attributes_logical_id_mapping = self._get_destination_index()
+
+        dest_resources = [
+            (
+                LogicalIdReference(
+                    value=child_resources_linking_attributes_logical_id_mapping[value][0],
+                    resource_type=child_resources_linking_attributes_logical_id_mapping[value][1],
+                )
+                if value in child_resources_linking_attributes_logical_id_mapping
+                else ExistingResourceReference(value)
+            )
+            for value in values
+        ]
+
+        if not dest_resources:
+            LOG.debug("Skipping linking call back, no destination resources discovered.")
+            return
+
+        LOG.debug("The value of the source resource linking field after mapping %s", dest_resources)
+        self._resource_pair.cfn_resource_update_call_back_function(cfn_resource, dest_resources)
+
+    def _get_destination_index(self) -> Dict[str, Tuple[str, str]]:
+        """
+        Returns the map between the destination resources linking field values, and the resources' logical ids and
+        types. It is built once per linker, instead of scanning all the destination resources for each source resource.
+        """
+        if self._destination_index is not None:
+            return self._destination_index
+
         # build map between the destination linking field property values, and resources' logical ids
         expected_destinations_map = {
             expected_destination.terraform_resource_type_prefix: expected_destination.terraform_attribute_name
@@ -356,25 +388,8 @@ class ResourceLinker:
             ),
             child_resources_linking_attributes_logical_id_mapping,
         )
-
-        dest_resources = [
-            (
-                LogicalIdReference(
-                    value=child_resources_linking_attributes_logical_id_mapping[value][0],
-                    resource_type=child_resources_linking_attributes_logical_id_mapping[value][1],
-                )
-                if value in child_resources_linking_attributes_logical_id_mapping
-                else ExistingResourceReference(value)
-            )
-            for value in values
-        ]
-
-        if not dest_resources:
-            LOG.debug("Skipping linking call back, no destination resources discovered.")
-            return
-
-        LOG.debug("The value of the source resource linking field after mapping %s", dest_resources)
-        self._resource_pair.cfn_resource_update_call_back_function(cfn_resource, dest_resources)
+        self._destination_index = child_resources_linking_attributes_logical_id_mapping
+        return self._destination_index
 
     def _process_resolved_resources(
         self,
@@ -808,7 +823,8 @@ def _clean_references_list(references: List[str]) -> List[str]:
 
 def _resolve_module_output(module: TFModule, output_name: str) -> List[Union[ConstantValue, ResolvedReference]]:
     """
-    Resolves any references in the output section of the module
+    Resolves any references in the output section of the module. The result is memoized in the module, so each
+    output is only resolved once for all the resources referring to it.
 
     Parameters
     ----------
@@ -822,6 +838,15 @@ def _resolve_module_output(module: TFModule, output_name: str) -> List[Union[Con
     List[Union[ConstantValue, ResolvedReference]]
         A list of resolved values
     """
+    key = ("output", output_name)
+    if key not in module.resolved_references:
+        module.resolved_references[key] = _resolve_module_output_uncached(module, output_name)
+    return list(module.resolved_references[key])
+
+
+def _resolve_module_output_uncached(
+    module: TFModule, output_name: str
+) -> List[Union[ConstantValue, ResolvedReference]]:
     results: List[Union[ConstantValue, ResolvedReference]] = []
 
     output = module.outputs.get(output_name)
@@ -907,7 +932,16 @@ def _resolve_module_output(module: TFModule, output_name: str) -> List[Union[Con
 
 def _resolve_module_variable(module: TFModule, variable_name: str) -> List[Union[ConstantValue, ResolvedReference]]:
     # return a list of the values that resolve the passed variable
-    # name in the input module.
+    # name in the input module. The result is memoized in the module.
+    key = ("variable", variable_name)
+    if key not in module.resolved_references:
+        module.resolved_references[key] = _resolve_module_variable_uncached(module, variable_name)
+    return list(module.resolved_references[key])
+
+
+def _resolve_module_variable_uncached(
+    module: TFModule, variable_name: str
+) -> List[Union[ConstantValue, ResolvedReference]]:
     results: List[Union[ConstantValue, ResolvedReference]] = []
 
     LOG.debug("Resolving module variable for module (%s) and variable (%s)", module.module_name, variable_name)
@@ -979,7 +1013,15 @@ def _resolve_resource_attribute(
     List[Union[ConstantValue, ResolvedReference]]
         A list of combination of constant values and/or references to other terraform resources attributes.
     """
+    # memoized in the resource, as the same attribute is resolved by the property builders and the linkers
+    if attribute_name not in resource.resolved_attributes:
+        resource.resolved_attributes[attribute_name] = _resolve_resource_attribute_uncached(resource, attribute_name)
+    return list(resource.resolved_attributes[attribute_name])
 
+
+def _resolve_resource_attribute_uncached(
+    resource: TFResource, attribute_name: str
+) -> List[Union[ConstantValue, ResolvedReference]]:
     results: List[Union[ConstantValue, ResolvedReference]] = []
     LOG.debug(
         "Resolving resource attribute for resource (%s) and attribute (%s)", resource.full_address, attribute_name
@@ -3,7 +3,7 @@ Module for API Gateway-related Terraform translation logic
 """
 
 import logging
-from typing import Dict, List, Optional
+from typing import Dict, FrozenSet, List, Optional
 
 from samcli.hook_packages.terraform.hooks.prepare.exceptions import OpenAPIBodyNotSupportedException
 from samcli.hook_packages.terraform.hooks.prepare.types import (
@@ -187,11 +187,12 @@ def add_integrations_to_methods(
     gateway_integrations_cfn: Dict[str, List]
         Dict containing Internal API Gateway integrations to be appended to the CFN dict
     """
+    integrations_index = _index_gateway_integrations(gateway_integrations_cfn)
     for config_address, cfn_dicts in gateway_methods_cfn.items():
         for method_resource in cfn_dicts:
             resource_properties = method_resource.get("Properties", {})
             search_key = _gateway_method_integration_identifier(resource_properties)
-            integration_properties = _find_gateway_integration(search_key, gateway_integrations_cfn)
+            integration_properties = _lookup_gateway_integration(search_key, integrations_index)
             if not integration_properties:
                 LOG.debug("A corresponding gateway integration for the gateway method %s was not found", config_address)
                 continue
@@ -223,11 +224,12 @@ def add_integration_responses_to_methods(
     gateway_integration_responses_cfn: Dict[str, List]
         Dict containing Internal API Gateway integration responses to be appended to the CFN dict
     """
+    integration_responses_index = _index_gateway_integrations(gateway_integration_responses_cfn)
     for config_address, cfn_dicts in gateway_methods_cfn.items():
         for method_resource in cfn_dicts:
             method_resource_properties = method_resource.get("Properties", {})
             search_key = _gateway_method_integration_identifier(method_resource_properties)
-            integration_response_properties = _find_gateway_integration(search_key, gateway_integration_responses_cfn)
+            integration_response_properties = _lookup_gateway_integration(search_key, integration_responses_index)
             if not integration_response_properties:
                 LOG.debug(
                     "A corresponding gateway integration response for the gateway method %s was not found",
@@ -255,13 +257,40 @@ def _find_gateway_integration(search_key: set, gateway_integrations_cfn: Dict[st
         Properties of the internal API Gateway integration / integration response if found, otherwise returns None
 
     """
+    return _lookup_gateway_integration(search_key, _index_gateway_integrations(gateway_integrations_cfn))
+
+
+def _index_gateway_integrations(gateway_integrations_cfn: Dict[str, List]) -> Dict[FrozenSet, dict]:
+    """
+    Map the unique identifier of each internal API Gateway integration or integration response to its properties,
+    so that the integration of each API Gateway method is found without iterating through all the integrations.
+    The first integration is kept when several ones have the same identifier.
+
+    Parameters
+    ----------
+    gateway_integrations_cfn: Dict[str, List]
+        Dict containing all Internal API Gateway integration resources to index
+
+    Returns
+    -------
+        Dict mapping the unique identifiers to the properties of the internal API Gateway integrations
+    """
+    integrations_index: Dict[FrozenSet, dict] = {}
     for _, gateway_integrations in gateway_integrations_cfn.items():
         for resource in gateway_integrations:
             resource_properties = resource.get("Properties", {})
-            integration_key = _gateway_method_integration_identifier(resource_properties)
-            if integration_key == search_key:
-                return dict(resource_properties)
-    return None
+            integration_key = frozenset(_gateway_method_integration_identifier(resource_properties))
+            integrations_index.setdefault(integration_key, resource_properties)
+    return integrations_index
+
+
+def _lookup_gateway_integration(search_key: set, integrations_index: Dict[FrozenSet, dict]) -> Optional[dict]:
+    """
+    Returns a copy of the properties of the indexed internal API Gateway integration / integration response whose
+    unique identifier matches the given search key, otherwise returns None
+    """
+    resource_properties = integrations_index.get(frozenset(search_key))
+    return dict(resource_properties) if resource_properties is not None else None
 
 
 def _gateway_method_integration_identifier(resource_properties: dict) -> set:
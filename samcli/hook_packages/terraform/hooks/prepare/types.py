@@ -2,7 +2,7 @@
 
 from abc import ABC
 from copy import deepcopy
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple, Union
 
 from samcli.hook_packages.terraform.hooks.prepare.utilities import get_configuration_address
@@ -37,6 +37,10 @@ class TFModule:
     resources: Dict[str, "TFResource"]
     child_modules: Dict[str, "TFModule"]
     outputs: Dict[str, Expression]
+    # memo of the resolved outputs and variables, keyed by ("output" | "variable", name), shared by all the linkers
+    resolved_references: Dict[Tuple[str, str], List[Union[ConstantValue, ResolvedReference]]] = field(
+        default_factory=dict, repr=False, compare=False
+    )
 
     # current module's + all child modules' resources
     def get_all_resources(self) -> List["TFResource"]:
@@ -58,6 +62,10 @@ class TFResource:
     # the module this resource is defined in
     module: TFModule
     attributes: Dict[str, Expression]
+    # memo of the resolved attributes, keyed by the attribute name
+    resolved_attributes: Dict[str, List[Union[ConstantValue, ResolvedReference]]] = field(
+        default_factory=dict, repr=False, compare=False
+    )
 
     @property
     def full_address(self) -> str:
@@ -110,6 +110,7 @@ class ApplicationBuilder:
         combine_dependencies: bool = True,
         build_in_source: Optional[bool] = None,
         mount_with_write: bool = False,
+        parallel_jobs: Optional[int] = None,
     ) -> None:
         """
         Initialize the class
@@ -155,6 +156,8 @@ class ApplicationBuilder:
             Set to True to build in the source directory.
         mount_with_write: bool
             Mount source code directory with write permissions when building inside container.
+        parallel_jobs: Optional[int]
+            Maximum number of builds running at the same time when building in parallel, defaults to the number of CPUs
         """
         self._resources_to_build = resources_to_build
         self._build_dir = build_dir
@@ -166,6 +169,7 @@ class ApplicationBuilder:
 
         self._container_manager = container_manager
         self._parallel = parallel
+        self._parallel_jobs = parallel_jobs
         self._mode = mode
         self._stream_writer = stream_writer if stream_writer else StreamWriter(stream=osutils.stderr(), auto_flush=True)
         self._docker_client = docker_client if docker_client else docker.from_env(version=DOCKER_MIN_API_VERSION)
@@ -208,9 +212,14 @@ class ApplicationBuilder:
                         self._is_building_specific_resource,
                         bool(self._container_manager),
                     ),
+                    parallel_jobs=self._parallel_jobs,
                 )
             else:
-                build_strategy = ParallelBuildStrategy(build_graph, build_strategy)
+                build_strategy = ParallelBuildStrategy(
+                    build_graph,
+                    build_strategy,
+                    parallel_jobs=self._parallel_jobs,
+                )
         elif self._cached:
             build_strategy = CachedOrIncrementalBuildStrategyWrapper(
                 build_graph,
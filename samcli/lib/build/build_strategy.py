@@ -8,6 +8,7 @@ import os.path
 import pathlib
 import shutil
 from abc import ABC, abstractmethod
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from copy import deepcopy
 from typing import Any, Callable, Dict, List, Optional, Set, Tuple, TypeVar, cast
 
@@ -24,8 +25,7 @@ from samcli.lib.build.exceptions import MissingBuildMethodException
 from samcli.lib.build.utils import warn_on_invalid_architecture
 from samcli.lib.utils import osutils
 from samcli.lib.utils.architecture import X86_64
-from samcli.lib.utils.async_utils import AsyncContext
-from samcli.lib.utils.hash import dir_checksum
+from samcli.lib.utils.hash import FILE_CHECKSUM_CACHE_FILE_NAME, FileChecksumCache, dir_checksum
 from samcli.lib.utils.packagetype import IMAGE, ZIP
 
 LOG = logging.getLogger(__name__)
@@ -275,6 +275,7 @@ class CachedBuildStrategy(BuildStrategy):
         self._base_dir = base_dir
         self._build_dir = build_dir
         self._cache_dir = cache_dir
+        self._checksum_cache = FileChecksumCache(os.path.join(cache_dir, FILE_CHECKSUM_CACHE_FILE_NAME))
 
     def build(self) -> Dict[str, str]:
         result = {}
@@ -282,6 +283,9 @@ class CachedBuildStrategy(BuildStrategy):
             result.update(super().build())
         return result
 
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self._checksum_cache.save()
+
     def build_single_function_definition(self, build_definition: FunctionBuildDefinition) -> Dict[str, str]:
         """
         Builds single function definition with caching
@@ -290,7 +294,9 @@ class CachedBuildStrategy(BuildStrategy):
             return self._delegate_build_strategy.build_single_function_definition(build_definition)
 
         code_dir = str(pathlib.Path(self._base_dir, cast(str, build_definition.codeuri)).resolve())
-        source_hash = dir_checksum(code_dir, ignore_list=[".aws-sam"], hash_generator=hashlib.sha256())
+        source_hash = dir_checksum(
+            code_dir, ignore_list=[".aws-sam"], hash_generator=hashlib.sha256(), checksum_cache=self._checksum_cache
+        )
         cache_function_dir = pathlib.Path(self._cache_dir, build_definition.uuid)
         function_build_results = {}
 
@@ -348,7 +354,9 @@ class CachedBuildStrategy(BuildStrategy):
         """
 
         code_dir = str(pathlib.Path(self._base_dir, cast(str, layer_definition.codeuri)).resolve())
-        source_hash = dir_checksum(code_dir, ignore_list=[".aws-sam"], hash_generator=hashlib.sha256())
+        source_hash = dir_checksum(
+            code_dir, ignore_list=[".aws-sam"], hash_generator=hashlib.sha256(), checksum_cache=self._checksum_cache
+        )
         cache_function_dir = pathlib.Path(self._cache_dir, layer_definition.uuid)
         layer_build_result = {}
 
@@ -398,7 +406,10 @@ class CachedBuildStrategy(BuildStrategy):
 class ParallelBuildStrategy(BuildStrategy):
     """
     Parallel implementation of Build Strategy
-    This strategy runs each build in parallel.
+    This strategy runs the builds in parallel, scheduling them on the dependencies between functions and layers.
+    A function build starts as soon as the builds of the layers it uses are completed, without waiting for the other
+    layers. Builds which run in process and builds which run inside a container share the same limit of builds
+    running at the same time.
     For actual build implementation it calls delegate implementation (could be one of the other Build Strategy)
     """
 
@@ -406,41 +417,107 @@ class ParallelBuildStrategy(BuildStrategy):
         self,
         build_graph: BuildGraph,
         delegate_build_strategy: BuildStrategy,
+        parallel_jobs: Optional[int] = None,
     ) -> None:
+        """
+        Parameters
+        ----------
+        build_graph : BuildGraph
+            Build graph which contains the functions and layers to build
+        delegate_build_strategy : BuildStrategy
+            Build strategy which runs each individual build
+        parallel_jobs : Optional[int]
+            Maximum number of builds running at the same time, in process or inside a container. Defaults to the
+            worker count of the default executor, as builds mostly wait on I/O and on Docker
+        """
         super().__init__(build_graph)
         self._delegate_build_strategy = delegate_build_strategy
+        if parallel_jobs:
+            self._parallel_jobs = max(parallel_jobs, 1)
+        else:
+            # same default as ThreadPoolExecutor, which used to run all the builds
+            self._parallel_jobs = min(32, (os.cpu_count() or 1) + 4)
 
     def build(self) -> Dict[str, str]:
-        with self._delegate_build_strategy:
-            return super().build()
+        with self._delegate_build_strategy, self:
+            return self._run_build_graph(self._build_graph)
 
-    def _build_layers(self, build_graph: BuildGraph) -> Dict[str, str]:
-        return self._run_builds_async(self.build_single_layer_definition, build_graph.get_layer_build_definitions())
+    def _run_build_graph(self, build_graph: BuildGraph) -> Dict[str, str]:
+        """
+        Builds all functions and layers of the build graph, each function build waits for the layers it uses
+        """
+        layer_definitions = build_graph.get_layer_build_definitions()
+        layer_uuids = {layer_definition.full_path: layer_definition.uuid for layer_definition in layer_definitions}
 
-    def _build_functions(self, build_graph: BuildGraph) -> Dict[str, str]:
-        return self._run_builds_async(
-            self.build_single_function_definition, build_graph.get_function_build_definitions()
-        )
+        builds: List[Tuple[AbstractBuildDefinition, Set[str]]] = [
+            (layer_definition, set()) for layer_definition in layer_definitions
+        ]
+        for build_definition in build_graph.get_function_build_definitions():
+            dependencies = {
+                layer_uuids[layer.full_path]
+                for function in build_definition.functions
+                for layer in function.layers
+                if layer.full_path in layer_uuids
+            }
+            builds.append((build_definition, dependencies))
 
-    @staticmethod
-    def _run_builds_async(
-        build_method: Callable[[FunctionOrLayerBuildDefinition], Dict[str, str]],
-        build_definitions: Tuple[FunctionOrLayerBuildDefinition, ...],
-    ) -> Dict[str, str]:
-        """Builds given list of build definitions in async and return the result"""
-        if not build_definitions:
+        return self._run_builds_async(builds)
+
+    def _run_builds_async(self, builds: List[Tuple[AbstractBuildDefinition, Set[str]]]) -> Dict[str, str]:
+        """
+        Runs the given builds in parallel, each build starts once all the builds it depends on are completed
+
+        Parameters
+        ----------
+        builds : List[Tuple[AbstractBuildDefinition, Set[str]]]
+            Build definitions to build, along with the uuids of the build definitions they depend on
+
+        Returns
+        -------
+        Dict[str, str]
+            Build results of all the given builds, in the order of the given build definitions
+        """
+        if not builds:
             return dict()
 
-        async_context = AsyncContext()
-        for build_definition in build_definitions:
-            async_context.add_async_task(build_method, build_definition)
-        async_results = async_context.run_async()
+        results: Dict[str, Dict[str, str]] = {}
+        waiting = list(builds)
+        running: Dict[Future, AbstractBuildDefinition] = {}
+
+        with ThreadPoolExecutor(max_workers=self._parallel_jobs, thread_name_prefix="sam-build") as executor:
+            try:
+                while waiting or running:
+                    blocked = []
+                    for build_definition, dependencies in waiting:
+                        if not dependencies.issubset(results):
+                            blocked.append((build_definition, dependencies))
+                            continue
+                        running[executor.submit(self._build_single_definition, build_definition)] = build_definition
+                    waiting = blocked
+
+                    if not running:
+                        # dependencies which are not part of the given builds can never be satisfied
+                        raise ValueError(f"Build definitions have unresolvable dependencies: {waiting}")
+
+                    completed, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in completed:
+                        build_definition = running.pop(future)
+                        # re-raise the first build error, remaining builds are cancelled below
+                        results[build_definition.uuid] = future.result()
+            finally:
+                for future in running:
+                    future.cancel()
 
         build_result: Dict[str, str] = dict()
-        for async_result in async_results:
-            build_result.update(async_result)
+        for build_definition, _ in builds:
+            build_result.update(results[build_definition.uuid])
         return build_result
 
+    def _build_single_definition(self, build_definition: AbstractBuildDefinition) -> Dict[str, str]:
+        if isinstance(build_definition, LayerBuildDefinition):
+            return self.build_single_layer_definition(build_definition)
+        return self.build_single_function_definition(cast(FunctionBuildDefinition, build_definition))
+
     def build_single_layer_definition(self, layer_definition: LayerBuildDefinition) -> Dict[str, str]:
         return self._delegate_build_strategy.build_single_layer_definition(layer_definition)
 
@@ -571,11 +648,9 @@ class CachedOrIncrementalBuildStrategyWrapper(BuildStrategy):
         self._is_building_specific_resource = is_building_specific_resource
         self._use_container = use_container
 
-    def build(self) -> Dict[str, str]:
-        result = {}
-        with self._cached_build_strategy, self._incremental_build_strategy:
-            result.update(super().build())
-        return result
+    def __enter__(self) -> None:
+        self._cached_build_strategy.__enter__()
+        self._incremental_build_strategy.__enter__()
 
     def build_single_function_definition(self, build_definition: FunctionBuildDefinition) -> Dict[str, str]:
         if self._is_incremental_build_supported(build_definition.runtime):
@@ -616,13 +691,20 @@ class CachedOrIncrementalBuildStrategyWrapper(BuildStrategy):
 
         If SAM CLI switched to use only IncrementalBuildStrategy, contents of this method should be moved inside
         IncrementalBuildStrategy so that it will still continue to clean-up redundant folders.
+
+        The wrapped strategies are exited from here rather than from ``build``, since ParallelBuildStrategy calls the
+        single definition builds of this wrapper directly and only enters and exits the wrapper itself.
         """
-        if self._is_building_specific_resource:
-            self._build_graph.update_definition_hash()
-        else:
-            self._build_graph.clean_redundant_definitions_and_update(not self._is_building_specific_resource)
-            self._cached_build_strategy._clean_redundant_cached()
-            self._incremental_build_strategy._clean_redundant_dependencies()
+        try:
+            if self._is_building_specific_resource:
+                self._build_graph.update_definition_hash()
+            else:
+                self._build_graph.clean_redundant_definitions_and_update(not self._is_building_specific_resource)
+                self._cached_build_strategy._clean_redundant_cached()
+                self._incremental_build_strategy._clean_redundant_dependencies()
+        finally:
+            self._incremental_build_strategy.__exit__(exc_type, exc_val, exc_tb)
+            self._cached_build_strategy.__exit__(exc_type, exc_val, exc_tb)
 
     def _is_incremental_build_supported(self, runtime: Optional[str]) -> bool:
         # incremental build doesn't support in container build
@@ -15,13 +15,15 @@ Cloudformation deploy class which also streams events and changeset information
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 
+import heapq
 import logging
 import math
 import sys
 import time
-from collections import OrderedDict, deque
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple, Union
 
 import botocore
 
@@ -34,12 +36,13 @@ from samcli.commands.deploy.exceptions import (
     DeployStackOutPutFailedError,
     DeployStackStatusMissingError,
 )
+from samcli.lib.deploy.stack_events import StackEventPoller, get_nested_stack_id
 from samcli.lib.deploy.utils import DeployColor, FailureMode
 from samcli.lib.package.local_files_utils import get_uploaded_s3_object_name, mktempfile
 from samcli.lib.package.s3_uploader import S3Uploader
 from samcli.lib.utils.colors import Colored, Colors
 from samcli.lib.utils.s3 import parse_s3_url
-from samcli.lib.utils.time import to_datetime, utc_to_timestamp
+from samcli.lib.utils.time import utc_to_timestamp
 
 LOG = logging.getLogger(__name__)
 
@@ -76,6 +79,8 @@ OUTPUTS_TABLE_HEADER_NAME = "CloudFormation outputs from deployed stack"
 
 # 500ms of sleep time between stack checks and describe stack events.
 DEFAULT_CLIENT_SLEEP = 0.5
+# Maximum number of stacks whose events are described at the same time
+MAX_STACK_EVENTS_WORKERS = 8
 
 
 class Deployer:
@@ -371,106 +376,177 @@ class Deployer:
         self, stack_name: str, time_stamp_marker: float, on_failure: FailureMode = FailureMode.ROLLBACK, **kwargs
     ):
         """
-        Calls CloudFormation to get current stack events
+        Calls CloudFormation to get current stack events, and the events of the nested stacks as they are created or
+        updated. The stacks are polled concurrently, less often while they have no new events, and their events are
+        shown in chronological order.
         :param stack_name: Name or ID of the stack
         :param time_stamp_marker: last event time on the stack to start streaming events from.
         :param on_failure: The action to take if the stack fails to deploy
         :param kwargs: Other arguments to pass to pprint_columns()
         """
 
-        stack_change_in_progress = True
-        events = set()
-        retry_attempts = 0
+        root_poller = StackEventPoller(self._client, stack_name, time_stamp_marker, self.client_sleep)
+        # Pollers of the root stack and of the nested stacks. The pollers of the nested stacks which are done are kept,
+        # so that their time stamp marker and seen events carry over if the stacks are updated again
+        pollers: Dict[str, StackEventPoller] = {stack_name: root_poller}
+
+        with ThreadPoolExecutor(
+            max_workers=MAX_STACK_EVENTS_WORKERS, thread_name_prefix="sam-stack-events"
+        ) as executor:
+            while True:
+                active_pollers = [poller for poller in pollers.values() if not poller.done]
+                wait_time = min(poller.delay for poller in active_pollers)
+                time.sleep(wait_time)
+                due_pollers = []
+                for poller in active_pollers:
+                    poller.delay -= wait_time
+                    if poller.delay <= 0:
+                        due_pollers.append(poller)
+
+                polled_events = []
+                for poller, result in self._poll_stack_events(executor, due_pollers):
+                    if not isinstance(result, botocore.exceptions.ClientError):
+                        polled_events.append([(poller, event) for event in result])
+                        continue
 
-        while stack_change_in_progress and retry_attempts <= self.max_attempts:
-            try:
-                # Only sleep if there have been no retry_attempts
-                LOG.debug("Trial # %d to get the stack %s create events", retry_attempts, stack_name)
-                time.sleep(0 if retry_attempts else self.client_sleep)
-                paginator = self._client.get_paginator("describe_stack_events")
-                response_iterator = paginator.paginate(StackName=stack_name)
-
-                # Event buffer
-                new_events = deque()  # type: deque
-
-                for event_items in response_iterator:
-                    for event in event_items["StackEvents"]:
-                        LOG.debug("Stack Event: %s", event)
-                        # Skip already shown old event entries or former deployments
-                        if utc_to_timestamp(event["Timestamp"]) <= time_stamp_marker:
-                            LOG.debug(
-                                "Skip previous event as time_stamp_marker: %s is after the event time stamp: %s",
-                                to_datetime(time_stamp_marker),
-                                event["Timestamp"],
-                            )
-                            break
-                        if event["EventId"] not in events:
-                            events.add(event["EventId"])
-                            # Events are in reverse chronological order
-                            # Pushing in front reverse the order to display older events first
-                            new_events.appendleft(event)
-                    else:  # go to next loop (page of events) if not break from inside loop
-                        LOG.debug("Still in describe_stack_events loop, got to next page")
+                    ex = result
+                    if (
+                        poller is root_poller
+                        and "Stack with id {0} does not exist".format(stack_name) in str(ex)
+                        and on_failure == FailureMode.DELETE
+                    ):
+                        LOG.debug("Stack %s does not exist", stack_name)
+                        return
+
+                    LOG.debug("Trial # %d failed due to exception %s", poller.retry_attempts, str(ex))
+                    poller.retry_attempts += 1
+                    if poller.retry_attempts > self.max_attempts:
+                        if poller is root_poller:
+                            LOG.error("Describing stack events for %s failed: %s", stack_name, str(ex))
+                            return
+                        LOG.debug("Stop describing the events of nested stack %s", poller.stack_name)
+                        poller.done = True
                         continue
-                    break  # reached here only if break from inner loop!
-                LOG.debug("Exit from the describe event loop")
-                # Override timestamp marker with latest event (last in deque)
-                if len(new_events) > 0:
-                    time_stamp_marker = utc_to_timestamp(new_events[-1]["Timestamp"])
-
-                for new_event in new_events:
-                    row_color = self.deploy_color.get_stack_events_status_color(status=new_event["ResourceStatus"])
-                    pprint_columns(
-                        # Print the detailed status beside the status if it is present
-                        # E.g. CREATE_IN_PROGRESS - CONFIGURATION_COMPLETE
-                        columns=[
-                            (
-                                (new_event["ResourceStatus"] + " - " + new_event["DetailedStatus"])
-                                if "DetailedStatus" in new_event
-                                else new_event["ResourceStatus"]
-                            ),
-                            new_event["ResourceType"],
-                            new_event["LogicalResourceId"],
-                            new_event.get("ResourceStatusReason", "-"),
-                        ],
-                        width=kwargs["width"],
-                        margin=kwargs["margin"],
-                        format_string=DESCRIBE_STACK_EVENTS_FORMAT_STRING,
-                        format_args=kwargs["format_args"],
-                        columns_dict=DESCRIBE_STACK_EVENTS_DEFAULT_ARGS.copy(),
-                        color=row_color,
+                    # Retry in exponential backoff mode
+                    poller.delay = math.pow(self.backoff, poller.retry_attempts)
+
+                self._print_polled_events(polled_events, pollers, time_stamp_marker, **kwargs)
+                if not root_poller.done:
+                    continue
+
+                # The nested stacks which were quiet may still be waiting for their next poll, their last events are
+                # shown before returning
+                final_pollers = [poller for poller in pollers.values() if not poller.done]
+                final_events = [
+                    [(poller, event) for event in result]
+                    for poller, result in self._poll_stack_events(executor, final_pollers)
+                    if not isinstance(result, botocore.exceptions.ClientError)
+                ]
+                self._print_polled_events(final_events, pollers, time_stamp_marker, **kwargs)
+                return
+
+    def _print_polled_events(
+        self,
+        polled_events: List[List[Tuple[StackEventPoller, Dict]]],
+        pollers: Dict[str, StackEventPoller],
+        time_stamp_marker: float,
+        **kwargs,
+    ) -> None:
+        """
+        Shows the events polled from each stack in chronological order, starts polling the nested stacks which are
+        being created or updated, and marks the stacks which are not in progress anymore as done
+
+        Parameters
+        ----------
+        polled_events: List[List[Tuple[StackEventPoller, Dict]]]
+            The new events of each polled stack, in chronological order
+        pollers: Dict[str, StackEventPoller]
+            Pollers of the root stack and of the nested stacks, by stack name or ID
+        time_stamp_marker: float
+            Time stamp the events of the nested stacks are shown from, when they are first polled
+        kwargs:
+            Other arguments to pass to pprint_columns()
+        """
+        for poller, new_event in heapq.merge(
+            *polled_events, key=lambda polled_event: utc_to_timestamp(polled_event[1]["Timestamp"])
+        ):
+            if poller.done:
+                # Skip events from another consecutive deployment triggered during sleep by another process
+                continue
+            LOG.debug("Stack Event: %s", new_event)
+            self._print_stack_event(new_event, **kwargs)
+
+            nested_stack_id = get_nested_stack_id(new_event)
+            if nested_stack_id:
+                nested_poller = pollers.get(nested_stack_id)
+                if not nested_poller:
+                    LOG.debug("Describing the events of nested stack %s", nested_stack_id)
+                    pollers[nested_stack_id] = StackEventPoller(
+                        self._client, nested_stack_id, time_stamp_marker, self.client_sleep
                     )
-                    # Skip events from another consecutive deployment triggered during sleep by another process
-                    if self._is_root_stack_event(new_event) and self._check_stack_not_in_progress(
-                        new_event["ResourceStatus"]
-                    ):
-                        LOG.debug(
-                            "Stack %s is not in progress. Its status is %s, and event is %s",
-                            stack_name,
-                            new_event["ResourceStatus"],
-                            new_event,
-                        )
-                        stack_change_in_progress = False
-                        break
-
-                # Reset retry attempts if iteration is a success to use client_sleep again
-                retry_attempts = 0
+                elif nested_poller.done:
+                    # the nested stack is updated again, or rolled back
+                    LOG.debug("Describing the events of nested stack %s again", nested_stack_id)
+                    nested_poller.done = False
+                    nested_poller.retry_attempts = 0
+                    nested_poller.delay = nested_poller.poll_interval
+
+            if self._is_root_stack_event(new_event) and self._check_stack_not_in_progress(
+                new_event["ResourceStatus"]
+            ):
+                LOG.debug(
+                    "Stack %s is not in progress. Its status is %s, and event is %s",
+                    poller.stack_name,
+                    new_event["ResourceStatus"],
+                    new_event,
+                )
+                poller.done = True
+
+    @staticmethod
+    def _poll_stack_events(
+        executor: ThreadPoolExecutor, pollers: List[StackEventPoller]
+    ) -> List[Tuple[StackEventPoller, Union[List[Dict], botocore.exceptions.ClientError]]]:
+        """
+        Polls the events of the given stacks concurrently
+
+        Returns
+        -------
+        List[Tuple[StackEventPoller, Union[List[Dict], botocore.exceptions.ClientError]]]
+            The new events of each stack, or the error raised while describing them
+        """
+
+        def poll(poller: StackEventPoller) -> Union[List[Dict], botocore.exceptions.ClientError]:
+            try:
+                return poller.poll()
             except botocore.exceptions.ClientError as ex:
-                if (
-                    "Stack with id {0} does not exist".format(stack_name) in str(ex)
-                    and on_failure == FailureMode.DELETE
-                ):
-                    LOG.debug("Stack %s does not exist", stack_name)
-                    return
-
-                LOG.debug("Trial # %d failed due to exception %s", retry_attempts, str(ex))
-
-                retry_attempts = retry_attempts + 1
-                if retry_attempts > self.max_attempts:
-                    LOG.error("Describing stack events for %s failed: %s", stack_name, str(ex))
-                    return
-                # Sleep in exponential backoff mode
-                time.sleep(math.pow(self.backoff, retry_attempts))
+                return ex
+
+        if len(pollers) == 1:
+            return [(pollers[0], poll(pollers[0]))]
+        return list(zip(pollers, executor.map(poll, pollers)))
+
+    def _print_stack_event(self, event: Dict, **kwargs) -> None:
+        row_color = self.deploy_color.get_stack_events_status_color(status=event["ResourceStatus"])
+        pprint_columns(
+            # Print the detailed status beside the status if it is present
+            # E.g. CREATE_IN_PROGRESS - CONFIGURATION_COMPLETE
+            columns=[
+                (
+                    (event["ResourceStatus"] + " - " + event["DetailedStatus"])
+                    if "DetailedStatus" in event
+                    else event["ResourceStatus"]
+                ),
+                event["ResourceType"],
+                event["LogicalResourceId"],
+                event.get("ResourceStatusReason", "-"),
+            ],
+            width=kwargs["width"],
+            margin=kwargs["margin"],
+            format_string=DESCRIBE_STACK_EVENTS_FORMAT_STRING,
+            format_args=kwargs["format_args"],
+            columns_dict=DESCRIBE_STACK_EVENTS_DEFAULT_ARGS.copy(),
+            color=row_color,
+        )
 
     @staticmethod
     def _is_root_stack_event(event: Dict) -> bool:
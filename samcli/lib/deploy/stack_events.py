@@ -0,0 +1,171 @@
+"""
+Polling of the CloudFormation events of a stack and of its nested stacks
+"""
+
+import logging
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, List, Optional
+
+from samcli.lib.utils.time import utc_to_timestamp
+
+LOG = logging.getLogger(__name__)
+
+# A stack with no new events is polled less and less often, up to this interval in seconds
+MAX_STACK_EVENTS_POLL_INTERVAL = 5.0
+STACK_EVENTS_POLL_BACKOFF = 1.5
+# Upper bound of the event IDs remembered per stack, only the events sharing the latest time stamp are kept anyway
+MAX_SEEN_EVENT_IDS = 1000
+
+NESTED_STACK_RESOURCE_TYPE = "AWS::CloudFormation::Stack"
+
+
+class SeenEventIds:
+    """
+    Sliding window of the IDs of the events already shown for a stack.
+
+    Events are read newer first and the time stamp marker of the stack moves forward as they are shown, so an
+    event older than the marker is never looked at again. Only the IDs of the events at or after the marker are
+    needed to skip duplicates, the older ones are dropped when the marker moves.
+    """
+
+    def __init__(self, max_size: int = MAX_SEEN_EVENT_IDS) -> None:
+        self._max_size = max_size
+        self._events: "OrderedDict[str, float]" = OrderedDict()
+
+    def __contains__(self, event_id: str) -> bool:
+        return event_id in self._events
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def add(self, event_id: str, time_stamp: float) -> None:
+        """
+        Remembers an event, the events must be added in chronological order
+        """
+        self._events[event_id] = time_stamp
+        while len(self._events) > self._max_size:
+            self._events.popitem(last=False)
+
+    def forget_before(self, time_stamp: float) -> None:
+        """
+        Drops the events older than the given time stamp
+        """
+        while self._events and next(iter(self._events.values())) < time_stamp:
+            self._events.popitem(last=False)
+
+
+class StackEventPoller:
+    """
+    Reads the new events of a single stack, and picks the delay before its next poll.
+
+    The delay is reset to ``poll_interval`` when new events are found, and grows up to ``max_poll_interval``
+    while the stack stays quiet.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        stack_name: str,
+        time_stamp_marker: float,
+        poll_interval: float,
+        max_poll_interval: float = MAX_STACK_EVENTS_POLL_INTERVAL,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        client: Any
+            CloudFormation client
+        stack_name: str
+            Name or ID of the stack
+        time_stamp_marker: float
+            Events up to this time stamp are not returned
+        poll_interval: float
+            Seconds between two polls while the stack has new events
+        max_poll_interval: float
+            Maximum number of seconds between two polls, while the stack has no new events
+        """
+        self._client = client
+        self.stack_name = stack_name
+        self.time_stamp_marker = time_stamp_marker
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max(max_poll_interval, poll_interval)
+        # Seconds left before the next poll, it is longer than the interval while the poll is retried after errors
+        self.delay = poll_interval
+        self._interval = poll_interval
+        self.retry_attempts = 0
+        self.done = False
+        self._seen = SeenEventIds()
+
+    def poll(self) -> List[Dict]:
+        """
+        Fetches the events of the stack since the last poll
+
+        Returns
+        -------
+        List[Dict]
+            New events of the stack, in chronological order
+
+        Raises
+        ------
+        botocore.exceptions.ClientError
+            When the events can not be described
+        """
+        paginator = self._client.get_paginator("describe_stack_events")
+        new_events: Deque[Dict] = deque()
+        last_event: Optional[float] = None
+
+        for event_items in paginator.paginate(StackName=self.stack_name):
+            for event in event_items["StackEvents"]:
+                time_stamp = utc_to_timestamp(event["Timestamp"])
+                # Events at the time stamp of the marker are only new if the marker came from a previous poll
+                if time_stamp < self.time_stamp_marker or (time_stamp == self.time_stamp_marker and not self._seen):
+                    LOG.debug("Reached events of %s older than %s", self.stack_name, self.time_stamp_marker)
+                    break
+                # Anything listed after an event that was already shown is older, or was shown as well
+                if event["EventId"] in self._seen:
+                    break
+                # Events are in reverse chronological order
+                new_events.appendleft(event)
+                last_event = time_stamp if last_event is None else max(last_event, time_stamp)
+            else:
+                continue
+            break
+
+        for event in new_events:
+            self._seen.add(event["EventId"], utc_to_timestamp(event["Timestamp"]))
+        if last_event is not None:
+            self.time_stamp_marker = last_event
+            self._seen.forget_before(last_event)
+
+        self.retry_attempts = 0
+        if new_events:
+            self._interval = self.poll_interval
+        else:
+            self._interval = min(self._interval * STACK_EVENTS_POLL_BACKOFF, self.max_poll_interval)
+        self.delay = self._interval
+        return list(new_events)
+
+
+def get_nested_stack_id(event: Dict) -> Optional[str]:
+    """
+    Returns the ID of the nested stack an event is about, once CloudFormation has started to create or update it
+
+    Parameters
+    ----------
+    event: Dict
+        Stack event
+
+    Returns
+    -------
+    Optional[str]
+        The ARN of the nested stack, None if the event is not about an active nested stack
+    """
+    physical_id = event.get("PhysicalResourceId") or ""
+    if (
+        event.get("ResourceType") == NESTED_STACK_RESOURCE_TYPE
+        and physical_id != event.get("StackId")
+        and ":stack/" in physical_id
+        and "IN_PROGRESS" in event.get("ResourceStatus", "")
+    ):
+        return physical_id
+    return None
@@ -3,9 +3,7 @@ Log streaming utilities when streaming logs from Docker
 """
 
 import os
-from typing import Dict
-
-import docker
+from typing import TYPE_CHECKING, Dict
 
 from samcli.lib.package.stream_cursor_utils import (
     ClearLineFormatter,
@@ -15,6 +13,9 @@ from samcli.lib.package.stream_cursor_utils import (
 )
 from samcli.lib.utils.stream_writer import StreamWriter
 
+if TYPE_CHECKING:  # pragma: no cover
+    import docker
+
 
 class LogStreamError(Exception):
     def __init__(self, msg: str) -> None:
@@ -29,7 +30,7 @@ class LogStreamer:
         self._cursor_left_formatter = CursorLeftFormatter()
         self._cursor_clear_formatter = ClearLineFormatter()
 
-    def stream_progress(self, logs: docker.APIClient.logs):
+    def stream_progress(self, logs: "docker.APIClient.logs"):
         """
         Stream progress from docker push logs and move the cursor based on the log id.
         :param logs: generator from docker_clent.APIClient.logs
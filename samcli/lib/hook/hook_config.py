@@ -4,10 +4,12 @@ import json
 from pathlib import Path
 from typing import Dict, NamedTuple, Optional, cast
 
-import jsonschema
+from samcli.lib.utils.lazy_import import lazy_import
 
 from .exceptions import InvalidHookPackageConfigException
 
+jsonschema = lazy_import("jsonschema")
+
 
 class HookFunctionality(NamedTuple):
     """
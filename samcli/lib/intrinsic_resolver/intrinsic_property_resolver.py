@@ -7,6 +7,7 @@ import copy
 import logging
 import re
 from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
 
 from samcli.commands._utils.template import get_template_data
 from samcli.lib.intrinsic_resolver.invalid_intrinsic_exception import InvalidIntrinsicException, InvalidSymbolException
@@ -66,6 +67,10 @@ class IntrinsicResolver:
 
     CONDITIONAL_FUNCTIONS = [FN_AND, FN_OR, FN_IF, FN_EQUALS, FN_NOT]
 
+    RESOURCES = "Resources"
+    OUTPUTS = "Outputs"
+    DEPENDS_ON = "DependsOn"
+
     def __init__(self, template, symbol_resolver):
         """
         Initializes the Intrinsic Property class with the default intrinsic_key_function_map and
@@ -80,6 +85,11 @@ class IntrinsicResolver:
         self._parameters = None
         self._conditions = None
         self._outputs = None
+        # Resolved values are memoized, they only depend on the template and the symbol table which do not change
+        self._resolved_conditions: Dict[Tuple[str, bool], Any] = {}
+        self._resolved_symbols: Dict[Tuple[str, str, bool], Any] = {}
+        self._resolved_resources: Dict[Tuple[str, bool], Tuple[str, Any]] = {}
+        self._reference_graph: Optional[Dict[str, Set[str]]] = None
         self.init_template(template)
 
         self._symbol_resolver = symbol_resolver
@@ -88,7 +98,20 @@ class IntrinsicResolver:
         self.conditional_key_function_map = self.default_conditional_key_map()
 
     def init_template(self, template):
-        self._template = copy.deepcopy(template or {})
+        template = template or {}
+        if isinstance(template, dict):
+            # Resources and Outputs are rebuilt while they are resolved, without modifying the given template.
+            # Only the other sections are copied, copying every resource of large templates is slow.
+            self._template = copy.copy(template)
+            for key, value in template.items():
+                if key not in (IntrinsicResolver.RESOURCES, IntrinsicResolver.OUTPUTS) or not value:
+                    self._template[key] = copy.deepcopy(value)
+        else:
+            self._template = copy.deepcopy(template)
+        self._resolved_conditions = {}
+        self._resolved_symbols = {}
+        self._resolved_resources = {}
+        self._reference_graph = None
         self._resources = self._template.get("Resources", {})
         self._mapping = self._template.get("Mappings", {})
         self._parameters = self._template.get("Parameters", {})
@@ -195,8 +218,10 @@ class IntrinsicResolver:
             raise InvalidIntrinsicException("Missing Intrinsic property in {}".format(parent_function))
         if isinstance(intrinsic, list):
             return [self.intrinsic_property_resolver(item, ignore_errors) for item in intrinsic]
-        if not isinstance(intrinsic, dict) or intrinsic == {}:
+        if not isinstance(intrinsic, dict):
             return intrinsic
+        if intrinsic == {}:
+            return copy.copy(intrinsic)
 
         # `intrinsic` is a dict at this point.
 
@@ -230,17 +255,25 @@ class IntrinsicResolver:
             except Exception:
                 if ignore_errors:
                     LOG.debug("Unable to resolve property %s: %s. Leaving as is.", key, val)
-                    sanitized_dict[key] = val
+                    sanitized_dict[key] = copy.deepcopy(val)
                 else:
                     raise
 
         return sanitized_dict
 
-    def resolve_template(self, ignore_errors=False):
+    def resolve_template(self, ignore_errors=False, logical_ids: Optional[Iterable[str]] = None):
         """
         This resolves all the attributes of the CloudFormation dictionary Resources, Outputs, Mappings, Parameters,
         Conditions.
 
+        Parameters
+        ----------
+        ignore_errors: bool
+            An option to ignore errors that are InvalidIntrinsicException and InvalidSymbolException
+        logical_ids: Optional[Iterable[str]]
+            Logical ids of the resources to resolve, along with the resources they reference. The other resources are
+            left as they are in the template. All the resources are resolved by default.
+
         Return
         -------
         Return a processed template
@@ -248,12 +281,116 @@ class IntrinsicResolver:
         processed_template = self._template
 
         if self._resources:
-            processed_template["Resources"] = self.resolve_attribute(self._resources, ignore_errors)
+            resources_to_resolve = None if logical_ids is None else self.get_referenced_resources(logical_ids)
+            processed_resources = OrderedDict()
+            for logical_id, resource in self._resources.items():
+                if resources_to_resolve is not None and logical_id not in resources_to_resolve:
+                    processed_resources[logical_id] = copy.deepcopy(resource)
+                    continue
+                processed_key, processed_resource = self._resolve_resource_item(logical_id, ignore_errors)
+                processed_resources[processed_key] = processed_resource
+            processed_template["Resources"] = processed_resources
         if self._outputs:
             processed_template["Outputs"] = self.resolve_attribute(self._outputs, ignore_errors)
 
         return processed_template
 
+    def resolve_resource(self, logical_id, ignore_errors=False):
+        """
+        Resolves a single resource of the template, without resolving the other resources.
+
+        Parameters
+        ----------
+        logical_id: str
+            Logical id of the resource
+        ignore_errors: bool
+            An option to ignore errors that are InvalidIntrinsicException and InvalidSymbolException
+
+        Return
+        -------
+        The resolved resource, or None if the template does not contain it
+        """
+        if logical_id not in (self._resources or {}):
+            return None
+        _, processed_resource = self._resolve_resource_item(logical_id, ignore_errors)
+        return processed_resource
+
+    def get_referenced_resources(self, logical_ids: Iterable[str]) -> Set[str]:
+        """
+        Returns the given logical ids and the logical ids of the resources they reference, directly or through other
+        resources, with Ref, Fn::GetAtt, Fn::Sub or DependsOn.
+
+        Parameters
+        ----------
+        logical_ids: Iterable[str]
+            Logical ids of the resources
+
+        Return
+        -------
+        Set of logical ids of the resources
+        """
+        reference_graph = self._get_reference_graph()
+        referenced = set()
+        pending = [logical_id for logical_id in logical_ids if logical_id in reference_graph]
+        while pending:
+            logical_id = pending.pop()
+            if logical_id in referenced:
+                continue
+            referenced.add(logical_id)
+            pending.extend(reference_graph[logical_id] - referenced)
+        return referenced
+
+    def _get_reference_graph(self) -> Dict[str, Set[str]]:
+        """
+        Returns the logical ids of the resources referenced by each resource of the template. The graph is built once,
+        when it is first needed.
+        """
+        if self._reference_graph is None:
+            resources = self._resources or {}
+            self._reference_graph = {
+                logical_id: self._find_references(resource, resources) - {logical_id}
+                for logical_id, resource in resources.items()
+            }
+        return self._reference_graph
+
+    @staticmethod
+    def _find_references(value, resources) -> Set[str]:
+        references: Set[str] = set()
+        pending = [value]
+        while pending:
+            item = pending.pop()
+            if isinstance(item, list):
+                pending.extend(item)
+                continue
+            if not isinstance(item, dict):
+                continue
+            for key, val in item.items():
+                if key in (IntrinsicResolver.REF, IntrinsicResolver.DEPENDS_ON) and isinstance(val, (str, list)):
+                    references.update([val] if isinstance(val, str) else [v for v in val if isinstance(v, str)])
+                elif key == IntrinsicResolver.FN_GET_ATT and isinstance(val, (str, list)) and val:
+                    logical_id = val.split(".", 1)[0] if isinstance(val, str) else val[0]
+                    if isinstance(logical_id, str):
+                        references.add(logical_id)
+                elif key == IntrinsicResolver.FN_SUB:
+                    sub_str = val[0] if isinstance(val, list) and val else val
+                    if isinstance(sub_str, str):
+                        references.update(
+                            sub_item.split(".", 1)[0]
+                            for sub_item in re.findall(string=sub_str, pattern=IntrinsicResolver._REGEX_SUB_FUNCTION)
+                        )
+                pending.append(val)
+        return {reference for reference in references if reference in resources}
+
+    def _resolve_resource_item(self, logical_id, ignore_errors):
+        """
+        Resolves the resource with the given logical id, and returns its translated logical id and its resolved value.
+        The result is memoized, so resources are resolved once even if they are requested several times.
+        """
+        key = (logical_id, ignore_errors)
+        if key not in self._resolved_resources:
+            self._resolved_resources[key] = self._resolve_item(logical_id, self._resources[logical_id], ignore_errors)
+        return self._resolved_resources[key]
+
     def resolve_attribute(self, cloud_formation_property, ignore_errors=False):
         """
         This will parse through every entry in a CloudFormation root key and resolve them based on the symbol_resolver.
@@ -271,21 +408,47 @@ class IntrinsicResolver:
         """
         processed_dict = OrderedDict()
         for key, val in cloud_formation_property.items():
-            processed_key = self._symbol_resolver.get_translation(key) or key
-            try:
-                processed_resource = self.intrinsic_property_resolver(val, ignore_errors, parent_function=processed_key)
-                processed_dict[processed_key] = processed_resource
-            except (InvalidIntrinsicException, InvalidSymbolException) as e:
-                resource_type = val.get("Type", "")
-                if ignore_errors:
-                    LOG.error("Unable to process properties of %s.%s", key, resource_type)
-                    processed_dict[key] = val
-                else:
-                    raise InvalidIntrinsicException(
-                        "Exception with property of {}.{}".format(key, resource_type) + ": " + str(e.args)
-                    ) from e
+            processed_key, processed_resource = self._resolve_item(key, val, ignore_errors)
+            processed_dict[processed_key] = processed_resource
         return processed_dict
 
+    def _resolve_item(self, key, val, ignore_errors):
+        processed_key = self._symbol_resolver.get_translation(key) or key
+        try:
+            return processed_key, self.intrinsic_property_resolver(val, ignore_errors, parent_function=processed_key)
+        except (InvalidIntrinsicException, InvalidSymbolException) as e:
+            resource_type = val.get("Type", "")
+            if ignore_errors:
+                LOG.error("Unable to process properties of %s.%s", key, resource_type)
+                return key, copy.deepcopy(val)
+            raise InvalidIntrinsicException(
+                "Exception with property of {}.{}".format(key, resource_type) + ": " + str(e.args)
+            ) from e
+
+    def _resolve_condition(self, condition_name, condition, ignore_errors, parent_function):
+        """
+        Evaluates the condition with the given name. Conditions only depend on parameters, so each condition is
+        evaluated once, however many Fn::If, Fn::And, Fn::Or or Fn::Not use it.
+        """
+        key = (condition_name, ignore_errors)
+        if key not in self._resolved_conditions:
+            self._resolved_conditions[key] = self.intrinsic_property_resolver(
+                condition, ignore_errors, parent_function=parent_function
+            )
+        return self._resolved_conditions[key]
+
+    def _resolve_symbol(self, logical_id, resource_attribute, ignore_errors=False):
+        """
+        Resolves the symbol with the symbol resolver, and memoizes the values which can be shared safely
+        """
+        key = (logical_id, resource_attribute, ignore_errors)
+        if key in self._resolved_symbols:
+            return self._resolved_symbols[key]
+        resolved = self._symbol_resolver.resolve_symbols(logical_id, resource_attribute, ignore_errors=ignore_errors)
+        if isinstance(resolved, (str, int, float, bool)):
+            self._resolved_symbols[key] = resolved
+        return resolved
+
     def handle_fn_join(self, intrinsic_value, ignore_errors):
         """
         { "Fn::Join" : [ "delimiter", [ comma-delimited list of values ] ] }
@@ -615,7 +778,7 @@ class IntrinsicResolver:
         verify_intrinsic_type_str(logical_id, IntrinsicResolver.FN_GET_ATT)
         verify_intrinsic_type_str(resource_type, IntrinsicResolver.FN_GET_ATT)
 
-        return self._symbol_resolver.resolve_symbols(logical_id, resource_type)
+        return self._resolve_symbol(logical_id, resource_type)
 
     def handle_fn_ref(self, intrinsic_value, ignore_errors):
         """
@@ -639,7 +802,7 @@ class IntrinsicResolver:
         )
         verify_intrinsic_type_str(arguments, IntrinsicResolver.REF)
 
-        return self._symbol_resolver.resolve_symbols(arguments, IntrinsicResolver.REF)
+        return self._resolve_symbol(arguments, IntrinsicResolver.REF)
 
     def handle_fn_sub(self, intrinsic_value, ignore_errors):
         """
@@ -658,12 +821,12 @@ class IntrinsicResolver:
         A string with the resolved attributes
         """
 
-        def resolve_sub_attribute(intrinsic_item, symbol_resolver):
+        def resolve_sub_attribute(intrinsic_item):
             if "." in intrinsic_item:
                 (logical_id, attribute_type) = intrinsic_item.rsplit(".", 1)
             else:
                 (logical_id, attribute_type) = intrinsic_item, IntrinsicResolver.REF
-            return symbol_resolver.resolve_symbols(logical_id, attribute_type, ignore_errors=True)
+            return self._resolve_symbol(logical_id, attribute_type, ignore_errors=True)
 
         if isinstance(intrinsic_value, str):
             intrinsic_value = [intrinsic_value, {}]
@@ -689,7 +852,7 @@ class IntrinsicResolver:
         subable_props = re.findall(string=sub_str, pattern=IntrinsicResolver._REGEX_SUB_FUNCTION)
         for sub_item in subable_props:
             sanitized_item = sanitized_variables[sub_item] if sub_item in sanitized_variables else sub_item
-            result = resolve_sub_attribute(sanitized_item, self._symbol_resolver)
+            result = resolve_sub_attribute(sanitized_item)
             sub_str = re.sub(pattern=r"\$\{" + sub_item + r"\}", string=sub_str, repl=str(result))
         return sub_str
 
@@ -716,9 +879,13 @@ class IntrinsicResolver:
         -------
         This will return value_if_true and value_if_false depending on how the condition is evaluated
         """
-        arguments = self.intrinsic_property_resolver(
-            intrinsic_value, ignore_errors, parent_function=IntrinsicResolver.FN_IF
-        )
+        # Only the value selected by the condition is resolved. Resolving both values makes nested Fn::If exponentially
+        # slower with their depth.
+        arguments = intrinsic_value
+        if not isinstance(arguments, list):
+            arguments = self.intrinsic_property_resolver(
+                intrinsic_value, ignore_errors, parent_function=IntrinsicResolver.FN_IF
+            )
         verify_intrinsic_type_list(arguments, IntrinsicResolver.FN_IF)
         verify_number_arguments(arguments, IntrinsicResolver.FN_IF, num=3)
 
@@ -727,13 +894,6 @@ class IntrinsicResolver:
         )
         verify_intrinsic_type_str(condition_name, IntrinsicResolver.FN_IF)
 
-        value_if_true = self.intrinsic_property_resolver(
-            arguments[1], ignore_errors, parent_function=IntrinsicResolver.FN_IF
-        )
-        value_if_false = self.intrinsic_property_resolver(
-            arguments[2], ignore_errors, parent_function=IntrinsicResolver.FN_IF
-        )
-
         condition = self._conditions.get(condition_name)
         verify_intrinsic_type_dict(
             condition,
@@ -741,8 +901,8 @@ class IntrinsicResolver:
             message="The condition is missing in the Conditions dictionary for {}".format(IntrinsicResolver.FN_IF),
         )
 
-        condition_evaluated = self.intrinsic_property_resolver(
-            condition, ignore_errors, parent_function=IntrinsicResolver.FN_IF
+        condition_evaluated = self._resolve_condition(
+            condition_name, condition, ignore_errors, parent_function=IntrinsicResolver.FN_IF
         )
         verify_intrinsic_type_bool(
             condition_evaluated,
@@ -750,7 +910,11 @@ class IntrinsicResolver:
             message="The result of {} must evaluate to bool".format(IntrinsicResolver.FN_IF),
         )
 
-        return value_if_true if condition_evaluated else value_if_false
+        return self.intrinsic_property_resolver(
+            arguments[1] if condition_evaluated else arguments[2],
+            ignore_errors,
+            parent_function=IntrinsicResolver.FN_IF,
+        )
 
     def handle_fn_equals(self, intrinsic_value, ignore_errors):
         """
@@ -811,8 +975,8 @@ class IntrinsicResolver:
             condition = self._conditions.get(condition_name)
             verify_non_null(condition, IntrinsicResolver.FN_NOT, position_in_list="first")
 
-            argument_sanitised = self.intrinsic_property_resolver(
-                condition, ignore_errors, parent_function=IntrinsicResolver.FN_NOT
+            argument_sanitised = self._resolve_condition(
+                condition_name, condition, ignore_errors, parent_function=IntrinsicResolver.FN_NOT
             )
 
         verify_intrinsic_type_bool(
@@ -878,8 +1042,8 @@ class IntrinsicResolver:
                     condition, IntrinsicResolver.FN_AND, position_in_list=self.get_prefix_position_in_list(i)
                 )
 
-                condition_evaluated = self.intrinsic_property_resolver(
-                    condition, ignore_errors, parent_function=IntrinsicResolver.FN_AND
+                condition_evaluated = self._resolve_condition(
+                    condition_name, condition, ignore_errors, parent_function=IntrinsicResolver.FN_AND
                 )
                 verify_intrinsic_type_bool(condition_evaluated, IntrinsicResolver.FN_AND)
 
@@ -934,8 +1098,8 @@ class IntrinsicResolver:
                     condition, IntrinsicResolver.FN_OR, position_in_list=self.get_prefix_position_in_list(i)
                 )
 
-                condition_evaluated = self.intrinsic_property_resolver(
-                    condition, ignore_errors, parent_function=IntrinsicResolver.FN_OR
+                condition_evaluated = self._resolve_condition(
+                    condition_name, condition, ignore_errors, parent_function=IntrinsicResolver.FN_OR
                 )
                 verify_intrinsic_type_bool(condition_evaluated, IntrinsicResolver.FN_OR)
                 if condition_evaluated:
@@ -0,0 +1,398 @@
+"""
+Puller implementation that merges the events of many CloudWatch log groups, and can tail them through a few Live Tail
+sessions
+"""
+
+import heapq
+import itertools
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import ExitStack
+from datetime import datetime
+from typing import Any, Deque, Dict, Generator, Iterator, List, Optional, Set, Tuple, Union, cast
+
+from botocore.exceptions import BotoCoreError, ClientError
+
+from samcli.lib.observability.cw_logs.cw_log_event import CWLogEvent
+from samcli.lib.observability.cw_logs.cw_log_puller import CWLogPuller
+from samcli.lib.observability.observability_info_puller import ObservabilityPuller
+from samcli.lib.utils.arn_utils import ARNParts, InvalidArnValue
+from samcli.lib.utils.boto_utils import get_client_error_code
+from samcli.lib.utils.time import to_datetime
+
+LOG = logging.getLogger(__name__)
+
+# StartLiveTail accepts up to 10 log groups per session
+MAX_LOG_GROUPS_PER_SESSION = 10
+# Live Tail sends the events of each session once per second, they are held for this many milliseconds so that the
+# events of all the sessions are shown in timestamp order
+LIVE_TAIL_REORDER_WINDOW = 2000
+# Number of log groups fetched, or polled, at the same time
+MAX_FETCH_WORKERS = 8
+# Number of times a session is restarted after an unexpected error of the stream
+MAX_SESSION_RESTARTS = 3
+
+# Sessions are closed by the service after 3 hours, they are restarted to keep tailing
+SESSION_TIMEOUT_ERROR = "SessionTimeoutException"
+
+_SESSION_ENDED = object()
+
+
+class CWLogGroupsPuller(ObservabilityPuller):
+    """
+    Puller implementation that pulls the events of many CloudWatch log groups, and gives them to the consumer of each
+    log group in timestamp order.
+
+    Past events are fetched from each log group, a page ahead, and merged together while they are shown. New events are
+    tailed by polling each log group, or when Live Tail is enabled, with CloudWatch Logs Live Tail which streams the
+    events of up to 10 log groups in a single session. Live Tail sessions are billed per minute, so they are only
+    started when asked for. When Live Tail can not be used, for instance when the credentials are not allowed to start
+    a session, it falls back to polling each log group.
+
+    The fetches and the polls of all the log groups are scheduled on a fixed pool of worker threads, so pulling the
+    events of hundreds of log groups does not start hundreds of threads.
+    """
+
+    def __init__(self, logs_client: Any, sts_client: Any, pullers: List[CWLogPuller], live_tail: bool = False):
+        """
+        Parameters
+        ----------
+        logs_client : CloudWatchLogsClient
+            boto3 logs client instance, used to start the Live Tail sessions
+        sts_client : STSClient
+            boto3 sts client instance, used to find the ARNs of the log groups
+        pullers : List[CWLogPuller]
+            Pullers of each log group, which hold the consumer and the resource name of the log group
+        live_tail : bool
+            Whether new events are tailed with Live Tail sessions instead of polling each log group
+        """
+        self.logs_client = logs_client
+        self.sts_client = sts_client
+        self._pullers = pullers
+        self._live_tail = live_tail
+        self._pullers_by_log_group: Dict[str, CWLogPuller] = {puller.cw_log_group: puller for puller in pullers}
+        self._streams: List[Any] = []
+        self._streams_lock = threading.Lock()
+
+    def tail(self, start_time: Optional[datetime] = None, filter_pattern: Optional[str] = None):
+        # Live Tail does not stream the events sent before the sessions are started, so they are started before
+        # loading the past events, up to the time the sessions were started
+        sessions_start = int(time.time() * 1000)
+        sessions = self._start_sessions(filter_pattern) if self._live_tail else None
+        live_tail_start = to_datetime(int(time.time() * 1000))
+        if sessions is None:
+            if start_time:
+                self.load_time_period(start_time, live_tail_start, filter_pattern)
+            LOG.debug("Tailing %d log groups by polling each of them", len(self._pullers))
+            self._poll_log_groups(live_tail_start, filter_pattern)
+            return
+
+        events: queue.Queue = queue.Queue()
+        threads = [
+            threading.Thread(
+                target=self._read_session,
+                args=(log_group_arns, filter_pattern, stream, events),
+                name="sam-logs-live-tail",
+                daemon=True,
+            )
+            for log_group_arns, stream in sessions
+        ]
+        for thread in threads:
+            thread.start()
+
+        try:
+            # events sent while the sessions were starting are both loaded and streamed
+            loaded_events = (
+                self._load_past_events(start_time, live_tail_start, filter_pattern, sessions_start)
+                if start_time
+                else set()
+            )
+            self._consume_in_order(events, len(threads), loaded_events)
+        except KeyboardInterrupt:
+            LOG.info(" CTRL+C received, cancelling...")
+            self.stop_tailing()
+
+    def load_time_period(
+        self,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        filter_pattern: Optional[str] = None,
+    ):
+        self._load_past_events(start_time, end_time, filter_pattern)
+
+    def load_events(self, event_ids: Union[List[Any], Dict]):
+        LOG.debug("Loading specific events are not supported via CloudWatch Log Group")
+
+    def stop_tailing(self):
+        self.cancelled = True
+        for puller in self._pullers:
+            puller.stop_tailing()
+        with self._streams_lock:
+            streams = list(self._streams)
+        for stream in streams:
+            _close_stream(stream)
+
+    def _load_past_events(
+        self,
+        start_time: Optional[datetime],
+        end_time: Optional[datetime],
+        filter_pattern: Optional[str],
+        recent_since: Optional[int] = None,
+    ) -> Set[Tuple[str, str, int, str]]:
+        """
+        Consumes the past events of all the log groups in timestamp order
+
+        Parameters
+        ----------
+        recent_since : Optional[int]
+            Timestamp, in milliseconds, from which the consumed events are returned
+
+        Returns
+        -------
+        Set[Tuple[str, str, int, str]]
+            Keys of the consumed events whose timestamp is at or after recent_since
+        """
+        recent_events: Set[Tuple[str, str, int, str]] = set()
+        events = self._fetch_merged_events(start_time, end_time, filter_pattern)
+        try:
+            for event in events:
+                if recent_since is not None and event.timestamp >= recent_since:
+                    recent_events.add(_event_key(event))
+                self._pullers_by_log_group[event.cw_log_group].consumer.consume(event)
+        finally:
+            # stops the prefetching right away when the events are not all consumed
+            events.close()
+        return recent_events
+
+    def _fetch_merged_events(
+        self,
+        start_time: Optional[datetime],
+        end_time: Optional[datetime],
+        filter_pattern: Optional[str],
+    ) -> Generator[CWLogEvent, None, None]:
+        """
+        Yields the past events of all the log groups in timestamp order, as soon as the first page of each log group
+        is fetched.
+
+        The events of each log group are fetched a page at a time on a fixed pool of workers, and the next page of a
+        log group is fetched while its current one is shown.
+        """
+        executor = ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS, thread_name_prefix="sam-logs-fetch")
+        prefetchers = [
+            _LogGroupPrefetcher(puller.fetch_pages(start_time, end_time, filter_pattern), executor)
+            for puller in self._pullers
+        ]
+        try:
+            # events of each log group are already sorted
+            yield from heapq.merge(*prefetchers, key=lambda event: event.timestamp)
+        finally:
+            for prefetcher in prefetchers:
+                prefetcher.cancel()
+            executor.shutdown(wait=False)
+
+    def _poll_log_groups(self, start_time: datetime, filter_pattern: Optional[str]) -> None:
+        """
+        Tails the log groups by polling each of them, from a single schedule of the polls which runs them on a fixed
+        pool of workers. A log group is never polled twice at the same time, so its events are consumed in order.
+        """
+        with ExitStack() as stack:
+            poll_intervals = [stack.enter_context(puller.start_tailing(start_time)) for puller in self._pullers]
+            executor = stack.enter_context(
+                ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS, thread_name_prefix="sam-logs-poll")
+            )
+            # (time of the next poll, index of the puller)
+            scheduled: List[Tuple[float, int]] = [(time.monotonic(), index) for index in range(len(self._pullers))]
+            polling: Dict[Future, int] = {}
+            try:
+                while (scheduled or polling) and not self.cancelled:
+                    now = time.monotonic()
+                    while scheduled and scheduled[0][0] <= now:
+                        _, index = heapq.heappop(scheduled)
+                        puller = self._pullers[index]
+                        polling[executor.submit(puller.poll, poll_intervals[index], filter_pattern)] = index
+
+                    timeout = max(scheduled[0][0] - now, 0) if scheduled else None
+                    if not polling:
+                        time.sleep(cast(float, timeout))
+                        continue
+                    done, _ = wait(polling, timeout=timeout, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        index = polling.pop(future)
+                        delay = future.result()
+                        if self._pullers[index].is_tailing():
+                            heapq.heappush(scheduled, (time.monotonic() + delay, index))
+            except KeyboardInterrupt:
+                LOG.info(" CTRL+C received, cancelling...")
+                self.stop_tailing()
+            finally:
+                for future in polling:
+                    future.cancel()
+
+    def _get_log_group_arn_prefix(self) -> Optional[str]:
+        try:
+            caller_identity = self.sts_client.get_caller_identity()
+            partition = ARNParts(caller_identity["Arn"]).partition
+        except (ClientError, BotoCoreError, InvalidArnValue, KeyError) as ex:
+            LOG.debug("Failed to find the account of the log groups", exc_info=ex)
+            return None
+        region = self.logs_client.meta.region_name
+        return f"arn:{partition}:logs:{region}:{caller_identity['Account']}:log-group:"
+
+    def _start_sessions(self, filter_pattern: Optional[str]) -> Optional[List[Tuple[List[str], Any]]]:
+        """
+        Starts the Live Tail sessions of all the log groups
+
+        Returns
+        -------
+        Optional[List[Tuple[List[str], Any]]]
+            The ARNs of the log groups of each session with the stream of the session,
+            None if Live Tail is not available
+        """
+        arn_prefix = self._get_log_group_arn_prefix()
+        if not arn_prefix:
+            return None
+
+        if not hasattr(self.logs_client, "start_live_tail"):
+            LOG.warning("The installed version of botocore does not support Live Tail, polling the log groups instead")
+            return None
+
+        log_group_arns = [f"{arn_prefix}{puller.cw_log_group}" for puller in self._pullers]
+        sessions = []
+        for index in range(0, len(log_group_arns), MAX_LOG_GROUPS_PER_SESSION):
+            session_log_group_arns = log_group_arns[index : index + MAX_LOG_GROUPS_PER_SESSION]
+            try:
+                sessions.append((session_log_group_arns, self._start_session(session_log_group_arns, filter_pattern)))
+            except (ClientError, BotoCoreError) as ex:
+                LOG.debug("Failed to start Live Tail session", exc_info=ex)
+                for _, stream in sessions:
+                    _close_stream(stream)
+                return None
+        return sessions
+
+    def _start_session(self, log_group_arns: List[str], filter_pattern: Optional[str]) -> Any:
+        kwargs: Dict[str, Any] = {"logGroupIdentifiers": log_group_arns}
+        if filter_pattern:
+            kwargs["logEventFilterPattern"] = filter_pattern
+        LOG.debug("Starting Live Tail session with parameters %s", kwargs)
+        stream = self.logs_client.start_live_tail(**kwargs)["responseStream"]
+        with self._streams_lock:
+            self._streams.append(stream)
+        return stream
+
+    def _read_session(
+        self, log_group_arns: List[str], filter_pattern: Optional[str], stream: Any, events: queue.Queue
+    ) -> None:
+        restarts = 0
+        try:
+            while True:
+                try:
+                    for message in stream:
+                        for result in message.get("sessionUpdate", {}).get("sessionResults", []):
+                            event = self._to_event(result)
+                            if event:
+                                events.put(event)
+                    return
+                except ClientError as ex:
+                    if self.cancelled:
+                        return
+                    if get_client_error_code(ex) != SESSION_TIMEOUT_ERROR:
+                        restarts += 1
+                        if restarts > MAX_SESSION_RESTARTS:
+                            LOG.warning("Live Tail session of %s failed: %s", ", ".join(log_group_arns), str(ex))
+                            return
+                    LOG.debug("Restarting Live Tail session of %s", log_group_arns, exc_info=ex)
+                    _close_stream(stream)
+                    stream = self._start_session(log_group_arns, filter_pattern)
+        except Exception as ex:  # pylint: disable=broad-except
+            # closing the stream while it is read, when tailing is cancelled, ends up here as well
+            if not self.cancelled:
+                LOG.warning("Live Tail session of %s failed: %s", ", ".join(log_group_arns), str(ex))
+        finally:
+            events.put(_SESSION_ENDED)
+
+    def _to_event(self, result: Dict) -> Optional[CWLogEvent]:
+        log_group_identifier = result.get("logGroupIdentifier", "")
+        log_group_name = log_group_identifier.split(":log-group:", 1)[-1]
+        puller = self._pullers_by_log_group.get(log_group_name)
+        if not puller:
+            LOG.debug("Ignoring event of unknown log group %s", log_group_identifier)
+            return None
+        return CWLogEvent(puller.cw_log_group, dict(result), puller.resource_name)
+
+    def _consume_in_order(
+        self, events: queue.Queue, active_sessions: int, loaded_events: Set[Tuple[str, str, int, str]]
+    ) -> None:
+        """
+        Consumes the events of the sessions in timestamp order, until all the sessions are ended. The events which
+        were already consumed with the past events are skipped.
+        """
+        pending: List[Tuple[int, int, CWLogEvent]] = []
+        sequence = itertools.count()
+        while active_sessions or pending:
+            if active_sessions:
+                try:
+                    item = events.get(timeout=LIVE_TAIL_REORDER_WINDOW / 1000)
+                    if item is _SESSION_ENDED:
+                        active_sessions -= 1
+                    else:
+                        heapq.heappush(pending, (item.timestamp, next(sequence), item))
+                except queue.Empty:
+                    pass
+
+            # Events older than the reorder window will not be preceded by events of another session anymore
+            watermark = time.time() * 1000 - LIVE_TAIL_REORDER_WINDOW if active_sessions else float("inf")
+            while pending and pending[0][0] <= watermark:
+                _, _, event = heapq.heappop(pending)
+                if loaded_events and _event_key(event) in loaded_events:
+                    continue
+                self._pullers_by_log_group[event.cw_log_group].consumer.consume(event)
+
+
+class _LogGroupPrefetcher:
+    """
+    Iterates over the events of a log group, while its next page of events is fetched on the given executor
+    """
+
+    def __init__(self, pages: Iterator[List[CWLogEvent]], executor: ThreadPoolExecutor) -> None:
+        self._pages = pages
+        self._executor = executor
+        self._buffer: Deque[CWLogEvent] = deque()
+        self._fetching: Optional[Future] = None
+        self._fetch_next()
+
+    def __iter__(self) -> Iterator[CWLogEvent]:
+        while self._buffer or self._fetching:
+            if not self._buffer:
+                page = cast(Future, self._fetching).result()
+                self._fetching = None
+                if page is None:
+                    return
+                self._buffer.extend(page)
+                self._fetch_next()
+            if self._buffer:
+                yield self._buffer.popleft()
+
+    def cancel(self) -> None:
+        if self._fetching:
+            self._fetching.cancel()
+
+    def _fetch_next(self) -> None:
+        # a log group has a single fetch at a time, so its pages are never read by two threads at once
+        self._fetching = self._executor.submit(next, self._pages, None)
+
+
+def _event_key(event: CWLogEvent) -> Tuple[str, str, int, str]:
+    return event.cw_log_group, event.log_stream_name, event.timestamp, event.message
+
+
+def _close_stream(stream: Any) -> None:
+    close = getattr(stream, "close", None)
+    if close:
+        try:
+            close()
+        except Exception as ex:  # pylint: disable=broad-except
+            LOG.debug("Failed to close Live Tail stream", exc_info=ex)
@@ -5,12 +5,13 @@ CloudWatch log event puller implementation
 import logging
 import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Union
 
 from botocore.exceptions import ClientError
 
 from samcli.lib.observability.cw_logs.cw_log_event import CWLogEvent
 from samcli.lib.observability.observability_info_puller import ObservabilityEventConsumer, ObservabilityPuller
+from samcli.lib.observability.poll_scheduler import AdaptivePollInterval, PollRateBudget, get_poll_rate_budget
 from samcli.lib.utils.time import to_datetime, to_timestamp
 
 LOG = logging.getLogger(__name__)
@@ -29,6 +30,7 @@ class CWLogPuller(ObservabilityPuller):
         resource_name: Optional[str] = None,
         max_retries: int = 1000,
         poll_interval: int = 1,
+        poll_rate_budget: Optional[PollRateBudget] = None,
     ):
         """
         Parameters
@@ -45,6 +47,8 @@ class CWLogPuller(ObservabilityPuller):
             Optional parameter to set maximum retries when tailing. Default value is 1000
         poll_interval: int
             Optional parameter to define sleep interval between pulling new log events when tailing. Default value is 1
+        poll_rate_budget: Optional[PollRateBudget]
+            Optional rate budget shared with other pullers, defaults to the one of all the CloudWatch Logs pullers
         """
         self.logs_client = logs_client
         self.consumer = consumer
@@ -52,49 +56,84 @@ class CWLogPuller(ObservabilityPuller):
         self.resource_name = resource_name
         self._max_retries = max_retries
         self._poll_interval = poll_interval
+        self._poll_rate_budget = poll_rate_budget or get_poll_rate_budget("logs")
         self.latest_event_time = 0
         self.had_data = False
+        self._remaining_polls = max_retries
         self._invalid_log_group = False
 
     def tail(self, start_time: Optional[datetime] = None, filter_pattern: Optional[str] = None):
+        with self.start_tailing(start_time) as poll_interval:
+            while self.is_tailing():
+                # We already fetched logs once. Sleep for some time before querying again.
+                # This also helps us scoot under the TPS limit for CloudWatch API call.
+                time.sleep(self.poll(poll_interval, filter_pattern))
+
+    def start_tailing(self, start_time: Optional[datetime] = None) -> AdaptivePollInterval:
+        """
+        Prepares the puller to poll new events, from the given time when it is provided
+
+        Returns
+        -------
+        AdaptivePollInterval
+            Delay between the polls of the puller, to use as a context manager around them
+        """
         if start_time:
             self.latest_event_time = to_timestamp(start_time)
+        self._remaining_polls = self._max_retries
+        return AdaptivePollInterval(self._poll_interval, self._poll_rate_budget)
 
-        counter = self._max_retries
-        while counter > 0 and not self.cancelled:
-            LOG.debug("Tailing logs from %s starting at %s", self.cw_log_group, str(self.latest_event_time))
-
-            counter -= 1
-            try:
-                self.load_time_period(to_datetime(self.latest_event_time), filter_pattern=filter_pattern)
-            except ClientError as err:
-                error_code = err.response.get("Error", {}).get("Code")
-                if error_code == "ThrottlingException":
-                    # if throttled, increase poll interval by 1 second each time
-                    if self._poll_interval == 1:
-                        self._poll_interval += 1
-                    else:
-                        self._poll_interval **= 2
-                    LOG.warning(
-                        "Throttled by CloudWatch Logs API, consider pulling logs for certain resources. "
-                        "Increasing the poll interval time for resource %s to %s seconds",
-                        self.cw_log_group,
-                        self._poll_interval,
-                    )
-                else:
-                    # if error is other than throttling, re-raise it
-                    LOG.error("Failed while fetching new log events", exc_info=err)
-                    raise err
+    def is_tailing(self) -> bool:
+        """
+        Returns True while the puller is not cancelled and did not run out of polls without new events
+        """
+        return self._remaining_polls > 0 and not self.cancelled
 
-            # This poll fetched logs. Reset the retry counter and set the timestamp for next poll
-            if self.had_data:
-                counter = self._max_retries
-                self.latest_event_time += 1  # one extra millisecond to fetch next log event
-                self.had_data = False
+    def poll(self, poll_interval: AdaptivePollInterval, filter_pattern: Optional[str] = None) -> float:
+        """
+        Fetches and consumes the events received since the previous poll
 
-            # We already fetched logs once. Sleep for some time before querying again.
-            # This also helps us scoot under the TPS limit for CloudWatch API call.
-            time.sleep(self._poll_interval)
+        Parameters
+        ----------
+        poll_interval : AdaptivePollInterval
+            Delay between the polls of the puller, returned by start_tailing
+        filter_pattern : Optional[str]
+            Optional parameter to filter events with given string
+
+        Returns
+        -------
+        float
+            Number of seconds to wait before the next poll
+        """
+        LOG.debug("Tailing logs from %s starting at %s", self.cw_log_group, str(self.latest_event_time))
+
+        self._remaining_polls -= 1
+        try:
+            self.load_time_period(to_datetime(self.latest_event_time), filter_pattern=filter_pattern)
+        except ClientError as err:
+            error_code = err.response.get("Error", {}).get("Code")
+            if error_code != "ThrottlingException":
+                # if error is other than throttling, re-raise it
+                LOG.error("Failed while fetching new log events", exc_info=err)
+                raise err
+            # if throttled, back off and slow down all the other log pullers as well
+            delay = poll_interval.next_delay_after_throttling()
+            LOG.warning(
+                "Throttled by CloudWatch Logs API, consider pulling logs for certain resources. "
+                "Increasing the poll interval time for resource %s to %.1f seconds",
+                self.cw_log_group,
+                delay,
+            )
+        else:
+            delay = poll_interval.next_delay(self.had_data)
+
+        # This poll fetched logs. Reset the retry counter and set the timestamp for next poll
+        if self.had_data:
+            self._remaining_polls = self._max_retries
+            self.latest_event_time += 1  # one extra millisecond to fetch next log event
+            self.had_data = False
+
+        return delay
 
     def load_time_period(
         self,
@@ -102,6 +141,53 @@ class CWLogPuller(ObservabilityPuller):
         end_time: Optional[datetime] = None,
         filter_pattern: Optional[str] = None,
     ):
+        for cw_event in self.fetch_events(start_time, end_time, filter_pattern):
+            self.had_data = True
+            self.latest_event_time = max(cw_event.timestamp, self.latest_event_time)
+
+            self.consumer.consume(cw_event)
+
+    def fetch_events(
+        self,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        filter_pattern: Optional[str] = None,
+    ) -> Iterator[CWLogEvent]:
+        """
+        Fetches the events of the log group in the given time period, without consuming them
+
+        Parameters
+        ----------
+        start_time : Optional[datetime]
+            Optional parameter to load events from certain date time
+        end_time :  Optional[datetime]
+            Optional parameter to load events until certain date time
+        filter_pattern : Optional[str]
+            Optional parameter to filter events with given string
+
+        Returns
+        -------
+        Iterator[CWLogEvent]
+            Events of the log group, in chronological order
+        """
+        for page in self.fetch_pages(start_time, end_time, filter_pattern):
+            # Several events will be returned. Return one at a time
+            yield from page
+
+    def fetch_pages(
+        self,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        filter_pattern: Optional[str] = None,
+    ) -> Iterator[List[CWLogEvent]]:
+        """
+        Fetches the events of the log group in the given time period, one page of results at a time
+
+        Returns
+        -------
+        Iterator[List[CWLogEvent]]
+            Events of each page of results, in chronological order
+        """
         kwargs = {"logGroupName": self.cw_log_group, "interleaved": True}
 
         if start_time:
@@ -128,14 +214,7 @@ class CWLogPuller(ObservabilityPuller):
                     self._invalid_log_group = True
                 break
 
-            # Several events will be returned. Consume one at a time
-            for event in result.get("events", []):
-                self.had_data = True
-                cw_event = CWLogEvent(self.cw_log_group, dict(event), self.resource_name)
-
-                self.latest_event_time = max(cw_event.timestamp, self.latest_event_time)
-
-                self.consumer.consume(cw_event)
+            yield [CWLogEvent(self.cw_log_group, dict(event), self.resource_name) for event in result.get("events", [])]
 
             # Keep iterating until there are no more logs left to query.
             next_token = result.get("nextToken", None)
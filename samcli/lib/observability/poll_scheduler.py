@@ -0,0 +1,187 @@
+"""
+Adaptive polling shared by the pullers which tail observability information
+"""
+
+import random
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+# Calls per second that all the pullers of the same API are allowed to make together
+DEFAULT_POLL_RATE_BUDGET = 5.0
+# The budget is halved when an API throttles, at most once per round of polls of all the pullers, down to this rate,
+# and grows back by this step on each successful poll
+MIN_POLL_RATE_BUDGET = 0.1
+POLL_RATE_BUDGET_RECOVERY_STEP = 0.1
+# Longest delay between two polls of a puller, even after being throttled many times
+MAX_POLL_INTERVAL = 30.0
+# While events are flowing, a puller polls up to this many times more often than its configured interval
+MAX_POLL_SPEEDUP = 4
+
+
+class PollRateBudget:
+    """
+    Rate of API calls shared by all the pullers tailing the same API.
+
+    Each registered puller gets an equal share of the budget, so that tailing many resources spreads the calls over
+    time instead of having every puller throttled. The budget shrinks when the API throttles and slowly grows back
+    while the calls succeed. When many pullers are throttled together, they all react to the same overload, so the
+    budget is only halved once until every puller had the time to poll at the reduced rate.
+    """
+
+    def __init__(
+        self,
+        max_rate: float = DEFAULT_POLL_RATE_BUDGET,
+        min_rate: float = MIN_POLL_RATE_BUDGET,
+        clock: Optional[Callable[[], float]] = None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        max_rate : float
+            Maximum number of calls per second for all the pullers
+        min_rate : float
+            Lowest rate the budget shrinks to when throttled
+        clock : Optional[Callable[[], float]]
+            Returns the current time in seconds, defaults to time.monotonic
+        """
+        self._max_rate = max_rate
+        self._min_rate = min(min_rate, max_rate)
+        self._rate = max_rate
+        self._pullers = 0
+        self._clock = clock or time.monotonic
+        self._throttled_until: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    def register(self) -> None:
+        with self._lock:
+            self._pullers += 1
+
+    def unregister(self) -> None:
+        with self._lock:
+            self._pullers = max(self._pullers - 1, 0)
+
+    def throttled(self) -> None:
+        with self._lock:
+            now = self._clock()
+            if self._throttled_until is not None and now < self._throttled_until:
+                return
+            self._rate = max(self._rate / 2, self._min_rate)
+            self._throttled_until = now + max(self._pullers, 1) / self._rate
+
+    def succeeded(self) -> None:
+        with self._lock:
+            self._rate = min(self._rate + POLL_RATE_BUDGET_RECOVERY_STEP, self._max_rate)
+
+    def min_interval(self) -> float:
+        """
+        Returns the shortest delay between two polls of each puller, which keeps all of them within the budget
+        """
+        with self._lock:
+            return max(self._pullers, 1) / self._rate
+
+
+_POLL_RATE_BUDGETS: Dict[str, PollRateBudget] = {}
+_POLL_RATE_BUDGETS_LOCK = threading.Lock()
+
+
+def get_poll_rate_budget(api_name: str) -> PollRateBudget:
+    """
+    Returns the budget shared by all the pullers of the given API
+
+    Parameters
+    ----------
+    api_name : str
+        Name of the API that is polled, eg: "logs" or "xray"
+    """
+    with _POLL_RATE_BUDGETS_LOCK:
+        budget = _POLL_RATE_BUDGETS.get(api_name)
+        if not budget:
+            budget = _POLL_RATE_BUDGETS[api_name] = PollRateBudget()
+        return budget
+
+
+class AdaptivePollInterval:
+    """
+    Delay between the polls of a single puller.
+
+    The delay shrinks while events are flowing, goes back to the configured interval once they stop, and doubles,
+    with jitter, up to MAX_POLL_INTERVAL when the API throttles. It is never shorter than the share of the rate
+    budget of the puller. Use it as a context manager around the tail loop, so that the puller takes part in the
+    budget while it is tailing.
+    """
+
+    def __init__(
+        self,
+        poll_interval: float,
+        budget: PollRateBudget,
+        max_interval: float = MAX_POLL_INTERVAL,
+        jitter: Optional[Callable[[], float]] = None,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        poll_interval : float
+            Interval configured for the puller, used while it does not receive events
+        budget : PollRateBudget
+            Rate budget shared with the other pullers of the same API
+        max_interval : float
+            Ceiling of the delay after throttling
+        jitter : Optional[Callable[[], float]]
+            Returns a random number in [0, 1) used to spread the polls of the pullers, defaults to random.random
+        """
+        self._poll_interval = poll_interval
+        self._min_interval = poll_interval / MAX_POLL_SPEEDUP
+        self._max_interval = max(max_interval, poll_interval)
+        self._budget = budget
+        self._jitter = jitter or random.random
+        self._interval = poll_interval
+
+    def __enter__(self) -> "AdaptivePollInterval":
+        self._budget.register()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self._budget.unregister()
+
+    def next_delay(self, had_data: bool) -> float:
+        """
+        Returns the delay before the next poll, after a poll that succeeded
+
+        Parameters
+        ----------
+        had_data : bool
+            Whether the poll returned new events
+        """
+        self._budget.succeeded()
+        if self._interval > self._poll_interval:
+            # recovering from throttling
+            self._interval = max(self._interval / 2, self._poll_interval)
+        elif had_data:
+            self._interval = max(self._interval / 2, self._min_interval)
+        else:
+            self._interval = min(self._interval * 2, self._poll_interval)
+        return self._delay()
+
+    def next_delay_after_throttling(self) -> float:
+        """
+        Returns the delay before the next poll, after the API throttled the puller
+        """
+        self._budget.throttled()
+        self._interval = min(max(self._interval, self._poll_interval) * 2, self._max_interval)
+        return self._delay()
+
+    def _delay(self) -> float:
+        min_interval = self._budget.min_interval()
+        if self._interval <= self._poll_interval and self._interval >= min_interval:
+            return self._interval
+        # The share of the budget wins over the ceiling, so that many pullers do not exceed the rate of the API
+        delay = max(min(self._interval, self._max_interval), min_interval)
+        # Spread the polls which are slowed down, so that the pullers do not all call the API at the same time,
+        # without ever polling more often than the share of the budget
+        floor = max(delay / 2, min_interval)
+        return floor + (delay - floor) * self._jitter()
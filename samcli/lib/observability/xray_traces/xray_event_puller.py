@@ -11,6 +11,7 @@ from typing import Any, Dict, List, Optional, Union
 from botocore.exceptions import ClientError
 
 from samcli.lib.observability.observability_info_puller import ObservabilityEventConsumer, ObservabilityPuller
+from samcli.lib.observability.poll_scheduler import AdaptivePollInterval, PollRateBudget, get_poll_rate_budget
 from samcli.lib.observability.xray_traces.xray_events import XRayTraceEvent
 from samcli.lib.utils.time import to_datetime, to_timestamp
 
@@ -22,6 +23,7 @@ class AbstractXRayPuller(ObservabilityPuller):
         self,
         max_retries: int = 1000,
         poll_interval: int = 1,
+        poll_rate_budget: Optional[PollRateBudget] = None,
     ):
         """
         Parameters
@@ -30,9 +32,12 @@ class AbstractXRayPuller(ObservabilityPuller):
             Optional maximum number of retries which can be used to pull information. Default value is 1000
         poll_interval : int
             Optional interval value that will be used to wait between calls in tail operation. Default value is 1
+        poll_rate_budget : Optional[PollRateBudget]
+            Optional rate budget shared with other pullers, defaults to the one of all the XRay pullers
         """
         self._max_retries = max_retries
         self._poll_interval = poll_interval
+        self._poll_rate_budget = poll_rate_budget or get_poll_rate_budget("xray")
         self._had_data = False
         self.latest_event_time = 0
 
@@ -40,36 +45,32 @@ class AbstractXRayPuller(ObservabilityPuller):
         if start_time:
             self.latest_event_time = to_timestamp(start_time)
 
-        counter = self._max_retries
-        while counter > 0 and not self.cancelled:
-            LOG.debug("Tailing XRay traces starting at %s", self.latest_event_time)
-
-            counter -= 1
-            try:
-                self.load_time_period(to_datetime(self.latest_event_time), datetime.utcnow())
-            except ClientError as err:
-                error_code = err.response.get("Error", {}).get("Code")
-                if error_code == "ThrottlingException":
-                    # if throttled, increase poll interval by 1 second each time
-                    if self._poll_interval == 1:
-                        self._poll_interval += 1
-                    else:
-                        self._poll_interval **= 2
-                    LOG.warning(
-                        "Throttled by XRay API, increasing the poll interval time to %s seconds",
-                        self._poll_interval,
-                    )
+        with AdaptivePollInterval(self._poll_interval, self._poll_rate_budget) as poll_interval:
+            counter = self._max_retries
+            while counter > 0 and not self.cancelled:
+                LOG.debug("Tailing XRay traces starting at %s", self.latest_event_time)
+
+                counter -= 1
+                try:
+                    self.load_time_period(to_datetime(self.latest_event_time), datetime.utcnow())
+                except ClientError as err:
+                    error_code = err.response.get("Error", {}).get("Code")
+                    if error_code != "ThrottlingException":
+                        # if exception is other than throttling re-raise
+                        LOG.error("Failed while fetching new AWS X-Ray events", exc_info=err)
+                        raise err
+                    # if throttled, back off and slow down all the other XRay pullers as well
+                    delay = poll_interval.next_delay_after_throttling()
+                    LOG.warning("Throttled by XRay API, increasing the poll interval time to %.1f seconds", delay)
                 else:
-                    # if exception is other than throttling re-raise
-                    LOG.error("Failed while fetching new AWS X-Ray events", exc_info=err)
-                    raise err
+                    delay = poll_interval.next_delay(bool(self._had_data))
 
-            if self._had_data:
-                counter = self._max_retries
-                self.latest_event_time += 1
-                self._had_data = False
+                if self._had_data:
+                    counter = self._max_retries
+                    self.latest_event_time += 1
+                    self._had_data = False
 
-            time.sleep(self._poll_interval)
+                time.sleep(delay)
 
 
 class XRayTracePuller(AbstractXRayPuller):
@@ -79,7 +80,12 @@ class XRayTracePuller(AbstractXRayPuller):
     """
 
     def __init__(
-        self, xray_client: Any, consumer: ObservabilityEventConsumer, max_retries: int = 1000, poll_interval: int = 1
+        self,
+        xray_client: Any,
+        consumer: ObservabilityEventConsumer,
+        max_retries: int = 1000,
+        poll_interval: int = 1,
+        poll_rate_budget: Optional[PollRateBudget] = None,
     ):
         """
         Parameters
@@ -92,8 +98,10 @@ class XRayTracePuller(AbstractXRayPuller):
             Optional maximum number of retries which can be used to pull information. Default value is 1000
         poll_interval : int
             Optional interval value that will be used to wait between calls in tail operation. Default value is 1
+        poll_rate_budget : Optional[PollRateBudget]
+            Optional rate budget shared with other pullers, defaults to the one of all the XRay pullers
         """
-        super().__init__(max_retries, poll_interval)
+        super().__init__(max_retries, poll_interval, poll_rate_budget)
         self.xray_client = xray_client
         self.consumer = consumer
         # Previous trace ID is a dictionary that contains the following information: {trace_id: trace_revision,}
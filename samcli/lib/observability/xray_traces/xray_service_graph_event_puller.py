@@ -7,6 +7,7 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional, Set, Union
 
 from samcli.lib.observability.observability_info_puller import ObservabilityEventConsumer
+from samcli.lib.observability.poll_scheduler import PollRateBudget
 from samcli.lib.observability.xray_traces.xray_event_puller import AbstractXRayPuller
 from samcli.lib.observability.xray_traces.xray_events import XRayServiceGraphEvent
 from samcli.lib.utils.time import to_utc, utc_to_timestamp
@@ -20,7 +21,12 @@ class XRayServiceGraphPuller(AbstractXRayPuller):
     """
 
     def __init__(
-        self, xray_client: Any, consumer: ObservabilityEventConsumer, max_retries: int = 1000, poll_interval: int = 1
+        self,
+        xray_client: Any,
+        consumer: ObservabilityEventConsumer,
+        max_retries: int = 1000,
+        poll_interval: int = 1,
+        poll_rate_budget: Optional[PollRateBudget] = None,
     ):
         """
         Parameters
@@ -33,8 +39,10 @@ class XRayServiceGraphPuller(AbstractXRayPuller):
             Optional maximum number of retries which can be used to pull information. Default value is 1000
         poll_interval : int
             Optional interval value that will be used to wait between calls in tail operation. Default value is 1
+        poll_rate_budget : Optional[PollRateBudget]
+            Optional rate budget shared with other pullers, defaults to the one of all the XRay pullers
         """
-        super().__init__(max_retries, poll_interval)
+        super().__init__(max_retries, poll_interval, poll_rate_budget)
         self.xray_client = xray_client
         self.consumer = consumer
         self._previous_xray_service_graphs: Set[str] = set()
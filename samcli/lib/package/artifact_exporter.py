@@ -15,12 +15,14 @@ Exporting resources defined in the cloudformation template to the cloud.
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 import os
+from concurrent.futures import Future
 from typing import Dict, List, Optional
 
 from botocore.utils import set_value_from_jmespath
 
 from samcli.commands.package import exceptions
 from samcli.lib.package.code_signer import CodeSigner
+from samcli.lib.package.export_executor import IMAGE_PUSH_LOCK, ExportExecutor, wait_for_exports
 from samcli.lib.package.local_files_utils import get_uploaded_s3_object_name, mktempfile
 from samcli.lib.package.packageable_resources import (
     GLOBAL_EXPORT_DICT,
@@ -60,6 +62,8 @@ class CloudFormationStackResource(ResourceZip):
 
     RESOURCE_TYPE = AWS_CLOUDFORMATION_STACK
     PROPERTY_NAME = RESOURCES_WITH_LOCAL_PATHS[RESOURCE_TYPE][0]
+    # set by the parent template, the artifacts of the nested template are exported on the same worker pools
+    export_executor: Optional[ExportExecutor] = None
 
     def do_export(self, resource_id, resource_dict, parent_dir):
         """
@@ -88,6 +92,7 @@ class CloudFormationStackResource(ResourceZip):
             normalize_template=True,
             normalize_parameters=True,
             parent_stack_id=resource_id,
+            export_executor=self.export_executor,
         ).export()
 
         exported_template_str = yaml_dump(exported_template_dict)
@@ -178,9 +183,12 @@ class Template:
         normalize_template: bool = False,
         normalize_parameters: bool = False,
         parent_stack_id: str = "",
+        export_executor: Optional[ExportExecutor] = None,
     ):
         """
-        Reads the template and makes it ready for export
+        Reads the template and makes it ready for export.
+        When an export executor is given, the resources and nested stacks are exported concurrently on its workers,
+        otherwise they are exported one at a time.
         """
         if not template_str:
             if not (is_local_folder(parent_dir) and os.path.isabs(parent_dir)):
@@ -201,6 +209,7 @@ class Template:
         self.metadata_to_export = metadata_to_export
         self.uploaders = uploaders
         self.parent_stack_id = parent_stack_id
+        self.export_executor = export_executor
 
     def _export_global_artifacts(self, template_dict: Dict) -> Dict:
         """
@@ -275,6 +284,7 @@ class Template:
         self._apply_global_values()
         self.template_dict = self._export_global_artifacts(self.template_dict)
 
+        futures: List[Future] = []
         for resource_logical_id, resource in self.template_dict["Resources"].items():
             resource_type = resource.get("Type", None)
             resource_dict = resource.get("Properties", {})
@@ -288,8 +298,26 @@ class Template:
                     continue
                 # Export code resources
                 exporter = exporter_class(self.uploaders, self.code_signer)
-                exporter.export(full_path, resource_dict, self.template_dir)
-
+                if not self.export_executor:
+                    exporter.export(full_path, resource_dict, self.template_dir)
+                elif isinstance(exporter, CloudFormationStackResource):
+                    exporter.export_executor = self.export_executor
+                    futures.append(
+                        self.export_executor.submit_stack(exporter.export, full_path, resource_dict, self.template_dir)
+                    )
+                elif exporter.EXPORT_DESTINATION == Destination.ECR:
+                    # images are pushed one at a time, the docker push progress can not be interleaved
+                    with IMAGE_PUSH_LOCK:
+                        exporter.export(full_path, resource_dict, self.template_dir)
+                else:
+                    futures.append(
+                        self.export_executor.submit_artifact(
+                            exporter.export, full_path, resource_dict, self.template_dir
+                        )
+                    )
+
+        # every export only updates the properties of its own resource, the template stays in the same order
+        wait_for_exports(futures)
         return self.template_dict
 
     def delete(self, retain_resources: List):
@@ -10,8 +10,6 @@ from typing import Dict
 
 import botocore
 import click
-import docker
-from docker.errors import APIError, BuildError
 
 from samcli.commands.package.exceptions import (
     DeleteArtifactFailedError,
@@ -22,9 +20,13 @@ from samcli.commands.package.exceptions import (
 from samcli.lib.constants import DOCKER_MIN_API_VERSION
 from samcli.lib.docker.log_streamer import LogStreamer, LogStreamError
 from samcli.lib.package.image_utils import tag_translation
+from samcli.lib.utils.lazy_import import lazy_import
 from samcli.lib.utils.osutils import stderr
 from samcli.lib.utils.stream_writer import StreamWriter
 
+docker = lazy_import("docker")
+docker_errors = lazy_import("docker.errors")
+
 LOG = logging.getLogger(__name__)
 
 ECR_USERNAME = "AWS"
@@ -63,7 +65,7 @@ class ECRUploader:
 
         try:
             self.docker_client.login(username=ECR_USERNAME, password=password, registry=registry)
-        except APIError as ex:
+        except docker_errors.APIError as ex:
             raise DockerLoginFailedError(msg=str(ex)) from ex
         self.auth_config = {"username": username, "password": password}
 
@@ -115,7 +117,7 @@ class ECRUploader:
                 _log_streamer = LogStreamer(stream=StreamWriter(stream=StringIO(), auto_flush=True))
                 _log_streamer.stream_progress(push_logs)
 
-        except (BuildError, APIError, LogStreamError) as ex:
+        except (docker_errors.BuildError, docker_errors.APIError, LogStreamError) as ex:
             raise DockerPushFailedError(msg=str(ex)) from ex
 
         return f"{repository}:{_tag}"
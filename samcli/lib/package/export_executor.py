@@ -0,0 +1,124 @@
+"""
+Runs the export of the artifacts of a template and of its nested stacks concurrently
+"""
+
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, List, Set
+
+# Same sizing as the default ThreadPoolExecutor, exports mostly wait on S3 uploads
+DEFAULT_EXPORT_JOBS = min(32, (os.cpu_count() or 1) + 4)
+# Serializes the image pushes of all the templates, nested stacks are exported concurrently on the stack pool and the
+# docker push progress can not be interleaved
+IMAGE_PUSH_LOCK = threading.Lock()
+
+
+class ExportExecutor:
+    """
+    Runs the exports of a template and of its nested stacks on two bounded pools of worker threads.
+
+    Artifacts (zip, hash and upload of a single property) are exported on the artifact pool, they never wait on other
+    exports. A nested stack waits for the artifacts of its own template, so it runs on the stack pool instead, and the
+    stacks nested deeper are exported on the thread of their parent stack. This way, a worker never waits for a task
+    that is queued behind it on the same pool.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_EXPORT_JOBS) -> None:
+        """
+        Parameters
+        ----------
+        max_workers: int
+            Maximum number of artifacts, and of nested stacks, exported at the same time
+        """
+        if max_workers < 1:
+            raise ValueError("The export needs at least one worker thread")
+
+        self._artifact_pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="sam-package")
+        self._stack_pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="sam-package-stack")
+        self._local = threading.local()
+        self._futures: Set[Future] = set()
+        self._futures_lock = threading.Lock()
+
+    def __enter__(self) -> "ExportExecutor":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.shutdown()
+
+    def submit_artifact(self, fn: Callable[..., Any], *args: Any) -> Future:
+        """
+        Schedules the export of an artifact
+
+        Returns
+        -------
+        Future
+            Future of the export
+        """
+        return self._track(self._artifact_pool.submit(fn, *args))
+
+    def submit_stack(self, fn: Callable[..., Any], *args: Any) -> Future:
+        """
+        Schedules the export of a nested stack, it runs on the current thread if it is already exporting a stack
+
+        Returns
+        -------
+        Future
+            Future of the export
+        """
+        if getattr(self._local, "in_stack", False):
+            future: Future = Future()
+            try:
+                future.set_result(fn(*args))
+            except Exception as ex:  # pylint: disable=broad-except
+                future.set_exception(ex)
+            return future
+        return self._track(self._stack_pool.submit(self._run_stack, fn, *args))
+
+    def shutdown(self) -> None:
+        """
+        Cancels the exports which are not started yet and waits for the running ones
+        """
+        # ThreadPoolExecutor.shutdown only accepts cancel_futures from Python 3.9
+        with self._futures_lock:
+            futures, self._futures = self._futures, set()
+        for future in futures:
+            future.cancel()
+        self._stack_pool.shutdown(wait=True)
+        self._artifact_pool.shutdown(wait=True)
+
+    def _track(self, future: Future) -> Future:
+        with self._futures_lock:
+            self._futures.add(future)
+        future.add_done_callback(self._untrack)
+        return future
+
+    def _untrack(self, future: Future) -> None:
+        with self._futures_lock:
+            self._futures.discard(future)
+
+    def _run_stack(self, fn: Callable[..., Any], *args: Any) -> Any:
+        self._local.in_stack = True
+        try:
+            return fn(*args)
+        finally:
+            self._local.in_stack = False
+
+
+def wait_for_exports(futures: List[Future]) -> None:
+    """
+    Waits for the given exports, in order, and raises the error of the first one that failed.
+    The exports which did not start yet are cancelled once one of them fails.
+
+    Parameters
+    ----------
+    futures: List[Future]
+        Futures of the exports, in the order of the template
+    """
+    try:
+        for future in futures:
+            future.result()
+    except BaseException:
+        for future in futures:
+            future.cancel()
+        raise
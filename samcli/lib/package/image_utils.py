@@ -2,12 +2,13 @@
 Image artifacts based utilities
 """
 
-import docker
-from docker.errors import APIError, NullResource
-
 from samcli.commands.package.exceptions import DockerGetLocalImageFailedError
 from samcli.lib.constants import DOCKER_MIN_API_VERSION
 from samcli.lib.package.utils import is_ecr_url
+from samcli.lib.utils.lazy_import import lazy_import
+
+docker = lazy_import("docker")
+docker_errors = lazy_import("docker.errors")
 
 SHA_CHECKSUM_TRUNCATION_LENGTH = 12
 
@@ -39,9 +40,9 @@ def tag_translation(image, docker_image_id=None, gen_tag="latest"):
         try:
             docker_client = docker.from_env(version=DOCKER_MIN_API_VERSION)
             docker_image_id = docker_client.images.get(image).id
-        except APIError as ex:
+        except docker_errors.APIError as ex:
             raise DockerGetLocalImageFailedError(str(ex)) from ex
-        except NullResource as ex:
+        except docker_errors.NullResource as ex:
             raise NoImageFoundException(str(ex)) from ex
 
     # NOTE(sriram-mv): Checksum truncation Length is set to 12
@@ -0,0 +1,210 @@
+"""
+Settings of the S3 transfers, and the transfer manager shared by all the S3 uploaders of a command
+"""
+
+import logging
+import threading
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Tuple, cast
+
+from samcli.commands.exceptions import UserException
+from samcli.lib.utils.lazy_import import lazy_import
+
+if TYPE_CHECKING:  # pragma: no cover
+    from boto3.s3.transfer import TransferConfig
+
+transfer = lazy_import("boto3.s3.transfer")
+
+LOG = logging.getLogger(__name__)
+
+MB = 1024 * 1024
+# Same defaults as boto3
+DEFAULT_MAX_CONCURRENCY = 10
+DEFAULT_MULTIPART_THRESHOLD_MB = 8
+DEFAULT_MULTIPART_CHUNKSIZE_MB = 8
+# S3 does not accept multipart upload parts smaller than 5 MiB, except for the last one
+MIN_MULTIPART_CHUNKSIZE_MB = 5
+
+
+class InvalidS3TransferConfigException(UserException):
+    """
+    Raised when the S3 transfer settings can not be used to upload artifacts
+    """
+
+
+class S3TransferSettings(NamedTuple):
+    """
+    Concurrency and chunking of the S3 uploads
+    """
+
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    multipart_threshold: int = DEFAULT_MULTIPART_THRESHOLD_MB * MB
+    multipart_chunksize: int = DEFAULT_MULTIPART_CHUNKSIZE_MB * MB
+
+    def to_transfer_config(self) -> "TransferConfig":
+        return cast(
+            "TransferConfig",
+            transfer.TransferConfig(
+                max_concurrency=self.max_concurrency,
+                multipart_threshold=self.multipart_threshold,
+                multipart_chunksize=self.multipart_chunksize,
+            ),
+        )
+
+
+def get_s3_transfer_settings(
+    max_concurrency: Optional[int], multipart_threshold_mb: Optional[int], multipart_chunksize_mb: Optional[int]
+) -> S3TransferSettings:
+    """
+    Validates the S3 transfer settings provided through the command line and creates the transfer settings
+
+    Parameters
+    ----------
+    max_concurrency: Optional[int]
+        Maximum number of parts uploaded at the same time, the default is used if it is not provided
+    multipart_threshold_mb: Optional[int]
+        Size in MiB from which files are uploaded in multiple parts, the default is used if it is not provided
+    multipart_chunksize_mb: Optional[int]
+        Size in MiB of each part of a multipart upload, the default is used if it is not provided
+
+    Returns
+    -------
+    S3TransferSettings
+        The S3 transfer settings
+    """
+    max_concurrency = DEFAULT_MAX_CONCURRENCY if max_concurrency is None else max_concurrency
+    multipart_threshold_mb = (
+        DEFAULT_MULTIPART_THRESHOLD_MB if multipart_threshold_mb is None else multipart_threshold_mb
+    )
+    multipart_chunksize_mb = (
+        DEFAULT_MULTIPART_CHUNKSIZE_MB if multipart_chunksize_mb is None else multipart_chunksize_mb
+    )
+    if max_concurrency < 1:
+        raise InvalidS3TransferConfigException(f"S3 max concurrency must be at least 1, got {max_concurrency}")
+    if multipart_threshold_mb < 1:
+        raise InvalidS3TransferConfigException(
+            f"S3 multipart threshold must be at least 1 MiB, got {multipart_threshold_mb}"
+        )
+    if multipart_chunksize_mb < MIN_MULTIPART_CHUNKSIZE_MB:
+        raise InvalidS3TransferConfigException(
+            f"S3 multipart chunk size must be at least {MIN_MULTIPART_CHUNKSIZE_MB} MiB, got {multipart_chunksize_mb}"
+        )
+
+    return S3TransferSettings(
+        max_concurrency=max_concurrency,
+        multipart_threshold=multipart_threshold_mb * MB,
+        multipart_chunksize=multipart_chunksize_mb * MB,
+    )
+
+
+class SharedTransferManager:
+    """
+    Hands out one transfer manager, with its pool of upload threads, to all the S3 uploaders of a command.
+
+    A transfer manager is bound to the S3 client it was created with, including its credentials and botocore
+    configuration, so the managers are kept per client object. The uploaders built on the same client share its
+    transfer manager. The client is kept alongside its manager so that its id can't be reused by another client.
+
+    Commands use it as a context manager, the managers, and their threads, are shut down when the command ends.
+    """
+
+    def __init__(self, settings: Optional[S3TransferSettings] = None) -> None:
+        self._settings = settings or S3TransferSettings()
+        self._managers: Dict[int, Tuple[Any, Any]] = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "SharedTransferManager":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.shutdown()
+
+    @property
+    def settings(self) -> S3TransferSettings:
+        return self._settings
+
+    def shutdown(self) -> None:
+        """
+        Shuts down the transfer managers and releases their clients, new ones are created if uploads start again
+        """
+        with self._lock:
+            managers = self._take_managers()
+        for manager in managers:
+            manager.shutdown()
+
+    def _take_managers(self) -> List[Any]:
+        managers = [manager for _, manager in self._managers.values()]
+        self._managers.clear()
+        return managers
+
+    def configure(self, settings: S3TransferSettings) -> None:
+        """
+        Changes the transfer settings, the transfer managers created with the previous settings are shut down
+
+        Parameters
+        ----------
+        settings: S3TransferSettings
+            Settings of the transfer managers created from now on
+        """
+        with self._lock:
+            if settings == self._settings:
+                return
+            self._settings = settings
+            managers = self._take_managers()
+        for manager in managers:
+            manager.shutdown()
+
+    def get(self, s3_client: Any) -> Any:
+        """
+        Returns the transfer manager shared by the uploaders built on the given client
+
+        Parameters
+        ----------
+        s3_client: Any
+            S3 client of the uploader
+
+        Returns
+        -------
+        TransferManager
+            The shared transfer manager
+        """
+        with self._lock:
+            entry = self._managers.get(id(s3_client))
+            if entry is None:
+                LOG.debug(
+                    "Creating S3 transfer manager for %s (%s) with %s",
+                    s3_client.meta.region_name,
+                    s3_client.meta.endpoint_url,
+                    self._settings,
+                )
+                entry = (s3_client, transfer.create_transfer_manager(s3_client, self._settings.to_transfer_config()))
+                self._managers[id(s3_client)] = entry
+            return entry[1]
+
+
+_SHARED_TRANSFER_MANAGER = SharedTransferManager()
+
+
+def get_shared_transfer_manager() -> SharedTransferManager:
+    """
+    Returns the transfer manager shared by the S3 uploaders of the running command
+    """
+    return _SHARED_TRANSFER_MANAGER
+
+
+def configure_s3_transfer(
+    max_concurrency: Optional[int], multipart_threshold_mb: Optional[int], multipart_chunksize_mb: Optional[int]
+) -> SharedTransferManager:
+    """
+    Validates the S3 transfer settings provided through the command line and applies them to the uploads of the
+    running command
+
+    Returns
+    -------
+    SharedTransferManager
+        The shared transfer manager, to use as a context manager around the uploads of the command
+    """
+    shared_transfer_manager = get_shared_transfer_manager()
+    shared_transfer_manager.configure(
+        get_s3_transfer_settings(max_concurrency, multipart_threshold_mb, multipart_chunksize_mb)
+    )
+    return shared_transfer_manager
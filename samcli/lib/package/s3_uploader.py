@@ -20,19 +20,30 @@ import os
 import sys
 import threading
 from collections import abc
-from typing import Any, Optional, cast
+from typing import Any, Optional, Set, Tuple, cast
 
 import botocore
 import botocore.exceptions
-from boto3.s3 import transfer
-from boto3.s3.transfer import ProgressCallbackInvoker
 
 from samcli.commands.package.exceptions import BucketNotSpecifiedError, NoSuchBucketError
 from samcli.lib.package.local_files_utils import get_uploaded_s3_object_name
+from samcli.lib.package.s3_transfer import get_shared_transfer_manager
+from samcli.lib.package.upload_manifest import UploadManifest
+from samcli.lib.utils.hash import FileChecksumCache
+from samcli.lib.utils.lazy_import import lazy_import
 from samcli.lib.utils.s3 import parse_s3_url
 
+boto3_s3_transfer = lazy_import("boto3.s3.transfer")
+
 LOG = logging.getLogger(__name__)
 
+# Maximum number of keys listed to find the artifacts which are already uploaded, a single list_objects_v2 request.
+# Existence of the keys which are not listed is checked one by one.
+MAX_LISTED_KEYS = 1000
+# Number of objects checked one by one before the keys under the prefix are listed, listing them does not save any
+# request when only a few artifacts are packaged
+MIN_CHECKS_BEFORE_LISTING = 3
+
 
 class S3Uploader:
     """
@@ -61,16 +72,39 @@ class S3Uploader:
         kms_key_id: Optional[str] = None,
         force_upload: bool = False,
         no_progressbar: bool = False,
+        upload_manifest: Optional[UploadManifest] = None,
+        checksum_cache: Optional[FileChecksumCache] = None,
+        parallel_uploads: bool = False,
     ):
+        """
+        Parameters
+        ----------
+        upload_manifest : Optional[UploadManifest]
+            Record of the artifacts uploaded by previous runs, used as a hint which is still confirmed against S3
+        checksum_cache : Optional[FileChecksumCache]
+            Index of file checksums, used to compute the S3 keys of the artifacts without reading unchanged files
+        parallel_uploads : bool
+            Whether several files are uploaded at the same time, in which case the progress of each upload is not
+            printed and a line is printed once each upload completes
+        """
         self.s3 = s3_client
         self.bucket_name = bucket_name
         self.prefix = prefix
         self.kms_key_id = kms_key_id or None
         self.force_upload = force_upload
         self.no_progressbar = no_progressbar
-        self.transfer_manager = transfer.create_transfer_manager(self.s3, transfer.TransferConfig())
+        # the uploaders of a command share the transfer manager, and its upload threads, of their S3 client
+        self.transfer_manager = get_shared_transfer_manager().get(self.s3)
+        self.upload_manifest = upload_manifest
+        self.checksum_cache = checksum_cache
+        self.parallel_uploads = parallel_uploads
 
         self._artifact_metadata = None
+        # keys found under the prefix, listed once after the first few existence checks
+        self._listed_keys: Optional[Set[str]] = None
+        self._listed_all_keys = False
+        self._existence_checks = 0
+        self._listing_lock = threading.Lock()
 
     def upload(self, file_name: str, remote_path: str) -> str:
         """
@@ -84,7 +118,7 @@ class S3Uploader:
             remote_path = "{0}/{1}".format(self.prefix, remote_path)
 
         # Check if a file with same data exists
-        if not self.force_upload and self.file_exists(remote_path):
+        if not self.force_upload and self.object_exists(remote_path):
             LOG.info("File with same data already exists at %s, skipping upload", remote_path)
             return self.make_url(remote_path)
 
@@ -104,8 +138,8 @@ class S3Uploader:
                 raise BucketNotSpecifiedError()
 
             if not self.no_progressbar:
-                print_progress_callback = ProgressCallbackInvoker(
-                    ProgressPercentage(file_name, remote_path).on_progress
+                print_progress_callback = boto3_s3_transfer.ProgressCallbackInvoker(
+                    ProgressPercentage(file_name, remote_path, completion_only=self.parallel_uploads).on_progress
                 )
                 future = self.transfer_manager.upload(
                     file_name, self.bucket_name, remote_path, additional_args, [print_progress_callback]
@@ -114,6 +148,7 @@ class S3Uploader:
                 future = self.transfer_manager.upload(file_name, self.bucket_name, remote_path, additional_args)
             future.result()
 
+            self._record_upload(remote_path)
             return self.make_url(remote_path)
 
         except botocore.exceptions.ClientError as ex:
@@ -138,11 +173,66 @@ class S3Uploader:
         # uploads of same object. Uploader will check if the file exists in S3
         # and re-upload only if necessary. So the template points to same file
         # in multiple places, this will upload only once
+        if not precomputed_md5 and self.checksum_cache:
+            precomputed_md5 = self.checksum_cache.checksum(file_name)
         remote_path = get_uploaded_s3_object_name(
             precomputed_md5=precomputed_md5, file_path=file_name, extension=extension
         )
         return self.upload(file_name, remote_path)
 
+    def find_uploaded(self, precomputed_md5: str, extension: Optional[str] = None) -> Optional[str]:
+        """
+        Looks for an artifact with the given content which was already uploaded, so that it does not need to be
+        created again
+
+        :param precomputed_md5: md5 hash of the content of the artifact
+        :param extension: String of file extension of the object
+        :return: S3 URL of the uploaded object, None if it needs to be uploaded
+        """
+        if self.force_upload:
+            return None
+
+        remote_path = get_uploaded_s3_object_name(precomputed_md5=precomputed_md5, extension=extension)
+        if self.prefix:
+            remote_path = "{0}/{1}".format(self.prefix, remote_path)
+        if not self.object_exists(remote_path):
+            return None
+
+        LOG.info("File with same data already exists at %s, skipping upload", remote_path)
+        return self.make_url(remote_path)
+
+    def object_exists(self, remote_path: str) -> bool:
+        """
+        Checks if an object exists in S3, without sending a request per object when possible.
+
+        Objects are checked one by one until a few objects which are not recorded in the upload manifest were
+        checked. Past that, the keys under the prefix are listed once, and only the keys which could not be listed are
+        checked one by one. The upload manifest is only a hint, the objects it records are still confirmed against S3.
+
+        :param remote_path: key of the object
+        :return: True, if the object exists. False, otherwise
+        """
+        url = self.make_url(remote_path)
+        recorded = bool(self.upload_manifest and self.upload_manifest.contains(url))
+        listing = self._list_keys(expected=recorded)
+        if listing is None:
+            exists = self.file_exists(remote_path)
+        else:
+            listed_keys, listed_all_keys = listing
+            if remote_path in listed_keys:
+                exists = True
+            elif listed_all_keys:
+                exists = False
+            else:
+                exists = self.file_exists(remote_path)
+
+        if exists:
+            self._record_upload(remote_path)
+        elif recorded and self.upload_manifest:
+            LOG.debug("Object %s recorded in the upload manifest no longer exists", url)
+            self.upload_manifest.remove(url)
+        return exists
+
     def delete_artifact(self, remote_path: str, is_key: bool = False) -> bool:
         """
         Deletes a given file from S3
@@ -164,6 +254,10 @@ class S3Uploader:
             if self.file_exists(remote_path=key):
                 LOG.info("\t- Deleting S3 object with key %s", key)
                 self.s3.delete_object(Bucket=self.bucket_name, Key=key)
+                if self.upload_manifest:
+                    self.upload_manifest.remove(self.make_url(key))
+                if self._listed_keys is not None:
+                    self._listed_keys.discard(key)
                 LOG.debug("Deleted s3 object with key %s successfully", key)
                 return True
 
@@ -213,6 +307,49 @@ class S3Uploader:
             # this information.
             return False
 
+    def _list_keys(self, expected: bool = False) -> Optional[Tuple[Set[str], bool]]:
+        """
+        Lists the keys under the prefix, only once for the lifetime of the uploader and only after the first few
+        objects were checked one by one
+
+        :param expected: True if the object being checked is expected to exist, it is then checked with a single
+            request which does not count towards listing the keys
+        :return: the listed keys, and True if all the keys under the prefix could be listed. None if the keys are not
+            listed yet
+        """
+        with self._listing_lock:
+            if self._listed_keys is not None:
+                return self._listed_keys, self._listed_all_keys
+
+            if expected:
+                return None
+            self._existence_checks += 1
+            if self._existence_checks <= MIN_CHECKS_BEFORE_LISTING:
+                return None
+
+            if not self.bucket_name:
+                raise BucketNotSpecifiedError()
+
+            self._listed_keys = set()
+            try:
+                prefix = self.prefix + "/" if self.prefix else ""
+                response = self.s3.list_objects_v2(Bucket=self.bucket_name, Prefix=prefix, MaxKeys=MAX_LISTED_KEYS)
+                self._listed_keys.update(obj["Key"] for obj in response.get("Contents", []))
+                self._listed_all_keys = not response.get("IsTruncated", False)
+            except botocore.exceptions.ClientError as ex:
+                # ListBucket permission is optional, existence is then checked for each object
+                LOG.debug("Unable to list the objects of bucket %s", self.bucket_name, exc_info=ex)
+                self._listed_all_keys = False
+            LOG.debug("Listed %d existing objects in bucket %s", len(self._listed_keys), self.bucket_name)
+            return self._listed_keys, self._listed_all_keys
+
+    def _record_upload(self, remote_path: str) -> None:
+        with self._listing_lock:
+            if self._listed_keys is not None:
+                self._listed_keys.add(remote_path)
+        if self.upload_manifest:
+            self.upload_manifest.add(self.make_url(remote_path))
+
     def make_url(self, obj_path: str) -> str:
         if not self.bucket_name:
             raise BucketNotSpecifiedError()
@@ -246,12 +383,14 @@ class S3Uploader:
 class ProgressPercentage:
     # This class was copied directly from S3Transfer docs
 
-    def __init__(self, filename, remote_path):
+    def __init__(self, filename, remote_path, completion_only=False):
         self._filename = filename
         self._remote_path = remote_path
         self._size = os.path.getsize(filename)
         self._seen_so_far = 0
         self._lock = threading.Lock()
+        # the progress lines of files uploaded at the same time would overwrite each other
+        self._completion_only = completion_only
 
     def on_progress(self, bytes_transferred, **kwargs):
         # To simplify we'll assume this is hooked up
@@ -259,6 +398,12 @@ class ProgressPercentage:
         with self._lock:
             self._seen_so_far += bytes_transferred
             percentage = (self._seen_so_far / self._size) * 100  # noqa: PLR2004
+            if self._completion_only:
+                if self._seen_so_far == self._size:
+                    # written at once, so that it is not interleaved with the lines of the other uploads
+                    sys.stderr.write("\tUploaded to %s  %s bytes%s" % (self._remote_path, self._size, os.linesep))
+                    sys.stderr.flush()
+                return
             sys.stderr.write(
                 "\r\tUploading to %s  %s / %s  (%.2f%%)"
                 % (self._remote_path, self._seen_so_far, self._size, percentage)
@@ -0,0 +1,137 @@
+"""
+Local record of the artifacts uploaded to S3 by previous runs
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+LOG = logging.getLogger(__name__)
+
+UPLOAD_MANIFEST_FILE_NAME = "upload-manifest.json"
+# Entries older than this are checked against S3 again, the object could have been removed by a lifecycle rule
+DEFAULT_MANIFEST_ENTRY_TTL = 7 * 24 * 60 * 60
+
+
+class UploadManifest:
+    """
+    Index of the S3 objects that are known to exist, keyed on their S3 URL.
+
+    The S3 key of an artifact is derived from the checksum of its content, so a URL recorded in the manifest means
+    that the same content was already uploaded. It is only a hint, the object could have been removed from S3 since,
+    so the uploader still confirms that it exists before skipping its upload. When a manifest
+    file is given, the index is loaded from it on first use and written back with ``save``, so that it is shared
+    between SAM CLI runs.
+    """
+
+    VERSION = 1
+
+    def __init__(
+        self,
+        manifest_file: Optional[str] = None,
+        ttl: float = DEFAULT_MANIFEST_ENTRY_TTL,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        manifest_file : Optional[str]
+            Path of the file that persists the index. The index is only kept in memory if it is not provided
+        ttl : float
+            Number of seconds an entry is trusted for, after it was recorded
+        clock : Callable[[], float]
+            Wall clock used to expire the entries
+        """
+        self._manifest_file = manifest_file
+        self._ttl = ttl
+        self._clock = clock
+        self._entries: Dict[str, float] = {}
+        self._loaded = manifest_file is None
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def contains(self, url: str) -> bool:
+        """
+        Returns True if the object was recorded as uploaded and its entry did not expire yet
+
+        Parameters
+        ----------
+        url : str
+            S3 URL of the object
+        """
+        with self._lock:
+            self._load()
+            recorded_at = self._entries.get(url)
+            return recorded_at is not None and self._clock() - recorded_at < self._ttl
+
+    def add(self, url: str) -> None:
+        """
+        Records that the object exists in S3
+
+        Parameters
+        ----------
+        url : str
+            S3 URL of the object
+        """
+        with self._lock:
+            self._load()
+            self._entries[url] = self._clock()
+            self._dirty = True
+
+    def remove(self, url: str) -> None:
+        """
+        Forgets about an object, after it was deleted from S3
+
+        Parameters
+        ----------
+        url : str
+            S3 URL of the object
+        """
+        with self._lock:
+            self._load()
+            if self._entries.pop(url, None) is not None:
+                self._dirty = True
+
+    def save(self) -> None:
+        """
+        Writes the index to the manifest file, if it has changed since it was loaded
+        """
+        if not self._manifest_file:
+            return
+
+        with self._lock:
+            if not self._dirty:
+                return
+            # drop the expired entries, so that the manifest does not grow forever
+            now = self._clock()
+            entries = {url: recorded_at for url, recorded_at in self._entries.items() if now - recorded_at < self._ttl}
+            try:
+                os.makedirs(os.path.dirname(self._manifest_file) or ".", exist_ok=True)
+                temp_file = f"{self._manifest_file}.{os.getpid()}.tmp"
+                with open(temp_file, "w", encoding="utf-8") as file_handle:
+                    json.dump({"version": self.VERSION, "objects": entries}, file_handle)
+                os.replace(temp_file, self._manifest_file)
+                self._entries = entries
+                self._dirty = False
+            except OSError as ex:
+                LOG.debug("Failed to write upload manifest %s", self._manifest_file, exc_info=ex)
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+
+        try:
+            with open(str(self._manifest_file), "r", encoding="utf-8") as file_handle:
+                content = json.load(file_handle)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as ex:
+            LOG.debug("Ignoring unreadable upload manifest %s", self._manifest_file, exc_info=ex)
+            return
+
+        if isinstance(content, dict) and content.get("version") == self.VERSION:
+            self._entries = content.get("objects") or {}
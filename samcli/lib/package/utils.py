@@ -4,6 +4,7 @@ Utilities involved in Packaging.
 
 import contextlib
 import functools
+import hashlib
 import logging
 import os
 import re
@@ -11,7 +12,7 @@ import shutil
 import tempfile
 import zipfile
 from contextlib import contextmanager
-from typing import Callable, Dict, List, Optional, cast
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Union, cast
 
 import jmespath
 
@@ -25,7 +26,7 @@ from samcli.lib.package.permissions import (
     WindowsFilePermissionPermissionMapper,
 )
 from samcli.lib.package.s3_uploader import S3Uploader
-from samcli.lib.utils.hash import dir_checksum
+from samcli.lib.utils.hash import BLOCK_SIZE, _get_md5, dir_checksum, directory_checksum
 from samcli.lib.utils.resources import LAMBDA_LOCAL_RESOURCES
 from samcli.lib.utils.s3 import parse_s3_url
 
@@ -189,7 +190,11 @@ def upload_local_artifacts(
             local_path,
             uploader,
             extension,
-            zip_method=make_zip_with_lambda_permissions if resource_type in LAMBDA_LOCAL_RESOURCES else make_zip,
+            zip_method=(
+                make_zip_artifact_with_lambda_permissions
+                if resource_type in LAMBDA_LOCAL_RESOURCES
+                else make_zip_artifact
+            ),
         )
 
     # Path could be pointing to a file. Upload the file
@@ -206,7 +211,48 @@ def resource_not_packageable(resource_dict):
     return False
 
 
+class ZipArtifact(NamedTuple):
+    """
+    Zip archive created from a directory, with the digests computed while it was written
+    """
+
+    # path of the zip file
+    path: str
+    # checksum of the zipped directory content, the same value as dir_checksum(source_root, followlinks=True)
+    content_md5: str
+    # hex digest of the SHA256 of the zip file itself
+    sha256: str
+
+
+class _HashingWriter:
+    """
+    Write-only file object that computes the digest of everything written to the underlying file.
+
+    It does not support seek or tell, so zipfile writes the archive sequentially, with data descriptors after the
+    entries, instead of going back to rewrite the local headers.
+    """
+
+    def __init__(self, file_obj: Any) -> None:
+        self._file_obj = file_obj
+        self.digest = hashlib.sha256()
+
+    def write(self, data: bytes) -> int:
+        self.digest.update(data)
+        return cast(int, self._file_obj.write(data))
+
+    def flush(self) -> None:
+        self._file_obj.flush()
+
+
 def zip_and_upload(local_path: str, uploader: S3Uploader, extension: Optional[str], zip_method: Callable) -> str:
+    if uploader.checksum_cache and not uploader.force_upload:
+        # with the checksums of the unchanged files indexed, the content checksum is known without reading them,
+        # and an artifact which was already uploaded does not need to be zipped again
+        md5_hash = dir_checksum(local_path, followlinks=True, checksum_cache=uploader.checksum_cache)
+        uploaded_url = uploader.find_uploaded(md5_hash, extension)
+        if uploaded_url:
+            return uploaded_url
+
     with zip_folder(local_path, zip_method=zip_method) as (zip_file, md5_hash):
         return uploader.upload_with_dedup(zip_file, precomputed_md5=md5_hash, extension=extension)
 
@@ -231,10 +277,14 @@ def zip_folder(folder_path, zip_method):
     md5hash : str
         The md5 hash of the directory
     """
-    md5hash = dir_checksum(folder_path, followlinks=True)
-    filename = os.path.join(tempfile.mkdtemp(), "data-" + md5hash)
-
-    zipfile_name = zip_method(filename, folder_path)
+    filename = os.path.join(tempfile.mkdtemp(), "data")
+
+    zip_result: Union[ZipArtifact, str] = zip_method(filename, folder_path)
+    if isinstance(zip_result, ZipArtifact):
+        # the content checksum was computed while the files were zipped, no need to read them again
+        zipfile_name, md5hash = zip_result.path, zip_result.content_md5
+    else:
+        zipfile_name, md5hash = zip_result, dir_checksum(folder_path, followlinks=True)
     try:
         yield zipfile_name, md5hash
     finally:
@@ -242,9 +292,14 @@ def zip_folder(folder_path, zip_method):
             os.remove(zipfile_name)
 
 
-def make_zip_with_permissions(file_name, source_root, permission_mappers: List[PermissionMapper]):
+def make_zip_artifact_with_permissions(
+    file_name: str, source_root: str, permission_mappers: List[PermissionMapper]
+) -> ZipArtifact:
     """
-    Create a zip file from the source directory
+    Create a zip file from the source directory, walking and reading the directory only once.
+
+    Every file is streamed into the archive in chunks, while the checksum of its content is computed. The files are
+    added in a sorted order, so the same content always produces the same archive and the same digests.
 
     Parameters
     ----------
@@ -257,48 +312,89 @@ def make_zip_with_permissions(file_name, source_root, permission_mappers: List[P
         which takes in the external attributes of a zipfile.Zipinfo object
     Returns
     -------
-    str
-        The name of the zip file, including .zip extension
+    ZipArtifact
+        The name of the zip file, including .zip extension, with the checksum of the zipped content and of the zip
     """
     permission_mappers = permission_mappers or []
     zipfile_name = "{0}.zip".format(file_name)
     source_root = os.path.abspath(source_root)
     compression_type = zipfile.ZIP_DEFLATED
+
+    files: List[str] = []
+    for root, _, filenames in os.walk(source_root, followlinks=True):
+        files.extend(os.path.join(root, filename) for filename in filenames)
+    # same order as dir_checksum, which is needed to compute the same content checksum
+    files.sort()
+
+    file_checksums = []
+    buffer = bytearray(BLOCK_SIZE)
+    view = memoryview(buffer)
     with open(zipfile_name, "wb") as f:
-        with contextlib.closing(zipfile.ZipFile(f, "w", compression_type)) as zf:
-            for root, _, files in os.walk(source_root, followlinks=True):
-                for filename in files:
-                    full_path = os.path.join(root, filename)
-                    relative_path = os.path.relpath(full_path, source_root)
-                    with open(full_path, "rb") as data:
-                        file_bytes = data.read()
-                        info = zipfile.ZipInfo(relative_path)
-                        # Context: Nov 2020
-                        # Set external attr with Unix 0755 permission
-                        # Originally set to 0005 in the discussion below
-                        # https://github.com/aws/aws-sam-cli/pull/2193#discussion_r513110608
-                        # Changed to 0755 due to a regression in https://github.com/aws/aws-sam-cli/issues/2344
-                        # Final PR: https://github.com/aws/aws-sam-cli/pull/2356/files
-                        if permission_mappers:
-                            # Set host OS to Unix
-                            info.create_system = 3
-                            # Set current permission of the file/dir to ZipInfo's external_attr
-                            info.external_attr = os.stat(full_path).st_mode << 16
-                            for permission_mapper in permission_mappers:
-                                info = permission_mapper.apply(info)
-                            # ZIP date time can be set to the last time the zip content was modified using this logic.
-                            # info.date_time = time.localtime()[0:6]
-
-                            # If the date time above is added, the caching logic that compares ZIP files sha will break.
-                            # Currently we skip executing sync flows for sam sync command when the logic ZIP hash is
-                            # the same as the remote lambda ZIP hash. A timestamp will make the evaluation always false.
-                            # However, without this field, contents of the zip file will have a last modified date 1980
-                            # because python's zipfile.ZipInfo is set to: https://docs.python.org/3/library/zipfile.html.
-                            zf.writestr(info, file_bytes, compress_type=compression_type)
-                        else:
-                            zf.write(full_path, relative_path)
-
-    return zipfile_name
+        writer = _HashingWriter(f)
+        with contextlib.closing(zipfile.ZipFile(writer, "w", compression_type)) as zf:  # type: ignore[call-overload]
+            for full_path in files:
+                relative_path = os.path.relpath(full_path, source_root)
+                file_stat = os.stat(full_path)
+                if permission_mappers:
+                    info = zipfile.ZipInfo(relative_path)
+                    # Context: Nov 2020
+                    # Set external attr with Unix 0755 permission
+                    # Originally set to 0005 in the discussion below
+                    # https://github.com/aws/aws-sam-cli/pull/2193#discussion_r513110608
+                    # Changed to 0755 due to a regression in https://github.com/aws/aws-sam-cli/issues/2344
+                    # Final PR: https://github.com/aws/aws-sam-cli/pull/2356/files
+                    # Set host OS to Unix
+                    info.create_system = 3
+                    # Set current permission of the file/dir to ZipInfo's external_attr
+                    info.external_attr = file_stat.st_mode << 16
+                    for permission_mapper in permission_mappers:
+                        info = permission_mapper.apply(info)
+                    # ZIP date time can be set to the last time the zip content was modified using this logic.
+                    # info.date_time = time.localtime()[0:6]
+
+                    # If the date time above is added, the caching logic that compares ZIP files sha will break.
+                    # Currently we skip executing sync flows for sam sync command when the logic ZIP hash is
+                    # the same as the remote lambda ZIP hash. A timestamp will make the evaluation always false.
+                    # However, without this field, contents of the zip file will have a last modified date 1980
+                    # because python's zipfile.ZipInfo is set to: https://docs.python.org/3/library/zipfile.html.
+                else:
+                    info = zipfile.ZipInfo.from_file(full_path, relative_path)
+                info.compress_type = compression_type
+                # lets zipfile decide upfront if the entry needs the zip64 extensions
+                info.file_size = file_stat.st_size
+
+                content_hash = _get_md5()
+                with open(full_path, "rb") as data, zf.open(info, "w") as entry:
+                    size = data.readinto(buffer)
+                    while size:
+                        chunk = view[:size]
+                        content_hash.update(chunk)
+                        entry.write(chunk)
+                        size = data.readinto(buffer)
+                file_checksums.append((relative_path, content_hash.hexdigest()))
+
+    return ZipArtifact(zipfile_name, directory_checksum(file_checksums), writer.digest.hexdigest())
+
+
+def make_zip_with_permissions(file_name, source_root, permission_mappers: List[PermissionMapper]):
+    """
+    Create a zip file from the source directory
+
+    Parameters
+    ----------
+    file_name : str
+        The basename of the zip file, without .zip
+    source_root : str
+        The path to the source directory
+    permission_mappers : list
+        permission objects that need to match an interface such that they have an apply method
+        which takes in the external attributes of a zipfile.Zipinfo object
+    Returns
+    -------
+    str
+        The name of the zip file, including .zip extension
+    """
+    return make_zip_artifact_with_permissions(file_name, source_root, permission_mappers).path
 
 
 make_zip = functools.partial(
@@ -324,6 +420,24 @@ make_zip_with_lambda_permissions = functools.partial(
 )
 
 
+make_zip_artifact = functools.partial(
+    make_zip_artifact_with_permissions,
+    permission_mappers=[
+        WindowsFilePermissionPermissionMapper(permissions=0o100755),
+        WindowsDirPermissionPermissionMapper(permissions=0o100755),
+    ],
+)
+make_zip_artifact_with_lambda_permissions = functools.partial(
+    make_zip_artifact_with_permissions,
+    permission_mappers=[
+        WindowsFilePermissionPermissionMapper(permissions=0o100755),
+        WindowsDirPermissionPermissionMapper(permissions=0o100755),
+        AdditiveFilePermissionPermissionMapper(permissions=0o100444),
+        AdditiveDirPermissionPermissionMapper(permissions=0o100111),
+    ],
+)
+
+
 def copy_to_temp_dir(filepath):
     tmp_dir = tempfile.mkdtemp()
     dst = os.path.join(tmp_dir, os.path.basename(filepath))
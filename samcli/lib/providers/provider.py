@@ -10,7 +10,7 @@ import posixpath
 from collections import namedtuple
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Set, Union, cast
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Set, Union, cast
 
 from samcli.commands.local.cli_common.user_exceptions import (
     InvalidFunctionPropertyType,
@@ -645,6 +645,16 @@ class Stack:
         self._resources = processed_template_dict.get("Resources", {})
         return self._resources
 
+    def resolve_resources(self, logical_ids: Iterable[str]) -> None:
+        """
+        Substitute parameter values in the given resources and the resources they reference only, and keep them as
+        the resources of the stack. The other resources are left out, for commands which only need some resources.
+        """
+        processed_template_dict: Dict[str, Dict] = SamBaseProvider.get_template(
+            self.template_dict, self.parameters, logical_ids=logical_ids
+        )
+        self._resources = processed_template_dict.get("Resources", {})
+
     @property
     def raw_resources(self) -> Dict:
         """
@@ -10,7 +10,8 @@ from samcli.lib.intrinsic_resolver.intrinsic_property_resolver import IntrinsicR
 from samcli.lib.intrinsic_resolver.intrinsics_symbol_table import IntrinsicsSymbolTable
 from samcli.lib.package.ecr_utils import is_ecr_url
 from samcli.lib.samlib.resource_metadata_normalizer import ResourceMetadataNormalizer
-from samcli.lib.samlib.wrapper import SamTranslatorWrapper
+from samcli.lib.samlib.translated_template_cache import get_translated_template_cache
+from samcli.lib.utils.lazy_import import lazy_import
 from samcli.lib.utils.resources import (
     AWS_LAMBDA_FUNCTION,
     AWS_LAMBDA_LAYERVERSION,
@@ -18,6 +19,9 @@ from samcli.lib.utils.resources import (
     AWS_SERVERLESS_LAYERVERSION,
 )
 
+# the SAM translator is only loaded once a template is processed
+wrapper = lazy_import("samcli.lib.samlib.wrapper")
+
 LOG = logging.getLogger(__name__)
 
 
@@ -165,7 +169,10 @@ class SamBaseProvider:
 
     @staticmethod
     def get_template(
-        template_dict: Dict, parameter_overrides: Optional[Dict[str, str]] = None, use_sam_transform: bool = True
+        template_dict: Dict,
+        parameter_overrides: Optional[Dict[str, str]] = None,
+        use_sam_transform: bool = True,
+        logical_ids: Optional[Iterable[str]] = None,
     ) -> Dict:
         """
         Given a SAM template dictionary, return a cleaned copy of the template where SAM plugins have been run
@@ -182,6 +189,10 @@ class SamBaseProvider:
         use_sam_transform: bool
             Whether to transform the given template with Serverless Application Model. Default is True
 
+        logical_ids: Optional[Iterable[str]]
+            Optional logical ids of the resources to resolve. When they are given, the processed template only keeps
+            these resources and the resources they reference. All the resources are kept by default
+
         Returns
         -------
         dict
@@ -190,14 +201,21 @@ class SamBaseProvider:
         template_dict = template_dict or {}
         parameters_values = SamBaseProvider._get_parameter_values(template_dict, parameter_overrides)
         if template_dict and use_sam_transform:
-            template_dict = SamTranslatorWrapper(template_dict, parameter_values=parameters_values).run_plugins()
+            template_dict = SamBaseProvider._run_sam_plugins(template_dict, parameters_values)
         ResourceMetadataNormalizer.normalize(template_dict)
 
         resolver = IntrinsicResolver(
             template=template_dict,
             symbol_resolver=IntrinsicsSymbolTable(logical_id_translator=parameters_values, template=template_dict),
         )
-        template_dict = resolver.resolve_template(ignore_errors=True)
+        template_dict = resolver.resolve_template(ignore_errors=True, logical_ids=logical_ids)
+        if logical_ids is not None:
+            referenced_resources = resolver.get_referenced_resources(logical_ids)
+            template_dict["Resources"] = {
+                logical_id: resource
+                for logical_id, resource in template_dict.get("Resources", {}).items()
+                if logical_id in referenced_resources
+            }
         return template_dict
 
     @staticmethod
@@ -229,7 +247,7 @@ class SamBaseProvider:
         template_dict = template_dict or Stack()
         parameters_values = SamBaseProvider._get_parameter_values(template_dict, parameter_overrides)
         if template_dict:
-            template_dict = SamTranslatorWrapper(template_dict, parameter_values=parameters_values).run_plugins()
+            template_dict = SamBaseProvider._run_sam_plugins(template_dict, parameters_values)
         if normalize_resource_metadata:
             ResourceMetadataNormalizer.normalize(template_dict)
 
@@ -240,6 +258,39 @@ class SamBaseProvider:
         template_dict = resolver.resolve_template(ignore_errors=True)
         return template_dict
 
+    @staticmethod
+    def _run_sam_plugins(template_dict: Any, parameters_values: Dict) -> Any:
+        """
+        Runs the SAM translator plugins on the template. When the running command enables the cache of translated
+        templates, the result is cached in the build cache directory, so the commands which follow reuse it as long as
+        the template, the parameter values and the translator version do not change.
+
+        Parameters
+        ----------
+        template_dict : dict
+            unprocessed SAM template dictionary
+        parameters_values : dict
+            values of the template parameters, including the pseudo parameters
+
+        Returns
+        -------
+        dict
+            Template processed by the SAM plugins
+        """
+        cache = get_translated_template_cache()
+        cache_key = cache.key(template_dict, parameters_values) if cache else None
+        if cache and cache_key:
+            cached_template = cache.get(cache_key)
+            if cached_template is not None:
+                return cached_template
+
+        translated_template = wrapper.SamTranslatorWrapper(
+            template_dict, parameter_values=parameters_values
+        ).run_plugins()
+        if cache and cache_key:
+            cache.put(cache_key, translated_template)
+        return translated_template
+
     @staticmethod
     def _get_parameter_values(template_dict: Any, parameter_overrides: Optional[Dict]) -> Dict:
         """
@@ -3,6 +3,7 @@ Class that provides functions from a given SAM template
 """
 
 import logging
+import posixpath
 from pathlib import Path
 from typing import Any, Dict, Iterator, List, Optional, cast
 
@@ -45,6 +46,7 @@ class SamFunctionProvider(SamBaseProvider):
         use_raw_codeuri: bool = False,
         ignore_code_extraction_warnings: bool = False,
         locate_layer_nested: bool = False,
+        function_identifier: Optional[str] = None,
     ) -> None:
         """
         Initialize the class with SAM template data. The SAM template passed to this provider is assumed
@@ -61,10 +63,15 @@ class SamFunctionProvider(SamBaseProvider):
             Note(xinhol): use_raw_codeuri is temporary to fix a bug, and will be removed for a permanent solution.
         :param bool ignore_code_extraction_warnings: Ignores Log warnings
         :param bool locate_layer_nested: resolved nested layer reference to their actual location in the nested stack
+        :param str function_identifier: Optional identifier of the only function the command uses. The stack defining
+            a function with this logical id only resolves that function and the resources it references.
         """
 
         self._stacks = stacks
 
+        if function_identifier:
+            SamFunctionProvider._resolve_function_resources(self._stacks, function_identifier)
+
         for stack in stacks:
             LOG.debug("%d resources found in the stack %s", len(stack.resources), stack.stack_path)
 
@@ -179,6 +186,24 @@ class SamFunctionProvider(SamBaseProvider):
         for _, function in self.functions.items():
             yield function
 
+    @staticmethod
+    def _resolve_function_resources(stacks: List[Stack], function_identifier: str) -> None:
+        """
+        Resolves only the function with the given logical id, and the resources it references, in the stacks
+        defining it. The identifier can be prefixed with the path of the stack. The other stacks are resolved entirely,
+        as the identifier can also be the name of one of their functions.
+
+        :param stacks: List of SAM/CloudFormation stacks the function is looked up in
+        :param str function_identifier: Logical id of the function, or its full path
+        """
+        stack_path, logical_id = posixpath.split(function_identifier)
+        for stack in stacks:
+            if "/" in function_identifier and stack.stack_path != stack_path:
+                continue
+            resource = stack.raw_resources.get(logical_id)
+            if isinstance(resource, dict) and resource.get("Type") in [AWS_SERVERLESS_FUNCTION, AWS_LAMBDA_FUNCTION]:
+                stack.resolve_resources([logical_id])
+
     @staticmethod
     def _extract_functions(
         stacks: List[Stack],
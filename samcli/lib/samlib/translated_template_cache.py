@@ -0,0 +1,170 @@
+"""
+Cache of the templates processed by the SAM translator plugins, kept with the build caches of a project
+"""
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from samcli import __version__ as samcli_version
+
+LOG = logging.getLogger(__name__)
+
+# Name of the directory of the translated templates, inside the cache directory of the build
+TRANSLATED_TEMPLATE_CACHE_DIR_NAME = "translated-templates"
+# Set to 0 to translate the templates on every command
+TEMPLATE_CACHE_ENV_VAR = "SAM_CLI_TEMPLATE_CACHE"
+# Number of translated templates kept, the least recently used ones are removed
+MAX_CACHED_TEMPLATES = 64
+
+
+class TranslatedTemplateCache:
+    """
+    Content addressed cache of translated templates.
+
+    Each template is stored as JSON in a file named after the hash of the original template, the parameter values and
+    the versions of SAM CLI and of the SAM translator, so a template is translated again as soon as one of them
+    changes. Templates which do not survive a JSON round trip, like the ones containing dates, are not cached.
+    """
+
+    def __init__(self, cache_dir: str, max_templates: int = MAX_CACHED_TEMPLATES) -> None:
+        """
+        Parameters
+        ----------
+        cache_dir : str
+            Directory where the translated templates are stored
+        max_templates : int
+            Number of translated templates kept in the cache
+        """
+        self._cache_dir = Path(cache_dir)
+        self._max_templates = max_templates
+
+    @staticmethod
+    def key(template: Any, parameter_values: Optional[Dict]) -> Optional[str]:
+        """
+        Returns the key of the translated template, or None if the template can not be cached
+
+        Parameters
+        ----------
+        template : Dict
+            Template before translation
+        parameter_values : Optional[Dict]
+            Values of the template parameters, including the pseudo parameters
+        """
+        # imported here, so that looking up the cache does not load the whole translator
+        from samtranslator import __version__ as translator_version
+
+        if not isinstance(template, dict):
+            return None
+        try:
+            content = json.dumps(
+                [samcli_version, translator_version, parameter_values or {}, template],
+                sort_keys=True,
+                separators=(",", ":"),
+            )
+        except (TypeError, ValueError):
+            return None
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    def get(self, key: Optional[str]) -> Optional[Dict]:
+        """
+        Returns the translated template stored with the given key, or None if it is not cached
+        """
+        if not key:
+            return None
+        path = self._path(key)
+        try:
+            translated = json.loads(path.read_text(encoding="utf-8"))
+            # keep the templates which are used, when removing the old ones
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        LOG.debug("Using the translated template cached in %s", path)
+        return translated if isinstance(translated, dict) else None
+
+    def put(self, key: Optional[str], translated: Dict) -> None:
+        """
+        Stores the translated template with the given key, and removes the least recently used templates
+        """
+        if not key:
+            return
+        try:
+            content = json.dumps(translated)
+            if json.loads(content) != translated:
+                # tuples or keys which are not strings would come back differently from the cache
+                return
+        except (TypeError, ValueError):
+            return
+
+        path = self._path(key)
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            temp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            temp_path.write_text(content, encoding="utf-8")
+            os.replace(temp_path, path)
+            self._remove_least_recently_used()
+        except OSError as ex:
+            LOG.debug("Failed to cache the translated template in %s", path, exc_info=ex)
+
+    def _path(self, key: str) -> Path:
+        return self._cache_dir / f"{key}.json"
+
+    def _remove_least_recently_used(self) -> None:
+        cached = []
+        for path in self._cache_dir.glob("*.json"):
+            try:
+                cached.append((path.stat().st_mtime, path))
+            except OSError:
+                continue
+        if len(cached) <= self._max_templates:
+            return
+        cached.sort()
+        for _, path in cached[: len(cached) - self._max_templates]:
+            try:
+                path.unlink()
+            except OSError:
+                # already removed by another command
+                pass
+
+
+# Settings of the cache set by the running command, the cache is disabled until a command sets its directory
+_TRANSLATED_TEMPLATE_CACHE_SETTINGS: Dict[str, str] = {}
+
+
+def configure_translated_template_cache(cache_dir: Optional[str], existing_only: bool = False) -> None:
+    """
+    Caches the translated templates of the running command in the given build cache directory.
+
+    Only the commands which own the cache directory of the build, like sam build --cached and sam sync, create it. The
+    other ones, like sam local and sam list, use the cache once a build created the directory, so that they do not
+    create any file in the directory they run from otherwise.
+
+    Parameters
+    ----------
+    cache_dir : Optional[str]
+        Cache directory of the build, None to disable the cache
+    existing_only : bool
+        Whether the cache is only used if the cache directory of the build already exists
+    """
+    if cache_dir and existing_only and not os.path.isdir(cache_dir):
+        LOG.debug("The build cache directory %s does not exist, the translated templates are not cached", cache_dir)
+        cache_dir = None
+    if cache_dir:
+        _TRANSLATED_TEMPLATE_CACHE_SETTINGS["cache_dir"] = os.path.join(
+            os.path.abspath(cache_dir), TRANSLATED_TEMPLATE_CACHE_DIR_NAME
+        )
+    else:
+        _TRANSLATED_TEMPLATE_CACHE_SETTINGS.pop("cache_dir", None)
+
+
+def get_translated_template_cache() -> Optional[TranslatedTemplateCache]:
+    """
+    Returns the cache of translated templates of the running command, or None if it is disabled
+    """
+    cache_dir = _TRANSLATED_TEMPLATE_CACHE_SETTINGS.get("cache_dir")
+    if not cache_dir or os.environ.get(TEMPLATE_CACHE_ENV_VAR) == "0":
+        return None
+    return TranslatedTemplateCache(cache_dir)
@@ -2,7 +2,6 @@
 Contains sync flow implementation for Auto Dependency Layer
 """
 
-import hashlib
 import logging
 import os
 import tempfile
@@ -13,7 +12,7 @@ from samcli.lib.bootstrap.nested_stack.nested_stack_builder import NestedStackBu
 from samcli.lib.bootstrap.nested_stack.nested_stack_manager import NestedStackManager
 from samcli.lib.build.app_builder import ApplicationBuildResult
 from samcli.lib.build.build_graph import BuildGraph
-from samcli.lib.package.utils import make_zip_with_lambda_permissions
+from samcli.lib.package.utils import make_zip_artifact_with_lambda_permissions
 from samcli.lib.providers.provider import Function, Stack
 from samcli.lib.providers.sam_function_provider import SamFunctionProvider
 from samcli.lib.sync.exceptions import (
@@ -24,7 +23,6 @@ from samcli.lib.sync.exceptions import (
 from samcli.lib.sync.flows.layer_sync_flow import AbstractLayerSyncFlow
 from samcli.lib.sync.flows.zip_function_sync_flow import ZipFunctionSyncFlow
 from samcli.lib.sync.sync_flow import SyncFlow
-from samcli.lib.utils.hash import file_checksum
 
 if TYPE_CHECKING:  # pragma: no cover
     from samcli.commands.build.build_context import BuildContext
@@ -92,8 +90,9 @@ class AutoDependencyLayerSyncFlow(AbstractLayerSyncFlow):
             self._get_compatible_runtimes()[0],
         )
         zip_file_path = os.path.join(tempfile.gettempdir(), "data-" + uuid.uuid4().hex)
-        self._zip_file = make_zip_with_lambda_permissions(zip_file_path, self._artifact_folder)
-        self._local_sha = file_checksum(cast(str, self._zip_file), hashlib.sha256())
+        zip_artifact = make_zip_artifact_with_lambda_permissions(zip_file_path, self._artifact_folder)
+        self._zip_file = zip_artifact.path
+        self._local_sha = zip_artifact.sha256
 
     def _get_dependent_functions(self) -> List[Function]:
         function = SamFunctionProvider(cast(List[Stack], self._stacks)).get(self._function_identifier)
@@ -13,7 +13,7 @@ from contextlib import ExitStack
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, cast
 
 from samcli.lib.build.app_builder import ApplicationBuilder, ApplicationBuildResult
-from samcli.lib.package.utils import make_zip_with_lambda_permissions
+from samcli.lib.package.utils import make_zip_artifact_with_lambda_permissions
 from samcli.lib.providers.provider import Function, LayerVersion, ResourceIdentifier, Stack, get_resource_by_id
 from samcli.lib.providers.sam_function_provider import SamFunctionProvider
 from samcli.lib.sync.exceptions import MissingPhysicalResourceError, NoLayerVersionsFoundError
@@ -259,9 +259,10 @@ class LayerSyncFlow(AbstractLayerSyncFlow):
             self._build_resources_from_scratch()
 
         zip_file_path = os.path.join(tempfile.gettempdir(), f"data-{uuid.uuid4().hex}")
-        self._zip_file = make_zip_with_lambda_permissions(zip_file_path, self._artifact_folder)
+        zip_artifact = make_zip_artifact_with_lambda_permissions(zip_file_path, cast(str, self._artifact_folder))
+        self._zip_file = zip_artifact.path
         LOG.debug("%sCreated artifact ZIP file: %s", self.log_prefix, self._zip_file)
-        self._local_sha = file_checksum(cast(str, self._zip_file), hashlib.sha256())
+        self._local_sha = zip_artifact.sha256
 
     def _use_prebuilt_resources(self, application_build_result: ApplicationBuildResult) -> None:
         """Uses pre-build artifacts and assigns artifact_folder"""
@@ -312,9 +313,10 @@ class LayerSyncFlowSkipBuildDirectory(LayerSyncFlow):
 
     def gather_resources(self) -> None:
         zip_file_path = os.path.join(tempfile.gettempdir(), f"data-{uuid.uuid4().hex}")
-        self._zip_file = make_zip_with_lambda_permissions(zip_file_path, self._layer.codeuri)
+        zip_artifact = make_zip_artifact_with_lambda_permissions(zip_file_path, cast(str, self._layer.codeuri))
+        self._zip_file = zip_artifact.path
         LOG.debug("%sCreated artifact ZIP file: %s", self.log_prefix, self._zip_file)
-        self._local_sha = file_checksum(cast(str, self._zip_file), hashlib.sha256())
+        self._local_sha = zip_artifact.sha256
 
 
 class LayerSyncFlowSkipBuildZipFile(LayerSyncFlow):
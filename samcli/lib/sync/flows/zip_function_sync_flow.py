@@ -6,14 +6,16 @@ import logging
 import os
 import shutil
 import tempfile
+import threading
 import uuid
 from contextlib import ExitStack
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, cast
+from weakref import WeakKeyDictionary
 
 from samcli.lib.build.app_builder import ApplicationBuilder, ApplicationBuildResult
 from samcli.lib.build.build_graph import BuildGraph
 from samcli.lib.package.s3_uploader import S3Uploader
-from samcli.lib.package.utils import make_zip_with_lambda_permissions
+from samcli.lib.package.utils import make_zip_artifact_with_lambda_permissions
 from samcli.lib.providers.provider import Stack
 from samcli.lib.sync.flows.function_sync_flow import FunctionSyncFlow, wait_for_function_update_complete
 from samcli.lib.sync.sync_flow import ApiCallTypes, ResourceAPICall
@@ -29,6 +31,11 @@ if TYPE_CHECKING:  # pragma: no cover
 LOG = logging.getLogger(__name__)
 MAXIMUM_FUNCTION_ZIP_SIZE = 50 * 1024 * 1024  # 50MB limit for Lambda direct ZIP upload
 
+# S3 clients of the flows, per deploy context. The flows of a sync command share one S3 client, and so the transfer
+# manager and the upload threads of that client, instead of creating new ones on every sync.
+_S3_CLIENTS: "WeakKeyDictionary[DeployContext, Any]" = WeakKeyDictionary()
+_S3_CLIENTS_LOCK = threading.Lock()
+
 
 class ZipFunctionSyncFlow(FunctionSyncFlow):
     """SyncFlow for ZIP based functions"""
@@ -83,7 +90,12 @@ class ZipFunctionSyncFlow(FunctionSyncFlow):
 
     def set_up(self) -> None:
         super().set_up()
-        self._s3_client = self._boto_client("s3")
+        with _S3_CLIENTS_LOCK:
+            s3_client = _S3_CLIENTS.get(self._deploy_context)
+            if s3_client is None:
+                s3_client = self._boto_client("s3")
+                _S3_CLIENTS[self._deploy_context] = s3_client
+        self._s3_client = s3_client
 
     def gather_resources(self) -> None:
         """Build function and ZIP it into a temp file in self._zip_file"""
@@ -95,9 +107,10 @@ class ZipFunctionSyncFlow(FunctionSyncFlow):
             self._build_resources_from_scratch()
 
         zip_file_path = os.path.join(tempfile.gettempdir(), "data-" + uuid.uuid4().hex)
-        self._zip_file = make_zip_with_lambda_permissions(zip_file_path, self._artifact_folder)
+        zip_artifact = make_zip_artifact_with_lambda_permissions(zip_file_path, cast(str, self._artifact_folder))
+        self._zip_file = zip_artifact.path
         LOG.debug("%sCreated artifact ZIP file: %s", self.log_prefix, self._zip_file)
-        self._local_sha = file_checksum(cast(str, self._zip_file), hashlib.sha256())
+        self._local_sha = zip_artifact.sha256
 
     def _use_prebuilt_resources(self, application_build_result: ApplicationBuildResult) -> None:
         """Uses pre-built artifacts and assigns build_graph and artifacts_folder"""
@@ -250,6 +263,7 @@ class ZipFunctionSyncFlowSkipBuildDirectory(ZipFunctionSyncFlow):
 
     def gather_resources(self) -> None:
         zip_file_path = os.path.join(tempfile.gettempdir(), f"data-{uuid.uuid4().hex}")
-        self._zip_file = make_zip_with_lambda_permissions(zip_file_path, self._function.codeuri)
+        zip_artifact = make_zip_artifact_with_lambda_permissions(zip_file_path, cast(str, self._function.codeuri))
+        self._zip_file = zip_artifact.path
         LOG.debug("%sCreated artifact ZIP file: %s", self.log_prefix, self._zip_file)
-        self._local_sha = file_checksum(cast(str, self._zip_file), hashlib.sha256())
+        self._local_sha = zip_artifact.sha256
@@ -20,6 +20,8 @@ from samcli.lib.sync.infra_sync_executor import InfraSyncExecutor, InfraSyncResu
 from samcli.lib.sync.sync_flow_factory import SyncFlowFactory
 from samcli.lib.utils.code_trigger_factory import CodeTriggerFactory
 from samcli.lib.utils.colors import Colored, Colors
+from samcli.lib.utils.event_coalescer import EventCoalescer
+from samcli.lib.utils.hash import file_checksum
 from samcli.lib.utils.path_observer import HandlerObserver
 from samcli.lib.utils.resource_trigger import OnChangeCallback, TemplateTrigger
 from samcli.local.lambdafn.exceptions import ResourceNotFound
@@ -30,7 +32,10 @@ if TYPE_CHECKING:  # pragma: no cover
     from samcli.commands.package.package_context import PackageContext
     from samcli.commands.sync.sync_context import SyncContext
 
+# Number of seconds without any file change after which the changes of a resource are synced
 DEFAULT_WAIT_TIME = 1
+# Number of synced files whose checksum is kept to skip the syncs of unchanged content
+MAX_PATH_CHECKSUMS = 10000
 LOG = logging.getLogger(__name__)
 
 
@@ -50,6 +55,9 @@ class WatchManager:
     _color: Colored
     _auto_dependency_layer: bool
     _disable_infra_syncs: bool
+    _change_coalescer: EventCoalescer[ResourceIdentifier]
+    _path_checksums: Dict[str, str]
+    _path_checksums_lock: threading.Lock
 
     def __init__(
         self,
@@ -61,6 +69,7 @@ class WatchManager:
         auto_dependency_layer: bool,
         disable_infra_syncs: bool,
         watch_exclude: Dict[str, List[str]],
+        watch_quiet_window: float = DEFAULT_WAIT_TIME,
     ):
         """Manager for sync watch execution logic.
         This manager will observe template and its code resources.
@@ -76,6 +85,8 @@ class WatchManager:
             PackageContext
         deploy_context : DeployContext
             DeployContext
+        watch_quiet_window : float
+            Number of seconds without file changes on a resource before it gets synced
         """
         self._stacks = None
         self._template = template
@@ -98,6 +109,12 @@ class WatchManager:
 
         self._watch_exclude = watch_exclude
 
+        # file system events are grouped per resource, a resource is only synced once its files stop changing
+        self._change_coalescer = EventCoalescer(self._on_resource_changes, quiet_window=watch_quiet_window)
+        # checksums of the synced files seen in the events, to skip the syncs when the content did not change
+        self._path_checksums = {}
+        self._path_checksums_lock = threading.Lock()
+
     def queue_infra_sync(self) -> None:
         """Queue up an infra structure sync.
         A simple bool flag is suffice
@@ -113,6 +130,8 @@ class WatchManager:
             )
             return
         self._waiting_infra_sync = True
+        # the infra sync deploys the code as well, the code changes waiting for their quiet window are covered by it
+        self._change_coalescer.discard()
 
     def _update_stacks(self) -> None:
         """
@@ -233,12 +252,14 @@ class WatchManager:
                 self._color.color_log(msg="Shutting down sync watch...", color=Colors.PROGRESS), extra=dict(markup=True)
             )
             self._observer.stop()
+            self._change_coalescer.stop()
             self._stop_code_sync()
             LOG.info(self._color.color_log(msg="Sync watch stopped.", color=Colors.SUCCESS), extra=dict(markup=True))
 
     def _start(self) -> None:
         """Start WatchManager and watch for changes to the template and its code resources."""
         first_sync = True
+        self._change_coalescer.start()
         self._observer.start()
         while True:
             if self._waiting_infra_sync:
@@ -366,17 +387,73 @@ class WatchManager:
                 LOG.debug(f"Ignoring file system MODIFIED event for folder {event.src_path}")
                 return
 
-            # sync flow factory should always exist, but guarding just incase
-            if not self._sync_flow_factory:
-                LOG.debug("Sync flow factory not defined, skipping trigger")
-                return
-
-            sync_flow = self._sync_flow_factory.create_sync_flow(resource_id)
-            if sync_flow and not self._waiting_infra_sync:
-                self._sync_flow_executor.add_delayed_sync_flow(sync_flow, dedup=True, wait_time=DEFAULT_WAIT_TIME)
+            self._change_coalescer.add(resource_id, event.src_path if event else None)
 
         return on_code_change
 
+    def _on_resource_changes(self, resource_id: ResourceIdentifier, changed_paths: Set[str]) -> None:
+        """
+        Called once the files of a resource stopped changing for the quiet window, queues a single sync flow for all
+        the changes received during that window.
+
+        Parameters
+        ----------
+        resource_id : ResourceIdentifier
+            Resource whose files changed
+        changed_paths : Set[str]
+            Paths reported by the file system events, empty if the events did not carry any path
+        """
+        checksums = self._get_checksums(changed_paths)
+        if changed_paths and not self._has_content_changes(checksums):
+            LOG.debug("Skipping sync of %s as the content of its changed files is the same", resource_id)
+            return
+
+        # sync flow factory should always exist, but guarding just incase
+        if not self._sync_flow_factory:
+            LOG.debug("Sync flow factory not defined, skipping trigger")
+            return
+
+        sync_flow = self._sync_flow_factory.create_sync_flow(resource_id)
+        if sync_flow and not self._waiting_infra_sync:
+            # recorded before the sync runs, the checksums are cleared if it fails
+            self._record_checksums(checksums)
+            self._sync_flow_executor.add_delayed_sync_flow(sync_flow, dedup=True)
+
+    @staticmethod
+    def _get_checksums(changed_paths: Set[str]) -> Dict[str, Optional[str]]:
+        """
+        Hashes the changed files only, paths which are not regular files have no checksum
+        """
+        checksums: Dict[str, Optional[str]] = {}
+        for path in changed_paths:
+            try:
+                checksums[path] = file_checksum(path) if Path(path).is_file() else None
+            except OSError:
+                checksums[path] = None
+        return checksums
+
+    def _has_content_changes(self, checksums: Dict[str, Optional[str]]) -> bool:
+        """
+        Compares the checksums of the changed files with the checksums of the last synced changes.
+        Paths which are not regular files, or which were never synced before, are considered as changed.
+        """
+        return any(
+            checksum is None or self._path_checksums.get(path) != checksum for path, checksum in checksums.items()
+        )
+
+    def _record_checksums(self, checksums: Dict[str, Optional[str]]) -> None:
+        """
+        Records the checksums of the synced files. Paths which are not regular files anymore are forgotten, and the
+        least recently synced paths are dropped over MAX_PATH_CHECKSUMS.
+        """
+        with self._path_checksums_lock:
+            for path, checksum in checksums.items():
+                self._path_checksums.pop(path, None)
+                if checksum is not None:
+                    self._path_checksums[path] = checksum
+            while len(self._path_checksums) > MAX_PATH_CHECKSUMS:
+                del self._path_checksums[next(iter(self._path_checksums))]
+
     def _watch_sync_flow_exception_handler(self, sync_flow_exception: SyncFlowException) -> None:
         """Exception handler for watch.
         Simply logs unhandled exceptions instead of failing the entire process.
@@ -386,6 +463,10 @@ class WatchManager:
         sync_flow_exception : SyncFlowException
             SyncFlowException
         """
+        # the files of the failed sync are not deployed, so that their next change must be synced even if the content
+        # goes back to a previously synced one
+        with self._path_checksums_lock:
+            self._path_checksums.clear()
         exception = sync_flow_exception.exception
         if isinstance(exception, MissingPhysicalResourceError):
             LOG.warning(
@@ -0,0 +1,340 @@
+"""
+Sends the telemetry metrics in batches from a background thread, and keeps them on disk while offline
+"""
+
+import json
+import logging
+import os
+import queue
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from samcli.cli.global_config import GlobalConfig
+from samcli.lib.utils.lazy_import import lazy_import
+
+requests = lazy_import("requests")
+
+LOG = logging.getLogger(__name__)
+
+# Number of metrics sent in a single request
+MAX_BATCH_SIZE = 25
+# Queued metrics are sent once the oldest of them waited this long, or when the command exits
+BATCH_INTERVAL = 5.0
+# Longest time a command waits at exit for its metrics to be sent, the metrics which are not sent by then are spooled
+FLUSH_TIMEOUT = 1.0
+# Connection and read timeouts of the requests
+CONNECT_TIMEOUT = 2
+READ_TIMEOUT = 0.5
+# After failing to connect, the metrics are spooled without trying to connect during this many seconds, so that
+# commands running without network access do not wait for the connection timeout every time
+OFFLINE_RETRY_INTERVAL = 600
+# Number of batches kept on disk, older batches are dropped
+MAX_SPOOLED_BATCHES = 100
+
+SPOOL_DIR_NAME = "telemetry-spool"
+OFFLINE_MARKER_NAME = "offline"
+
+_FLUSH = object()
+
+
+class MetricsSpool:
+    """
+    Batches of metrics kept on disk until they can be sent.
+
+    Each batch is written to its own file, so that several SAM CLI processes can use the spool at the same time.
+    The spool also remembers when the telemetry endpoint was last unreachable.
+    """
+
+    def __init__(self, spool_dir: Path, max_batches: int = MAX_SPOOLED_BATCHES) -> None:
+        """
+        Parameters
+        ----------
+        spool_dir : Path
+            Directory where the batches are written
+        max_batches : int
+            Number of batches kept in the spool, the oldest ones are dropped
+        """
+        self._spool_dir = spool_dir
+        self._max_batches = max_batches
+
+    def save(self, metrics: List[Dict]) -> None:
+        """
+        Writes the batch of metrics to the spool, and drops the oldest batches over the limit
+        """
+        if not metrics:
+            return
+        try:
+            self._spool_dir.mkdir(parents=True, exist_ok=True)
+            batch_path = self._spool_dir / f"{time.time_ns()}-{uuid.uuid4().hex}.json"
+            temp_path = batch_path.with_suffix(".tmp")
+            temp_path.write_text(json.dumps(metrics), encoding="utf-8")
+            os.replace(temp_path, batch_path)
+            for stale_batch in self.batches()[: -self._max_batches]:
+                self.remove(stale_batch)
+        except (OSError, TypeError, ValueError) as ex:
+            LOG.debug("Failed to spool telemetry metrics", exc_info=ex)
+
+    def batches(self) -> List[Path]:
+        """
+        Returns the files of the spooled batches, oldest first
+        """
+        try:
+            return sorted(self._spool_dir.glob("*.json"))
+        except OSError:
+            return []
+
+    @staticmethod
+    def load(batch: Path) -> Optional[List[Dict]]:
+        try:
+            metrics = json.loads(batch.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as ex:
+            LOG.debug("Failed to read spooled telemetry metrics %s", batch, exc_info=ex)
+            return None
+        return metrics if isinstance(metrics, list) else None
+
+    @staticmethod
+    def remove(batch: Path) -> None:
+        try:
+            batch.unlink()
+        except OSError:
+            # already sent or dropped by another process
+            pass
+
+    def is_offline(self) -> bool:
+        """
+        Returns True if the endpoint could not be reached less than OFFLINE_RETRY_INTERVAL seconds ago
+        """
+        try:
+            failed_at = (self._spool_dir / OFFLINE_MARKER_NAME).stat().st_mtime
+        except OSError:
+            return False
+        return 0 <= time.time() - failed_at < OFFLINE_RETRY_INTERVAL
+
+    def set_offline(self, offline: bool) -> None:
+        marker = self._spool_dir / OFFLINE_MARKER_NAME
+        try:
+            if offline:
+                self._spool_dir.mkdir(parents=True, exist_ok=True)
+                marker.touch()
+            elif marker.exists():
+                marker.unlink()
+        except OSError as ex:
+            LOG.debug("Failed to update telemetry offline marker", exc_info=ex)
+
+
+class MetricsSender:
+    """
+    Sends metrics to the telemetry endpoint off the critical path of the commands.
+
+    Metrics are queued and sent in batches by a background thread, which starts with the first metric. At exit,
+    ``flush`` waits at most FLUSH_TIMEOUT seconds for the queued metrics to be sent, and writes the ones which
+    are still queued by then to the spool. The batch of a request which is still running is left to the background
+    thread, which spools it only if the request fails, so that it is never sent twice. Spooled metrics are sent after
+    the next successful request. When the endpoint can not be reached, the metrics go straight to the spool for a
+    while instead of waiting for the connection timeout on every command. A request which is still running when
+    ``flush`` gives up also marks the endpoint as unreachable, since the flush timeout is shorter than the connection
+    timeout.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        spool: MetricsSpool,
+        max_batch_size: int = MAX_BATCH_SIZE,
+        batch_interval: float = BATCH_INTERVAL,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        url : str
+            URL of the telemetry endpoint
+        spool : MetricsSpool
+            Spool of the metrics which could not be sent
+        max_batch_size : int
+            Number of metrics sent in a single request
+        batch_interval : float
+            Longest time a metric waits in the queue before being sent while the command runs
+        """
+        self._url = url
+        self._spool = spool
+        self._max_batch_size = max_batch_size
+        self._batch_interval = batch_interval
+        self._queue: queue.Queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._posting = False
+        self._closed = False
+
+    def enqueue(self, metric: Dict) -> None:
+        """
+        Queues the metric to be sent by the background thread
+        """
+        with self._lock:
+            if self._closed:
+                self._spool.save([metric])
+                return
+            if not self._thread:
+                self._thread = threading.Thread(target=self._run, name="sam-telemetry", daemon=True)
+                self._thread.start()
+        self._queue.put(metric)
+
+    def flush(self, timeout: float = FLUSH_TIMEOUT) -> None:
+        """
+        Sends the queued metrics, waiting at most ``timeout`` seconds, and spools the ones which are not sent
+
+        Parameters
+        ----------
+        timeout : float
+            Longest time to wait for the metrics to be sent
+        """
+        with self._lock:
+            if self._closed or not self._thread:
+                return
+        flushed = threading.Event()
+        self._queue.put((_FLUSH, flushed, time.monotonic() + timeout))
+        if flushed.wait(timeout):
+            return
+
+        LOG.debug("Telemetry metrics were not sent within %s seconds, spooling them", timeout)
+        with self._lock:
+            self._closed = True
+            posting = self._posting
+        if posting:
+            # the flush timeout is shorter than the connection timeout, so the request still running most likely did
+            # not connect yet. The next commands spool their metrics instead of waiting for the endpoint as well.
+            self._spool.set_offline(True)
+        unsent: List[Dict] = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(item, dict):
+                unsent.append(item)
+        self._spool.save(unsent)
+
+    def _run(self) -> None:
+        batch: List[Dict] = []
+        send_at: Optional[float] = None
+        while True:
+            timeout = None if send_at is None else max(send_at - time.monotonic(), 0)
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            if isinstance(item, dict):
+                batch.append(item)
+                if send_at is None:
+                    send_at = time.monotonic() + self._batch_interval
+                if len(batch) < self._max_batch_size:
+                    continue
+            if batch:
+                self._send_batch(batch, time.monotonic() + FLUSH_TIMEOUT)
+                batch, send_at = [], None
+            if isinstance(item, tuple) and item[0] is _FLUSH:
+                _, flushed, deadline = item
+                self._send_spooled_batches(deadline)
+                flushed.set()
+            with self._lock:
+                if self._closed:
+                    return
+
+    def _send_batch(self, batch: List[Dict], deadline: float) -> None:
+        with self._lock:
+            closed = self._closed
+        if closed:
+            # flush gave up waiting, the batch is kept for the next command
+            self._spool.save(batch)
+            return
+        offline = self._spool.is_offline()
+        sent = not offline and self._post(batch)
+        if not sent:
+            # also when flush gave up waiting for the request, it does not spool the batch being sent
+            self._spool.save(batch)
+            return
+        with self._lock:
+            closed = self._closed
+        if not offline and not closed:
+            self._send_spooled_batches(deadline)
+
+    def _send_spooled_batches(self, deadline: float) -> None:
+        """
+        Sends the spooled batches until the deadline, if the endpoint is reachable
+        """
+        if self._spool.is_offline():
+            return
+        for spooled_batch in self._spool.batches():
+            if time.monotonic() >= deadline:
+                return
+            metrics = self._spool.load(spooled_batch)
+            if metrics and not self._post(metrics):
+                return
+            self._spool.remove(spooled_batch)
+
+    def _post(self, metrics: List[Dict]) -> bool:
+        """
+        Sends the metrics in a single request
+
+        Returns
+        -------
+        bool
+            False if the endpoint could not be reached, True otherwise
+        """
+        payload = {"metrics": metrics}
+        LOG.debug("Sending Telemetry: %s", payload)
+        with self._lock:
+            self._posting = True
+        try:
+            response = requests.post(self._url, json=payload, timeout=(CONNECT_TIMEOUT, READ_TIMEOUT))
+            LOG.debug("Telemetry response: %d", response.status_code)
+        except requests.exceptions.ConnectionError as ex:
+            # Offline, or the endpoint is not reachable. The metrics are kept to be sent later.
+            LOG.debug("Failed to connect to telemetry endpoint: %s", str(ex))
+            self._spool.set_offline(True)
+            return False
+        except requests.exceptions.Timeout as ex:
+            # The request reached the endpoint, there is no need to wait for the response
+            LOG.debug(str(ex))
+        except Exception as ex:  # pylint: disable=broad-except
+            LOG.debug("Failed to send telemetry metrics", exc_info=ex)
+        finally:
+            with self._lock:
+                self._posting = False
+        self._spool.set_offline(False)
+        return True
+
+
+_METRICS_SENDERS: Dict[str, MetricsSender] = {}
+_METRICS_SENDERS_LOCK = threading.Lock()
+
+
+def get_metrics_sender(url: str) -> MetricsSender:
+    """
+    Returns the sender shared by all the metrics published to the given endpoint
+
+    Parameters
+    ----------
+    url : str
+        URL of the telemetry endpoint
+    """
+    with _METRICS_SENDERS_LOCK:
+        sender = _METRICS_SENDERS.get(url)
+        if not sender:
+            spool = MetricsSpool(Path(GlobalConfig().config_dir, SPOOL_DIR_NAME))
+            sender = _METRICS_SENDERS[url] = MetricsSender(url, spool)
+        return sender
+
+
+def flush_metrics(timeout: float = FLUSH_TIMEOUT) -> None:
+    """
+    Sends the metrics queued by all the senders, waiting at most ``timeout`` seconds in total
+    """
+    deadline = time.monotonic() + timeout
+    with _METRICS_SENDERS_LOCK:
+        senders = list(_METRICS_SENDERS.values())
+    for sender in senders:
+        sender.flush(max(deadline - time.monotonic(), 0))
@@ -2,15 +2,20 @@
 This module contains utility functions for boto3 library
 """
 
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
-from boto3 import Session
 from botocore.config import Config
 from botocore.exceptions import ClientError
 from typing_extensions import Protocol
 
 from samcli import __version__
 from samcli.cli.global_config import GlobalConfig
+from samcli.lib.utils.lazy_import import lazy_import
+
+if TYPE_CHECKING:  # pragma: no cover
+    from boto3 import Session
+
+boto3 = lazy_import("boto3")
 
 
 def get_boto_config_with_user_agent(**kwargs) -> Config:
@@ -41,7 +46,7 @@ class BotoProviderType(Protocol):
     def __call__(self, service_name: str) -> Any: ...  # pragma: no cover
 
 
-def get_boto_client_provider_from_session_with_config(session: Session, **kwargs) -> BotoProviderType:
+def get_boto_client_provider_from_session_with_config(session: "Session", **kwargs) -> BotoProviderType:
     """
     Returns a wrapper function for boto client with given configuration. It can be used like;
 
@@ -85,11 +90,11 @@ def get_boto_client_provider_with_config(
         A callable function which will return a boto client
     """
     return get_boto_client_provider_from_session_with_config(
-        Session(region_name=region, profile_name=profile), **kwargs
+        boto3.Session(region_name=region, profile_name=profile), **kwargs
     )
 
 
-def get_boto_resource_provider_from_session_with_config(session: Session, **kwargs) -> BotoProviderType:
+def get_boto_resource_provider_from_session_with_config(session: "Session", **kwargs) -> BotoProviderType:
     """
     Returns a wrapper function for boto resource with given configuration. It can be used like;
 
@@ -133,7 +138,7 @@ def get_boto_resource_provider_with_config(
         A callable function which will return a boto resource
     """
     return get_boto_resource_provider_from_session_with_config(
-        Session(region_name=region, profile_name=profile), **kwargs
+        boto3.Session(region_name=region, profile_name=profile), **kwargs
     )
 
 
@@ -5,15 +5,18 @@ Wrapper to generated colored messages for printing in Terminal
 import logging
 import os
 import platform
+import sys
 from enum import Enum
 
 import click
-from rich.logging import RichHandler
-from rich.style import Style
-from rich.text import Text
 
+from samcli.lib.utils.lazy_import import lazy_import
 from samcli.lib.utils.sam_logging import SAM_CLI_LOGGER_NAME
 
+rich_logging = lazy_import("rich.logging")
+rich_style = lazy_import("rich.style")
+rich_text = lazy_import("rich.text")
+
 # Enables ANSI escape codes on Windows
 if platform.system().lower() == "windows":
     try:
@@ -57,8 +60,9 @@ class Colored:
         colorize : bool
             Optional. Set this to True to turn on coloring. False will turn off coloring
         """
-        self.rich_logging = any(
-            isinstance(handler, RichHandler) for handler in logging.getLogger(SAM_CLI_LOGGER_NAME).handlers
+        # no handler can be a RichHandler while rich is not loaded, checking it first avoids loading rich
+        self.rich_logging = "rich.logging" in sys.modules and any(
+            isinstance(handler, rich_logging.RichHandler) for handler in logging.getLogger(SAM_CLI_LOGGER_NAME).handlers
         )
         self.colorize = colorize
 
@@ -89,7 +93,7 @@ class Colored:
     def underline_log(self, msg):
         """Underline the input such that underlying Rich Logger understands it (if configured)."""
         if self.rich_logging:
-            _color_msg = Text(msg, style=Style(underline=True))
+            _color_msg = rich_text.Text(msg, style=rich_style.Style(underline=True))
             return _color_msg.markup if self.colorize else msg
         else:
             return click.style(msg, underline=True) if self.colorize else msg
@@ -105,7 +109,7 @@ class Colored:
 
     def _color_log(self, msg, color):
         """Marked up text with color used for logging with a logger"""
-        _color_msg = Text(msg, style=Style(color=color))
+        _color_msg = rich_text.Text(msg, style=rich_style.Style(color=color))
         return _color_msg.markup if self.colorize else msg
 
     def color_log(self, msg, color):
@@ -0,0 +1,165 @@
+"""
+Coalesces bursts of file system events into a single notification per key
+"""
+
+import logging
+import threading
+import time
+from typing import Callable, Dict, Generic, Hashable, Optional, Set, TypeVar
+
+LOG = logging.getLogger(__name__)
+
+KeyType = TypeVar("KeyType", bound=Hashable)
+
+# A key that keeps receiving events is still flushed after this many quiet windows
+MAX_DELAY_WINDOWS = 10
+
+
+class _PendingChanges:
+    """
+    Changes collected for one key since its last flush
+    """
+
+    def __init__(self, first_seen: float) -> None:
+        self.first_seen = first_seen
+        self.last_seen = first_seen
+        self.paths: Set[str] = set()
+
+
+class EventCoalescer(Generic[KeyType]):
+    """
+    Groups the events received for the same key and calls ``on_flush`` once per key, when no new event was received
+    for that key during ``quiet_window`` seconds.
+
+    A tool like ``git checkout`` or ``npm install`` produces thousands of events in a short burst, they all end up in a
+    single flush with the set of paths that were touched. The flush is never delayed by more than ``max_delay``
+    seconds, so that a key receiving a continuous stream of events is still flushed.
+    """
+
+    def __init__(
+        self,
+        on_flush: Callable[[KeyType, Set[str]], None],
+        quiet_window: float,
+        max_delay: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        on_flush: Callable[[KeyType, Set[str]], None]
+            Called from the coalescer thread with the key and the paths changed since the last flush
+        quiet_window: float
+            Number of seconds without events after which the changes of a key are flushed
+        max_delay: Optional[float]
+            Maximum number of seconds between the first event of a key and its flush,
+            defaults to MAX_DELAY_WINDOWS quiet windows
+        clock: Callable[[], float]
+            Monotonic clock used to track the quiet windows
+        """
+        if quiet_window < 0:
+            raise ValueError("The quiet window can not be negative")
+
+        self._on_flush = on_flush
+        self._quiet_window = quiet_window
+        self._max_delay = max_delay if max_delay is not None else quiet_window * MAX_DELAY_WINDOWS
+        self._clock = clock
+        self._pending: Dict[KeyType, _PendingChanges] = {}
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+
+    def add(self, key: KeyType, path: Optional[str] = None) -> None:
+        """
+        Records an event for the given key
+
+        Parameters
+        ----------
+        key: KeyType
+            Key the event belongs to
+        path: Optional[str]
+            Path that was changed, if known
+        """
+        with self._condition:
+            now = self._clock()
+            pending = self._pending.get(key)
+            if not pending:
+                pending = self._pending[key] = _PendingChanges(now)
+            pending.last_seen = now
+            if path:
+                pending.paths.add(path)
+            self._condition.notify()
+
+    def discard(self) -> None:
+        """
+        Drops all the changes that are waiting for their quiet window to end
+        """
+        with self._condition:
+            self._pending.clear()
+
+    def start(self) -> None:
+        """
+        Starts the thread that flushes the changes
+        """
+        with self._condition:
+            self._stopped = False
+            if self._thread and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self._run, name="sam-event-coalescer", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stops the flushing thread, the changes that are still pending are dropped
+        """
+        with self._condition:
+            self._stopped = True
+            self._pending.clear()
+            self._condition.notify()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def flush_ready(self) -> Optional[float]:
+        """
+        Flushes every key whose quiet window is over
+
+        Returns
+        -------
+        Optional[float]
+            Number of seconds until the next key is ready, None if no change is pending
+        """
+        with self._condition:
+            now = self._clock()
+            ready = {}
+            next_deadline: Optional[float] = None
+            for key, pending in self._pending.items():
+                deadline = min(pending.last_seen + self._quiet_window, pending.first_seen + self._max_delay)
+                if deadline <= now:
+                    ready[key] = pending
+                elif next_deadline is None or deadline < next_deadline:
+                    next_deadline = deadline
+            for key in ready:
+                del self._pending[key]
+
+        # callbacks run outside of the lock, so events received while flushing are not blocked
+        for key, pending in ready.items():
+            LOG.debug("Flushing %d changed paths of %s", len(pending.paths), key)
+            try:
+                self._on_flush(key, pending.paths)
+            except Exception:  # pylint: disable=broad-except
+                LOG.error("Failed to handle the changes of %s", key, exc_info=True)
+
+        return None if next_deadline is None else max(next_deadline - now, 0)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                if self._stopped:
+                    return
+                if not self._pending:
+                    self._condition.wait()
+                    continue
+            wait_time = self.flush_ready()
+            if wait_time:
+                with self._condition:
+                    if not self._stopped:
+                        self._condition.wait(timeout=wait_time)
@@ -9,12 +9,8 @@ import uuid
 from abc import ABC, abstractmethod
 from pathlib import Path
 from threading import Lock, Thread
-from typing import Callable, Dict, List, Optional
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
 
-import docker
-from docker import DockerClient
-from docker.errors import ImageNotFound
-from docker.types import CancellableStream
 from watchdog.events import (
     EVENT_TYPE_DELETED,
     EVENT_TYPE_OPENED,
@@ -27,10 +23,18 @@ from watchdog.observers.api import BaseObserver, ObservedWatch
 
 from samcli.cli.global_config import Singleton
 from samcli.lib.constants import DOCKER_MIN_API_VERSION
-from samcli.lib.utils.hash import dir_checksum, file_checksum
+from samcli.lib.utils.hash import FileChecksumCache, dir_checksum, file_checksum
+from samcli.lib.utils.lazy_import import lazy_import
 from samcli.lib.utils.packagetype import IMAGE, ZIP
 from samcli.local.lambdafn.config import FunctionConfig
 
+if TYPE_CHECKING:  # pragma: no cover
+    from docker import DockerClient
+    from docker.types import CancellableStream
+
+docker = lazy_import("docker")
+docker_errors = lazy_import("docker.errors")
+
 LOG = logging.getLogger(__name__)
 # Windows API error returned when attempting to perform I/O on closed pipe
 BROKEN_PIPE_ERROR = 109
@@ -306,8 +310,8 @@ class ImageObserver(ResourceObserver):
         """
         self._observed_images: Dict[str, str] = {}
         self._input_on_change: Callable = on_change
-        self.docker_client: DockerClient = docker.from_env(version=DOCKER_MIN_API_VERSION)
-        self.events: CancellableStream = self.docker_client.events(filters={"type": "image"}, decode=True)
+        self.docker_client: "DockerClient" = docker.from_env(version=DOCKER_MIN_API_VERSION)
+        self.events: "CancellableStream" = self.docker_client.events(filters={"type": "image"}, decode=True)
         self._images_observer_thread: Optional[Thread] = None
         self._lock: Lock = threading.Lock()
 
@@ -340,7 +344,7 @@ class ImageObserver(ResourceObserver):
         try:
             image = self.docker_client.images.get(resource)
             self._observed_images[resource] = image.id
-        except ImageNotFound as exc:
+        except docker_errors.ImageNotFound as exc:
             raise ImageObserverException("Can not observe non exist image") from exc
 
     def unwatch(self, resource: str) -> None:
@@ -653,13 +657,17 @@ class SingletonFileObserver(metaclass=Singleton):
                 self._observer.stop()
 
 
+# watched folders are hashed again on every change event, only re-read the files that were modified since
+_CHECKSUM_CACHE = FileChecksumCache()
+
+
 def calculate_checksum(path: str) -> Optional[str]:
     try:
         path_obj = Path(path)
         if path_obj.is_file():
             checksum = file_checksum(path)
         else:
-            checksum = dir_checksum(path)
+            checksum = dir_checksum(path, checksum_cache=_CHECKSUM_CACHE)
         return checksum
     except Exception:
         return None
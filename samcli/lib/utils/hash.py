@@ -3,11 +3,27 @@ Hash calculation utilities for files and directories.
 """
 
 import hashlib
+import json
+import logging
+import mmap
 import os
 import sys
-from typing import Any, List, Optional, cast
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple, cast
 
-BLOCK_SIZE = 4096
+LOG = logging.getLogger(__name__)
+
+# hashlib releases the GIL while hashing large buffers, big reads keep the time spent in python low
+BLOCK_SIZE = 1024 * 1024
+# files at least this big are hashed straight from a memory map instead of being copied into read buffers
+MMAP_THRESHOLD = 64 * 1024 * 1024
+# same sizing as the default ThreadPoolExecutor, hashing is a mix of I/O waits and GIL-free CPU work
+DEFAULT_HASH_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+# index of source file checksums, kept in the cache folder and shared by build and package, so that unchanged files
+# are not hashed again
+FILE_CHECKSUM_CACHE_FILE_NAME = "file-checksums.json"
 # earliest python version to support usedforsecurity option for hashlib.md5 is 3.9
 # https://docs.python.org/3/library/hashlib.html#hash-algorithms
 _MAJOR_PYTHON_VERSION = 3
@@ -44,10 +60,17 @@ def file_checksum(file_name: str, hash_generator: Any = None) -> str:
         curpos = file_handle.tell()
         file_handle.seek(0)
 
-        buf = file_handle.read(BLOCK_SIZE)
-        while buf:
-            hash_generator.update(buf)
-            buf = file_handle.read(BLOCK_SIZE)
+        file_size = _get_file_size(file_handle)
+        if file_size < BLOCK_SIZE:
+            # small files are read at once, allocating a big read buffer would cost more than hashing them
+            hash_generator.update(file_handle.read())
+        elif not _update_from_mmap(file_handle, file_size, hash_generator):
+            buf = bytearray(BLOCK_SIZE)
+            view = memoryview(buf)
+            size = file_handle.readinto(buf)
+            while size:
+                hash_generator.update(view[:size])
+                size = file_handle.readinto(buf)
 
         # Restore file cursor's position
         file_handle.seek(curpos)
@@ -55,8 +78,157 @@ def file_checksum(file_name: str, hash_generator: Any = None) -> str:
         return cast(str, hash_generator.hexdigest())
 
 
+def _get_file_size(file_handle: Any) -> int:
+    try:
+        return os.fstat(file_handle.fileno()).st_size
+    except (OSError, ValueError):
+        return 0
+
+
+def _get_path_size(path: str) -> int:
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        # hashing the file reports the error
+        return 0
+
+
+def _update_from_mmap(file_handle: Any, file_size: int, hash_generator: Any) -> bool:
+    """
+    Feeds a big file to the hash generator through a read-only memory map
+
+    Returns
+    -------
+    bool
+        False if the file is too small or can not be mapped, in which case it should be read instead
+    """
+    try:
+        if file_size < MMAP_THRESHOLD:
+            return False
+        with mmap.mmap(file_handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+            hash_generator.update(mapped_file)
+        return True
+    except (OSError, ValueError):
+        # special files, or file systems which do not support memory mapping
+        return False
+
+
+class FileChecksumCache:
+    """
+    Index of the md5 checksums of files, keyed on the stat metadata (size, mtime_ns and inode) of each file.
+
+    As long as the stat metadata of a file stays the same, its checksum is returned from the index instead of
+    reading the file again. When a cache file is given, the index is loaded from it on first use and written back
+    with ``save``, so that it is shared between SAM CLI runs.
+    """
+
+    VERSION = 1
+    # Files modified within this many seconds of being hashed are not indexed. File systems with a coarse mtime
+    # resolution could otherwise miss a second change that happens within the same clock tick.
+    RACY_WINDOW_NS = 2 * 1_000_000_000
+
+    def __init__(self, cache_file: Optional[str] = None) -> None:
+        """
+        Parameters
+        ----------
+        cache_file : Optional[str]
+            Path of the file that persists the index. The index is only kept in memory if it is not provided
+        """
+        self._cache_file = cache_file
+        self._entries: Dict[str, List[Any]] = {}
+        self._loaded = cache_file is None
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def checksum(self, file_name: str) -> str:
+        """
+        Returns the md5 checksum of the given file, reading it only if it was modified since it was last indexed
+
+        Parameters
+        ----------
+        file_name : str
+            Path of the file
+
+        Returns
+        -------
+        md5 checksum of the file, same as file_checksum(file_name)
+        """
+        path = os.path.abspath(file_name)
+        stat = os.stat(path)
+        key = [stat.st_size, stat.st_mtime_ns, stat.st_ino]
+
+        with self._lock:
+            self._load()
+            entry = self._entries.get(path)
+            if entry and entry[:3] == key:
+                return cast(str, entry[3])
+
+        checksum = file_checksum(path)
+
+        if time.time_ns() - stat.st_mtime_ns > self.RACY_WINDOW_NS:
+            with self._lock:
+                self._entries[path] = key + [checksum]
+                self._dirty = True
+        return checksum
+
+    def save(self) -> None:
+        """
+        Writes the index to the cache file, if it has changed since it was loaded
+        """
+        if not self._cache_file:
+            return
+
+        with self._lock:
+            if not self._dirty:
+                return
+            # drop the files which are gone, so that the index does not grow forever
+            entries = {path: entry for path, entry in self._entries.items() if os.path.exists(path)}
+            try:
+                os.makedirs(os.path.dirname(self._cache_file), exist_ok=True)
+                temp_file = f"{self._cache_file}.{os.getpid()}.tmp"
+                with open(temp_file, "w", encoding="utf-8") as file_handle:
+                    json.dump({"version": self.VERSION, "files": entries}, file_handle)
+                os.replace(temp_file, self._cache_file)
+                self._entries = entries
+                self._dirty = False
+            except OSError as ex:
+                LOG.debug("Failed to write file checksum cache %s", self._cache_file, exc_info=ex)
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+
+        try:
+            with open(cast(str, self._cache_file), "r", encoding="utf-8") as file_handle:
+                content = json.load(file_handle)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as ex:
+            LOG.debug("Ignoring unreadable file checksum cache %s", self._cache_file, exc_info=ex)
+            return
+
+        if isinstance(content, dict) and content.get("version") == self.VERSION:
+            self._entries = content.get("files") or {}
+
+
+class DirectoryChecksum(NamedTuple):
+    """
+    Checksum of a directory along with the checksums of the files it is calculated from
+    """
+
+    # checksum of the whole directory
+    checksum: str
+    # md5 checksum of each file, keyed on the file path relative to the directory, in a stable (sorted) order
+    files: Dict[str, str]
+
+
 def dir_checksum(
-    directory: str, followlinks: bool = True, ignore_list: Optional[List[str]] = None, hash_generator: Any = None
+    directory: str,
+    followlinks: bool = True,
+    ignore_list: Optional[List[str]] = None,
+    hash_generator: Any = None,
+    checksum_cache: Optional[FileChecksumCache] = None,
 ) -> str:
     """
 
@@ -70,15 +242,50 @@ def dir_checksum(
         The list of file/directory names to ignore in checksum
     hash_generator : hashlib._Hash
         The hashing method (hashlib _Hash object) that generates checksum. Defaults to hashlib.md5.
+    checksum_cache : FileChecksumCache
+        Index of file checksums, files which have not changed since they were indexed are not read again
 
     Returns
     -------
     checksum hash of the directory.
 
+    """
+    return dir_checksum_manifest(directory, followlinks, ignore_list, hash_generator, checksum_cache).checksum
+
+
+def dir_checksum_manifest(
+    directory: str,
+    followlinks: bool = True,
+    ignore_list: Optional[List[str]] = None,
+    hash_generator: Any = None,
+    checksum_cache: Optional[FileChecksumCache] = None,
+    max_workers: int = DEFAULT_HASH_WORKERS,
+) -> DirectoryChecksum:
+    """
+    Calculates the checksum of a directory, hashing its large files concurrently
+
+    Parameters
+    ----------
+    directory : dict
+        A directory with an absolute path
+    followlinks : bool
+        Follow symbolic links through the given directory
+    ignore_list : list(str)
+        The list of file/directory names to ignore in checksum
+    hash_generator : hashlib._Hash
+        The hashing method (hashlib _Hash object) that generates checksum. Defaults to hashlib.md5.
+    checksum_cache : FileChecksumCache
+        Index of file checksums, files which have not changed since they were indexed are not read again
+    max_workers : int
+        Maximum number of files hashed at the same time
+
+    Returns
+    -------
+    DirectoryChecksum
+        checksum hash of the directory, and the checksum of each of its files
+
     """
     ignore_set = set(ignore_list or [])
-    if not hash_generator:
-        hash_generator = _get_md5()
     files = list()
     # Walk through given directory and find all directories and files.
     for dirpath, dirnames, filenames in os.walk(directory, followlinks=followlinks):
@@ -94,11 +301,49 @@ def dir_checksum(
             files.append(filepath)
 
     files.sort()
-    for file in files:
-        hash_generator.update(os.path.relpath(file, directory).encode("utf-8"))
-        filepath_checksum = file_checksum(file)
-        hash_generator.update(filepath_checksum.encode("utf-8"))
+    checksum_file: Callable[[str], str] = file_checksum
+    if checksum_cache:
+        checksum_file = checksum_cache.checksum
+    file_checksums: Dict[str, str] = {}
+    large_files = [file for file in files if _get_path_size(file) >= BLOCK_SIZE] if max_workers > 1 else []
+    if len(large_files) > 1:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(large_files))) as executor:
+            futures = {file: executor.submit(checksum_file, file) for file in large_files}
+            # handing small files to the pool costs more than hashing them, they are hashed here meanwhile
+            for file in files:
+                if file not in futures:
+                    file_checksums[file] = checksum_file(file)
+            for file, future in futures.items():
+                file_checksums[file] = future.result()
+    else:
+        file_checksums = {file: checksum_file(file) for file in files}
+
+    manifest = {os.path.relpath(file, directory): file_checksums[file] for file in files}
+
+    return DirectoryChecksum(directory_checksum(manifest.items(), hash_generator), manifest)
+
+
+def directory_checksum(file_checksums: Iterable[Tuple[str, str]], hash_generator: Any = None) -> str:
+    """
+    Combines the checksums of the files of a directory into the checksum of the directory
+
+    Parameters
+    ----------
+    file_checksums : Iterable[Tuple[str, str]]
+        Path of each file relative to the directory and its md5 checksum, sorted by path
+    hash_generator : hashlib._Hash
+        The hashing method (hashlib _Hash object) that generates checksum. Defaults to hashlib.md5.
 
+    Returns
+    -------
+    checksum hash of the directory, same as dir_checksum(directory)
+    """
+    if not hash_generator:
+        hash_generator = _get_md5()
+    for relative_path, filepath_checksum in file_checksums:
+        # Encode file's path and checksum to be utf-8 and bytes.
+        hash_generator.update(relative_path.encode("utf-8"))
+        hash_generator.update(filepath_checksum.encode("utf-8"))
     return cast(str, hash_generator.hexdigest())
 
 
@@ -0,0 +1,72 @@
+"""
+Lazily imported modules, which defer loading heavy dependencies until a command actually uses them
+"""
+
+import importlib
+import sys
+import threading
+from types import ModuleType
+from typing import Any, List, Optional
+
+
+class LazyModule(ModuleType):
+    """
+    Placeholder of a module which is imported the first time one of its attributes is read.
+
+    Modules which are only needed while a command runs, like boto3 or docker, are declared with ``lazy_import`` at the
+    top of a file instead of being imported. ``sam --version``, ``sam <command> --help`` and the commands which do not
+    use them then start without paying for their import time.
+
+    The module is loaded through ``importlib.import_module``, so lazily imported modules go through the import module
+    proxy of ``samdev`` and must be listed in ``samcli.cli.hidden_imports`` to be bundled by pyinstaller.
+    """
+
+    def __init__(self, name: str) -> None:
+        super().__init__(name)
+        self.__dict__["_lazy_module"] = None
+        self.__dict__["_lazy_lock"] = threading.Lock()
+
+    def _load(self) -> ModuleType:
+        module: Optional[ModuleType] = self.__dict__["_lazy_module"]
+        if module is None:
+            with self.__dict__["_lazy_lock"]:
+                module = self.__dict__["_lazy_module"]
+                if module is None:
+                    module = importlib.import_module(self.__name__)
+                    self.__dict__["_lazy_module"] = module
+        return module
+
+    @property
+    def is_loaded(self) -> bool:
+        return self.__dict__["_lazy_module"] is not None
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._load(), name)
+
+    def __dir__(self) -> List[str]:
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.is_loaded else "not loaded"
+        return f"<lazy module '{self.__name__}' ({state})>"
+
+
+def lazy_import(name: str) -> Any:
+    """
+    Returns the module with the given name if it is already imported, or a placeholder which imports it on first use
+
+    Parameters
+    ----------
+    name : str
+        Absolute name of the module, eg: "boto3" or "docker.errors"
+
+    Returns
+    -------
+    ModuleType
+        The module, or a LazyModule standing for it. The return type is Any so that type checkers do not complain
+        about the attributes of the module, which are only known once it is loaded.
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    return LazyModule(name)
@@ -6,12 +6,14 @@ import logging
 from collections.abc import Collection
 from typing import Dict, List, Optional, Union, cast
 
-import boto3
 import click
 from botocore.config import Config
 from botocore.exceptions import BotoCoreError, ClientError, NoCredentialsError, NoRegionError, ProfileNotFound
 
 from samcli.commands.exceptions import AWSServiceClientError, RegionError, UserException
+from samcli.lib.utils.lazy_import import lazy_import
+
+boto3 = lazy_import("boto3")
 
 LOG = logging.getLogger(__name__)
 
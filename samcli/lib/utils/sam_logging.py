@@ -6,8 +6,10 @@ import logging
 import os
 import sys
 
-from rich.console import Console
-from rich.logging import RichHandler
+from samcli.lib.utils.lazy_import import lazy_import
+
+rich_console = lazy_import("rich.console")
+rich_logging = lazy_import("rich.logging")
 
 SAM_CLI_FORMATTER = logging.Formatter("%(message)s")
 SAM_CLI_FORMATTER_WITH_TIMESTAMP = logging.Formatter("%(asctime)s | %(message)s")
@@ -40,7 +42,9 @@ class SamCliLogger:
             log_stream_handler = handlers[0]
         else:
             log_stream_handler = (
-                RichHandler(console=Console(stderr=True), show_time=False, show_path=False, show_level=False)
+                rich_logging.RichHandler(
+                    console=rich_console.Console(stderr=True), show_time=False, show_path=False, show_level=False
+                )
                 if sys.stderr.isatty()
                 and not any(
                     [
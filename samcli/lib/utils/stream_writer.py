@@ -2,8 +2,13 @@
 This class acts like a wrapper around output streams to provide any flexibility with output we need
 """
 
-from io import BytesIO, TextIOWrapper
-from typing import Optional, TextIO, Union
+import queue
+import threading
+from io import BytesIO, StringIO, TextIOWrapper
+from typing import Iterator, Optional, TextIO, Union
+
+# Number of chunks that can be written to a ChunkedStreamWriter before the writer waits for the reader
+DEFAULT_MAX_PENDING_CHUNKS = 16
 
 
 class StreamWriter:
@@ -67,3 +72,61 @@ class StreamWriter:
         self._stream.flush()
         if self._stream_bytes:
             self._stream_bytes.flush()
+
+
+class ChunkedStreamWriter(StreamWriter):
+    """
+    Stream writer that hands every write over to a reader thread, so that the output can be forwarded while it is
+    still being produced instead of being buffered in memory.
+
+    The writer blocks once ``max_pending_chunks`` chunks are waiting to be read. The producer must call ``close`` when
+    it is done, and the reader calls ``abort`` if it stops reading early, so that the producer is never left blocked.
+    """
+
+    _END = object()
+
+    def __init__(self, max_pending_chunks: int = DEFAULT_MAX_PENDING_CHUNKS):
+        super().__init__(StringIO())
+        self._chunks: queue.Queue = queue.Queue(maxsize=max_pending_chunks)
+        self._aborted = threading.Event()
+
+    def write_bytes(self, output: bytes):
+        if output:
+            self._put(bytes(output))
+
+    def write_str(self, output: str):
+        if output:
+            self._put(output.encode("utf-8"))
+
+    def flush(self):
+        pass
+
+    def close(self) -> None:
+        """
+        Marks the end of the output
+        """
+        self._put(self._END)
+
+    def abort(self) -> None:
+        """
+        Stops accepting output, the following writes are discarded
+        """
+        self._aborted.set()
+
+    def _put(self, item: object) -> None:
+        while not self._aborted.is_set():
+            try:
+                self._chunks.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def __iter__(self) -> Iterator[bytes]:
+        """
+        Yields the written chunks until the writer is closed
+        """
+        while True:
+            chunk = self._chunks.get()
+            if chunk is self._END:
+                return
+            yield chunk
@@ -4,7 +4,9 @@ Date & Time related utilities
 
 import datetime
 
-import dateparser
+from samcli.lib.utils.lazy_import import lazy_import
+
+dateparser = lazy_import("dateparser")
 
 
 def timestamp_to_iso(timestamp):
@@ -39,6 +39,7 @@ from samcli.local.events.api_event import (
 )
 from samcli.local.lambdafn.exceptions import FunctionNotFound
 from samcli.local.services.base_local_service import BaseLocalService, LambdaOutputParser
+from samcli.local.services.server_config import ServerConfig
 
 LOG = logging.getLogger(__name__)
 
@@ -68,6 +69,7 @@ class LocalApigwService(BaseLocalService):
         host: Optional[str] = None,
         stderr: Optional[StreamWriter] = None,
         ssl_context: Optional[Tuple[str, str]] = None,
+        server_config: Optional[ServerConfig] = None,
     ):
         """
         Creates an ApiGatewayService
@@ -91,8 +93,12 @@ class LocalApigwService(BaseLocalService):
             Defaults to None
         stderr : samcli.lib.utils.stream_writer.StreamWriter
             Optional stream writer where the stderr from Docker container should be written to
+        server_config : ServerConfig
+            Optional. Engine and sizing of the HTTP server
         """
-        super().__init__(lambda_runner.is_debugging(), port=port, host=host, ssl_context=ssl_context)
+        super().__init__(
+            lambda_runner.is_debugging(), port=port, host=host, ssl_context=ssl_context, server_config=server_config
+        )
         self.api = api
         self.lambda_runner = lambda_runner
         self.static_dir = static_dir
@@ -23,10 +23,11 @@ from docker.errors import (
 from docker.errors import (
     NotFound as DockerNetworkNotFound,
 )
+from requests.exceptions import RequestException
 
 from samcli.lib.constants import DOCKER_MIN_API_VERSION
 from samcli.lib.utils.retry import retry
-from samcli.lib.utils.stream_writer import StreamWriter
+from samcli.lib.utils.stream_writer import ChunkedStreamWriter, StreamWriter
 from samcli.lib.utils.tar import extract_tarfile
 from samcli.local.docker.effective_user import ROOT_USER_ID, EffectiveUser
 from samcli.local.docker.exceptions import (
@@ -39,6 +40,12 @@ from samcli.local.docker.utils import NoFreePortsError, find_free_port, to_posix
 LOG = logging.getLogger(__name__)
 
 CONTAINER_CONNECTION_TIMEOUT = float(os.environ.get("SAM_CLI_CONTAINER_CONNECTION_TIMEOUT", 20))
+# Interval between two attempts to connect to a starting container. It starts short, since the runtime interface
+# emulator usually listens within a few milliseconds, and doubles after every failed attempt up to the max value
+CONTAINER_CONNECTION_INITIAL_DELAY = 0.0005
+CONTAINER_CONNECTION_MAX_DELAY = 0.1
+# Size of the chunks read from the runtime interface emulator when the response is streamed
+RESPONSE_STREAM_CHUNK_SIZE = 64 * 1024
 DEFAULT_CONTAINER_HOST_INTERFACE = "127.0.0.1"
 
 # Keep a lock instance to access the locks for individual containers (see dict below)
@@ -150,6 +157,11 @@ class Container:
         self._mount_with_write = mount_with_write
         self._host_tmp_dir = host_tmp_dir
 
+        # HTTP session to the runtime interface emulator, it keeps the connection open between invocations
+        self._http_session: Optional[requests.Session] = None
+        # the runtime interface emulator only needs to be waited for once, after the container is started
+        self._is_rapid_ready = False
+
         try:
             self.rapid_port_host = find_free_port(
                 network_interface=self._container_host_interface, start=self._start_port_range, end=self._end_port_range
@@ -307,6 +319,8 @@ class Container:
             Optional. Number of seconds between SIGTERM and SIGKILL. Effectively, the amount of time
             the container has to perform shutdown steps. Default: 3
         """
+        self._close_http_session()
+
         if not self.is_created():
             LOG.debug("Container was not created, cannot run stop.")
             return
@@ -330,6 +344,8 @@ class Container:
         """
         Removes a container that was created earlier.
         """
+        self._close_http_session()
+
         if not self.is_created():
             LOG.debug("Container was not created. Skipping deletion")
             return
@@ -381,6 +397,9 @@ class Container:
             os.makedirs(self._host_tmp_dir)
             LOG.debug("Successfully created temporary directory %s on the host.", self._host_tmp_dir)
 
+        # A restarted runtime interface emulator is not listening yet, wait for it again on the next invoke
+        self._close_http_session()
+
         # Get the underlying container instance from Docker API
         real_container = self.docker_client.containers.get(self.id)
 
@@ -398,17 +417,8 @@ class Container:
         # NOTE(sriram-mv): There is a connection timeout set on the http call to `aws-lambda-rie`, however there is not
         # a read time out for the response received from the server.
 
-        # generate a lock key with host-port combination which is unique per function
-        lock_key = f"{self._container_host}-{self.rapid_port_host}"
-        LOG.debug("Getting lock for the key %s", lock_key)
-        with CONCURRENT_CALL_MANAGER_LOCK:
-            lock = CONCURRENT_CALL_MANAGER.get(lock_key)
-            if not lock:
-                lock = threading.Lock()
-                CONCURRENT_CALL_MANAGER[lock_key] = lock
-        LOG.debug("Waiting to retrieve the lock (%s) to start invocation", lock_key)
-        with lock:
-            resp = requests.post(
+        with self._get_invocation_lock():
+            resp = self._get_http_session().post(
                 self.URL.format(host=self._container_host, port=self.rapid_port_host, function_name="function"),
                 data=event.encode("utf-8"),
                 timeout=(self.RAPID_CONNECTION_TIMEOUT, None),
@@ -423,6 +433,59 @@ class Container:
             LOG.debug("Failed to deserialize response from RIE, returning the raw response as is")
             return resp.content, False
 
+    def stream_http_response(self, name, event, stdout: ChunkedStreamWriter) -> None:
+        """
+        Invokes the function and writes the response to the given stream chunk by chunk, as it is read from the
+        runtime interface emulator socket, instead of buffering the whole payload.
+
+        Parameters
+        ----------
+        name str
+            Name of the function to invoke
+        event str
+            Event passed to the function
+        stdout ChunkedStreamWriter
+            Stream that receives the chunks of the response
+        """
+        with self._get_invocation_lock():
+            resp = self._open_http_response_stream(event)
+            # the connection is only given back to the pool once the body is consumed, keep the lock until then
+            with resp:
+                try:
+                    for chunk in resp.iter_content(chunk_size=RESPONSE_STREAM_CHUNK_SIZE):
+                        stdout.write_bytes(chunk)
+                except RequestException as ex:
+                    # part of the response may already be written, the invocation can not be retried anymore
+                    raise ContainerResponseException(str(ex)) from ex
+
+    @retry(exc=RequestException, exc_raise=ContainerResponseException)
+    def _open_http_response_stream(self, event: str) -> requests.Response:
+        """
+        Sends the invocation to the runtime interface emulator and returns once the response headers are received.
+        Failures, such as a stale pooled connection, are retried since no byte of the response was written yet.
+        """
+        return self._get_http_session().post(
+            self.URL.format(host=self._container_host, port=self.rapid_port_host, function_name="function"),
+            data=event.encode("utf-8"),
+            timeout=(self.RAPID_CONNECTION_TIMEOUT, None),
+            stream=True,
+        )
+
+    def _get_invocation_lock(self) -> threading.Lock:
+        """
+        Returns the lock that serializes the invocations sent to this container
+        """
+        # generate a lock key with host-port combination which is unique per function
+        lock_key = f"{self._container_host}-{self.rapid_port_host}"
+        LOG.debug("Getting lock for the key %s", lock_key)
+        with CONCURRENT_CALL_MANAGER_LOCK:
+            lock = CONCURRENT_CALL_MANAGER.get(lock_key)
+            if not lock:
+                lock = threading.Lock()
+                CONCURRENT_CALL_MANAGER[lock_key] = lock
+        LOG.debug("Waiting to retrieve the lock (%s) to start invocation", lock_key)
+        return lock
+
     def wait_for_result(self, full_path, event, stdout, stderr, start_timer=None):
         # NOTE(sriram-mv): Let logging happen in its own thread, so that a http request can be sent.
         # NOTE(sriram-mv): All logging is re-directed to stderr, so that only the lambda function return
@@ -438,13 +501,20 @@ class Container:
             self._logs_thread.start()
 
         # wait_for_http_response will attempt to establish a connection to the socket
-        # but it'll fail if the socket is not listening yet, so we wait for the socket
-        self._wait_for_socket_connection()
+        # but it'll fail if the socket is not listening yet, so we wait for the socket.
+        # Once it has been listening, it keeps listening until the container is stopped
+        if not self._is_rapid_ready:
+            self._wait_for_socket_connection()
+            self._is_rapid_ready = True
 
         # start the timer for function timeout right before executing the function, as waiting for the socket
         # can take some time
         timer = start_timer() if start_timer else None
-        response, is_image = self.wait_for_http_response(full_path, event, stdout)
+        if isinstance(stdout, ChunkedStreamWriter):
+            self.stream_http_response(full_path, event, stdout)
+            response, is_image = None, False
+        else:
+            response, is_image = self.wait_for_http_response(full_path, event, stdout)
         if timer:
             timer.cancel()
 
@@ -479,21 +549,55 @@ class Container:
         logs_itr = real_container.attach(stream=True, logs=True, demux=True)
         self._write_container_output(logs_itr, event=event, stdout=stdout, stderr=stderr)
 
+    def _get_http_session(self) -> requests.Session:
+        """
+        Returns the HTTP session used to invoke the function through the runtime interface emulator.
+        Invocations to a container are serialized, so a single pooled connection is kept alive between them.
+        """
+        if not self._http_session:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=1)
+            session.mount("http://", adapter)
+            self._http_session = session
+        return self._http_session
+
+    def _close_http_session(self) -> None:
+        """
+        Closes the connection to the runtime interface emulator, it is re-opened and waited for on the next invoke
+        """
+        self._is_rapid_ready = False
+        if self._http_session:
+            self._http_session.close()
+            self._http_session = None
+
     def _wait_for_socket_connection(self) -> None:
         """
         Waits for a successful connection to the socket used to communicate with Docker.
+        The connection is retried with an exponential backoff, so that a container which starts quickly is not
+        delayed by a long polling interval.
         """
 
-        start_time = time.time()
+        start_time = time.monotonic()
+        delay = CONTAINER_CONNECTION_INITIAL_DELAY
+        attempts = 1
         while not self._can_connect_to_socket():
-            time.sleep(0.1)
-            current_time = time.time()
-            if current_time - start_time > CONTAINER_CONNECTION_TIMEOUT:
+            elapsed = time.monotonic() - start_time
+            if elapsed >= CONTAINER_CONNECTION_TIMEOUT:
                 raise ContainerConnectionTimeoutException(
                     f"Timed out while attempting to establish a connection to the container. You can increase this "
                     f"timeout by setting the SAM_CLI_CONTAINER_CONNECTION_TIMEOUT environment variable. "
                     f"The current timeout is {CONTAINER_CONNECTION_TIMEOUT} (seconds)."
                 )
+            time.sleep(min(delay, max(CONTAINER_CONNECTION_TIMEOUT - elapsed, 0)))
+            delay = min(delay * 2, CONTAINER_CONNECTION_MAX_DELAY)
+            attempts += 1
+
+        LOG.debug(
+            "Container %s accepted connections after %.1f ms (%d attempts)",
+            self.id,
+            (time.monotonic() - start_time) * 1000,
+            attempts,
+        )
 
     def _can_connect_to_socket(self) -> bool:
         """
@@ -11,12 +11,13 @@ import random
 import re
 import socket
 
-import docker
-import requests
-
 from samcli.lib.utils.architecture import ARM64, validate_architecture
+from samcli.lib.utils.lazy_import import lazy_import
 from samcli.local.docker.exceptions import NoFreePortsError
 
+docker = lazy_import("docker")
+requests = lazy_import("requests")
+
 LOG = logging.getLogger(__name__)
 
 
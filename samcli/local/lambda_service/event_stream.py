@@ -0,0 +1,71 @@
+"""
+Encoding of the event stream messages returned by the Lambda InvokeWithResponseStream API
+"""
+
+import binascii
+import json
+import struct
+from typing import Dict, Optional
+
+EVENT_STREAM_CONTENT_TYPE = "application/vnd.amazon.eventstream"
+
+# Type of a string header value in the event stream encoding
+_STRING_HEADER_TYPE = 7
+# total length, headers length and the CRC of these two fields
+_PRELUDE_LENGTH = 12
+_MESSAGE_CRC_LENGTH = 4
+
+
+def encode_message(headers: Dict[str, str], payload: bytes) -> bytes:
+    """
+    Encodes a message using the binary event stream format
+
+    Parameters
+    ----------
+    headers Dict[str, str]
+        Headers of the message, only string values are supported
+    payload bytes
+        Payload of the message
+
+    Returns
+    -------
+    bytes
+        The encoded message, with its prelude and message checksums
+    """
+    encoded_headers = b""
+    for name, value in headers.items():
+        encoded_name = name.encode("utf-8")
+        encoded_value = value.encode("utf-8")
+        encoded_headers += struct.pack("!B", len(encoded_name)) + encoded_name
+        encoded_headers += struct.pack("!BH", _STRING_HEADER_TYPE, len(encoded_value)) + encoded_value
+
+    total_length = _PRELUDE_LENGTH + len(encoded_headers) + len(payload) + _MESSAGE_CRC_LENGTH
+    prelude = struct.pack("!II", total_length, len(encoded_headers))
+    prelude += struct.pack("!I", binascii.crc32(prelude) & 0xFFFFFFFF)
+
+    message = prelude + encoded_headers + payload
+    return message + struct.pack("!I", binascii.crc32(message) & 0xFFFFFFFF)
+
+
+def payload_chunk_event(payload: bytes) -> bytes:
+    """
+    Encodes a PayloadChunk event that carries a part of the function response
+    """
+    return encode_message(
+        {":event-type": "PayloadChunk", ":content-type": "application/octet-stream", ":message-type": "event"},
+        payload,
+    )
+
+
+def invoke_complete_event(error_code: Optional[str] = None, error_details: Optional[str] = None) -> bytes:
+    """
+    Encodes the InvokeComplete event that ends the response stream
+    """
+    body: Dict[str, str] = {}
+    if error_code:
+        body["ErrorCode"] = error_code
+        body["ErrorDetails"] = error_details or ""
+    return encode_message(
+        {":event-type": "InvokeComplete", ":content-type": "application/json", ":message-type": "event"},
+        json.dumps(body).encode("utf-8"),
+    )
@@ -1,22 +1,29 @@
 """Local Lambda Service that only invokes a function"""
 
-import io
 import json
 import logging
+import threading
+from typing import Iterator, List, Optional, Union
 
-from flask import Flask, request
+from flask import Flask, Response, request
 from werkzeug.routing import BaseConverter
 
 from samcli.commands.local.lib.exceptions import UnsupportedInlineCodeError
-from samcli.lib.utils.stream_writer import StreamWriter
+from samcli.lib.utils.stream_writer import ChunkedStreamWriter
 from samcli.local.docker.exceptions import DockerContainerCreationFailedException
 from samcli.local.lambdafn.exceptions import FunctionNotFound
 from samcli.local.services.base_local_service import BaseLocalService, LambdaOutputParser
+from samcli.local.services.server_config import ServerEngine
 
+from .event_stream import EVENT_STREAM_CONTENT_TYPE, invoke_complete_event, payload_chunk_event
 from .lambda_error_responses import LambdaErrorResponses
 
 LOG = logging.getLogger(__name__)
 
+# Responses up to this size are buffered, so that function errors can be reported through the response headers.
+# Larger responses are sent to the client while they are read from the container.
+RESPONSE_BUFFER_THRESHOLD = 1024 * 1024
+
 
 class FunctionNamePathConverter(BaseConverter):
     regex = ".+"
@@ -30,8 +37,47 @@ class FunctionNamePathConverter(BaseConverter):
         return value
 
 
+class _BackgroundInvocation:
+    """
+    Invokes a function on a separate thread and exposes its output as a stream of chunks
+
+    When the given semaphore is set, the number of invocations running at the same time is bounded by its slots. The
+    invocation threads are daemon threads, so that an invocation whose client went away can not keep SAM CLI from
+    exiting.
+    """
+
+    def __init__(
+        self, lambda_runner, function_name: str, event: str, stderr, slots: Optional[threading.Semaphore]
+    ) -> None:
+        self.output = ChunkedStreamWriter()
+        self.error: Optional[Exception] = None
+        if slots:
+            slots.acquire()
+        self._thread = threading.Thread(
+            target=self._invoke, args=(lambda_runner, function_name, event, stderr, slots), daemon=True
+        )
+        try:
+            self._thread.start()
+        except Exception:
+            if slots:
+                slots.release()
+            raise
+
+    def _invoke(
+        self, lambda_runner, function_name: str, event: str, stderr, slots: Optional[threading.Semaphore]
+    ) -> None:
+        try:
+            lambda_runner.invoke(function_name, event, stdout=self.output, stderr=stderr)
+        except Exception as ex:  # pylint: disable=broad-except
+            self.error = ex
+        finally:
+            self.output.close()
+            if slots:
+                slots.release()
+
+
 class LocalLambdaInvokeService(BaseLocalService):
-    def __init__(self, lambda_runner, port, host, stderr=None, ssl_context=None):
+    def __init__(self, lambda_runner, port, host, stderr=None, ssl_context=None, server_config=None):
         """
         Creates a Local Lambda Service that will only response to invoking a function
 
@@ -48,10 +94,21 @@ class LocalLambdaInvokeService(BaseLocalService):
             Defaults to None
         stderr io.BaseIO
             Optional stream where the stderr from Docker container should be written to
+        server_config samcli.local.services.server_config.ServerConfig
+            Optional. Engine and sizing of the HTTP server
         """
-        super().__init__(lambda_runner.is_debugging(), port=port, host=host, ssl_context=ssl_context)
+        super().__init__(
+            lambda_runner.is_debugging(), port=port, host=host, ssl_context=ssl_context, server_config=server_config
+        )
         self.lambda_runner = lambda_runner
         self.stderr = stderr
+        # The pooled server bounds the requests, the invocations are bounded the same way so that the ones whose
+        # client went away can not pile up. The development server runs every request, so does the service.
+        self._invocation_slots: Optional[threading.Semaphore] = (
+            threading.BoundedSemaphore(self.server_config.threads)
+            if self.server_config.engine == ServerEngine.POOLED
+            else None
+        )
 
     def create(self):
         """
@@ -71,6 +128,15 @@ class LocalLambdaInvokeService(BaseLocalService):
             provide_automatic_options=False,
         )
 
+        streaming_path = "/2021-11-15/functions/<function_path:function_name>/response-streaming-invocations"
+        self._app.add_url_rule(
+            streaming_path,
+            endpoint=streaming_path,
+            view_func=self._invoke_with_response_stream_request_handler,
+            methods=["POST"],
+            provide_automatic_options=False,
+        )
+
         # setup request validation before Flask calls the view_func
         self._app.before_request(LocalLambdaInvokeService.validate_request)
 
@@ -148,6 +214,11 @@ class LocalLambdaInvokeService(BaseLocalService):
         Request Handler for the Local Lambda Invoke path. This method is responsible for understanding the incoming
         request and invoking the Local Lambda Function
 
+        Responses that fit in RESPONSE_BUFFER_THRESHOLD, and responses which may be function errors, are returned in
+        one piece, so that function errors are reported through the x-amz-function-error header. Other responses are
+        streamed to the client as they are returned by the function, with a chunked transfer encoding, while the
+        function output is read from the container.
+
         Parameters
         ----------
         function_name str
@@ -157,38 +228,137 @@ class LocalLambdaInvokeService(BaseLocalService):
         -------
         A Flask Response response object as if it was returned from Lambda
         """
-        flask_request = request
+        invocation = _BackgroundInvocation(
+            self.lambda_runner, function_name, self._get_request_data(), self.stderr, self._invocation_slots
+        )
+        chunks = iter(invocation.output)
+
+        buffered: List[bytes] = []
+        buffered_size = 0
+        may_be_error = True
+        for chunk in chunks:
+            buffered.append(chunk)
+            buffered_size += len(chunk)
+            if may_be_error and buffered_size > RESPONSE_BUFFER_THRESHOLD:
+                may_be_error = self._may_be_error_response(b"".join(buffered))
+                if not may_be_error:
+                    LOG.debug("Streaming the response of %s as it exceeds %d bytes", function_name, buffered_size)
+                    return Response(
+                        self._stream_output(invocation, buffered, chunks), headers={"Content-Type": "application/json"}
+                    )
+
+        if invocation.error:
+            return self._invoke_error_response(function_name, invocation.error)
+
+        lambda_response = b"".join(buffered)
+        if LambdaOutputParser.is_lambda_error_response(lambda_response):
+            return self.service_response(
+                self._normalize_response(lambda_response),
+                {"Content-Type": "application/json", "x-amz-function-error": "Unhandled"},
+                200,
+            )
 
-        request_data = flask_request.get_data()
+        return self.service_response(
+            self._normalize_response(lambda_response), {"Content-Type": "application/json"}, 200
+        )
 
-        if not request_data:
-            request_data = b"{}"
+    def _invoke_with_response_stream_request_handler(self, function_name):
+        """
+        Request Handler for the Local Lambda InvokeWithResponseStream path. The function output is sent to the client
+        as PayloadChunk events while it is read from the container, followed by an InvokeComplete event.
 
-        request_data = request_data.decode("utf-8")
+        Parameters
+        ----------
+        function_name str
+            Name of the function to invoke
+
+        Returns
+        -------
+        A Flask Response response object that streams the event stream messages
+        """
+        invocation = _BackgroundInvocation(
+            self.lambda_runner, function_name, self._get_request_data(), self.stderr, self._invocation_slots
+        )
+        chunks = iter(invocation.output)
+
+        # wait for the first chunk, so that the function could not be invoked errors are reported with a status code
+        first_chunk = next(chunks, None)
+        if first_chunk is None and invocation.error:
+            return self._invoke_error_response(function_name, invocation.error)
+
+        def events() -> Iterator[bytes]:
+            output = [first_chunk] if first_chunk else []
+            for chunk in self._stream_output(invocation, output, chunks):
+                yield payload_chunk_event(chunk)
+            if invocation.error:
+                yield invoke_complete_event("Unhandled", str(invocation.error))
+            else:
+                yield invoke_complete_event()
+
+        return Response(
+            events(),
+            headers={"Content-Type": EVENT_STREAM_CONTENT_TYPE, "X-Amz-Executed-Version": "$LATEST"},
+            status=200,
+        )
+
+    @staticmethod
+    def _stream_output(
+        invocation: _BackgroundInvocation, buffered: List[bytes], chunks: Iterator[bytes]
+    ) -> Iterator[bytes]:
+        """
+        Yields the already buffered chunks followed by the rest of the function output. If the client goes away
+        before the end of the output, the invocation stops waiting for the output to be read.
+        """
+        try:
+            yield from buffered
+            yield from chunks
+        finally:
+            invocation.output.abort()
+        if invocation.error:
+            LOG.error("Invocation failed while its response was streamed: %s", invocation.error)
 
-        stdout_stream_string = io.StringIO()
-        stdout_stream_bytes = io.BytesIO()
-        stdout_stream_writer = StreamWriter(stdout_stream_string, stdout_stream_bytes, auto_flush=True)
+    @staticmethod
+    def _may_be_error_response(lambda_response_start: bytes) -> bool:
+        """
+        Returns False if the start of the output can not be the start of a function error, which is a JSON object
+        with errorMessage and errorType keys. Such outputs can be streamed without reading them completely.
+        """
+        return lambda_response_start.lstrip().startswith(b"{") and (
+            b'"errorMessage"' in lambda_response_start or b'"errorType"' in lambda_response_start
+        )
 
+    @staticmethod
+    def _normalize_response(lambda_response: bytes) -> Union[str, bytes]:
+        """
+        Serializes JSON responses again, like the responses read at once from the container, other responses such as
+        images are returned as is. Streamed responses are forwarded as the function returned them.
+        """
         try:
-            self.lambda_runner.invoke(function_name, request_data, stdout=stdout_stream_writer, stderr=self.stderr)
-        except FunctionNotFound:
+            return json.dumps(json.loads(lambda_response), ensure_ascii=False)
+        except ValueError:
+            return lambda_response
+
+    @staticmethod
+    def _get_request_data() -> str:
+        request_data = request.get_data()
+
+        if not request_data:
+            request_data = b"{}"
+
+        return request_data.decode("utf-8")
+
+    @staticmethod
+    def _invoke_error_response(function_name: str, error: Exception):
+        """
+        Maps the errors raised when a function can not be invoked to the matching Lambda error responses
+        """
+        if isinstance(error, FunctionNotFound):
             LOG.debug("%s was not found to invoke.", function_name)
             return LambdaErrorResponses.resource_not_found(function_name)
-        except UnsupportedInlineCodeError:
+        if isinstance(error, UnsupportedInlineCodeError):
             return LambdaErrorResponses.not_implemented_locally(
                 "Inline code is not supported for sam local commands. Please write your code in a separate file."
             )
-        except DockerContainerCreationFailedException as ex:
-            return LambdaErrorResponses.container_creation_failed(ex.message)
-
-        lambda_response, is_lambda_user_error_response = LambdaOutputParser.get_lambda_output(
-            stdout_stream_string, stdout_stream_bytes
-        )
-
-        if is_lambda_user_error_response:
-            return self.service_response(
-                lambda_response, {"Content-Type": "application/json", "x-amz-function-error": "Unhandled"}, 200
-            )
-
-        return self.service_response(lambda_response, {"Content-Type": "application/json"}, 200)
+        if isinstance(error, DockerContainerCreationFailedException):
+            return LambdaErrorResponses.container_creation_failed(error.message)
+        raise error
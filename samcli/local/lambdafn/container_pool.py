@@ -0,0 +1,183 @@
+"""
+Pool of warm containers created for a single Lambda function
+"""
+
+import logging
+import threading
+import time
+from typing import Callable, List, Optional
+
+from samcli.local.docker.container import Container
+
+LOG = logging.getLogger(__name__)
+
+
+class _PooledContainer:
+    """
+    Book-keeping record of one container that is owned by a pool
+    """
+
+    def __init__(self, container: Container, last_used: float) -> None:
+        self.container = container
+        self.in_flight = 0
+        self.last_used = last_used
+
+
+class WarmContainerPool:
+    """
+    Keeps up to ``max_size`` warm containers for one Lambda function and dispatches invocations to the least busy one.
+
+    The pool itself never creates or stops containers. ``checkout`` either hands back an existing container, or
+    reserves a free slot and returns None, in which case the caller is responsible for creating a container and
+    passing it to ``add`` (or calling ``cancel_reservation`` if the creation failed). Every checked out container
+    must be given back with ``release`` once the invocation completes.
+    """
+
+    def __init__(
+        self, max_size: int = 1, idle_ttl: Optional[float] = None, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """
+        Parameters
+        ----------
+        max_size: int
+            Maximum number of containers the pool can hold, must be at least 1
+        idle_ttl: Optional[float]
+            Number of seconds a container can stay idle before it is evicted. The last container in the pool is
+            never evicted. None disables the eviction
+        clock: Callable[[], float]
+            Monotonic clock used to track container idle time
+        """
+        if max_size < 1:
+            raise ValueError("Warm container pool size must be at least 1")
+
+        self._max_size = max_size
+        self._idle_ttl = idle_ttl
+        self._clock = clock
+        self._entries: List[_PooledContainer] = []
+        self._pending = 0
+        self._condition = threading.Condition()
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    @property
+    def containers(self) -> List[Container]:
+        """
+        Returns all the containers currently held by the pool
+        """
+        with self._condition:
+            return [entry.container for entry in self._entries]
+
+    def __len__(self) -> int:
+        with self._condition:
+            return len(self._entries)
+
+    def checkout(self) -> Optional[Container]:
+        """
+        Picks the container that should serve the next invocation.
+
+        An idle container is always preferred. If every container is busy and the pool still has room, a slot is
+        reserved and None is returned so that the caller creates a new container. Once the pool is full, the least
+        busy container is returned and the invocation will queue behind the ones already running on it.
+
+        Returns
+        -------
+        Optional[Container]
+            The container to invoke, or None if the caller must create a new one and ``add`` it to the pool
+        """
+        with self._condition:
+            while True:
+                entry = min(self._entries, key=lambda item: item.in_flight, default=None)
+                has_capacity = len(self._entries) + self._pending < self._max_size
+
+                if entry and (entry.in_flight == 0 or not has_capacity):
+                    entry.in_flight += 1
+                    return entry.container
+
+                if has_capacity:
+                    self._pending += 1
+                    return None
+
+                # the pool is full of containers that are still being created, wait for one of them
+                self._condition.wait()
+
+    def add(self, container: Container) -> None:
+        """
+        Adds a newly created container to the pool, filling the slot reserved by ``checkout``.
+        The container is considered checked out by the caller.
+        """
+        with self._condition:
+            self._pending = max(self._pending - 1, 0)
+            entry = _PooledContainer(container, self._clock())
+            entry.in_flight = 1
+            self._entries.append(entry)
+            self._condition.notify_all()
+
+    def cancel_reservation(self) -> None:
+        """
+        Frees the slot reserved by ``checkout`` when the container could not be created.
+        """
+        with self._condition:
+            self._pending = max(self._pending - 1, 0)
+            self._condition.notify_all()
+
+    def release(self, container: Container) -> None:
+        """
+        Marks one invocation on the given container as done.
+        """
+        with self._condition:
+            for entry in self._entries:
+                if entry.container is container:
+                    entry.in_flight = max(entry.in_flight - 1, 0)
+                    entry.last_used = self._clock()
+                    break
+
+    def remove(self, container: Container) -> None:
+        """
+        Removes the given container from the pool without stopping it.
+        """
+        with self._condition:
+            self._entries = [entry for entry in self._entries if entry.container is not container]
+            self._condition.notify_all()
+
+    def evict_idle(self) -> List[Container]:
+        """
+        Removes the containers that have been idle for longer than the idle TTL. The most recently used container is
+        always kept, so that the function stays warm.
+
+        Returns
+        -------
+        List[Container]
+            The evicted containers, which should be stopped by the caller
+        """
+        if self._idle_ttl is None:
+            return []
+
+        with self._condition:
+            now = self._clock()
+            most_recent = max(self._entries, key=lambda item: item.last_used, default=None)
+            evicted = [
+                entry
+                for entry in self._entries
+                if entry is not most_recent and entry.in_flight == 0 and now - entry.last_used > self._idle_ttl
+            ]
+            if evicted:
+                self._entries = [entry for entry in self._entries if entry not in evicted]
+                self._condition.notify_all()
+            return [entry.container for entry in evicted]
+
+    def drain(self) -> List[Container]:
+        """
+        Removes all the containers from the pool.
+
+        Returns
+        -------
+        List[Container]
+            The removed containers, which should be stopped by the caller
+        """
+        with self._condition:
+            containers = [entry.container for entry in self._entries]
+            self._entries = []
+            self._condition.notify_all()
+            return containers
@@ -18,6 +18,7 @@ from samcli.local.docker.container import Container
 from samcli.local.docker.container_analyzer import ContainerAnalyzer
 from samcli.local.docker.exceptions import ContainerFailureError, DockerContainerCreationFailedException
 from samcli.local.docker.lambda_container import LambdaContainer
+from samcli.local.lambdafn.container_pool import WarmContainerPool
 
 from ...lib.providers.provider import LayerVersion
 from ...lib.utils.stream_writer import StreamWriter
@@ -390,7 +391,7 @@ class WarmLambdaRuntime(LambdaRuntime):
     warm containers life cycle.
     """
 
-    def __init__(self, container_manager, image_builder, observer=None):
+    def __init__(self, container_manager, image_builder, observer=None, pool_size=1, idle_ttl=None):
         """
         Initialize the Local Lambda runtime
 
@@ -400,11 +401,21 @@ class WarmLambdaRuntime(LambdaRuntime):
             Instance of the ContainerManager class that can run a local Docker container
         image_builder samcli.local.docker.lambda_image.LambdaImage
             Instance of the LambdaImage class that can create am image
-        warm_containers bool
-            Determines if the warm containers is enabled or not.
+        observer LambdaFunctionObserver
+            Optional. Observer used to detect the changes in the functions source code or images
+        pool_size int
+            Optional. Maximum number of warm containers kept for each function. Concurrent invocations of the same
+            function are dispatched to the least busy container, and a new container is created only when all the
+            existing ones are busy. Defaults to 1
+        idle_ttl float
+            Optional. Number of seconds after which an idle container that exceeds the first one of a function gets
+            terminated. Defaults to None, which keeps the containers until the command ends
         """
         self._function_configs = {}
-        self._containers = {}
+        self._containers: Dict[str, WarmContainerPool] = {}
+        self._pool_size = pool_size
+        self._idle_ttl = idle_ttl
+        self._pools_lock = threading.Lock()
 
         self._observer = observer if observer else LambdaFunctionObserver(self._on_code_change)
 
@@ -414,9 +425,10 @@ class WarmLambdaRuntime(LambdaRuntime):
         self, function_config, debug_context=None, container_host=None, container_host_interface=None, extra_hosts=None
     ):
         """
-        Create a new Container for the passed function, then store it in a dictionary using the function name,
-        so it can be retrieved later and used in the other functions. Make sure to use the debug_context only
-        if the function_config.name equals debug_context.debug-function or the warm_containers option is disabled
+        Checkout a warm container of the passed function from its pool. A new container is created and stored in the
+        function pool only if all the existing ones are busy and the pool is not full yet, so it can be retrieved later
+        and used in the other functions. Make sure to use the debug_context only if the function_config.name equals
+        debug_context.debug-function or the warm_containers option is disabled
 
         Parameters
         ----------
@@ -435,24 +447,6 @@ class WarmLambdaRuntime(LambdaRuntime):
             the created container
         """
 
-        # reuse the cached container if it is created, and if the function configuration is not changed
-        exist_function_config = self._function_configs.get(function_config.full_path, None)
-        container = self._containers.get(function_config.full_path, None)
-        if exist_function_config and _require_container_reloading(exist_function_config, function_config):
-            LOG.info(
-                "Lambda Function '%s' definition has been changed in the stack template, "
-                "terminate the created warm container.",
-                function_config.full_path,
-            )
-            self._function_configs.pop(exist_function_config.full_path, None)
-            if container:
-                self._container_manager.stop(container)
-                self._containers.pop(exist_function_config.full_path, None)
-            self._observer.unwatch(exist_function_config)
-        elif container and container.is_created():
-            LOG.info("Reuse the created warm container for Lambda function '%s'", function_config.full_path)
-            return container
-
         # debug_context should be used only if the function name is the one defined
         # in debug-function option
         if debug_context and debug_context.debug_function != function_config.name:
@@ -463,17 +457,113 @@ class WarmLambdaRuntime(LambdaRuntime):
             )
             debug_context = None
 
-        self._observer.watch(function_config)
-        self._observer.start()
+        # NOTE: the observer calls back _on_code_change while holding its own lock, so it must not be called while
+        # holding the pools lock
+        changed_function_config = None
+        with self._pools_lock:
+            # drop the cached containers if the function configuration got changed
+            exist_function_config = self._function_configs.get(function_config.full_path, None)
+            if exist_function_config and _require_container_reloading(exist_function_config, function_config):
+                LOG.info(
+                    "Lambda Function '%s' definition has been changed in the stack template, "
+                    "terminate the created warm container.",
+                    function_config.full_path,
+                )
+                self._stop_pool(exist_function_config.full_path)
+                changed_function_config, exist_function_config = exist_function_config, None
+
+            if not exist_function_config:
+                self._function_configs[function_config.full_path] = function_config
+
+            pool = self._containers.get(function_config.full_path, None)
+            if not pool:
+                # the debugger port can only be bound by one container
+                pool_size = 1 if debug_context else self._pool_size
+                pool = WarmContainerPool(max_size=pool_size, idle_ttl=self._idle_ttl)
+                self._containers[function_config.full_path] = pool
+
+        if changed_function_config:
+            self._observer.unwatch(changed_function_config)
+        if not exist_function_config:
+            self._observer.watch(function_config)
+            self._observer.start()
+
+        for idle_container in pool.evict_idle():
+            LOG.debug("Terminate idle warm container for Lambda function '%s'", function_config.full_path)
+            self._container_manager.stop(idle_container)
+
+        container = pool.checkout()
+        while container and not container.is_created():
+            pool.remove(container)
+            container = pool.checkout()
 
-        container = super().create(
-            function_config, debug_context, container_host, container_host_interface, extra_hosts
+        if container:
+            LOG.info("Reuse the created warm container for Lambda function '%s'", function_config.full_path)
+            return container
+
+        LOG.debug(
+            "Creating a new warm container for Lambda function '%s' (%d of at most %d)",
+            function_config.full_path,
+            len(pool) + 1,
+            pool.max_size,
         )
-        self._function_configs[function_config.full_path] = function_config
-        self._containers[function_config.full_path] = container
+        try:
+            container = super().create(
+                function_config, debug_context, container_host, container_host_interface, extra_hosts
+            )
+        except BaseException:
+            pool.cancel_reservation()
+            raise
 
+        pool.add(container)
         return container
 
+    def run(
+        self,
+        container,
+        function_config,
+        debug_context,
+        container_host=None,
+        container_host_interface=None,
+        extra_hosts=None,
+    ):
+        """
+        Run the passed warm container, or checkout a container from the function pool and run it. Containers that
+        are checked out here are not used for any invocation, so they are given back to the pool right away.
+
+        Parameters
+        ----------
+        container Container
+            the created container to be run
+        function_config FunctionConfig
+            Configuration of the function to run its created container.
+        debug_context DebugContext
+            Debugging context for the function (includes port, args, and path)
+        container_host string
+            Host of locally emulated Lambda container
+        container_host_interface string
+            Optional. Interface that Docker host binds ports to
+        extra_hosts Dict
+            Optional. Dict of hostname to IP resolutions
+
+        Returns
+        -------
+        Container
+            the running container
+        """
+        if container:
+            return super().run(
+                container, function_config, debug_context, container_host, container_host_interface, extra_hosts
+            )
+
+        container = self.create(function_config, debug_context, container_host, container_host_interface, extra_hosts)
+        try:
+            return super().run(
+                container, function_config, debug_context, container_host, container_host_interface, extra_hosts
+            )
+        finally:
+            self._release_container(container)
+
     def _on_invoke_done(self, container):
         """
         Cleanup the created resources, just before the invoke function ends.
@@ -485,6 +575,34 @@ class WarmLambdaRuntime(LambdaRuntime):
         container: Container
            The current running container
         """
+        if container:
+            self._release_container(container)
+
+    def _release_container(self, container):
+        """
+        Give the container back to its function pool, so it can be picked by the next invocations
+
+        Parameters
+        ----------
+        container: Container
+           The container that was checked out by ``create``
+        """
+        for pool in list(self._containers.values()):
+            pool.release(container)
+
+    def _stop_pool(self, function_full_path):
+        """
+        Stop all the warm containers of a function and drop its pool
+
+        Parameters
+        ----------
+        function_full_path: str
+            The full path of the function whose containers should be terminated
+        """
+        pool = self._containers.pop(function_full_path, None)
+        if pool:
+            for container in pool.drain():
+                self._container_manager.stop(container)
 
     def _configure_interrupt(self, function_full_path, timeout, container, is_debugging):
         """
@@ -536,9 +654,10 @@ class WarmLambdaRuntime(LambdaRuntime):
         Clean the running containers, the decompressed code dirs, and stop the created observer
         """
         LOG.debug("Terminating all running warm containers")
-        for function_name, container in self._containers.items():
-            LOG.debug("Terminate running warm container for Lambda Function '%s'", function_name)
-            self._container_manager.stop(container)
+        for function_name, pool in self._containers.items():
+            for container in pool.containers:
+                LOG.debug("Terminate running warm container for Lambda Function '%s'", function_name)
+                self._container_manager.stop(container)
         self._clean_decompressed_paths()
         self._observer.stop()
 
@@ -561,12 +680,10 @@ class WarmLambdaRuntime(LambdaRuntime):
                 function_full_path,
                 resource,
             )
-            self._observer.unwatch(function_config)
-            self._function_configs.pop(function_full_path, None)
-            container = self._containers.get(function_full_path, None)
-            if container:
-                self._container_manager.stop(container)
-                self._containers.pop(function_full_path, None)
+            with self._pools_lock:
+                self._observer.unwatch(function_config)
+                self._function_configs.pop(function_full_path, None)
+                self._stop_pool(function_full_path)
 
 
 def _unzip_file(filepath):
@@ -9,12 +9,13 @@ from typing import Optional, Tuple, Union
 from flask import Response
 
 from samcli.local.docker.exceptions import ProcessSigTermException
+from samcli.local.services.server_config import ServerConfig, ServerEngine
 
 LOG = logging.getLogger(__name__)
 
 
 class BaseLocalService:
-    def __init__(self, is_debugging, port, host, ssl_context):
+    def __init__(self, is_debugging, port, host, ssl_context, server_config=None):
         """
         Creates a BaseLocalService class
 
@@ -28,11 +29,14 @@ class BaseLocalService:
             Optional. host to start the service on Defaults to '127.0.0.1
         ssl_context tuple(str, str)
             Optional. path to ssl certificate and key files to start service in https
+        server_config ServerConfig
+            Optional. engine and sizing of the HTTP server. Defaults to the Flask development server
         """
         self.is_debugging = is_debugging
         self.port = port
         self.host = host
         self.ssl_context = ssl_context
+        self.server_config = server_config or ServerConfig()
         self._app = None
 
     def create(self):
@@ -61,6 +65,18 @@ class BaseLocalService:
         # kill the container gracefully (Ctrl+C can be handled only by the main thread)
         multi_threaded = not self.is_debugging
 
+        def interrupt_handler(sig, frame):
+            LOG.debug("Caught SIGTERM interrupt")
+            raise ProcessSigTermException()
+
+        LOG.debug("Setting SIGTERM interrupt handler")
+        signal.signal(signal.SIGTERM, interrupt_handler)
+
+        # The pooled server handles the requests in worker threads, so it is only used when not debugging
+        if multi_threaded and self.server_config.engine == ServerEngine.POOLED:
+            self._run_pooled_server()
+            return
+
         LOG.debug("Localhost server is starting up. Multi-threading = %s", multi_threaded)
 
         # Suppress flask dev server output
@@ -69,15 +85,32 @@ class BaseLocalService:
 
         flask.cli.show_server_banner = lambda *args: None
 
-        def interrupt_handler(sig, frame):
-            LOG.debug("Caught SIGTERM interrupt")
-            raise ProcessSigTermException()
-
-        LOG.debug("Setting SIGTERM interrupt handler")
-        signal.signal(signal.SIGTERM, interrupt_handler)
-
         self._app.run(threaded=multi_threaded, host=self.host, port=self.port, ssl_context=self.ssl_context)
 
+    def _run_pooled_server(self):
+        """
+        Serves the application from a fixed pool of worker threads with a bounded accept backlog.
+        Note: This is a **blocking call**
+        """
+        from samcli.local.services.pooled_wsgi_server import PooledWSGIServer
+
+        LOG.debug(
+            "Localhost server is starting up. Worker threads = %s, accept backlog = %s",
+            self.server_config.threads,
+            self.server_config.backlog,
+        )
+
+        server = PooledWSGIServer(
+            self.host,
+            self.port,
+            self._app,
+            threads=self.server_config.threads,
+            backlog=self.server_config.backlog,
+            ssl_context=self.ssl_context,
+            client_timeout=self.server_config.client_timeout,
+        )
+        server.serve_forever()
+
     @staticmethod
     def service_response(body, headers, status_code):
         """
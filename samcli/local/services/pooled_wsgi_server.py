@@ -0,0 +1,104 @@
+"""
+WSGI server that serves requests from a bounded pool of worker threads
+"""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional, Tuple
+
+from werkzeug.serving import BaseWSGIServer, WSGIRequestHandler
+
+from samcli.local.services.server_config import DEFAULT_CLIENT_TIMEOUT
+
+LOG = logging.getLogger(__name__)
+
+
+class TimeoutRequestHandler(WSGIRequestHandler):
+    """
+    Request handler that gives up on clients that stop sending data, so they can not hold a worker forever
+    """
+
+    # Werkzeug enables HTTP/1.1 keep-alive for multithreaded servers, an idle persistent connection would then hold
+    # a worker of the pool until it times out. Answering in HTTP/1.0 closes the connection after every response.
+    protocol_version = "HTTP/1.0"
+    # Read timeout on the client socket, it bounds slow or stalled clients
+    timeout = DEFAULT_CLIENT_TIMEOUT
+
+
+class PooledWSGIServer(BaseWSGIServer):
+    """
+    A WSGI server that dispatches the accepted connections to a fixed number of worker threads.
+
+    Unlike the development server, it does not start a new thread per request. When all the workers are busy, the
+    server stops accepting connections and new clients wait in the socket accept backlog.
+    """
+
+    multithread = True
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        app: Any,
+        threads: int,
+        backlog: int,
+        ssl_context: Optional[Tuple[str, str]] = None,
+        client_timeout: float = DEFAULT_CLIENT_TIMEOUT,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        host: str
+            Host to start the server on
+        port: int
+            Port for the server to listen on
+        app: Any
+            WSGI application to serve
+        threads: int
+            Number of worker threads that handle the connections
+        backlog: int
+            Maximum number of connections waiting to be accepted
+        ssl_context: Optional[Tuple[str, str]]
+            Cert and key files to use to start in https mode
+        client_timeout: float
+            Number of seconds to wait for data from a client before closing its connection
+        """
+        if threads < 1:
+            raise ValueError("The server needs at least one worker thread")
+
+        # socketserver reads it when the socket starts listening
+        self.request_queue_size = backlog
+        self._executor = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="sam-local-server")
+        self._free_workers = threading.BoundedSemaphore(threads)
+        # werkzeug only keeps the protocol version which is set on the handler class itself
+        handler = type(
+            "TimeoutRequestHandler",
+            (TimeoutRequestHandler,),
+            {"timeout": client_timeout, "protocol_version": TimeoutRequestHandler.protocol_version},
+        )
+        super().__init__(host, port, app, handler=handler, ssl_context=ssl_context)
+
+    def process_request(self, request: Any, client_address: Any) -> None:
+        # Block the accept loop until a worker is free, so the pending connections stay in the socket backlog
+        self._free_workers.acquire()
+        try:
+            self._executor.submit(self._process_request_worker, request, client_address)
+        except RuntimeError:
+            # the executor is already shut down
+            self._free_workers.release()
+            self.shutdown_request(request)
+
+    def _process_request_worker(self, request: Any, client_address: Any) -> None:
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+            self._free_workers.release()
+
+    def server_close(self) -> None:
+        super().server_close()
+        # Connections are only handed to the pool when a worker is free, so there is nothing queued to cancel
+        self._executor.shutdown(wait=False)
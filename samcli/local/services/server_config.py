@@ -0,0 +1,66 @@
+"""
+Configuration of the HTTP server used by the local services
+"""
+
+import os
+from enum import Enum
+from typing import NamedTuple, Optional
+
+from samcli.commands.exceptions import UserException
+
+# Same sizing as the default ThreadPoolExecutor, requests mostly wait on the Lambda containers
+DEFAULT_SERVER_THREADS = min(32, (os.cpu_count() or 1) + 4)
+DEFAULT_SERVER_BACKLOG = 128
+# Number of seconds a client socket can stay silent while holding a worker thread before it gets closed
+DEFAULT_CLIENT_TIMEOUT = 5
+
+
+class InvalidServerConfigException(UserException):
+    """
+    Raised when the HTTP server settings can not be used to serve any request
+    """
+
+
+class ServerEngine(Enum):
+    # Flask development server, starts a new thread for every request
+    DEV = "DEV"
+    # Fixed size pool of worker threads with a bounded accept backlog
+    POOLED = "POOLED"
+
+
+class ServerConfig(NamedTuple):
+    """
+    Settings of the HTTP server that serves the local services
+    """
+
+    engine: ServerEngine = ServerEngine.DEV
+    threads: int = DEFAULT_SERVER_THREADS
+    backlog: int = DEFAULT_SERVER_BACKLOG
+    client_timeout: float = DEFAULT_CLIENT_TIMEOUT
+
+
+def get_server_config(engine: str, threads: Optional[int], backlog: int) -> ServerConfig:
+    """
+    Validates the server settings provided through the command line and creates the server configuration
+
+    Parameters
+    ----------
+    engine: str
+        Name of the server engine
+    threads: Optional[int]
+        Number of worker threads, the default size is used if it is not provided
+    backlog: int
+        Maximum number of connections waiting to be accepted
+
+    Returns
+    -------
+    ServerConfig
+        The server configuration
+    """
+    threads = DEFAULT_SERVER_THREADS if threads is None else threads
+    if threads < 1:
+        raise InvalidServerConfigException(f"Server threads must be at least 1, got {threads}")
+    if backlog < 1:
+        raise InvalidServerConfigException(f"Server backlog must be at least 1, got {backlog}")
+
+    return ServerConfig(engine=ServerEngine(engine), threads=threads, backlog=backlog)
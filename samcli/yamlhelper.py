@@ -18,12 +18,17 @@ https://github.com/aws/aws-cli/blob/develop/awscli/customizations/cloudformation
 # pylint: disable=too-many-ancestors
 
 import json
-from typing import Dict, Optional, cast
+from typing import Any, Dict, Optional, Type, cast
 
 import yaml
 from botocore.compat import OrderedDict
-from samtranslator.utils.py27hash_fix import Py27Dict, Py27UniStr
+from yaml.constructor import SafeConstructor
 from yaml.nodes import ScalarNode, SequenceNode
+from yaml.resolver import BaseResolver
+
+from samcli.lib.utils.lazy_import import lazy_import
+
+py27hash_fix = lazy_import("samtranslator.utils.py27hash_fix")
 
 TAG_STR = "tag:yaml.org,2002:str"
 TIMESTAMP_TAG = "tag:yaml.org,2002:timestamp"
@@ -100,8 +105,8 @@ def yaml_dump(dict_to_dump):
     """
     CfnDumper.add_representer(OrderedDict, _dict_representer)
     CfnDumper.add_representer(str, string_representer)
-    CfnDumper.add_representer(Py27Dict, _dict_representer)
-    CfnDumper.add_representer(Py27UniStr, string_representer)
+    CfnDumper.add_representer(py27hash_fix.Py27Dict, _dict_representer)
+    CfnDumper.add_representer(py27hash_fix.Py27UniStr, string_representer)
     return yaml.dump(dict_to_dump, default_flow_style=False, Dumper=CfnDumper)
 
 
@@ -111,6 +116,24 @@ def _dict_constructor(loader, node):
     return OrderedDict(loader.construct_pairs(node))
 
 
+def _make_cfn_loader(base_loader: Type[Any]) -> Type[Any]:
+    """
+    Returns a loader of CloudFormation templates derived from the given YAML loader. Timestamps are kept as strings,
+    mappings keep the order of their keys and the short form of the intrinsic functions is converted to the long form.
+    """
+    loader: Type[Any] = type(f"Cfn{base_loader.__name__}", (base_loader,), {})
+    loader.add_constructor(TIMESTAMP_TAG, SafeConstructor.construct_yaml_str)
+    loader.add_constructor(BaseResolver.DEFAULT_MAPPING_TAG, _dict_constructor)
+    loader.add_multi_constructor("!", intrinsics_multi_constructor)
+    return loader
+
+
+CfnSafeLoader = _make_cfn_loader(yaml.SafeLoader)
+# The libyaml bindings are optional in PyYAML. When they are available, templates are parsed by libyaml, which is an
+# order of magnitude faster, and built into Python objects by the same constructors as the pure Python loader.
+CfnCSafeLoader: Optional[Type[Any]] = _make_cfn_loader(yaml.CSafeLoader) if yaml.__with_libyaml__ else None
+
+
 def yaml_parse(yamlstr) -> Dict:
     """Parse a yaml string"""
     try:
@@ -119,12 +142,14 @@ def yaml_parse(yamlstr) -> Dict:
         # json parser.
         return cast(Dict, json.loads(yamlstr, object_pairs_hook=OrderedDict))
     except ValueError:
-        yaml.constructor.SafeConstructor.yaml_constructors[TIMESTAMP_TAG] = (
-            yaml.constructor.SafeConstructor.yaml_constructors[TAG_STR]
-        )
-        yaml.SafeLoader.add_constructor(yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, _dict_constructor)
-        yaml.SafeLoader.add_multi_constructor("!", intrinsics_multi_constructor)
-        return cast(Dict, yaml.safe_load(yamlstr))
+        if CfnCSafeLoader:
+            try:
+                return cast(Dict, yaml.load(yamlstr, Loader=CfnCSafeLoader))
+            except yaml.YAMLError:
+                # Parse the template again with the pure Python loader,
+                # so that the error message does not depend on libyaml being installed
+                pass
+        return cast(Dict, yaml.load(yamlstr, Loader=CfnSafeLoader))
 
 
 def parse_yaml_file(file_path, extra_context: Optional[Dict] = None) -> Dict:
@@ -1,3 +1,4 @@
+import json
 import os
 import pathlib
 import shutil
@@ -5,7 +6,7 @@ import subprocess
 import tempfile
 import sys
 
-from unittest import TestCase
+from unittest import TestCase, skipIf
 
 TIMEOUT = 3
 
@@ -200,3 +201,200 @@ class TestCopyTerraformBuiltArtifacts(TestCase):
             subprocess.check_call(
                 command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, stdin=subprocess.PIPE, cwd=self.working_dir
             )
+
+
+FAKE_TERRAFORM = """#!{python}
+import json
+import sys
+
+with open({log_path!r}, "a") as log:
+    log.write(json.dumps(sys.argv[1:]) + "\\n")
+if sys.argv[1] == "apply" and sys.argv.count("-target") > {max_apply_targets}:
+    sys.exit(1)
+if sys.argv[1] == "show":
+    with open({show_path!r}) as show:
+        sys.stdout.write(show.read())
+sys.exit({exit_code})
+"""
+
+
+@skipIf(sys.platform.startswith("win"), "The fake terraform executable is a python script with a shebang")
+class TestCopyTerraformBuiltArtifactsBatch(TestCase):
+    def setUp(self) -> None:
+        samcli_root_path = pathlib.Path(__file__).parents[3].joinpath("samcli")
+        self.temp_dir = pathlib.Path(tempfile.mkdtemp())
+        self.metadata_dir = self.temp_dir.joinpath("metadata")
+        self.project_dir = self.temp_dir.joinpath("project")
+        self.bin_dir = self.temp_dir.joinpath("bin")
+        for directory in (self.metadata_dir, self.project_dir, self.bin_dir):
+            directory.mkdir()
+
+        self.script_location = self.metadata_dir.joinpath("copy_terraform_built_artifacts.py")
+        shutil.copy(
+            samcli_root_path.joinpath("hook_packages", "terraform", self.script_location.name), self.metadata_dir
+        )
+        shutil.copy(samcli_root_path.joinpath("local", "lambdafn", "zip.py"), self.metadata_dir)
+        self.metadata_dir.joinpath("z_samcli_backend_override").write_text("terraform {}\n")
+        self.targets = ["sam_metadata_address", "other_sam_metadata_address"]
+        self.metadata_dir.joinpath("sam_metadata_targets.json").write_text(json.dumps(self.targets))
+
+        testdata_directory = pathlib.Path(__file__).parent.joinpath("testdata")
+        show_output = json.loads(testdata_directory.joinpath("build-output-path-dir.json").read_text())
+        show_output["values"]["root_module"]["child_modules"][0]["resources"][0]["values"]["triggers"][
+            "built_output_path"
+        ] = str(testdata_directory.joinpath("output_path_dir"))
+        self.show_path = self.temp_dir.joinpath("show.json")
+        self.show_path.write_text(json.dumps(show_output))
+        self.log_path = self.temp_dir.joinpath("terraform.log")
+        self.expression = (
+            '|values|root_module|child_modules|[?address=="module_address"]|resources|['
+            '?address=="sam_metadata_address"]|values|triggers|built_output_path'
+        )
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.temp_dir)
+
+    def _write_fake_terraform(self, exit_code=0, max_apply_targets=100):
+        terraform = self.bin_dir.joinpath("terraform")
+        terraform.write_text(
+            FAKE_TERRAFORM.format(
+                python=sys.executable,
+                log_path=str(self.log_path),
+                show_path=str(self.show_path),
+                exit_code=exit_code,
+                max_apply_targets=max_apply_targets,
+            )
+        )
+        terraform.chmod(0o755)
+
+    def _build(self, env=None, build_all_resources=True):
+        directory = pathlib.Path(tempfile.mkdtemp(dir=self.temp_dir))
+        command = [
+            sys.executable,
+            str(self.script_location),
+            "--directory",
+            str(directory),
+            "--expression",
+            self.expression,
+            "--target",
+            "sam_metadata_address",
+            "--batch",
+        ]
+        environment = dict(
+            os.environ,
+            PATH=f"{self.bin_dir}{os.pathsep}{os.environ['PATH']}",
+            SAM_CLI_HOOK_BUILD_ALL_RESOURCES="1" if build_all_resources else "0",
+            **(env or {}),
+        )
+        subprocess.check_call(
+            command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, cwd=self.project_dir, env=environment
+        )
+        return directory
+
+    def _terraform_calls(self):
+        return [json.loads(line) for line in self.log_path.read_text().splitlines()]
+
+    def test_applies_all_targets_once(self):
+        self._write_fake_terraform()
+
+        for _ in range(2):
+            self.assertEqual(os.listdir(self._build()), ["test_artifact"])
+
+        self.assertEqual(
+            self._terraform_calls(),
+            [
+                ["init", "-reconfigure", "-input=false", "-force-copy"],
+                [
+                    "apply",
+                    "-target",
+                    "sam_metadata_address",
+                    "-replace",
+                    "sam_metadata_address",
+                    "-target",
+                    "other_sam_metadata_address",
+                    "-replace",
+                    "other_sam_metadata_address",
+                    "-auto-approve",
+                ],
+                ["show", "-json"],
+            ],
+        )
+        self.assertFalse(self.metadata_dir.joinpath("sam_metadata_batch.lock").exists())
+
+    def test_stores_only_built_output_paths_of_targets(self):
+        show_output = json.loads(self.show_path.read_text())
+        child_module = show_output["values"]["root_module"]["child_modules"][0]
+        built_output_path = child_module["resources"][0]["values"]["triggers"]["built_output_path"]
+        child_module["resources"][0]["values"]["triggers"]["source_code_hash"] = "hash"
+        child_module["resources"].append({"address": "aws_lambda_function.func", "values": {"code": "x" * 1000}})
+        show_output["values"]["root_module"]["resources"] = [{"address": "aws_s3_bucket.bucket", "values": {}}]
+        self.show_path.write_text(json.dumps(show_output))
+        self._write_fake_terraform()
+
+        self.assertEqual(os.listdir(self._build()), ["test_artifact"])
+
+        batch_output = json.loads(self.metadata_dir.joinpath("sam_metadata_batch_output.json").read_text())
+        self.assertEqual(
+            batch_output["terraform_out"],
+            {
+                "values": {
+                    "root_module": {
+                        "child_modules": [
+                            {
+                                "address": "module_address",
+                                "resources": [
+                                    {
+                                        "address": "sam_metadata_address",
+                                        "values": {"triggers": {"built_output_path": built_output_path}},
+                                    }
+                                ],
+                            }
+                        ]
+                    }
+                }
+            },
+        )
+        # the other builds find their artifacts in the stored output
+        self.assertEqual(os.listdir(self._build()), ["test_artifact"])
+
+    def test_applies_single_target_when_batch_build_is_disabled(self):
+        self._write_fake_terraform()
+
+        self._build(env={"SAM_CLI_TERRAFORM_BATCH_BUILD": "0"})
+
+        self.assertIn(
+            ["apply", "-target", "sam_metadata_address", "-replace", "sam_metadata_address", "-auto-approve"],
+            self._terraform_calls(),
+        )
+        self.assertFalse(self.metadata_dir.joinpath("sam_metadata_batch_output.json").exists())
+
+    def test_applies_single_target_when_building_single_resource(self):
+        self._write_fake_terraform()
+
+        self._build(build_all_resources=False)
+
+        self.assertIn(
+            ["apply", "-target", "sam_metadata_address", "-replace", "sam_metadata_address", "-auto-approve"],
+            self._terraform_calls(),
+        )
+        self.assertFalse(self.metadata_dir.joinpath("sam_metadata_batch_output.json").exists())
+
+    def test_applies_single_target_after_batch_failure(self):
+        self._write_fake_terraform(max_apply_targets=1)
+
+        for _ in range(2):
+            self.assertEqual(os.listdir(self._build()), ["test_artifact"])
+
+        applies = [call for call in self._terraform_calls() if call[0] == "apply"]
+        # the batch apply is not retried by the second build
+        self.assertEqual([apply.count("-target") for apply in applies], [2, 1, 1])
+        self.assertFalse(self.metadata_dir.joinpath("sam_metadata_batch.lock").exists())
+
+    def test_fails_when_single_target_fails_after_batch_failure(self):
+        self._write_fake_terraform(max_apply_targets=0)
+
+        with self.assertRaises(subprocess.CalledProcessError):
+            self._build()
+
+        applies = [call for call in self._terraform_calls() if call[0] == "apply"]
+        self.assertEqual([apply.count("-target") for apply in applies], [2, 1])
@@ -0,0 +1,299 @@
+"""
+Measures how the translation of Terraform plans by the prepare hook scales with the number of API Gateway resources.
+
+Synthetic plans are generated with a tree of modules, each module defining a Lambda function and API Gateway
+resources, methods and integrations which refer to the rest API, the root resource and the layer defined in the root
+module through module variables. The plans are translated with and without the planned values of the linking fields,
+so that both the linking through the configuration references and through the applied values are measured. The
+duration of the translation and of the resource linking is reported in milliseconds for each size.
+
+    python -m tests.perf.resource_linking_benchmark
+    python -m tests.perf.resource_linking_benchmark --depth 3 --fanout 3 --resources 10 20 40
+"""
+
+import argparse
+import logging
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from unittest.mock import patch
+
+from samcli.hook_packages.terraform.hooks.prepare import translate
+from samcli.hook_packages.terraform.hooks.prepare.translate import AWS_PROVIDER_NAME, translate_to_cfn
+
+REST_API_ID = "rest-api-id"
+ROOT_RESOURCE_ID = "root-resource-id"
+LAYER_ARN = "arn:aws:lambda:us-east-1:123456789012:layer:layer:1"
+
+
+def _references(*references: str) -> Dict:
+    return {"references": list(references)}
+
+
+def _constant(value: Any) -> Dict:
+    return {"constant_value": value}
+
+
+def _planned_resource(module_address: Optional[str], resource_type: str, name: str, values: Dict) -> Dict:
+    address = f"{resource_type}.{name}"
+    return {
+        "address": f"{module_address}.{address}" if module_address else address,
+        "mode": "managed",
+        "type": resource_type,
+        "name": name,
+        "provider_name": AWS_PROVIDER_NAME,
+        "values": values,
+    }
+
+
+def _config_resource(resource_type: str, name: str, expressions: Dict) -> Dict:
+    return {
+        "address": f"{resource_type}.{name}",
+        "mode": "managed",
+        "type": resource_type,
+        "name": name,
+        "provider_config_key": "aws",
+        "expressions": expressions,
+    }
+
+
+def _generate_module(
+    module_address: Optional[str], depth: int, fanout: int, resources: int, applied: bool
+) -> Tuple[Dict, Dict]:
+    """
+    Returns the planned values and the configuration of a module and of its child modules
+    """
+    is_root = module_address is None
+    if is_root:
+        rest_api_id = _references("aws_api_gateway_rest_api.api.id", "aws_api_gateway_rest_api.api")
+        root_resource_id = _references("aws_api_gateway_rest_api.api.root_resource_id", "aws_api_gateway_rest_api.api")
+        layer_arn = _references("aws_lambda_layer_version.layer.arn", "aws_lambda_layer_version.layer")
+    else:
+        rest_api_id = _references("var.rest_api_id")
+        root_resource_id = _references("var.root_resource_id")
+        layer_arn = _references("var.layer_arn")
+
+    prefix = f"{module_address}." if module_address else ""
+    planned: List[Dict] = []
+    configured: List[Dict] = []
+
+    if is_root:
+        planned.append(
+            _planned_resource(
+                None,
+                "aws_api_gateway_rest_api",
+                "api",
+                {"name": "api", **({"id": REST_API_ID, "root_resource_id": ROOT_RESOURCE_ID} if applied else {})},
+            )
+        )
+        configured.append(_config_resource("aws_api_gateway_rest_api", "api", {"name": _constant("api")}))
+        planned.append(
+            _planned_resource(
+                None,
+                "aws_lambda_layer_version",
+                "layer",
+                {"layer_name": "layer", "filename": "layer.zip", **({"arn": LAYER_ARN} if applied else {})},
+            )
+        )
+        configured.append(
+            _config_resource(
+                "aws_lambda_layer_version",
+                "layer",
+                {"layer_name": _constant("layer"), "filename": _constant("layer.zip")},
+            )
+        )
+
+    function_name = f"{prefix}function".replace(".", "_")
+    planned.append(
+        _planned_resource(
+            module_address,
+            "aws_lambda_function",
+            "function",
+            {
+                "function_name": function_name,
+                "handler": "app.handler",
+                "runtime": "python3.12",
+                "filename": "function.zip",
+                **({"layers": [LAYER_ARN]} if applied else {}),
+            },
+        )
+    )
+    configured.append(
+        _config_resource(
+            "aws_lambda_function",
+            "function",
+            {
+                "function_name": _constant(function_name),
+                "handler": _constant("app.handler"),
+                "runtime": _constant("python3.12"),
+                "filename": _constant("function.zip"),
+                "layers": layer_arn,
+            },
+        )
+    )
+
+    for index in range(resources):
+        resource_id = f"{prefix}resource-{index}"
+        resource = f"aws_api_gateway_resource.resource_{index}"
+        applied_values: Dict = (
+            {"rest_api_id": REST_API_ID, "resource_id": resource_id, "http_method": "GET"} if applied else {}
+        )
+        planned.append(
+            _planned_resource(
+                module_address,
+                "aws_api_gateway_resource",
+                f"resource_{index}",
+                {
+                    "path_part": f"path{index}",
+                    **(
+                        {"id": resource_id, "rest_api_id": REST_API_ID, "parent_id": ROOT_RESOURCE_ID}
+                        if applied
+                        else {}
+                    ),
+                },
+            )
+        )
+        configured.append(
+            _config_resource(
+                "aws_api_gateway_resource",
+                f"resource_{index}",
+                {"path_part": _constant(f"path{index}"), "rest_api_id": rest_api_id, "parent_id": root_resource_id},
+            )
+        )
+        planned.append(
+            _planned_resource(
+                module_address,
+                "aws_api_gateway_method",
+                f"method_{index}",
+                {"authorization": "NONE", "http_method": "GET", **applied_values},
+            )
+        )
+        configured.append(
+            _config_resource(
+                "aws_api_gateway_method",
+                f"method_{index}",
+                {
+                    "authorization": _constant("NONE"),
+                    "http_method": _constant("GET"),
+                    "rest_api_id": rest_api_id,
+                    "resource_id": _references(f"{resource}.id", resource),
+                },
+            )
+        )
+        planned.append(
+            _planned_resource(
+                module_address,
+                "aws_api_gateway_integration",
+                f"integration_{index}",
+                {"type": "AWS_PROXY", "http_method": "GET", **applied_values},
+            )
+        )
+        configured.append(
+            _config_resource(
+                "aws_api_gateway_integration",
+                f"integration_{index}",
+                {
+                    "type": _constant("AWS_PROXY"),
+                    "http_method": _constant("GET"),
+                    "rest_api_id": rest_api_id,
+                    "resource_id": _references(f"{resource}.id", resource),
+                    "uri": _references("aws_lambda_function.function.invoke_arn", "aws_lambda_function.function"),
+                },
+            )
+        )
+
+    planned_module: Dict = {"resources": planned, "child_modules": []}
+    config_module: Dict = {"resources": configured, "module_calls": {}}
+    if not is_root:
+        planned_module["address"] = module_address
+        config_module["variables"] = {"rest_api_id": {}, "root_resource_id": {}, "layer_arn": {}}
+
+    if depth > 0:
+        for child in range(fanout):
+            child_name = f"module_{child}"
+            child_address = f"{prefix}module.{child_name}"
+            child_planned, child_config = _generate_module(child_address, depth - 1, fanout, resources, applied)
+            planned_module["child_modules"].append(child_planned)
+            config_module["module_calls"][child_name] = {
+                "source": "./modules/api",
+                "expressions": {
+                    "rest_api_id": rest_api_id,
+                    "root_resource_id": root_resource_id,
+                    "layer_arn": layer_arn,
+                },
+                "module": child_config,
+            }
+    return planned_module, config_module
+
+
+def generate_plan(depth: int, fanout: int, resources: int, applied: bool) -> Dict:
+    """
+    Returns a Terraform plan of a tree of modules of the given depth and fanout, with the given number of API Gateway
+    resources, methods and integrations in each module
+    """
+    planned_module, config_module = _generate_module(None, depth, fanout, resources, applied)
+    return {
+        "format_version": "1.1",
+        "planned_values": {"root_module": planned_module},
+        "configuration": {"root_module": config_module},
+    }
+
+
+def count_modules(depth: int, fanout: int) -> int:
+    return sum(fanout**level for level in range(depth + 1))
+
+
+def measure(tf_json: Dict, runs: int) -> Tuple[float, float]:
+    """
+    Returns the fastest durations of the translation and of the resource linking in milliseconds
+    """
+    linking_durations: List[float] = []
+    handle_linking = translate._handle_linking
+
+    def timed_handle_linking(*args, **kwargs):
+        start = time.perf_counter()
+        handle_linking(*args, **kwargs)
+        linking_durations.append((time.perf_counter() - start) * 1000)
+
+    translation_durations = []
+    with tempfile.TemporaryDirectory() as output_dir, patch.object(translate, "_handle_linking", timed_handle_linking):
+        for _ in range(runs):
+            start = time.perf_counter()
+            translate_to_cfn(tf_json, output_dir, output_dir, output_dir)
+            translation_durations.append((time.perf_counter() - start) * 1000)
+    return round(min(translation_durations), 1), round(min(linking_durations), 1)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Measure the translation of Terraform plans of growing sizes")
+    parser.add_argument("--depth", type=int, default=2, help="Depth of the tree of modules")
+    parser.add_argument("--fanout", type=int, default=3, help="Number of child modules of each module")
+    parser.add_argument(
+        "--resources",
+        type=int,
+        nargs="+",
+        default=[5, 10, 20, 40],
+        help="Numbers of API Gateway resources, methods and integrations in each module",
+    )
+    parser.add_argument("--runs", type=int, default=3, help="Number of times each plan is translated")
+    options = parser.parse_args(argv)
+    # hide the warnings about the values of the plans which are not known before they are applied
+    logging.disable(logging.WARNING)
+
+    modules = count_modules(options.depth, options.fanout)
+    print(f"{modules} modules, depth {options.depth}, fanout {options.fanout}")
+    for applied in (False, True):
+        print("Linking through the planned values" if applied else "Linking through the configuration")
+        for resources in options.resources:
+            tf_json = generate_plan(options.depth, options.fanout, resources, applied)
+            translation_ms, linking_ms = measure(tf_json, options.runs)
+            print(
+                f"  {modules * resources * 3} API Gateway resources: "
+                f"translation {translation_ms}ms, linking {linking_ms}ms"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,119 @@
+"""
+Measures the cold start time of SAM CLI commands.
+
+Each command is run several times in a new interpreter, like CI pipelines run ``sam``, and the wall clock time of the
+fastest and the median run is reported in milliseconds. Results can be written as JSON and compared with the results
+of a previous run to catch commands which got slower, for instance because a module started importing a heavy
+dependency at module level instead of through ``samcli.lib.utils.lazy_import``.
+
+    python -m tests.perf.startup_benchmark --runs 10 --output startup.json
+    python -m tests.perf.startup_benchmark --baseline startup.json --tolerance 0.2
+    python -m tests.perf.startup_benchmark -- "--version" "deploy --help"
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from samcli.cli.command import _SAM_CLI_COMMAND_PACKAGES
+
+LINT_TEMPLATE = """
+AWSTemplateFormatVersion: '2010-09-09'
+Transform: AWS::Serverless-2016-10-31
+Resources:
+  HelloWorldFunction:
+    Type: AWS::Serverless::Function
+    Properties:
+      CodeUri: hello_world/
+      Handler: app.lambda_handler
+      Runtime: python3.12
+"""
+
+
+def default_commands() -> List[List[str]]:
+    """
+    Returns ``sam --version``, ``sam --help``, the help of each command and ``sam validate --lint``
+    """
+    commands = [["--version"], ["--help"]]
+    commands += [[package.split(".")[-1], "--help"] for package in _SAM_CLI_COMMAND_PACKAGES]
+    commands.append(["validate", "--lint"])
+    return commands
+
+
+def measure_command(args: List[str], runs: int, working_dir: str) -> Dict[str, float]:
+    """
+    Runs ``sam <args>`` the given number of times and returns the fastest and median wall clock time in milliseconds
+    """
+    env = {**os.environ, "SAM_CLI_TELEMETRY": "0"}
+    durations = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-m", "samcli", *args],
+            cwd=working_dir,
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=False,
+        )
+        durations.append((time.perf_counter() - start) * 1000)
+    return {"min_ms": round(min(durations), 1), "median_ms": round(statistics.median(durations), 1)}
+
+
+def find_regressions(results: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """
+    Returns the commands whose median time is more than ``tolerance`` slower than in the baseline
+    """
+    regressions = []
+    for command, result in results.items():
+        previous = baseline.get(command)
+        if previous and result["median_ms"] > previous["median_ms"] * (1 + tolerance):
+            regressions.append(f"{command}: {previous['median_ms']}ms -> {result['median_ms']}ms")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Measure the cold start time of SAM CLI commands")
+    parser.add_argument("--runs", type=int, default=5, help="Number of runs of each command")
+    parser.add_argument("--output", type=Path, help="File to write the results to, as JSON")
+    parser.add_argument("--baseline", type=Path, help="Results of a previous run to compare with")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.2, help="Slowdown compared to the baseline which fails the benchmark"
+    )
+    parser.add_argument(
+        "commands", nargs="*", help='Commands to measure after "--", eg: "deploy --help". Defaults to all'
+    )
+    options = parser.parse_args(argv)
+
+    commands = [command.split() for command in options.commands] or default_commands()
+    results: Dict[str, Dict[str, float]] = {}
+    with tempfile.TemporaryDirectory() as working_dir:
+        Path(working_dir, "template.yaml").write_text(LINT_TEMPLATE, encoding="utf-8")
+        for args in commands:
+            command = " ".join(["sam", *args])
+            results[command] = measure_command(args, options.runs, working_dir)
+            print(f"{command:<32} min {results[command]['min_ms']:>8}ms  median {results[command]['median_ms']:>8}ms")
+
+    if options.output:
+        options.output.write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+    if options.baseline:
+        regressions = find_regressions(
+            results, json.loads(options.baseline.read_text(encoding="utf-8")), options.tolerance
+        )
+        for regression in regressions:
+            print(f"Slower than baseline: {regression}")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,148 @@
+"""
+Measures the time taken to parse YAML templates with the libyaml and the pure Python loaders of ``samcli.yamlhelper``.
+
+Each template is parsed several times with both loaders, the fastest run of each loader is reported in milliseconds,
+and the benchmark fails if the loaders return different templates. Without arguments, a generated template of about
+2 MB using the short form of the intrinsic functions, anchors and merge keys is parsed.
+
+    python -m tests.perf.yaml_parse_benchmark
+    python -m tests.perf.yaml_parse_benchmark --runs 3 path/to/template.yaml path/to/other/template.yaml
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import yaml
+
+from samcli.yamlhelper import CfnCSafeLoader, CfnSafeLoader
+
+RESOURCES_TEMPLATE = """
+  Function{index}:
+    Type: AWS::Serverless::Function
+    Properties:
+      <<: *function_defaults
+      Handler: handlers/function_{index}.handler
+      Role: !GetAtt FunctionRole.Arn
+      Environment:
+        Variables:
+          TABLE_NAME: !Ref Table{index}
+          QUEUE_URL: !Sub "https://sqs.${{AWS::Region}}.amazonaws.com/${{AWS::AccountId}}/queue-{index}"
+          STAGE: !If [IsProd, prod, !Select [0, !Split ["-", !Ref Stage]]]
+          CREATED: 2024-01-{day:02d}
+      Events:
+        Api:
+          Type: Api
+          Properties:
+            Path: /items/{index}/{{id}}
+            Method: get
+  Table{index}:
+    Type: AWS::DynamoDB::Table
+    Condition: IsProd
+    Properties:
+      TableName: !Join ["-", [!Ref "AWS::StackName", table, "{index}"]]
+      BillingMode: PAY_PER_REQUEST
+      AttributeDefinitions: [{{AttributeName: id, AttributeType: S}}]
+      KeySchema:
+        - AttributeName: id
+          KeyType: HASH
+      Tags:
+        - Key: Description
+          Value: >
+            Table storing the items of function {index}, with a description folded
+            over several lines like the generated templates do
+"""
+
+
+def generate_template(size_bytes: int = 2 * 1024 * 1024) -> str:
+    """
+    Returns a SAM template of about the given size in bytes
+    """
+    header = """AWSTemplateFormatVersion: 2010-09-09
+Transform: AWS::Serverless-2016-10-31
+Parameters:
+  Stage:
+    Type: String
+    Default: dev-1
+Conditions:
+  IsProd: !Equals [!Ref Stage, prod]
+Globals:
+  Function:
+    Timeout: 30
+x-function-defaults: &function_defaults
+  Runtime: python3.12
+  MemorySize: 256
+  CodeUri: src/
+Resources:
+  FunctionRole:
+    Type: AWS::IAM::Role
+    Properties:
+      AssumeRolePolicyDocument: {}
+"""
+    resources = []
+    size = len(header)
+    index = 0
+    while size < size_bytes:
+        resource = RESOURCES_TEMPLATE.format(index=index, day=index % 28 + 1)
+        resources.append(resource)
+        size += len(resource)
+        index += 1
+    return header + "".join(resources)
+
+
+def measure(parse: Callable[[], Any], runs: int) -> Tuple[float, Any]:
+    """
+    Returns the fastest time of the given number of runs in milliseconds, and the result of the last run
+    """
+    durations = []
+    result = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = parse()
+        durations.append((time.perf_counter() - start) * 1000)
+    return round(min(durations), 1), result
+
+
+def benchmark_template(name: str, content: str, runs: int) -> Dict[str, Any]:
+    """
+    Parses the template with both loaders and returns their timings, and whether they returned the same template
+    """
+    python_ms, python_result = measure(lambda: yaml.load(content, Loader=CfnSafeLoader), runs)
+    result: Dict[str, Any] = {"template": name, "size_kb": len(content.encode("utf-8")) // 1024, "python_ms": python_ms}
+    if CfnCSafeLoader:
+        libyaml_ms, libyaml_result = measure(lambda: yaml.load(content, Loader=CfnCSafeLoader), runs)
+        result["libyaml_ms"] = libyaml_ms
+        result["identical"] = repr(libyaml_result) == repr(python_result)
+    return result
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Measure the time taken to parse YAML templates")
+    parser.add_argument("--runs", type=int, default=5, help="Number of times each template is parsed by each loader")
+    parser.add_argument("templates", nargs="*", type=Path, help="Templates to parse. Defaults to a generated template")
+    options = parser.parse_args(argv)
+
+    if not CfnCSafeLoader:
+        print("PyYAML is installed without the libyaml bindings, only the pure Python loader is measured")
+
+    templates = [(str(path), path.read_text(encoding="utf-8")) for path in options.templates]
+    templates = templates or [("generated template", generate_template())]
+    mismatches = []
+    for name, content in templates:
+        result = benchmark_template(name, content, options.runs)
+        line = f"{name} ({result['size_kb']} KB): python {result['python_ms']}ms"
+        if "libyaml_ms" in result:
+            line += f", libyaml {result['libyaml_ms']}ms"
+            if not result["identical"]:
+                mismatches.append(name)
+        print(line)
+
+    for name in mismatches:
+        print(f"The loaders returned different templates for {name}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
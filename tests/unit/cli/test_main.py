@@ -1,8 +1,13 @@
 import json
+import os
+import subprocess
+import sys
+import tempfile
 from unittest.mock import patch, Mock, PropertyMock, call
 
 from unittest import TestCase
 from click.testing import CliRunner
+from parameterized import parameterized
 from samcli.cli.main import cli
 from samcli import __version__
 from samcli.commands.exceptions import RegionError
@@ -92,8 +97,8 @@ class TestCliBase(TestCase):
 
 
 class TestPrintSamCliInfo(TestCase):
-    @patch("samcli.cli.main.gather_system_info")
-    @patch("samcli.cli.main.gather_additional_dependencies_info")
+    @patch("samcli.lib.utils.system_info.gather_system_info")
+    @patch("samcli.lib.utils.system_info.gather_additional_dependencies_info")
     @patch("samcli.cli.main.get_all_experimental_env_vars")
     def test_print_info(self, beta_feat_env_vars_mock, deps_info_mock, system_info_mock):
         system_info_mock.return_value = {"Python": "1.2.3"}
@@ -117,3 +122,46 @@ class TestPrintSamCliInfo(TestCase):
             result = runner.invoke(cli, ["--info"])
             self.assertEqual(result.exit_code, 0)
             self.assertEqual(json.loads(result.output), expected)
+
+
+# Runs the CLI in a new interpreter and prints the top level packages which were imported
+LIST_IMPORTED_PACKAGES_SCRIPT = """
+import sys
+from samcli.cli.main import cli
+try:
+    cli(sys.argv[1:], prog_name="sam")
+except SystemExit:
+    pass
+print(*sorted(name for name in sys.modules if "." not in name), sep="\\n")
+"""
+
+
+class TestCliStartupImports(TestCase):
+    # dependencies which are only loaded once a command runs
+    HEAVY_PACKAGES = {"boto3", "cfnlint", "dateparser", "docker", "flask", "jsonschema", "requests"}
+
+    @parameterized.expand(
+        [
+            (["--version"],),
+            (["validate", "--help"],),
+            (["package", "--help"],),
+            (["deploy", "--help"],),
+            (["delete", "--help"],),
+            (["logs", "--help"],),
+            (["build", "--help"],),
+        ]
+    )
+    def test_must_not_import_heavy_packages_at_startup(self, args):
+        env = {**os.environ, "SAM_CLI_TELEMETRY": "0"}
+        with tempfile.TemporaryDirectory() as working_dir:
+            result = subprocess.run(
+                [sys.executable, "-c", LIST_IMPORTED_PACKAGES_SCRIPT, *args],
+                cwd=working_dir,
+                env=env,
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+
+        imported_packages = set(result.stdout.splitlines())
+        self.assertEqual(imported_packages & self.HEAVY_PACKAGES, set())
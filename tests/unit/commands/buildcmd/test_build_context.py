@@ -4,8 +4,12 @@ from unittest.mock import MagicMock, patch, Mock, ANY, call
 
 from parameterized import parameterized
 
-from samcli.commands.build.build_context import BuildContext
-from samcli.commands.build.exceptions import InvalidBuildDirException, MissingBuildMethodException
+from samcli.commands.build.build_context import HOOK_BUILD_ALL_RESOURCES_ENV_VAR, BuildContext
+from samcli.commands.build.exceptions import (
+    InvalidBuildDirException,
+    InvalidParallelJobsException,
+    MissingBuildMethodException,
+)
 from samcli.commands.build.utils import MountMode
 from samcli.commands.exceptions import UserException
 from samcli.lib.build.app_builder import (
@@ -862,12 +866,13 @@ class TestBuildContext_setup_build_dir(TestCase):
 
 class TestBuildContext_setup_cached_and_deps_dir(TestCase):
     @parameterized.expand([(True,), (False,)])
+    @patch("samcli.commands.build.build_context.configure_translated_template_cache")
     @patch("samcli.commands.build.build_context.pathlib.Path")
     @patch("samcli.commands.build.build_context.SamLocalStackProvider")
     @patch("samcli.commands.build.build_context.SamFunctionProvider")
     @patch("samcli.commands.build.build_context.SamLayerProvider")
     def test_cached_dir_and_deps_dir_creation(
-        self, cached, patched_layer, patched_function, patched_stack, patched_path
+        self, cached, patched_layer, patched_function, patched_stack, patched_path, patched_configure_template_cache
     ):
         patched_stack.get_stacks.return_value = ([], None)
         build_context = BuildContext(
@@ -898,9 +903,12 @@ class TestBuildContext_setup_cached_and_deps_dir(TestCase):
             # otherwise validate an assertion will be raised since they are not called
             if cached:
                 call_assertion()
+                # the translated templates are only cached when the build owns a cache directory
+                patched_configure_template_cache.assert_called_once_with("cache_dir")
             else:
                 with self.assertRaises(AssertionError):
                     call_assertion()
+                patched_configure_template_cache.assert_not_called()
 
 
 class TestBuildContext_run(TestCase):
@@ -1030,6 +1038,7 @@ class TestBuildContext_run(TestCase):
                 combine_dependencies=not auto_dependency_layer,
                 build_in_source=build_context._build_in_source,
                 mount_with_write=False,
+                parallel_jobs=None,
             )
             builder_mock.build.assert_called_once()
             builder_mock.update_template.assert_has_calls(
@@ -1310,6 +1319,59 @@ class TestBuildContext_is_sam_template(TestCase):
         self.assertEqual(result, expected_result)
 
 
+class TestBuildContext_parallel_jobs(TestCase):
+    def test_must_reject_parallel_jobs_below_one(self):
+        with self.assertRaises(InvalidParallelJobsException):
+            BuildContext(
+                resource_identifier="",
+                template_file="template_file",
+                base_dir="base_dir",
+                build_dir="build_dir",
+                cache_dir="cache_dir",
+                cached=False,
+                clean=False,
+                parallel=True,
+                mode="mode",
+                parallel_jobs=0,
+            )
+
+
+class TestBuildContext_hook_build_environment(TestCase):
+    def _make_build_context(self, resource_identifier, hook_name="terraform"):
+        return BuildContext(
+            resource_identifier=resource_identifier,
+            template_file="template_file",
+            base_dir="base_dir",
+            build_dir="build_dir",
+            cache_dir="cache_dir",
+            cached=False,
+            clean=False,
+            parallel=True,
+            mode="mode",
+            hook_name=hook_name,
+        )
+
+    @parameterized.expand([(None, "1"), ("FunctionLogicalId", "0")])
+    @patch.dict(os.environ, {}, clear=True)
+    def test_must_tell_hook_rules_whether_all_resources_are_built(self, resource_identifier, expected_value):
+        with self._make_build_context(resource_identifier)._hook_build_environment():
+            self.assertEqual(os.environ[HOOK_BUILD_ALL_RESOURCES_ENV_VAR], expected_value)
+
+        self.assertNotIn(HOOK_BUILD_ALL_RESOURCES_ENV_VAR, os.environ)
+
+    @patch.dict(os.environ, {HOOK_BUILD_ALL_RESOURCES_ENV_VAR: "1"}, clear=True)
+    def test_must_restore_previous_value(self):
+        with self._make_build_context("FunctionLogicalId")._hook_build_environment():
+            self.assertEqual(os.environ[HOOK_BUILD_ALL_RESOURCES_ENV_VAR], "0")
+
+        self.assertEqual(os.environ[HOOK_BUILD_ALL_RESOURCES_ENV_VAR], "1")
+
+    @patch.dict(os.environ, {}, clear=True)
+    def test_must_not_set_variable_without_hook(self):
+        with self._make_build_context(None, hook_name=None)._hook_build_environment():
+            self.assertNotIn(HOOK_BUILD_ALL_RESOURCES_ENV_VAR, os.environ)
+
+
 class TestBuildContext_exclude_warning(TestCase):
     @parameterized.expand(
         [
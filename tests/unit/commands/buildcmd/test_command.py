@@ -39,6 +39,7 @@ class TestDoCli(TestCase):
             hook_name=None,
             build_in_source=False,
             mount_with=MountMode.READ,
+            parallel_jobs=4,
         )
 
         BuildContextMock.assert_called_with(
@@ -64,6 +65,7 @@ class TestDoCli(TestCase):
             hook_name=None,
             build_in_source=False,
             mount_with=MountMode.READ,
+            parallel_jobs=4,
         )
         ctx_mock.run.assert_called_with()
         self.assertEqual(ctx_mock.run.call_count, 1)
@@ -105,6 +105,10 @@ class TestDeployCliCommand(TestCase):
             disable_rollback=self.disable_rollback,
             on_failure=self.on_failure,
             max_wait_duration=self.max_wait_duration,
+            s3_max_concurrency=None,
+            s3_multipart_threshold=None,
+            s3_multipart_chunksize=None,
+            package_jobs=None,
         )
 
         mock_deploy_context.assert_called_with(
@@ -223,6 +227,10 @@ class TestDeployCliCommand(TestCase):
                     disable_rollback=self.disable_rollback,
                     on_failure=self.on_failure,
                     max_wait_duration=self.max_wait_duration,
+                    s3_max_concurrency=None,
+                    s3_multipart_threshold=None,
+                    s3_multipart_chunksize=None,
+                    package_jobs=None,
                 )
 
     @patch("samcli.commands.package.command.click")
@@ -325,6 +333,10 @@ class TestDeployCliCommand(TestCase):
                 disable_rollback=self.disable_rollback,
                 on_failure=self.on_failure,
                 max_wait_duration=self.max_wait_duration,
+                s3_max_concurrency=None,
+                s3_multipart_threshold=None,
+                s3_multipart_chunksize=None,
+                package_jobs=None,
             )
 
             mock_deploy_context.assert_called_with(
@@ -471,6 +483,10 @@ class TestDeployCliCommand(TestCase):
                 disable_rollback=self.disable_rollback,
                 on_failure=self.on_failure,
                 max_wait_duration=self.max_wait_duration,
+                s3_max_concurrency=None,
+                s3_multipart_threshold=None,
+                s3_multipart_chunksize=None,
+                package_jobs=None,
             )
 
             mock_deploy_context.assert_called_with(
@@ -620,6 +636,10 @@ class TestDeployCliCommand(TestCase):
             disable_rollback=self.disable_rollback,
             on_failure=self.on_failure,
             max_wait_duration=self.max_wait_duration,
+            s3_max_concurrency=None,
+            s3_multipart_threshold=None,
+            s3_multipart_chunksize=None,
+            package_jobs=None,
         )
 
         mock_deploy_context.assert_called_with(
@@ -780,6 +800,10 @@ class TestDeployCliCommand(TestCase):
             disable_rollback=self.disable_rollback,
             on_failure=self.on_failure,
             max_wait_duration=self.max_wait_duration,
+            s3_max_concurrency=None,
+            s3_multipart_threshold=None,
+            s3_multipart_chunksize=None,
+            package_jobs=None,
         )
 
         mock_deploy_context.assert_called_with(
@@ -920,6 +944,10 @@ class TestDeployCliCommand(TestCase):
                 disable_rollback=self.disable_rollback,
                 on_failure=self.on_failure,
                 max_wait_duration=self.max_wait_duration,
+                s3_max_concurrency=None,
+                s3_multipart_threshold=None,
+                s3_multipart_chunksize=None,
+                package_jobs=None,
             )
 
             mock_deploy_context.assert_called_with(
@@ -998,6 +1026,10 @@ class TestDeployCliCommand(TestCase):
             disable_rollback=self.disable_rollback,
             on_failure=self.on_failure,
             max_wait_duration=self.max_wait_duration,
+            s3_max_concurrency=None,
+            s3_multipart_threshold=None,
+            s3_multipart_chunksize=None,
+            package_jobs=None,
         )
 
         mock_deploy_context.assert_called_with(
@@ -1064,6 +1096,10 @@ class TestDeployCliCommand(TestCase):
                 disable_rollback=self.disable_rollback,
                 on_failure=self.on_failure,
                 max_wait_duration=self.max_wait_duration,
+                s3_max_concurrency=None,
+                s3_multipart_threshold=None,
+                s3_multipart_chunksize=None,
+                package_jobs=None,
             )
 
     @patch("samcli.commands.package.command.click")
@@ -1116,6 +1152,10 @@ class TestDeployCliCommand(TestCase):
             disable_rollback=self.disable_rollback,
             on_failure=self.on_failure,
             max_wait_duration=self.max_wait_duration,
+            s3_max_concurrency=None,
+            s3_multipart_threshold=None,
+            s3_multipart_chunksize=None,
+            package_jobs=None,
         )
 
         mock_deploy_context.assert_called_with(
@@ -1191,6 +1231,10 @@ class TestDeployCliCommand(TestCase):
             disable_rollback=self.disable_rollback,
             on_failure=self.on_failure,
             max_wait_duration=self.max_wait_duration,
+            s3_max_concurrency=None,
+            s3_multipart_threshold=None,
+            s3_multipart_chunksize=None,
+            package_jobs=4,
         )
 
         mock_deploy_context.assert_called_with(
@@ -1238,6 +1282,7 @@ class TestDeployCliCommand(TestCase):
             profile=self.profile,
             signing_profiles=self.signing_profiles,
             parameter_overrides=self.parameter_overrides,
+            parallel_jobs=4,
         )
 
         context_mock.run.assert_called_with()
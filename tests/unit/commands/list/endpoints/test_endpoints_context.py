@@ -460,6 +460,12 @@ SAM_FILE_READER_RETURN = {
 
 
 class TestEndpointsInitClients(TestCase):
+    def setUp(self):
+        # the translated templates are not cached by the tests, whatever the builds of the directory they run from
+        patcher = patch("samcli.commands.list.endpoints.endpoints_context.configure_translated_template_cache")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
     @patch("samcli.commands.list.json_consumer.click.echo")
     @patch("samcli.commands.list.json_consumer.click.get_current_context")
     @patch("boto3.Session.region_name", "us-east-1")
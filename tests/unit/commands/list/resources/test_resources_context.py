@@ -136,6 +136,12 @@ SAM_FILE_READER_RETURN = {
 
 
 class TestResourcesContext(TestCase):
+    def setUp(self):
+        # the translated templates are not cached by the tests, whatever the builds of the directory they run from
+        patcher = patch("samcli.commands.list.resources.resources_context.configure_translated_template_cache")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
     @patch("samcli.commands.list.json_consumer.click.echo")
     @patch("samcli.commands.list.json_consumer.click.get_current_context")
     @patch("samcli.lib.list.resources.resource_mapping_producer.get_template_data")
@@ -493,6 +499,12 @@ class TestGetTranslatedDict(TestCase):
 
 
 class TestResourcesInitClients(TestCase):
+    def setUp(self):
+        # the translated templates are not cached by the tests, whatever the builds of the directory they run from
+        patcher = patch("samcli.commands.list.resources.resources_context.configure_translated_template_cache")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
     @patch("samcli.commands.list.json_consumer.click.echo")
     @patch("samcli.commands.list.json_consumer.click.get_current_context")
     @patch("boto3.Session.region_name", "us-east-1")
@@ -17,6 +17,8 @@ from samcli.commands.local.cli_common.invoke_context import (
     DockerIsNotReachableException,
     NoFunctionIdentifierProvidedException,
     InvalidEnvironmentVariablesFileException,
+    InvalidWarmContainersPoolSizeException,
+    InvalidPrewarmConfigException,
 )
 
 from unittest import TestCase
@@ -26,6 +28,12 @@ from samcli.lib.providers.provider import Stack
 
 
 class TestInvokeContext__enter__(TestCase):
+    def setUp(self):
+        # the translated templates are not cached by the tests, whatever the builds of the directory they run from
+        patcher = patch("samcli.commands.local.cli_common.invoke_context.configure_translated_template_cache")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
     @patch("samcli.commands.local.cli_common.invoke_context.ContainerManager")
     @patch("samcli.commands.local.cli_common.invoke_context.SamFunctionProvider")
     @patch("samcli.commands.local.cli_common.invoke_context.InvokeContext._add_account_id_to_global")
@@ -105,7 +113,7 @@ class TestInvokeContext__enter__(TestCase):
         self.assertEqual(invoke_context._invoke_images, {None: "image"})
 
         invoke_context._get_stacks.assert_called_once()
-        SamFunctionProviderMock.assert_called_with(stacks, True)
+        SamFunctionProviderMock.assert_called_with(stacks, True, function_identifier="id")
         self.assertEqual(invoke_context._global_parameter_overrides, {"AWS::Region": "region"})
         self.assertEqual(invoke_context._get_env_vars_value.call_count, 2)
         self.assertEqual(invoke_context._get_env_vars_value.call_args_list, [call(env_vars_file), call(None)])
@@ -447,6 +455,11 @@ class TestInvokeContext__enter__(TestCase):
                     str(ex_ctx.exception),
                 )
 
+    @patch("samcli.commands.local.cli_common.invoke_context.InvokeContext._add_account_id_to_global")
+    def test_must_raise_if_warm_containers_pool_size_is_not_positive(self, _add_account_id_to_global_mock):
+        with self.assertRaises(InvalidWarmContainersPoolSizeException):
+            InvokeContext("template-file", warm_container_initialization_mode="LAZY", warm_containers_pool_size=0)
+
     @patch("samcli.commands.local.cli_common.invoke_context.SamLocalStackProvider.get_stacks")
     def test_must_raise_if_template_cannot_be_parsed(self, get_buildable_stacks_mock):
         invoke_context = InvokeContext("template-file")
@@ -503,6 +516,83 @@ class TestInvokeContext__exit__(TestCase):
         self.assertIsNone(context._log_file_handle)
 
 
+class TestInvokeContext_prewarm_all_functions(TestCase):
+    @patch("samcli.commands.local.cli_common.invoke_context.InvokeContext._add_account_id_to_global")
+    def setUp(self, _add_account_id_to_global_mock):
+        self.context = InvokeContext(template_file="template", warm_container_initialization_mode="EAGER", prewarm=True)
+        self.function1 = Mock(full_path="Function1", packagetype=ZIP, inlinecode=None)
+        self.function1.name = "Function1"
+        self.function2 = Mock(full_path="Stack/Function2", packagetype=ZIP, inlinecode=None)
+        self.function2.name = "Function2"
+        self.inline_function = Mock(full_path="InlineFunction", packagetype=ZIP, inlinecode="code")
+        self.context._function_provider = Mock()
+        self.context._function_provider.get_all.return_value = [
+            self.function1,
+            self.function2,
+            self.inline_function,
+        ]
+        self.context._local_lambda_runner = Mock()
+        self.context._clean_running_containers_and_related_resources = Mock()
+
+    @patch("samcli.commands.local.cli_common.invoke_context.InvokeContext._add_account_id_to_global")
+    def test_must_require_warm_containers(self, _add_account_id_to_global_mock):
+        with self.assertRaises(InvalidPrewarmConfigException):
+            InvokeContext(template_file="template", prewarm=True)
+
+    @patch("samcli.commands.local.cli_common.invoke_context.InvokeContext._add_account_id_to_global")
+    def test_must_require_prewarm_for_prewarm_event(self, _add_account_id_to_global_mock):
+        with self.assertRaises(InvalidPrewarmConfigException):
+            InvokeContext(
+                template_file="template", warm_container_initialization_mode="EAGER", prewarm_event_file="event.json"
+            )
+
+    def test_must_invoke_every_function_with_empty_event(self):
+        self.context._prewarm_all_functions()
+
+        invoked = self.context._local_lambda_runner.invoke.call_args_list
+        self.assertEqual(
+            sorted(invoke_call.args for invoke_call in invoked), [("Function1", "{}"), ("Stack/Function2", "{}")]
+        )
+
+    def test_must_invoke_with_event_from_file(self):
+        self.context._prewarm_event_file = "event.json"
+
+        with patch("samcli.commands.local.cli_common.invoke_context.open", mock_open(read_data='{"warm": true}')):
+            self.context._prewarm_all_functions()
+
+        for invoke_call in self.context._local_lambda_runner.invoke.call_args_list:
+            self.assertEqual(invoke_call.args[1], '{"warm": true}')
+
+    def test_must_raise_if_event_file_is_not_json(self):
+        self.context._prewarm_event_file = "event.json"
+
+        with patch("samcli.commands.local.cli_common.invoke_context.open", mock_open(read_data="not json")):
+            with self.assertRaises(InvalidPrewarmConfigException):
+                self.context._prewarm_all_functions()
+
+        self.context._local_lambda_runner.invoke.assert_not_called()
+
+    def test_must_skip_function_being_debugged(self):
+        self.context._debug_context = Mock(debug_function="Function1")
+
+        self.context._prewarm_all_functions()
+
+        self.context._local_lambda_runner.invoke.assert_called_once_with(
+            "Stack/Function2", "{}", stdout=ANY, stderr=ANY
+        )
+
+    @patch("samcli.commands.local.cli_common.invoke_context.LOG")
+    def test_must_report_failures_without_raising(self, log_mock):
+        self.context._local_lambda_runner.invoke.side_effect = [None, Exception("boom")]
+
+        self.context._prewarm_all_functions()
+
+        log_mock.warning.assert_called_once_with("Prewarming function %s failed because of %s", ANY, ANY)
+        report = log_mock.info.call_args_list[-1].args
+        self.assertEqual(report[1], 2)
+        self.assertIn("failed after", report[3])
+
+
 class TestInvokeContextAsContextManager(TestCase):
     """
     Must be able to use the class as a context manager
@@ -692,6 +782,8 @@ class TestInvokeContext_local_lambda_runner(TestCase):
             aws_profile="profile",
             aws_region="region",
             warm_container_initialization_mode=ContainersInitializationMode.EAGER,
+            warm_containers_pool_size=4,
+            warm_containers_idle_ttl=60,
         )
         self.context.get_cwd = Mock()
         self.context.get_cwd.return_value = cwd
@@ -710,7 +802,7 @@ class TestInvokeContext_local_lambda_runner(TestCase):
             result = self.context.local_lambda_runner
             self.assertEqual(result, runner_mock)
 
-            WarmLambdaRuntimeMock.assert_called_with(container_manager_mock, image_mock)
+            WarmLambdaRuntimeMock.assert_called_with(container_manager_mock, image_mock, pool_size=4, idle_ttl=60)
             lambda_image_patch.assert_called_once_with(download_mock, True, True, invoke_images=None)
             LocalLambdaMock.assert_called_with(
                 local_runtime=runtime_mock,
@@ -76,6 +76,7 @@ class TestLocalApiService_start(TestCase):
             host=self.host,
             ssl_context=self.ssl_context,
             stderr=self.stderr_mock,
+            server_config=None,
         )
 
         self.apigw_service.create.assert_called_with()
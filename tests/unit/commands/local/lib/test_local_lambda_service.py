@@ -41,7 +41,12 @@ class TestLocalLambdaService(TestCase):
         service.start()
 
         local_lambda_invoke_service_mock.assert_called_once_with(
-            lambda_runner=lambda_runner_mock, port=3000, host="localhost", stderr=stderr_mock, ssl_context=None
+            lambda_runner=lambda_runner_mock,
+            port=3000,
+            host="localhost",
+            stderr=stderr_mock,
+            ssl_context=None,
+            server_config=None,
         )
         lambda_context_mock.create.assert_called_once()
         lambda_context_mock.run.assert_called_once()
@@ -7,7 +7,7 @@ from samcli.lib.intrinsic_resolver.intrinsics_symbol_table import IntrinsicsSymb
 
 class TestSamBaseProvider_get_template(TestCase):
     @patch("samcli.lib.providers.sam_base_provider.ResourceMetadataNormalizer")
-    @patch("samcli.lib.providers.sam_base_provider.SamTranslatorWrapper")
+    @patch("samcli.lib.samlib.wrapper.SamTranslatorWrapper")
     @patch.object(IntrinsicResolver, "resolve_template")
     def test_must_run_translator_plugins(
         self, resolve_template_mock, SamTranslatorWrapperMock, resource_metadata_normalizer_patch
@@ -24,3 +24,44 @@ class TestSamBaseProvider_get_template(TestCase):
         called_parameter_values.update(overrides)
         SamTranslatorWrapperMock.assert_called_once_with(template, parameter_values=called_parameter_values)
         translator_instance.run_plugins.assert_called_once()
+
+    @patch("samcli.lib.providers.sam_base_provider.get_translated_template_cache")
+    @patch("samcli.lib.samlib.wrapper.SamTranslatorWrapper")
+    def test_must_reuse_cached_translated_template(self, SamTranslatorWrapperMock, get_cache_mock):
+        cache_mock = get_cache_mock.return_value
+        cache_mock.get.return_value = {"Resources": {"Cached": {"Type": "AWS::Lambda::Function"}}}
+
+        template = SamBaseProvider.get_template({"Resources": {"Function": {"Type": "AWS::Serverless::Function"}}})
+
+        SamTranslatorWrapperMock.assert_not_called()
+        cache_mock.get.assert_called_once_with(cache_mock.key.return_value)
+        self.assertEqual(list(template["Resources"]), ["Cached"])
+
+    @patch("samcli.lib.providers.sam_base_provider.get_translated_template_cache")
+    @patch("samcli.lib.samlib.wrapper.SamTranslatorWrapper")
+    def test_must_cache_translated_template(self, SamTranslatorWrapperMock, get_cache_mock):
+        cache_mock = get_cache_mock.return_value
+        cache_mock.get.return_value = None
+        translated_template = {"Resources": {"Function": {"Type": "AWS::Lambda::Function"}}}
+        SamTranslatorWrapperMock.return_value.run_plugins.return_value = translated_template
+
+        SamBaseProvider.get_template({"Resources": {"Function": {"Type": "AWS::Serverless::Function"}}})
+
+        cache_mock.put.assert_called_once_with(cache_mock.key.return_value, translated_template)
+
+    @patch("samcli.lib.providers.sam_base_provider.get_translated_template_cache")
+    @patch("samcli.lib.samlib.wrapper.SamTranslatorWrapper")
+    def test_must_only_keep_given_resources_and_their_references(self, SamTranslatorWrapperMock, get_cache_mock):
+        get_cache_mock.return_value.get.return_value = {
+            "Resources": {
+                "Function": {"Type": "AWS::Lambda::Function", "Properties": {"Role": {"Fn::GetAtt": ["Role", "Arn"]}}},
+                "Role": {"Type": "AWS::IAM::Role"},
+                "OtherFunction": {"Type": "AWS::Lambda::Function"},
+            }
+        }
+
+        template = SamBaseProvider.get_template(
+            {"Resources": {"Function": {"Type": "AWS::Serverless::Function"}}}, logical_ids=["Function"]
+        )
+
+        self.assertEqual(set(template["Resources"]), {"Function", "Role"})
@@ -1144,6 +1144,56 @@ class TestSamFunctionProvider_init(TestCase):
         get_template_mock.assert_called_with(template, self.parameter_overrides)
         self.assertEqual(provider.functions, extract_result)
 
+    def test_must_only_resolve_the_identified_function(self):
+        template = {
+            "Parameters": {"Runtime": {"Type": "String"}},
+            "Resources": {
+                "Role": {"Type": "AWS::IAM::Role", "Properties": {"Description": {"Ref": "Runtime"}}},
+                "Func": {
+                    "Type": "AWS::Lambda::Function",
+                    "Properties": {
+                        "Code": "func",
+                        "Handler": "app.handler",
+                        "Runtime": {"Ref": "Runtime"},
+                        "Role": {"Fn::GetAtt": ["Role", "Arn"]},
+                    },
+                },
+                "OtherFunc": {
+                    "Type": "AWS::Lambda::Function",
+                    "Properties": {"Code": "other", "Handler": "app.handler", "Runtime": {"Ref": "Runtime"}},
+                },
+            },
+        }
+        stack = make_root_stack(template, {"Runtime": "python3.12"})
+
+        provider = SamFunctionProvider([stack], function_identifier="Func")
+
+        self.assertEqual(set(stack.resources), {"Func", "Role"})
+        self.assertEqual(stack.resources["Role"]["Properties"]["Description"], "python3.12")
+        self.assertEqual(provider.get("Func").runtime, "python3.12")
+        self.assertIsNone(provider.get("OtherFunc"))
+
+    @parameterized.expand(["FunctionName", "ChildStack/Func"])
+    def test_must_resolve_all_resources_if_identifier_is_not_a_logical_id(self, function_identifier):
+        template = {
+            "Resources": {
+                "Func": {
+                    "Type": "AWS::Lambda::Function",
+                    "Properties": {"FunctionName": "FunctionName", "Code": "func", "Handler": "app.handler"},
+                },
+                "OtherFunc": {
+                    "Type": "AWS::Lambda::Function",
+                    "Properties": {"Code": "other", "Handler": "app.handler"},
+                },
+            },
+        }
+        stack = make_root_stack(template)
+
+        provider = SamFunctionProvider([stack], function_identifier=function_identifier)
+
+        self.assertEqual(set(stack.resources), {"Func", "OtherFunc"})
+        self.assertEqual(len(list(provider.get_all())), 2)
+
 
 class TestSamFunctionProvider_extract_functions(TestCase):
     @patch("samcli.lib.providers.sam_function_provider.Stack.resources", new_callable=PropertyMock)
@@ -9,6 +9,8 @@ from parameterized import parameterized
 from samcli.lib.utils.resources import AWS_SERVERLESS_APPLICATION, AWS_CLOUDFORMATION_STACK
 from samcli.lib.providers.provider import Stack
 from samcli.lib.providers.sam_stack_provider import SamLocalStackProvider
+from samcli.lib.samlib.translated_template_cache import configure_translated_template_cache
+from samcli.lib.samlib.wrapper import SamTranslatorWrapper
 
 # LEAF_TEMPLATE is a template without any nested application/stack in it
 from tests.testing_utils import IS_WINDOWS
@@ -367,3 +369,46 @@ class TestSamBuildableStackProvider(TestCase):
                 SamLocalStackProvider.normalize_resource_path(link2, resource_path),
                 expected,
             )
+
+
+class TestSamLocalStackProviderTranslatedTemplateCache(TestCase):
+    template = {
+        "Parameters": {"Stage": {"Type": "String", "Default": "dev"}},
+        "Resources": {
+            "AFunction": {
+                "Type": "AWS::Serverless::Function",
+                "Properties": {
+                    "CodeUri": "hi/",
+                    "Handler": "app.handler",
+                    "Runtime": "python3.12",
+                    "Environment": {"Variables": {"STAGE": {"Ref": "Stage"}}},
+                },
+            }
+        },
+    }
+
+    def setUp(self):
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.cache_dir.cleanup)
+        configure_translated_template_cache(self.cache_dir.name)
+        self.addCleanup(configure_translated_template_cache, None)
+
+        run_plugins = SamTranslatorWrapper.run_plugins
+        patcher = patch.object(SamTranslatorWrapper, "run_plugins", autospec=True, side_effect=run_plugins)
+        self.run_plugins_mock = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_must_reuse_translated_template_of_previous_command(self):
+        stacks, _ = SamLocalStackProvider.get_stacks(template_dictionary=self.template)
+        cached_stacks, _ = SamLocalStackProvider.get_stacks(template_dictionary=self.template)
+
+        self.run_plugins_mock.assert_called_once()
+        self.assertEqual(cached_stacks[0].resources, stacks[0].resources)
+        self.assertEqual(len(list(Path(self.cache_dir.name, "translated-templates").glob("*.json"))), 1)
+
+    def test_must_translate_template_again_when_parameter_overrides_change(self):
+        SamLocalStackProvider.get_stacks(template_dictionary=self.template, parameter_overrides={"Stage": "dev"})
+        SamLocalStackProvider.get_stacks(template_dictionary=self.template, parameter_overrides={"Stage": "prod"})
+        SamLocalStackProvider.get_stacks(template_dictionary=self.template, parameter_overrides={"Stage": "prod"})
+
+        self.assertEqual(self.run_plugins_mock.call_count, 2)
@@ -15,6 +15,7 @@ from samcli.commands.validate.lib.exceptions import InvalidSamDocumentException
 from samcli.commands.local.lib.exceptions import OverridesNotWellDefinedError
 from samcli.local.docker.exceptions import ContainerNotStartableException, PortAlreadyInUse
 from samcli.local.docker.lambda_debug_settings import DebuggingNotSupported
+from samcli.local.services.server_config import DEFAULT_SERVER_THREADS, ServerConfig, ServerEngine
 
 
 class TestCli(TestCase):
@@ -38,6 +39,10 @@ class TestCli(TestCase):
         self.disable_authorizer = False
 
         self.warm_containers = None
+        self.warm_containers_pool_size = 1
+        self.warm_containers_idle_ttl = None
+        self.prewarm = False
+        self.prewarm_event = None
         self.debug_function = None
 
         self.hook_name = None
@@ -48,6 +53,9 @@ class TestCli(TestCase):
 
         self.host = "host"
         self.port = 123
+        self.server_engine = "DEV"
+        self.server_threads = None
+        self.server_backlog = 128
         self.ssl_cert_file = None
         self.ssl_key_file = None
         self.static_dir = "staticdir"
@@ -91,6 +99,10 @@ class TestCli(TestCase):
             aws_region=self.region_name,
             aws_profile=self.profile,
             warm_container_initialization_mode=self.warm_containers,
+            warm_containers_pool_size=self.warm_containers_pool_size,
+            warm_containers_idle_ttl=self.warm_containers_idle_ttl,
+            prewarm=self.prewarm,
+            prewarm_event_file=self.prewarm_event,
             debug_function=self.debug_function,
             shutdown=self.shutdown,
             container_host=self.container_host,
@@ -106,6 +118,7 @@ class TestCli(TestCase):
             ssl_context=None,
             static_dir=self.static_dir,
             disable_authorizer=self.disable_authorizer,
+            server_config=ServerConfig(engine=ServerEngine.DEV, threads=DEFAULT_SERVER_THREADS, backlog=128),
         )
 
         service_mock.start.assert_called_with()
@@ -198,11 +211,23 @@ class TestCli(TestCase):
         expected = "invalid imageuri"
         self.assertEqual(msg, expected)
 
+    def test_must_raise_user_exception_on_invalid_server_threads(self):
+        self.server_engine = "POOLED"
+        self.server_threads = 0
+
+        with self.assertRaises(UserException) as context:
+            self.call_cli()
+
+        self.assertEqual(str(context.exception), "Server threads must be at least 1, got 0")
+
     def call_cli(self):
         start_api_cli(
             ctx=self.ctx_mock,
             host=self.host,
             port=self.port,
+            server_engine=self.server_engine,
+            server_threads=self.server_threads,
+            server_backlog=self.server_backlog,
             static_dir=self.static_dir,
             template=self.template,
             env_vars=self.env_vars,
@@ -218,6 +243,10 @@ class TestCli(TestCase):
             layer_cache_basedir=self.layer_cache_basedir,
             force_image_build=self.force_image_build,
             warm_containers=self.warm_containers,
+            warm_containers_pool_size=self.warm_containers_pool_size,
+            warm_containers_idle_ttl=self.warm_containers_idle_ttl,
+            prewarm=self.prewarm,
+            prewarm_event=self.prewarm_event,
             debug_function=self.debug_function,
             shutdown=self.shutdown,
             container_host=self.container_host,
@@ -4,6 +4,7 @@ from unittest.mock import patch, Mock
 from parameterized import parameterized, param
 
 from samcli.commands.local.start_lambda.cli import do_cli as start_lambda_cli
+from samcli.local.services.server_config import DEFAULT_SERVER_THREADS, ServerConfig, ServerEngine
 from samcli.lib.providers.exceptions import InvalidLayerReference
 from samcli.commands.local.cli_common.user_exceptions import UserException
 from samcli.commands.validate.lib.exceptions import InvalidSamDocumentException
@@ -28,6 +29,10 @@ class TestCli(TestCase):
         self.layer_cache_basedir = "/some/layers/path"
         self.force_image_build = True
         self.warm_containers = None
+        self.warm_containers_pool_size = 1
+        self.warm_containers_idle_ttl = None
+        self.prewarm = False
+        self.prewarm_event = None
         self.shutdown = True
         self.debug_function = None
         self.region_name = "region"
@@ -39,6 +44,9 @@ class TestCli(TestCase):
 
         self.host = "host"
         self.port = 123
+        self.server_engine = "DEV"
+        self.server_threads = None
+        self.server_backlog = 128
 
         self.container_host = "localhost"
         self.container_host_interface = "127.0.0.1"
@@ -57,6 +65,8 @@ class TestCli(TestCase):
         local_lambda_service_mock.return_value = service_mock
 
         self.warm_containers = None
+        self.warm_containers_pool_size = 1
+        self.warm_containers_idle_ttl = None
         self.debug_function = None
         self.call_cli()
 
@@ -78,6 +88,10 @@ class TestCli(TestCase):
             aws_region=self.region_name,
             aws_profile=self.profile,
             warm_container_initialization_mode=self.warm_containers,
+            warm_containers_pool_size=self.warm_containers_pool_size,
+            warm_containers_idle_ttl=self.warm_containers_idle_ttl,
+            prewarm=self.prewarm,
+            prewarm_event_file=self.prewarm_event,
             debug_function=self.debug_function,
             shutdown=self.shutdown,
             container_host=self.container_host,
@@ -86,7 +100,12 @@ class TestCli(TestCase):
             invoke_images={},
         )
 
-        local_lambda_service_mock.assert_called_with(lambda_invoke_context=context_mock, port=self.port, host=self.host)
+        local_lambda_service_mock.assert_called_with(
+            lambda_invoke_context=context_mock,
+            port=self.port,
+            host=self.host,
+            server_config=ServerConfig(engine=ServerEngine.DEV, threads=DEFAULT_SERVER_THREADS, backlog=128),
+        )
 
         service_mock.start.assert_called_with()
 
@@ -164,6 +183,9 @@ class TestCli(TestCase):
             ctx=self.ctx_mock,
             host=self.host,
             port=self.port,
+            server_engine=self.server_engine,
+            server_threads=self.server_threads,
+            server_backlog=self.server_backlog,
             template=self.template,
             env_vars=self.env_vars,
             debug_port=self.debug_ports,
@@ -178,6 +200,10 @@ class TestCli(TestCase):
             layer_cache_basedir=self.layer_cache_basedir,
             force_image_build=self.force_image_build,
             warm_containers=self.warm_containers,
+            warm_containers_pool_size=self.warm_containers_pool_size,
+            warm_containers_idle_ttl=self.warm_containers_idle_ttl,
+            prewarm=self.prewarm,
+            prewarm_event=self.prewarm_event,
             debug_function=self.debug_function,
             shutdown=self.shutdown,
             container_host=self.container_host,
@@ -2,6 +2,7 @@ import itertools
 from unittest import TestCase
 from unittest.mock import Mock, patch, call
 
+import click
 import pytest
 from botocore.exceptions import ClientError
 from click.testing import CliRunner
@@ -25,7 +26,11 @@ class TestLogsCliCommand(TestCase):
 
     @parameterized.expand(
         itertools.product(
-            [True, False], [True, False], [[], ["cw_log_group"], ["cw_log_group", "cw_log_group2"]], ["text", "json"]
+            [True, False],
+            [True, False],
+            [True, False],
+            [[], ["cw_log_group"], ["cw_log_group", "cw_log_group2"]],
+            ["text", "json"],
         )
     )
     @patch("samcli.commands.logs.puller_factory.generate_puller")
@@ -36,6 +41,7 @@ class TestLogsCliCommand(TestCase):
     def test_logs_command(
         self,
         tailing,
+        live_tail,
         include_tracing,
         cw_log_group,
         output,
@@ -47,6 +53,10 @@ class TestLogsCliCommand(TestCase):
         patched_is_experimental_enabled,
         patched_update_experimental_context,
     ):
+        if live_tail and not tailing:
+            # covered by test_must_require_tail_for_live_tail
+            return
+
         mocked_start_time = Mock()
         mocked_end_time = Mock()
         patched_parse_time.side_effect = [mocked_start_time, mocked_end_time]
@@ -70,6 +80,7 @@ class TestLogsCliCommand(TestCase):
             self.stack_name,
             self.filter_pattern,
             tailing,
+            live_tail,
             include_tracing,
             self.start_time,
             self.end_time,
@@ -103,6 +114,7 @@ class TestLogsCliCommand(TestCase):
             cw_log_group,
             OutputOption(output),
             include_tracing,
+            live_tail,
         )
 
         if tailing:
@@ -112,6 +124,28 @@ class TestLogsCliCommand(TestCase):
                 [call.load_time_period(mocked_start_time, mocked_end_time, self.filter_pattern)]
             )
 
+    @patch("samcli.commands.logs.puller_factory.generate_puller")
+    def test_must_require_tail_for_live_tail(
+        self, patched_generate_puller, patched_is_experimental_enabled, patched_update_experimental_context
+    ):
+        with self.assertRaises(click.UsageError):
+            do_cli(
+                self.function_name,
+                self.stack_name,
+                self.filter_pattern,
+                False,
+                True,
+                False,
+                self.start_time,
+                self.end_time,
+                [],
+                "text",
+                self.region,
+                self.profile,
+            )
+
+        patched_generate_puller.assert_not_called()
+
     def test_without_stack_name_or_cw_log_group(
         self, patched_is_experimental_enabled, patched_update_experimental_context
     ):
@@ -26,6 +26,7 @@ class TestPullerFactory(TestCase):
     @patch("samcli.commands.logs.puller_factory.generate_text_consumer")
     @patch("samcli.commands.logs.puller_factory.generate_json_consumer")
     @patch("samcli.commands.logs.puller_factory.CWLogPuller")
+    @patch("samcli.commands.logs.puller_factory.CWLogGroupsPuller")
     @patch("samcli.commands.logs.puller_factory.generate_trace_puller")
     @patch("samcli.commands.logs.puller_factory.ObservabilityCombinedPuller")
     def test_generate_puller(
@@ -35,14 +36,17 @@ class TestPullerFactory(TestCase):
         param_output,
         patched_combined_puller,
         patched_xray_puller,
+        patched_cw_log_groups_puller,
         patched_cw_log_puller,
         patched_json_consumer,
         patched_text_consumer,
     ):
         mock_logs_client = Mock()
+        mock_sts_client = Mock()
         mock_xray_client = Mock()
 
-        mock_client_provider = lambda client_name: mock_logs_client if client_name == "logs" else mock_xray_client
+        mock_clients = {"logs": mock_logs_client, "sts": mock_sts_client, "xray": mock_xray_client}
+        mock_client_provider = lambda client_name: mock_clients[client_name]
 
         mock_resource_info_list = [
             Mock(resource_type=AWS_LAMBDA_FUNCTION),
@@ -62,9 +66,10 @@ class TestPullerFactory(TestCase):
 
         mocked_xray_puller = Mock()
         patched_xray_puller.return_value = mocked_xray_puller
-        mocked_pullers = [Mock() for _ in mocked_consumers]
-        mocked_pullers.append(mocked_xray_puller)  # add a mock puller for xray puller
-        patched_cw_log_puller.side_effect = mocked_pullers
+        mocked_cw_log_pullers = [Mock() for _ in mocked_consumers]
+        patched_cw_log_puller.side_effect = mocked_cw_log_pullers
+        mocked_cw_log_groups_puller = Mock()
+        patched_cw_log_groups_puller.return_value = mocked_cw_log_groups_puller
 
         mocked_combined_puller = Mock()
 
@@ -77,6 +82,7 @@ class TestPullerFactory(TestCase):
             param_cw_log_groups,
             OutputOption(param_output),
             True,
+            True,
         )
 
         self.assertEqual(puller, mocked_combined_puller)
@@ -91,7 +97,10 @@ class TestPullerFactory(TestCase):
             [call(mock_logs_client, consumer, ANY) for consumer in mocked_cw_specific_consumers]
         )
 
-        patched_combined_puller.assert_called_with(mocked_pullers)
+        patched_cw_log_groups_puller.assert_called_once_with(
+            mock_logs_client, mock_sts_client, mocked_cw_log_pullers, True
+        )
+        patched_combined_puller.assert_called_with([mocked_cw_log_groups_puller, mocked_xray_puller])
 
         # depending on the output_dir param assert calls for file consumer or console consumer
         if param_output == "json":
@@ -109,9 +118,10 @@ class TestPullerFactory(TestCase):
 
     @patch("samcli.commands.logs.puller_factory.generate_text_consumer")
     @patch("samcli.commands.logs.puller_factory.CWLogPuller")
+    @patch("samcli.commands.logs.puller_factory.CWLogGroupsPuller")
     @patch("samcli.commands.logs.puller_factory.ObservabilityCombinedPuller")
     def test_generate_puller_with_console_with_additional_cw_logs_groups(
-        self, patched_combined_puller, patched_cw_log_puller, patched_text_consumer
+        self, patched_combined_puller, patched_cw_log_groups_puller, patched_cw_log_puller, patched_text_consumer
     ):
         mock_logs_client = Mock()
         mock_logs_client_generator = lambda client: mock_logs_client
@@ -132,7 +142,8 @@ class TestPullerFactory(TestCase):
 
         patched_cw_log_puller.assert_has_calls([call(mock_logs_client, consumer, ANY) for consumer in mocked_consumers])
 
-        patched_combined_puller.assert_called_with(mocked_pullers)
+        patched_cw_log_groups_puller.assert_called_once_with(mock_logs_client, mock_logs_client, mocked_pullers, False)
+        patched_combined_puller.assert_called_with([patched_cw_log_groups_puller.return_value])
 
         patched_text_consumer.assert_has_calls([call(None) for _ in mock_cw_log_groups])
 
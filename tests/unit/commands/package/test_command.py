@@ -43,6 +43,10 @@ class TestPackageCliCommand(TestCase):
             region=self.region,
             profile=self.profile,
             resolve_s3=self.resolve_s3,
+            s3_max_concurrency=None,
+            s3_multipart_threshold=None,
+            s3_multipart_chunksize=None,
+            package_jobs=None,
             signing_profiles=self.signing_profiles,
         )
 
@@ -61,6 +65,7 @@ class TestPackageCliCommand(TestCase):
             region=self.region,
             profile=self.profile,
             signing_profiles=self.signing_profiles,
+            parallel_jobs=None,
         )
 
         context_mock.run.assert_called_with()
@@ -89,6 +94,10 @@ class TestPackageCliCommand(TestCase):
             region=self.region,
             profile=self.profile,
             resolve_s3=True,
+            s3_max_concurrency=None,
+            s3_multipart_threshold=None,
+            s3_multipart_chunksize=None,
+            package_jobs=None,
             signing_profiles=self.signing_profiles,
         )
 
@@ -107,6 +116,7 @@ class TestPackageCliCommand(TestCase):
             region=self.region,
             profile=self.profile,
             signing_profiles=self.signing_profiles,
+            parallel_jobs=None,
         )
 
         context_mock.run.assert_called_with()
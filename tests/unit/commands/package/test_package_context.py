@@ -7,8 +7,9 @@ import tempfile
 
 
 from samcli.commands.package.package_context import PackageContext
-from samcli.commands.package.exceptions import PackageFailedError
+from samcli.commands.package.exceptions import InvalidPackageJobsError, PackageFailedError
 from samcli.lib.package.artifact_exporter import Template
+from samcli.lib.package.export_executor import DEFAULT_EXPORT_JOBS
 from samcli.lib.providers.sam_stack_provider import SamLocalStackProvider
 from samcli.lib.samlib.resource_metadata_normalizer import ResourceMetadataNormalizer
 from samcli.lib.utils.resources import AWS_LAMBDA_FUNCTION, AWS_SERVERLESS_FUNCTION
@@ -32,6 +33,49 @@ class TestPackageCommand(TestCase):
             profile=None,
         )
 
+    def test_parallel_jobs_defaults_to_export_jobs(self):
+        self.assertEqual(self.package_command_context.parallel_jobs, DEFAULT_EXPORT_JOBS)
+
+    @parameterized.expand([(0,), (-1,)])
+    def test_invalid_parallel_jobs(self, parallel_jobs):
+        with self.assertRaises(InvalidPackageJobsError):
+            PackageContext(
+                template_file="template-file",
+                s3_bucket="s3-bucket",
+                s3_prefix="s3-prefix",
+                image_repository="image-repo",
+                image_repositories=None,
+                kms_key_id="kms-key-id",
+                output_template_file=None,
+                use_json=True,
+                force_upload=True,
+                no_progressbar=False,
+                metadata={},
+                region=None,
+                profile=None,
+                parallel_jobs=parallel_jobs,
+            )
+
+    @patch("samcli.commands.package.package_context.ExportExecutor")
+    @patch("samcli.commands.package.package_context.Template")
+    def test_export_with_parallel_jobs(self, patched_template, patched_export_executor):
+        patched_template.return_value.export.return_value = {}
+        self.package_command_context.parallel_jobs = 1
+        self.package_command_context.uploaders = Mock()
+
+        self.package_command_context._export("template-file", True)
+
+        patched_export_executor.assert_called_once_with(1)
+        patched_template.assert_called_once_with(
+            "template-file",
+            ANY,
+            ANY,
+            ANY,
+            normalize_template=True,
+            normalize_parameters=True,
+            export_executor=patched_export_executor.return_value.__enter__.return_value,
+        )
+
     @patch.object(SamLocalStackProvider, "get_stacks")
     @patch.object(Template, "export", MagicMock(sideeffect=OSError))
     @patch("boto3.client")
@@ -122,6 +122,7 @@ class TestSamConfigForAllCommands(TestCase):
             "build_image": [("")],
             "exclude": [("")],
             "mount_with": "read",
+            "parallel_jobs": 4,
         }
 
         with samconfig_parameters(["build"], self.scratch_dir, **config_values) as config_path:
@@ -160,6 +161,7 @@ class TestSamConfigForAllCommands(TestCase):
                 None,
                 False,
                 "READ",
+                4,
             )
 
     @patch("samcli.commands.build.command.do_cli")
@@ -220,6 +222,7 @@ class TestSamConfigForAllCommands(TestCase):
                 None,
                 False,
                 "READ",
+                None,
             )
 
     @patch("samcli.commands.build.command.do_cli")
@@ -277,6 +280,7 @@ class TestSamConfigForAllCommands(TestCase):
                 None,
                 False,
                 "READ",
+                None,
             )
 
     @patch("samcli.commands.build.command.do_cli")
@@ -333,6 +337,7 @@ class TestSamConfigForAllCommands(TestCase):
                 None,
                 False,
                 "READ",
+                None,
             )
 
     @patch("samcli.commands.local.invoke.cli.do_cli")
@@ -420,6 +425,12 @@ class TestSamConfigForAllCommands(TestCase):
             "shutdown": False,
             "parameter_overrides": "ParameterKey=Key,ParameterValue=Value ParameterKey=Key2,ParameterValue=Value2",
             "invoke_image": ["image"],
+            "warm_containers_pool_size": 4,
+            "warm_containers_idle_ttl": 30,
+            "server_engine": "POOLED",
+            "server_threads": 8,
+            "server_backlog": 256,
+            "prewarm": True,
         }
 
         # NOTE: Because we don't load the full Click BaseCommand here, this is mounted as top-level command
@@ -465,6 +476,13 @@ class TestSamConfigForAllCommands(TestCase):
                 None,
                 None,
                 None,
+                4,
+                30,
+                "POOLED",
+                8,
+                256,
+                True,
+                None,
             )
 
     @patch("samcli.commands.local.start_lambda.cli.do_cli")
@@ -528,6 +546,13 @@ class TestSamConfigForAllCommands(TestCase):
                 {},
                 ("image",),
                 None,
+                1,
+                None,
+                "DEV",
+                None,
+                128,
+                False,
+                None,
             )
 
     @patch("samcli.lib.cli_validation.image_repository_validation._is_all_image_funcs_provided")
@@ -556,6 +581,10 @@ class TestSamConfigForAllCommands(TestCase):
             "region": "myregion",
             "output_template_file": "output.yaml",
             "signing_profiles": "function=profile:owner",
+            "s3_max_concurrency": 20,
+            "s3_multipart_threshold": 64,
+            "s3_multipart_chunksize": 16,
+            "package_jobs": 4,
         }
 
         with samconfig_parameters(["package"], self.scratch_dir, **config_values) as config_path:
@@ -587,6 +616,10 @@ class TestSamConfigForAllCommands(TestCase):
                 "myregion",
                 None,
                 False,
+                20,
+                64,
+                16,
+                4,
             )
 
     @patch("samcli.commands._utils.options.get_template_artifacts_format")
@@ -695,6 +728,10 @@ class TestSamConfigForAllCommands(TestCase):
                 True,
                 "ROLLBACK",
                 60,
+                None,
+                None,
+                None,
+                None,
             )
 
     @patch("samcli.commands.deploy.command.do_cli")
@@ -810,6 +847,10 @@ class TestSamConfigForAllCommands(TestCase):
                 True,
                 "ROLLBACK",
                 60,
+                None,
+                None,
+                None,
+                None,
             )
 
     @patch("samcli.commands._utils.experimental.is_experimental_enabled")
@@ -846,6 +887,7 @@ class TestSamConfigForAllCommands(TestCase):
                 "myfilter",
                 True,
                 False,
+                False,
                 "starttime",
                 "endtime",
                 (),
@@ -862,6 +904,7 @@ class TestSamConfigForAllCommands(TestCase):
             "stack_name": "mystack",
             "filter": "myfilter",
             "tail": True,
+            "live_tail": True,
             "include_traces": True,
             "start_time": "starttime",
             "end_time": "endtime",
@@ -888,6 +931,7 @@ class TestSamConfigForAllCommands(TestCase):
                 "myfilter",
                 True,
                 True,
+                True,
                 "starttime",
                 "endtime",
                 ("cw_log_group",),
@@ -915,8 +959,8 @@ class TestSamConfigForAllCommands(TestCase):
 
             do_cli_mock.assert_called_with(ANY, str(Path(os.getcwd(), "mytemplate.yaml")), "0.1.1", False)
 
-    @patch("samcli.cli.main.gather_system_info")
-    @patch("samcli.cli.main.gather_additional_dependencies_info")
+    @patch("samcli.lib.utils.system_info.gather_system_info")
+    @patch("samcli.lib.utils.system_info.gather_additional_dependencies_info")
     def test_info_must_not_read_from_config(self, deps_info_mock, system_info_mock):
         config_values = {"a": "b"}
         system_info_mock.return_value = {"Python": "1.2.3"}
@@ -979,6 +1023,7 @@ class TestSamConfigForAllCommands(TestCase):
             "region": "myregion",
             "signing_profiles": "function=profile:owner",
             "watch_exclude": {"HelloWorld": ["file.txt", "other.txt"], "HelloMars": ["single.file"]},
+            "watch_quiet_window": 250,
         }
 
         with samconfig_parameters(["sync"], self.scratch_dir, **config_values) as config_path:
@@ -1025,6 +1070,11 @@ class TestSamConfigForAllCommands(TestCase):
                 "default",
                 False,
                 {"HelloWorld": ["file.txt", "other.txt"], "HelloMars": ["single.file"]},
+                250,
+                None,
+                None,
+                None,
+                None,
             )
 
 
@@ -1147,6 +1197,13 @@ class TestSamConfigWithOverrides(TestCase):
                 {},
                 ("image",),
                 None,
+                1,
+                None,
+                "DEV",
+                None,
+                128,
+                False,
+                None,
             )
 
     @patch("samcli.commands.local.start_lambda.cli.do_cli")
@@ -1244,6 +1301,13 @@ class TestSamConfigWithOverrides(TestCase):
                 {},
                 ("image",),
                 None,
+                1,
+                None,
+                "DEV",
+                None,
+                128,
+                False,
+                None,
             )
 
     @patch("samcli.commands.validate.validate.do_cli")
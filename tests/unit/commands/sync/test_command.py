@@ -149,6 +149,11 @@ class TestDoCli(TestCase):
             self.config_env,
             build_in_source=False,
             watch_exclude={},
+            watch_quiet_window=1000,
+            s3_max_concurrency=None,
+            s3_multipart_threshold=None,
+            s3_multipart_chunksize=None,
+            package_jobs=None,
         )
 
         if use_container and auto_dependency_layer:
@@ -190,6 +195,7 @@ class TestDoCli(TestCase):
             profile=self.profile,
             use_json=False,
             force_upload=True,
+            parallel_jobs=None,
         )
 
         DeployContextMock.assert_called_with(
@@ -312,6 +318,11 @@ class TestDoCli(TestCase):
             self.config_env,
             build_in_source=False,
             watch_exclude={},
+            watch_quiet_window=1000,
+            s3_max_concurrency=None,
+            s3_multipart_threshold=None,
+            s3_multipart_chunksize=None,
+            package_jobs=None,
         )
 
         BuildContextMock.assert_called_with(
@@ -349,6 +360,7 @@ class TestDoCli(TestCase):
             profile=self.profile,
             use_json=False,
             force_upload=True,
+            parallel_jobs=None,
         )
 
         DeployContextMock.assert_called_with(
@@ -387,6 +399,7 @@ class TestDoCli(TestCase):
             auto_dependency_layer=auto_dependency_layer,
             disable_infra_syncs=disable_infra_syncs,
             watch_exclude={},
+            watch_quiet_window=1.0,
         )
 
     @parameterized.expand([(True, False, True, True, False), (True, False, False, False, True)])
@@ -464,6 +477,11 @@ class TestDoCli(TestCase):
             self.config_env,
             build_in_source=None,
             watch_exclude={},
+            watch_quiet_window=1000,
+            s3_max_concurrency=None,
+            s3_multipart_threshold=None,
+            s3_multipart_chunksize=None,
+            package_jobs=None,
         )
         execute_code_sync_mock.assert_called_once_with(
             template=self.template_file,
@@ -800,6 +818,7 @@ class TestWatch(TestCase):
             auto_dependency_layer,
             disable_infra_syncs,
             {},
+            0.25,
         )
 
         watch_manager_mock.assert_called_once_with(
@@ -811,6 +830,7 @@ class TestWatch(TestCase):
             auto_dependency_layer,
             disable_infra_syncs,
             {},
+            0.25,
         )
         watch_manager_mock.return_value.start.assert_called_once_with()
 
@@ -11,6 +11,8 @@ from samcli.hook_packages.terraform.hooks.prepare.resources.apigw import (
     _get_reference_from_string_or_intrinsic,
     _gateway_method_integration_identifier,
     _find_gateway_integration,
+    _index_gateway_integrations,
+    _lookup_gateway_integration,
     add_integrations_to_methods,
     add_integration_responses_to_methods,
     _create_gateway_method_integration_response,
@@ -52,12 +54,12 @@ class TestRESTAPITranslationValidator(TestCase):
 
 class TestMethodToIntegrationLinking(TestCase):
     @patch("samcli.hook_packages.terraform.hooks.prepare.resources.apigw._gateway_method_integration_identifier")
-    @patch("samcli.hook_packages.terraform.hooks.prepare.resources.apigw._find_gateway_integration")
+    @patch("samcli.hook_packages.terraform.hooks.prepare.resources.apigw._lookup_gateway_integration")
     @patch("samcli.hook_packages.terraform.hooks.prepare.resources.apigw._create_gateway_method_integration")
     def test_add_integrations_to_methods(
         self,
         mock_create_gateway_method_integration,
-        mock_find_gateway_integration,
+        mock_lookup_gateway_integration,
         mock_gateway_method_integration_identifier,
     ):
         integration_a = {
@@ -87,7 +89,7 @@ class TestMethodToIntegrationLinking(TestCase):
             "MethodA": [method_a],
             "MethodB": [method_b],
         }
-        mock_find_gateway_integration.side_effect = [integration_a["Properties"], integration_b["Properties"], None]
+        mock_lookup_gateway_integration.side_effect = [integration_a["Properties"], integration_b["Properties"], None]
         add_integrations_to_methods(gateway_methods, gateway_integrations)
         mock_create_gateway_method_integration.assert_has_calls(
             [
@@ -200,6 +202,23 @@ class TestMethodToIntegrationLinking(TestCase):
         response = _find_gateway_integration(search_key, gateway_integrations_cfn)
         self.assertEqual(response, expected_response)
 
+    def test_index_gateway_integrations_keeps_first_integration(self):
+        properties = {"ResourceId": "MyResource", "HttpMethod": "GET", "RestApiId": "MyRestApi"}
+        gateway_integrations_cfn = {
+            "MyResourceA": [{"Properties": dict(properties, Uri="first_invoke_arn")}],
+            "MyResourceB": [{"Properties": dict(properties, Uri="second_invoke_arn")}],
+        }
+
+        index = _index_gateway_integrations(gateway_integrations_cfn)
+        response = _lookup_gateway_integration({"GET", "MyRestApi", "MyResource"}, index)
+        response["Uri"] = "changed_invoke_arn"
+
+        self.assertEqual(len(index), 1)
+        self.assertEqual(
+            _lookup_gateway_integration({"GET", "MyRestApi", "MyResource"}, index)["Uri"], "first_invoke_arn"
+        )
+        self.assertIsNone(_lookup_gateway_integration({"POST", "MyRestApi", "MyResource"}, index))
+
     @parameterized.expand(
         [
             (
@@ -290,12 +309,12 @@ class TestMethodToIntegrationLinking(TestCase):
 
 class TestMethodToIntegrationResponseLinking(TestCase):
     @patch("samcli.hook_packages.terraform.hooks.prepare.resources.apigw._gateway_method_integration_identifier")
-    @patch("samcli.hook_packages.terraform.hooks.prepare.resources.apigw._find_gateway_integration")
+    @patch("samcli.hook_packages.terraform.hooks.prepare.resources.apigw._lookup_gateway_integration")
     @patch("samcli.hook_packages.terraform.hooks.prepare.resources.apigw._create_gateway_method_integration_response")
     def test_add_integration_responses_to_methods(
         self,
         mock_create_gateway_method_integration_response,
-        mock_find_gateway_integration,
+        mock_lookup_gateway_integration,
         mock_gateway_method_integration_identifier,
     ):
         integration_response_a = {
@@ -339,7 +358,7 @@ class TestMethodToIntegrationResponseLinking(TestCase):
             "MethodA": [method_a],
             "MethodB": [method_b],
         }
-        mock_find_gateway_integration.side_effect = [
+        mock_lookup_gateway_integration.side_effect = [
             integration_response_a["Properties"],
             integration_response_b["Properties"],
             None,
@@ -152,7 +152,9 @@ class TestPrepareHookMakefile(PrepareHookUnitBase):
             ]
         )
 
-        mock_generate_makefile.assert_called_once_with(makefile_rules, "/output/dir")
+        mock_generate_makefile.assert_called_once_with(
+            makefile_rules, "/output/dir", ["null_resource.sam_metadata_myfunc", "null_resource.sam_metadata_myfunc2"]
+        )
 
     @patch("samcli.hook_packages.terraform.hooks.prepare.enrich._get_python_command_name")
     @patch("samcli.hook_packages.terraform.hooks.prepare.enrich.generate_makefile")
@@ -241,7 +243,9 @@ class TestPrepareHookMakefile(PrepareHookUnitBase):
             ]
         )
 
-        mock_generate_makefile.assert_called_once_with(makefile_rules, "/output/dir")
+        mock_generate_makefile.assert_called_once_with(
+            makefile_rules, "/output/dir", ["null_resource.sam_metadata_lambda_layer"]
+        )
 
     @patch("samcli.hook_packages.terraform.hooks.prepare.enrich._get_python_command_name")
     @patch("samcli.hook_packages.terraform.hooks.prepare.enrich.generate_makefile")
@@ -350,7 +354,9 @@ class TestPrepareHookMakefile(PrepareHookUnitBase):
             ]
         )
 
-        mock_generate_makefile.assert_called_once_with(makefile_rules, "/output/dir")
+        mock_generate_makefile.assert_called_once_with(
+            makefile_rules, "/output/dir", ["null_resource.sam_metadata_myfunc", "null_resource.sam_metadata_myfunc2"]
+        )
 
     @patch("samcli.hook_packages.terraform.hooks.prepare.enrich._get_relevant_cfn_resource")
     @patch(
@@ -547,7 +553,9 @@ class TestPrepareHookMakefile(PrepareHookUnitBase):
             ]
         )
 
-        mock_generate_makefile.assert_called_once_with(makefile_rules, "/output/dir")
+        mock_generate_makefile.assert_called_once_with(
+            makefile_rules, "/output/dir", ["null_resource.sam_metadata_image_func"]
+        )
 
     @patch("samcli.hook_packages.terraform.hooks.prepare.enrich._get_relevant_cfn_resource")
     @patch(
@@ -699,7 +707,9 @@ class TestPrepareHookMakefile(PrepareHookUnitBase):
             ]
         )
 
-        mock_generate_makefile.assert_called_once_with(makefile_rules, "/output/dir")
+        mock_generate_makefile.assert_called_once_with(
+            makefile_rules, "/output/dir", ["null_resource.sam_metadata_image_func"]
+        )
 
     @parameterized.expand(
         [
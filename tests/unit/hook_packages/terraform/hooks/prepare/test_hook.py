@@ -468,6 +468,34 @@ class TestPrepareHook(PrepareHookUnitBase):
 
         run_mock.assert_not_called()
 
+    @patch("samcli.hook_packages.terraform.hooks.prepare.hook.PrepareCache")
+    @patch("samcli.hook_packages.terraform.hooks.prepare.hook.translate_to_cfn")
+    @patch("samcli.hook_packages.terraform.hooks.prepare.hook.invoke_subprocess_with_loading_pattern")
+    def test_prepare_reuses_metadata_file_of_unchanged_application(
+        self, mock_subprocess_loader, mock_translate_to_cfn, mock_prepare_cache
+    ):
+        mock_prepare_cache.return_value.is_current.return_value = True
+
+        metadata = prepare(self.prepare_params)
+
+        metadata_file = metadata["iac_applications"]["MainApplication"]["metadata_file"]
+        mock_prepare_cache.return_value.is_current.assert_called_once_with(metadata_file)
+        mock_subprocess_loader.assert_not_called()
+        mock_translate_to_cfn.assert_not_called()
+        mock_prepare_cache.return_value.store.assert_not_called()
+
+    @patch("samcli.hook_packages.terraform.hooks.prepare.hook.remove_batch_build_output")
+    @patch("samcli.hook_packages.terraform.hooks.prepare.hook.os")
+    @patch("samcli.hook_packages.terraform.hooks.prepare.hook.run")
+    def test_skip_prepare_infra_removes_batch_build_output(self, run_mock, os_mock, remove_batch_build_output_mock):
+        os_mock.path.exists.return_value = True
+
+        self.prepare_params["SkipPrepareInfra"] = True
+
+        prepare(self.prepare_params)
+
+        remove_batch_build_output_mock.assert_called_once_with(self.prepare_params["OutputDirPath"])
+
     @patch("samcli.hook_packages.terraform.hooks.prepare.hook.invoke_subprocess_with_loading_pattern")
     @patch("samcli.hook_packages.terraform.hooks.prepare.hook._update_resources_paths")
     @patch("samcli.hook_packages.terraform.hooks.prepare.hook.translate_to_cfn")
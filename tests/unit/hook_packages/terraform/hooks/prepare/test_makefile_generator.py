@@ -1,5 +1,9 @@
 """Test Terraform prepare Makefile"""
 
+import json
+import os
+import time
+from tempfile import TemporaryDirectory
 from unittest.mock import patch, Mock, call
 from parameterized import parameterized
 
@@ -10,6 +14,11 @@ from samcli.hook_packages.terraform.hooks.prepare.types import (
 from samcli.hook_packages.terraform.hooks.prepare.makefile_generator import (
     generate_makefile_rule_for_lambda_resource,
     generate_makefile,
+    remove_batch_build_output,
+    TF_BATCH_LOCK_FILENAME,
+    TF_BATCH_LOCK_STALE_AGE,
+    TF_BATCH_OUTPUT_FILENAME,
+    TF_BATCH_TARGETS_FILENAME,
     _get_makefile_build_target,
     _get_parent_modules,
     _build_jpath_string,
@@ -30,7 +39,7 @@ class TestPrepareMakefile(PrepareHookUnitBase):
             "\tpython3 .aws-sam/iacs_metadata/copy_terraform_built_artifacts.py --expression "
             '"|values|root_module|resources|[?address=="null_resource.sam_metadata_aws_lambda_function"]'
             '|values|triggers|built_output_path" --directory "$(ARTIFACTS_DIR)" '
-            '--target "null_resource.sam_metadata_aws_lambda_function"\n',
+            '--target "null_resource.sam_metadata_aws_lambda_function" --batch\n',
         ]
         get_build_target_mock.return_value = "build-function_logical_id:\n"
         sam_metadata_resource = SamMetadataResource(
@@ -50,7 +59,7 @@ class TestPrepareMakefile(PrepareHookUnitBase):
             "\tpython3 .aws-sam/iacs_metadata/copy_terraform_built_artifacts.py "
             '--expression "|values|root_module|resources|[?address=="null_resource.sam_metadata_aws_lambda_function"]'
             '|values|triggers|built_output_path" --directory "$(ARTIFACTS_DIR)" '
-            '--target "null_resource.sam_metadata_aws_lambda_function"\n'
+            '--target "null_resource.sam_metadata_aws_lambda_function" --batch\n'
         )
         self.assertEqual(makefile_rule, expected_makefile_rule)
 
@@ -83,7 +92,7 @@ class TestPrepareMakefile(PrepareHookUnitBase):
             '--expression "|values|root_module|resources|'
             f'[?address==\\"{escaped_resource}\\"]'
             '|values|triggers|built_output_path" --directory "$(ARTIFACTS_DIR)" '
-            f'--target "{escaped_resource}"'
+            f'--target "{escaped_resource}" --batch'
         )
         self.assertEqual(show_command, expected_show_command)
 
@@ -192,3 +201,38 @@ class TestPrepareMakefile(PrepareHookUnitBase):
             ]
         )
         mock_makefile.writelines.assert_called_once_with(mock_makefile_rules)
+
+    def test_generate_makefile_with_batch_targets(self):
+        targets = ["null_resource.sam_metadata_func1", 'module.m.null_resource.sam_metadata_func2["key"]']
+        with TemporaryDirectory() as output_dir:
+            generate_makefile(["build-func1:\n"], output_dir, targets)
+
+            with open(os.path.join(output_dir, TF_BATCH_TARGETS_FILENAME)) as targets_file:
+                self.assertEqual(json.load(targets_file), targets)
+            with open(os.path.join(output_dir, "Makefile")) as makefile:
+                self.assertEqual(makefile.read(), "build-func1:\n")
+
+    def test_remove_batch_build_output(self):
+        with TemporaryDirectory() as output_dir:
+            for filename in (TF_BATCH_OUTPUT_FILENAME, TF_BATCH_LOCK_FILENAME, TF_BATCH_TARGETS_FILENAME):
+                with open(os.path.join(output_dir, filename), "w") as f:
+                    f.write("{}")
+
+            remove_batch_build_output(output_dir)
+            # nothing left to remove
+            remove_batch_build_output(output_dir)
+
+            # the lock is held by a build which is still running
+            self.assertEqual(set(os.listdir(output_dir)), {TF_BATCH_LOCK_FILENAME, TF_BATCH_TARGETS_FILENAME})
+
+    def test_remove_batch_build_output_removes_stale_lock(self):
+        with TemporaryDirectory() as output_dir:
+            lock_path = os.path.join(output_dir, TF_BATCH_LOCK_FILENAME)
+            with open(lock_path, "w") as f:
+                f.write("1")
+            stale_time = time.time() - TF_BATCH_LOCK_STALE_AGE - 1
+            os.utime(lock_path, (stale_time, stale_time))
+
+            remove_batch_build_output(output_dir)
+
+            self.assertEqual(os.listdir(output_dir), [])
@@ -0,0 +1,175 @@
+"""Test reuse of the files generated by the Terraform prepare hook"""
+
+import json
+import os
+from pathlib import Path
+from subprocess import CalledProcessError
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from samcli.hook_packages.terraform.hooks.prepare.prepare_cache import (
+    PREPARE_CACHE_ENV_VAR,
+    PREPARE_FINGERPRINT_FILENAME,
+    PrepareCache,
+)
+
+TERRAFORM_VERSION = {"terraform_version": "1.5.7", "platform": "linux_amd64", "terraform_outdated": False}
+
+
+class TestPrepareCache(TestCase):
+    def setUp(self):
+        self.temp_dir = TemporaryDirectory()
+        self.project_dir = Path(self.temp_dir.name)
+        self.application_dir = self.project_dir.joinpath("app")
+        self.output_dir = self.application_dir.joinpath(".aws-sam-iacs", "iacs_metadata")
+        self.output_dir.mkdir(parents=True)
+        self.metadata_file = self.output_dir.joinpath("template.json")
+        self.metadata_file.write_text("{}")
+        self.application_dir.joinpath("main.tf").write_text('module "lambda" { source = "../modules/lambda" }')
+        self.application_dir.joinpath("terraform.tfvars").write_text('name = "function"')
+
+        self.module_dir = self.project_dir.joinpath("modules", "lambda")
+        self.module_dir.mkdir(parents=True)
+        self.module_dir.joinpath("main.tf").write_text('resource "aws_lambda_function" "this" {}')
+        modules_manifest = self.application_dir.joinpath(".terraform", "modules", "modules.json")
+        modules_manifest.parent.mkdir(parents=True)
+        modules_manifest.write_text(
+            json.dumps({"Modules": [{"Key": "", "Dir": "."}, {"Key": "lambda", "Dir": "../modules/lambda"}]})
+        )
+
+        self.run_patcher = patch("samcli.hook_packages.terraform.hooks.prepare.prepare_cache.run")
+        self.run_mock = self.run_patcher.start()
+        self.run_mock.return_value = Mock(stdout=json.dumps(TERRAFORM_VERSION).encode("utf-8"))
+        self.env_patcher = patch.dict(os.environ, {PREPARE_CACHE_ENV_VAR: "1"})
+        self.env_patcher.start()
+
+        self.cache = PrepareCache(str(self.output_dir), str(self.application_dir), str(self.project_dir))
+
+    def tearDown(self):
+        self.env_patcher.stop()
+        self.run_patcher.stop()
+        self.temp_dir.cleanup()
+
+    def test_must_reuse_files_generated_from_same_inputs(self):
+        self.assertFalse(self.cache.is_current(str(self.metadata_file)))
+
+        self.cache.store()
+
+        self.assertTrue(self.cache.is_current(str(self.metadata_file)))
+
+    def test_must_not_reuse_missing_metadata_file(self):
+        self.cache.store()
+        self.metadata_file.unlink()
+
+        self.assertFalse(self.cache.is_current(str(self.metadata_file)))
+
+    def test_must_not_reuse_after_invalidation(self):
+        self.cache.store()
+
+        self.cache.invalidate()
+        self.cache.invalidate()
+
+        self.assertFalse(self.output_dir.joinpath(PREPARE_FINGERPRINT_FILENAME).exists())
+        self.assertFalse(self.cache.is_current(str(self.metadata_file)))
+
+    def test_fingerprint_changes_with_inputs(self):
+        changes = [
+            lambda: self.application_dir.joinpath("main.tf").write_text('module "lambda" { source = "../other" }'),
+            lambda: self.application_dir.joinpath("outputs.tf.json").write_text("{}"),
+            lambda: self.application_dir.joinpath("terraform.tfvars").write_text('name = "other"'),
+            lambda: self.module_dir.joinpath("main.tf").write_text('resource "aws_lambda_function" "other" {}'),
+            lambda: self.application_dir.joinpath(".terraform.lock.hcl").write_text("# lock"),
+            lambda: self.application_dir.joinpath(".terraform", "environment").write_text("staging"),
+            lambda: os.environ.update({"TF_VAR_name": "other"}),
+            lambda: self.run_mock.return_value.configure_mock(
+                stdout=json.dumps(dict(TERRAFORM_VERSION, terraform_version="1.6.0")).encode("utf-8")
+            ),
+        ]
+        fingerprints = {self.cache.fingerprint()}
+        for change in changes:
+            change()
+            fingerprints.add(self.cache.fingerprint())
+
+        self.assertEqual(len(fingerprints), len(changes) + 1)
+
+    def test_fingerprint_changes_with_local_state(self):
+        state_file = self.application_dir.joinpath("terraform.tfstate")
+        state_file.write_text('{"serial": 1}')
+        fingerprint = self.cache.fingerprint()
+
+        state_file.write_text('{"serial": 2}')
+
+        self.assertNotEqual(self.cache.fingerprint(), fingerprint)
+
+    def test_fingerprint_changes_with_local_state_of_workspace(self):
+        self.application_dir.joinpath(".terraform", "environment").write_text("staging")
+        state_file = self.application_dir.joinpath("states", "staging", "terraform.tfstate")
+        state_file.parent.mkdir(parents=True)
+        state_file.write_text('{"serial": 1}')
+        self.application_dir.joinpath(".terraform", "terraform.tfstate").write_text(
+            json.dumps({"backend": {"type": "local", "config": {"path": None, "workspace_dir": "states"}}})
+        )
+        fingerprint = self.cache.fingerprint()
+
+        state_file.write_text('{"serial": 2}')
+
+        self.assertNotEqual(self.cache.fingerprint(), fingerprint)
+
+    def test_fingerprint_ignores_state_of_remote_backend(self):
+        self.application_dir.joinpath(".terraform", "terraform.tfstate").write_text(
+            json.dumps({"backend": {"type": "s3", "config": {"bucket": "state"}}})
+        )
+        state_file = self.application_dir.joinpath("terraform.tfstate")
+        state_file.write_text('{"serial": 1}')
+        fingerprint = self.cache.fingerprint()
+
+        state_file.write_text('{"serial": 2}')
+
+        self.assertEqual(self.cache.fingerprint(), fingerprint)
+
+    def test_fingerprint_ignores_files_terraform_does_not_read(self):
+        fingerprint = self.cache.fingerprint()
+
+        self.application_dir.joinpath("src").mkdir()
+        self.application_dir.joinpath("src", "app.py").write_text("def handler(event, context): pass")
+        self.application_dir.joinpath("src", "nested.tf").write_text("# not a module of the application")
+        self.run_mock.return_value.stdout = json.dumps(dict(TERRAFORM_VERSION, terraform_outdated=True)).encode()
+
+        self.assertEqual(self.cache.fingerprint(), fingerprint)
+
+    def test_must_not_cache_without_terraform_version(self):
+        self.run_mock.side_effect = CalledProcessError(1, ["terraform", "version", "-json"])
+
+        self.cache.store()
+
+        self.assertIsNone(self.cache.fingerprint())
+        self.assertFalse(self.output_dir.joinpath(PREPARE_FINGERPRINT_FILENAME).exists())
+
+    def test_fingerprint_of_plan_file(self):
+        plan_file = self.project_dir.joinpath("plan.json")
+        plan_file.write_text('{"planned_values": {}}')
+        cache = PrepareCache(str(self.output_dir), str(self.application_dir), str(self.project_dir), str(plan_file))
+
+        fingerprint = cache.fingerprint()
+        self.application_dir.joinpath("main.tf").write_text("# not read when the plan file is provided")
+        unchanged_fingerprint = cache.fingerprint()
+        plan_file.write_text('{"planned_values": {"root_module": {}}}')
+
+        self.assertEqual(unchanged_fingerprint, fingerprint)
+        self.assertNotEqual(cache.fingerprint(), fingerprint)
+        self.run_mock.assert_not_called()
+
+    def test_must_not_reuse_when_disabled(self):
+        self.cache.store()
+
+        with patch.dict(os.environ, {PREPARE_CACHE_ENV_VAR: "0"}):
+            self.assertFalse(self.cache.is_current(str(self.metadata_file)))
+
+    def test_must_be_disabled_by_default(self):
+        self.cache.store()
+
+        with patch.dict(os.environ):
+            del os.environ[PREPARE_CACHE_ENV_VAR]
+            self.assertFalse(PrepareCache.is_enabled())
+            self.assertFalse(self.cache.is_current(str(self.metadata_file)))
@@ -442,6 +442,24 @@ class TestResourceLinking(TestCase):
         self.assertEqual(len(results), 1)
         self.assertEqual(results[0].value, "layer.arn")
 
+    @patch("samcli.hook_packages.terraform.hooks.prepare.resource_linking._resolve_module_variable_uncached")
+    @patch("samcli.hook_packages.terraform.hooks.prepare.resource_linking._resolve_module_output_uncached")
+    def test_resolve_module_references_memoized(self, resolve_output_mock, resolve_variable_mock):
+        resolve_output_mock.return_value = [ResolvedReference("aws_lambda_layer_version.layer.arn", "module.layer")]
+        resolve_variable_mock.return_value = [ConstantValue("layer.arn")]
+        module = TFModule("module.layer", None, {}, {}, {}, {})
+
+        outputs = [_resolve_module_output(module, "arn") for _ in range(2)]
+        variables = [_resolve_module_variable(module, "arn") for _ in range(2)]
+
+        resolve_output_mock.assert_called_once_with(module, "arn")
+        resolve_variable_mock.assert_called_once_with(module, "arn")
+        self.assertEqual(outputs[0], outputs[1])
+        self.assertEqual(variables[0], variables[1])
+        # callers receive copies which they can extend without changing the memoized values
+        outputs[0].append(ConstantValue("other.arn"))
+        self.assertEqual(_resolve_module_output(module, "arn"), resolve_output_mock.return_value)
+
     @patch("samcli.hook_packages.terraform.hooks.prepare.resource_linking.get_configuration_address")
     @patch("samcli.hook_packages.terraform.hooks.prepare.resource_linking._clean_references_list")
     def test_resolve_module_variable_nested_variables(self, mock_clean_references, mock_get_configuration_address):
@@ -883,6 +901,23 @@ class TestResourceLinking(TestCase):
         self.assertEqual(len(results), 1)
         self.assertEqual(results[0].value, ["layer1.arn", "layer2.arn"])
 
+    @patch("samcli.hook_packages.terraform.hooks.prepare.resource_linking._resolve_resource_attribute_uncached")
+    def test_resolve_resource_attribute_memoized(self, resolve_attribute_mock):
+        resolve_attribute_mock.return_value = [ConstantValue(value=["layer1.arn"])]
+        resource = TFResource(
+            address="aws_lambda_function.func",
+            type="aws_lambda_function",
+            module=TFModule(None, None, {}, [], {}, {}),
+            attributes={"Layers": ConstantValue(value=["layer1.arn"])},
+        )
+
+        first_results = _resolve_resource_attribute(resource, "Layers")
+        first_results.clear()
+        results = _resolve_resource_attribute(resource, "Layers")
+
+        resolve_attribute_mock.assert_called_once_with(resource, "Layers")
+        self.assertEqual(results, [ConstantValue(value=["layer1.arn"])])
+
     @patch("samcli.hook_packages.terraform.hooks.prepare.resource_linking._resolve_module_variable")
     @patch("samcli.hook_packages.terraform.hooks.prepare.resource_linking._clean_references_list")
     @patch("samcli.hook_packages.terraform.hooks.prepare.resource_linking.get_configuration_address")
@@ -1365,6 +1400,20 @@ class TestResourceLinker(TestCase):
             cfn_resource, dest_resources
         )
 
+    def test_link_using_linking_fields_builds_destination_index_once(self):
+        resource_linker = ResourceLinker(self.sample_resource_linking_pair)
+        resource_linker._link_using_linking_fields({"Properties": {"Layers": ["applied_layer1.arn"]}})
+        # the destination resources are not scanned again for the next source resources
+        self.sample_resource_linking_pair.destination_resource_tf = {}
+        cfn_resource = {"Properties": {"Layers": ["applied_layer2.arn"]}}
+        resource_linker._link_using_linking_fields(cfn_resource)
+
+        self.sample_resource_linking_pair.cfn_resource_update_call_back_function.assert_called_with(
+            cfn_resource,
+            [LogicalIdReference(value="applied_layer2_logical_id", resource_type=TF_AWS_LAMBDA_LAYER_VERSION)],
+        )
+        self.assertEqual(len(resource_linker._destination_index), 2)
+
     def test_process_resolved_resources_constant_only(self):
         resource = Mock()
 
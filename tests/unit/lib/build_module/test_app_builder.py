@@ -417,7 +417,9 @@ class TestApplicationBuilder_build(TestCase):
 
         result = builder.build().artifacts
 
-        mock_parallel_build_strategy_class.assert_called_once_with(ANY, mock_cached_and_incremental_build_strategy)
+        mock_parallel_build_strategy_class.assert_called_once_with(
+            ANY, mock_cached_and_incremental_build_strategy, parallel_jobs=None
+        )
 
         mock_parallel_build_strategy.build.assert_called_once()
         self.assertEqual(result, mock_parallel_build_strategy.build())
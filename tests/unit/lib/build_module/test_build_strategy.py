@@ -1,4 +1,7 @@
 import itertools
+import os
+import threading
+import time
 from copy import deepcopy
 from typing import List, Dict
 from unittest import TestCase
@@ -16,6 +19,7 @@ from samcli.lib.build.build_strategy import (
     CachedBuildStrategy,
     CachedOrIncrementalBuildStrategyWrapper,
     IncrementalBuildStrategy,
+    FILE_CHECKSUM_CACHE_FILE_NAME,
     clean_redundant_folders,
 )
 from samcli.lib.utils import osutils
@@ -35,14 +39,17 @@ class BuildStrategyBaseTest(TestCase):
         self.function1_1.inlinecode = None
         self.function1_1.get_build_dir = Mock()
         self.function1_1.full_path = "function1_1"
+        self.function1_1.layers = []
         self.function1_2 = Mock()
         self.function1_2.inlinecode = None
         self.function1_2.get_build_dir = Mock()
         self.function1_2.full_path = "function1_2"
+        self.function1_2.layers = []
         self.function2 = Mock()
         self.function2.inlinecode = None
         self.function2.get_build_dir = Mock()
         self.function2.full_path = "function2"
+        self.function2.layers = []
 
         self.function_build_definition1 = FunctionBuildDefinition(
             "runtime", "codeuri", None, ZIP, X86_64, {}, "handler"
@@ -548,52 +555,117 @@ class CachedBuildStrategyTest(BuildStrategyBaseTest):
             cached_build_strategy._clean_redundant_cached()
             self.assertTrue(not redundant_cache_folder.exists())
 
+    def test_source_checksums_should_be_cached_between_builds(self):
+        with osutils.mkdir_temp() as temp_base_dir:
+            build_dir = Path(temp_base_dir, ".aws-sam", "build")
+            build_dir.mkdir(parents=True)
+            cache_dir = Path(temp_base_dir, ".aws-sam", "cache")
+            cache_dir.mkdir(parents=True)
+            artifacts_dir = Path(build_dir, "Function")
+            artifacts_dir.mkdir()
+            source_file = Path(temp_base_dir, "function", "app.py")
+            source_file.parent.mkdir()
+            source_file.write_text("print('hello')")
+            os.utime(source_file, (0, 0))
+
+            build_graph = BuildGraph(str(build_dir))
+            build_definition = Mock(codeuri="function", packagetype=ZIP, uuid="uuid", source_hash=None, functions=[])
+            delegate_build_strategy = Mock()
+            delegate_build_strategy.build_single_function_definition.return_value = {"Function": str(artifacts_dir)}
+
+            cached_build_strategy = CachedBuildStrategy(
+                build_graph, delegate_build_strategy, temp_base_dir, build_dir, cache_dir
+            )
+            with cached_build_strategy:
+                cached_build_strategy.build_single_function_definition(build_definition)
+
+            self.assertTrue(Path(cache_dir, FILE_CHECKSUM_CACHE_FILE_NAME).is_file())
+            with patch("samcli.lib.utils.hash.file_checksum") as file_checksum_mock:
+                cached_build_strategy = CachedBuildStrategy(
+                    build_graph, delegate_build_strategy, temp_base_dir, build_dir, cache_dir
+                )
+                cached_build_strategy.build_single_function_definition(build_definition)
+                file_checksum_mock.assert_not_called()
+            delegate_build_strategy.build_single_function_definition.assert_called_once()
+
 
 class ParallelBuildStrategyTest(BuildStrategyBaseTest):
-    @patch("samcli.lib.build.build_strategy.AsyncContext")
-    def test_given_async_context_should_call_expected_methods(self, patched_async_context):
+    def test_function_build_should_wait_only_for_its_layers(self):
+        layer = Mock(full_path="layer1")
+        self.function2.layers = [layer]
+        layer2_started = threading.Event()
+        release_layer2 = threading.Event()
+        events = []
+
+        def build_layer(layer_definition):
+            if layer_definition is self.layer_build_definition2:
+                layer2_started.set()
+                release_layer2.wait(5)
+            events.append(layer_definition.full_path)
+            return {layer_definition.full_path: "layer_location"}
+
+        def build_function(build_definition):
+            # the first function does not use any layer, so it must not wait for the slow layer2 build
+            if build_definition is self.function_build_definition1:
+                self.assertTrue(layer2_started.wait(5))
+                release_layer2.set()
+            events.append(build_definition.functions[0].full_path)
+            return {build_definition.functions[0].full_path: "function_location"}
+
         delegate_build_strategy = MagicMock(wraps=_TestBuildStrategy(self.build_graph))
-        parallel_build_strategy = ParallelBuildStrategy(self.build_graph, delegate_build_strategy)
+        delegate_build_strategy.build_single_layer_definition.side_effect = build_layer
+        delegate_build_strategy.build_single_function_definition.side_effect = build_function
 
-        mock_layer_async_context = Mock()
-        mock_function_async_context = Mock()
-        patched_async_context.side_effect = [mock_layer_async_context, mock_function_async_context]
+        results = ParallelBuildStrategy(self.build_graph, delegate_build_strategy, parallel_jobs=4).build()
 
-        layer_build_results: List[Dict[str, str]] = [
-            {"layer1": "layer_location1"},
-            {"layer2": "layer_location2"},
-        ]
-        function_build_results: List[Dict[str, str]] = [
-            {"function1": "function_location1"},
-            {"function2": "function_location2"},
-        ]
-        mock_layer_async_context.run_async.return_value = layer_build_results
-        mock_function_async_context.run_async.return_value = function_build_results
+        self.assertLess(events.index("layer1"), events.index("function2"))
+        self.assertLess(events.index("function1_1"), events.index("layer2"))
+        self.assertEqual(
+            list(results),
+            ["layer1", "layer2", "function1_1", "function2"],
+        )
 
-        results = parallel_build_strategy.build()
+    def test_should_raise_build_error_and_skip_dependent_builds(self):
+        self.function2.layers = [Mock(full_path="layer1")]
+        delegate_build_strategy = MagicMock(wraps=_TestBuildStrategy(self.build_graph))
+        delegate_build_strategy.build_single_layer_definition.side_effect = [ValueError("layer failed"), {}]
 
-        expected_results = {}
-        for given_build_result in layer_build_results + function_build_results:
-            expected_results.update(given_build_result)
-        self.assertEqual(results, expected_results)
+        with self.assertRaises(ValueError):
+            ParallelBuildStrategy(self.build_graph, delegate_build_strategy, parallel_jobs=1).build()
 
-        # assert that result has collected
-        mock_layer_async_context.run_async.assert_has_calls([call()])
-        mock_function_async_context.run_async.assert_has_calls([call()])
+        delegate_build_strategy.build_single_function_definition.assert_not_called()
 
-        # assert that delegated function calls have been registered in async context
-        mock_layer_async_context.add_async_task.assert_has_calls(
-            [
-                call(parallel_build_strategy.build_single_layer_definition, self.layer_build_definition1),
-                call(parallel_build_strategy.build_single_layer_definition, self.layer_build_definition2),
-            ]
-        )
-        mock_function_async_context.add_async_task.assert_has_calls(
-            [
-                call(parallel_build_strategy.build_single_function_definition, self.function_build_definition1),
-                call(parallel_build_strategy.build_single_function_definition, self.function_build_definition2),
-            ]
-        )
+    @parameterized.expand([(None, 12), (1, 1), (5, 5)])
+    @patch("samcli.lib.build.build_strategy.os.cpu_count")
+    def test_worker_pool_size(self, parallel_jobs, expected_jobs, cpu_count_mock):
+        cpu_count_mock.return_value = 8
+
+        parallel_build_strategy = ParallelBuildStrategy(self.build_graph, Mock(), parallel_jobs=parallel_jobs)
+
+        self.assertEqual(parallel_build_strategy._parallel_jobs, expected_jobs)
+
+    def test_container_builds_should_share_the_build_limit(self):
+        self.function_build_definition2.packagetype = IMAGE
+        lock = threading.Lock()
+        running = [0]
+        max_running = [0]
+
+        def build(build_definition):
+            with lock:
+                running[0] += 1
+                max_running[0] = max(max_running[0], running[0])
+            time.sleep(0.05)
+            with lock:
+                running[0] -= 1
+            return {}
+
+        delegate_build_strategy = MagicMock(wraps=_TestBuildStrategy(self.build_graph))
+        delegate_build_strategy.build_single_layer_definition.side_effect = build
+        delegate_build_strategy.build_single_function_definition.side_effect = build
+
+        ParallelBuildStrategy(self.build_graph, delegate_build_strategy, parallel_jobs=2).build()
+
+        self.assertEqual(max_running[0], 2)
 
     def test_given_delegate_strategy_it_should_call_delegated_build_methods(self):
         # create a mock delegate build strategy
@@ -817,6 +889,40 @@ class TestCachedOrIncrementalBuildStrategyWrapper(TestCase):
                 clean_cache_mock.assert_called_once()
                 clean_dep_mock.assert_called_once()
 
+    def test_parallel_build_should_save_file_checksums(self, mocked_read, mocked_write):
+        with osutils.mkdir_temp() as temp_base_dir:
+            build_dir = Path(temp_base_dir, ".aws-sam", "build")
+            build_dir.mkdir(parents=True)
+            cache_dir = Path(temp_base_dir, ".aws-sam", "cache")
+            cache_dir.mkdir(parents=True)
+            artifacts_dir = Path(build_dir, "Function")
+            artifacts_dir.mkdir()
+            source_file = Path(temp_base_dir, "function", "main.go")
+            source_file.parent.mkdir()
+            source_file.write_text("package main")
+            os.utime(source_file, (0, 0))
+
+            build_graph = BuildGraph(str(build_dir))
+            build_definition = FunctionBuildDefinition("go1.x", "function", None, ZIP, X86_64, {}, "handler")
+            build_graph.put_function_build_definition(build_definition, Mock(full_path="Function", layers=[]))
+            delegate_build_strategy = Mock()
+            delegate_build_strategy.build_single_function_definition.return_value = {"Function": str(artifacts_dir)}
+
+            cached_build_strategy = CachedOrIncrementalBuildStrategyWrapper(
+                build_graph,
+                delegate_build_strategy,
+                temp_base_dir,
+                str(build_dir),
+                str(cache_dir),
+                None,
+                False,
+                False,
+            )
+            ParallelBuildStrategy(build_graph, cached_build_strategy).build()
+
+            delegate_build_strategy.build_single_function_definition.assert_called_once_with(build_definition)
+            self.assertTrue(Path(cache_dir, FILE_CHECKSUM_CACHE_FILE_NAME).is_file())
+
     @parameterized.expand(
         [
             ("python", True),
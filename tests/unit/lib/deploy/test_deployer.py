@@ -30,6 +30,48 @@ class MockPaginator:
         return self.resp
 
 
+class MockStackEventsPaginator:
+    """
+    Returns the next page of events of each stack, and the last one once they are all consumed
+    """
+
+    def __init__(self, resp_by_stack):
+        self.resp_by_stack = resp_by_stack
+
+    def paginate(self, StackName=None):
+        responses = self.resp_by_stack[StackName]
+        return responses.pop(0) if len(responses) > 1 else responses[0]
+
+
+NESTED_STACK_EVENTS_START = datetime(2022, 1, 1, 16, 42, 0, 0, timezone.utc)
+ROOT_STACK_ID = "arn:aws:cloudformation:region:accountId:stack/test/uuid"
+NESTED_STACK_ID = "arn:aws:cloudformation:region:accountId:stack/test-Nested-1/uuid"
+
+
+def stack_event(stack_id, seconds, status, stack_name=None, physical_id=None):
+    return {
+        "StackId": stack_id,
+        "EventId": str(uuid.uuid4()),
+        "StackName": stack_name or stack_id.split("/")[1],
+        "LogicalResourceId": stack_name or "Nested",
+        "PhysicalResourceId": physical_id or stack_id,
+        "ResourceType": "AWS::CloudFormation::Stack",
+        "Timestamp": NESTED_STACK_EVENTS_START + timedelta(seconds=seconds),
+        "ResourceStatus": status,
+    }
+
+
+def function_event(seconds, status):
+    return {
+        "StackId": NESTED_STACK_ID,
+        "EventId": str(uuid.uuid4()),
+        "Timestamp": NESTED_STACK_EVENTS_START + timedelta(seconds=seconds),
+        "ResourceStatus": status,
+        "ResourceType": "AWS::Lambda::Function",
+        "LogicalResourceId": "Function",
+    }
+
+
 class MockChangesetWaiter:
     def __init__(self, ex=None):
         self.ex = ex
@@ -844,9 +886,158 @@ class TestDeployer(CustomTestCase):
             patched_pprint_columns.call_args_list[2][1]["columns"],
         )
 
-    @patch("samcli.lib.deploy.deployer.math")
     @patch("time.sleep")
-    def test_describe_stack_events_exceptions(self, patched_time, patched_math):
+    @patch("samcli.lib.deploy.deployer.pprint_columns")
+    def test_describe_stack_events_nested_stacks(self, patched_pprint_columns, patched_time):
+        root_started = stack_event(ROOT_STACK_ID, 1, "UPDATE_IN_PROGRESS", stack_name="test")
+        nested_started = stack_event(ROOT_STACK_ID, 2, "UPDATE_IN_PROGRESS", physical_id=NESTED_STACK_ID)
+        nested_self_started = stack_event(NESTED_STACK_ID, 3, "UPDATE_IN_PROGRESS", stack_name="test-Nested-1")
+        function_started = function_event(4, "UPDATE_IN_PROGRESS")
+        function_done = function_event(5, "UPDATE_COMPLETE")
+        nested_self_done = stack_event(NESTED_STACK_ID, 6, "UPDATE_COMPLETE", stack_name="test-Nested-1")
+        nested_done = stack_event(ROOT_STACK_ID, 7, "UPDATE_COMPLETE", physical_id=NESTED_STACK_ID)
+        root_done = stack_event(ROOT_STACK_ID, 8, "UPDATE_COMPLETE", stack_name="test")
+
+        # describe_stack_events is in reverse chronological order
+        self.deployer._client.get_paginator = MagicMock(
+            return_value=MockStackEventsPaginator(
+                {
+                    "test": [
+                        [{"StackEvents": [nested_started, root_started]}],
+                        [{"StackEvents": [nested_started, root_started]}],
+                        [{"StackEvents": [root_done, nested_done, nested_started, root_started]}],
+                    ],
+                    NESTED_STACK_ID: [
+                        [{"StackEvents": [function_started, nested_self_started]}],
+                        [{"StackEvents": [nested_self_done, function_done, function_started, nested_self_started]}],
+                    ],
+                }
+            )
+        )
+
+        self.deployer.describe_stack_events("test", utc_to_timestamp(NESTED_STACK_EVENTS_START))
+
+        statuses = [
+            (call_args[1]["columns"][0], call_args[1]["columns"][2])
+            for call_args in patched_pprint_columns.call_args_list
+        ]
+        self.assertEqual(
+            statuses,
+            [
+                ("UPDATE_IN_PROGRESS", "test"),
+                ("UPDATE_IN_PROGRESS", "Nested"),
+                ("UPDATE_IN_PROGRESS", "test-Nested-1"),
+                ("UPDATE_IN_PROGRESS", "Function"),
+                ("UPDATE_COMPLETE", "Function"),
+                ("UPDATE_COMPLETE", "test-Nested-1"),
+                ("UPDATE_COMPLETE", "Nested"),
+                ("UPDATE_COMPLETE", "test"),
+            ],
+        )
+
+    @patch("time.sleep")
+    @patch("samcli.lib.deploy.deployer.pprint_columns")
+    def test_describe_stack_events_polls_backed_off_nested_stacks_before_returning(
+        self, patched_pprint_columns, patched_time
+    ):
+        root_started = stack_event(ROOT_STACK_ID, 1, "UPDATE_IN_PROGRESS", stack_name="test")
+        nested_started = stack_event(ROOT_STACK_ID, 2, "UPDATE_IN_PROGRESS", physical_id=NESTED_STACK_ID)
+        nested_self_started = stack_event(NESTED_STACK_ID, 3, "UPDATE_IN_PROGRESS", stack_name="test-Nested-1")
+        nested_self_done = stack_event(NESTED_STACK_ID, 6, "UPDATE_COMPLETE", stack_name="test-Nested-1")
+        root_done = stack_event(ROOT_STACK_ID, 8, "UPDATE_COMPLETE", stack_name="test")
+        root_pages = [[nested_started, root_started]] * 5 + [[root_done, nested_started, root_started]]
+        root_done_polled = []
+
+        class Paginator:
+            def paginate(self, StackName=None):
+                if StackName == "test":
+                    events = root_pages.pop(0) if len(root_pages) > 1 else root_pages[0]
+                    root_done_polled.append(root_done in events)
+                    return [{"StackEvents": events}]
+                # the nested stack stays quiet, and completes at the same time as the root stack
+                if any(root_done_polled):
+                    return [{"StackEvents": [nested_self_done, nested_self_started]}]
+                return [{"StackEvents": [nested_self_started]}]
+
+        self.deployer._client.get_paginator = MagicMock(return_value=Paginator())
+
+        self.deployer.describe_stack_events("test", utc_to_timestamp(NESTED_STACK_EVENTS_START))
+
+        statuses = [
+            (call_args[1]["columns"][0], call_args[1]["columns"][2])
+            for call_args in patched_pprint_columns.call_args_list
+        ]
+        self.assertIn(("UPDATE_COMPLETE", "test"), statuses)
+        self.assertIn(("UPDATE_COMPLETE", "test-Nested-1"), statuses)
+        self.assertEqual(len(statuses), 5)
+
+    @patch("time.sleep")
+    @patch("samcli.lib.deploy.deployer.pprint_columns")
+    def test_describe_stack_events_resumes_nested_stack_updated_again(self, patched_pprint_columns, patched_time):
+        root_started = stack_event(ROOT_STACK_ID, 1, "UPDATE_IN_PROGRESS", stack_name="test")
+        nested_started = stack_event(ROOT_STACK_ID, 2, "UPDATE_IN_PROGRESS", physical_id=NESTED_STACK_ID)
+        nested_self_started = stack_event(NESTED_STACK_ID, 3, "UPDATE_IN_PROGRESS", stack_name="test-Nested-1")
+        nested_self_done = stack_event(NESTED_STACK_ID, 4, "UPDATE_COMPLETE", stack_name="test-Nested-1")
+        nested_rollback = stack_event(ROOT_STACK_ID, 5, "UPDATE_ROLLBACK_IN_PROGRESS", physical_id=NESTED_STACK_ID)
+        nested_self_rollback = stack_event(
+            NESTED_STACK_ID, 6, "UPDATE_ROLLBACK_IN_PROGRESS", stack_name="test-Nested-1"
+        )
+        nested_self_rolled_back = stack_event(
+            NESTED_STACK_ID, 7, "UPDATE_ROLLBACK_COMPLETE", stack_name="test-Nested-1"
+        )
+        root_rolled_back = stack_event(ROOT_STACK_ID, 8, "UPDATE_ROLLBACK_COMPLETE", stack_name="test")
+
+        # describe_stack_events is in reverse chronological order
+        self.deployer._client.get_paginator = MagicMock(
+            return_value=MockStackEventsPaginator(
+                {
+                    "test": [
+                        [{"StackEvents": [nested_started, root_started]}],
+                        [{"StackEvents": [nested_started, root_started]}],
+                        [{"StackEvents": [nested_rollback, nested_started, root_started]}],
+                        [{"StackEvents": [nested_rollback, nested_started, root_started]}],
+                        [{"StackEvents": [root_rolled_back, nested_rollback, nested_started, root_started]}],
+                    ],
+                    NESTED_STACK_ID: [
+                        [{"StackEvents": [nested_self_done, nested_self_started]}],
+                        [
+                            {
+                                "StackEvents": [
+                                    nested_self_rolled_back,
+                                    nested_self_rollback,
+                                    nested_self_done,
+                                    nested_self_started,
+                                ]
+                            }
+                        ],
+                    ],
+                }
+            )
+        )
+
+        self.deployer.describe_stack_events("test", utc_to_timestamp(NESTED_STACK_EVENTS_START))
+
+        statuses = [
+            (call_args[1]["columns"][0], call_args[1]["columns"][2])
+            for call_args in patched_pprint_columns.call_args_list
+        ]
+        self.assertEqual(
+            statuses,
+            [
+                ("UPDATE_IN_PROGRESS", "test"),
+                ("UPDATE_IN_PROGRESS", "Nested"),
+                ("UPDATE_IN_PROGRESS", "test-Nested-1"),
+                ("UPDATE_COMPLETE", "test-Nested-1"),
+                ("UPDATE_ROLLBACK_IN_PROGRESS", "Nested"),
+                ("UPDATE_ROLLBACK_IN_PROGRESS", "test-Nested-1"),
+                ("UPDATE_ROLLBACK_COMPLETE", "test-Nested-1"),
+                ("UPDATE_ROLLBACK_COMPLETE", "test"),
+            ],
+        )
+
+    @patch("samcli.lib.deploy.deployer.math.pow", wraps=math.pow)
+    @patch("time.sleep")
+    def test_describe_stack_events_exceptions(self, patched_time, patched_pow):
         self.deployer._client.get_paginator = MagicMock(
             side_effect=[
                 ClientError(
@@ -866,12 +1057,12 @@ class TestDeployer(CustomTestCase):
         # No exception raised, we return with a log message, this is because,
         # the changeset is still getting executed, but displaying them is getting throttled.
         self.deployer.describe_stack_events("test", time.time())
-        self.assertEqual(patched_math.pow.call_count, 3)
-        self.assertEqual(patched_math.pow.call_args_list, [call(2, 1), call(2, 2), call(2, 3)])
+        self.assertEqual(patched_pow.call_count, 3)
+        self.assertEqual(patched_pow.call_args_list, [call(2, 1), call(2, 2), call(2, 3)])
 
-    @patch("samcli.lib.deploy.deployer.math")
+    @patch("samcli.lib.deploy.deployer.math.pow", wraps=math.pow)
     @patch("time.sleep")
-    def test_describe_stack_events_resume_after_exceptions(self, patched_time, patched_math):
+    def test_describe_stack_events_resume_after_exceptions(self, patched_time, patched_pow):
         start_timestamp = datetime(2022, 1, 1, 16, 42, 0, 0, timezone.utc)
 
         self.deployer._client.get_paginator = MagicMock(
@@ -947,8 +1138,8 @@ class TestDeployer(CustomTestCase):
         )
 
         self.deployer.describe_stack_events("test", utc_to_timestamp(start_timestamp) - 1)
-        self.assertEqual(patched_math.pow.call_count, 3)
-        self.assertEqual(patched_math.pow.call_args_list, [call(2, 1), call(2, 2), call(2, 3)])
+        self.assertEqual(patched_pow.call_count, 3)
+        self.assertEqual(patched_pow.call_args_list, [call(2, 1), call(2, 2), call(2, 3)])
 
     @patch("samcli.lib.deploy.deployer.math.pow", wraps=math.pow)
     @patch("time.sleep")
@@ -1019,11 +1210,11 @@ class TestDeployer(CustomTestCase):
 
         self.deployer.describe_stack_events("test", utc_to_timestamp(start_timestamp) - 1)
 
-        # There are 2 sleep call for exceptions (backoff + regular one at 0)
-        self.assertEqual(patched_time.call_count, 9)
+        # The poll after an exception waits for the backoff, a successful poll waits for client_sleep again
+        self.assertEqual(patched_time.call_count, 6)
         self.assertEqual(
             patched_time.call_args_list,
-            [call(0.5), call(0.5), call(2.0), call(0), call(4.0), call(0), call(0.5), call(2.0), call(0)],
+            [call(0.5), call(0.5), call(2.0), call(4.0), call(0.5), call(2.0)],
         )
         self.assertEqual(patched_pow.call_count, 3)
         self.assertEqual(patched_pow.call_args_list, [call(2, 1), call(2, 2), call(2, 1)])
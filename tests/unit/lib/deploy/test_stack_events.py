@@ -0,0 +1,118 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from samcli.lib.deploy.stack_events import SeenEventIds, StackEventPoller, get_nested_stack_id
+from samcli.lib.utils.time import utc_to_timestamp
+
+START = datetime(2022, 1, 1, 16, 42, 0, 0, timezone.utc)
+NESTED_STACK_ID = "arn:aws:cloudformation:region:accountId:stack/test-Nested-1/uuid"
+
+
+def _event(seconds, logical_id="mybucket", status="CREATE_IN_PROGRESS"):
+    return {
+        "EventId": str(uuid.uuid4()),
+        "Timestamp": START + timedelta(seconds=seconds),
+        "ResourceStatus": status,
+        "ResourceType": "s3",
+        "LogicalResourceId": logical_id,
+    }
+
+
+class TestSeenEventIds(TestCase):
+    def test_must_forget_old_events(self):
+        seen = SeenEventIds()
+        seen.add("old", 1)
+        seen.add("new", 2)
+        seen.add("newer", 2)
+
+        seen.forget_before(2)
+
+        self.assertNotIn("old", seen)
+        self.assertIn("new", seen)
+        self.assertIn("newer", seen)
+        self.assertEqual(len(seen), 2)
+
+    def test_must_bound_number_of_events(self):
+        seen = SeenEventIds(max_size=2)
+        for index in range(5):
+            seen.add(str(index), 1)
+
+        self.assertEqual(len(seen), 2)
+        self.assertIn("4", seen)
+        self.assertNotIn("2", seen)
+
+
+class TestStackEventPoller(TestCase):
+    def setUp(self):
+        self.client = MagicMock()
+        self.poller = StackEventPoller(
+            self.client, "test", utc_to_timestamp(START), poll_interval=0.5, max_poll_interval=2
+        )
+
+    def _set_events(self, *events):
+        # describe_stack_events is in reverse chronological order
+        self.client.get_paginator.return_value.paginate.return_value = [{"StackEvents": list(reversed(events))}]
+
+    def test_must_return_new_events_in_chronological_order(self):
+        first, second = _event(1), _event(2)
+        self._set_events(_event(0), first, second)
+
+        self.assertEqual(self.poller.poll(), [first, second])
+        self.assertEqual(self.poller.time_stamp_marker, utc_to_timestamp(second["Timestamp"]))
+        self.client.get_paginator.return_value.paginate.assert_called_with(StackName="test")
+
+    def test_must_return_events_sharing_time_stamp_of_last_poll(self):
+        first = _event(1)
+        self._set_events(first)
+        self.poller.poll()
+
+        same_time = _event(1, "mykms")
+        self._set_events(first, same_time)
+
+        self.assertEqual(self.poller.poll(), [same_time])
+
+    def test_must_poll_less_often_while_stack_is_quiet(self):
+        self._set_events()
+        delays = []
+        for _ in range(4):
+            self.poller.poll()
+            delays.append(self.poller.delay)
+
+        self.assertEqual(delays, [0.75, 1.125, 1.6875, 2])
+
+        self._set_events(_event(1))
+        self.poller.poll()
+        self.assertEqual(self.poller.delay, 0.5)
+
+
+class TestGetNestedStackId(TestCase):
+    def test_must_return_nested_stack_in_progress(self):
+        event = {
+            "StackId": "arn:aws:cloudformation:region:accountId:stack/test/uuid",
+            "ResourceType": "AWS::CloudFormation::Stack",
+            "PhysicalResourceId": NESTED_STACK_ID,
+            "ResourceStatus": "UPDATE_IN_PROGRESS",
+        }
+
+        self.assertEqual(get_nested_stack_id(event), NESTED_STACK_ID)
+
+    def test_must_ignore_other_events(self):
+        stack_id = "arn:aws:cloudformation:region:accountId:stack/test/uuid"
+        base = {"StackId": stack_id, "ResourceType": "AWS::CloudFormation::Stack"}
+
+        # root stack itself
+        self.assertIsNone(
+            get_nested_stack_id({**base, "PhysicalResourceId": stack_id, "ResourceStatus": "UPDATE_IN_PROGRESS"})
+        )
+        # nested stack not created yet
+        self.assertIsNone(
+            get_nested_stack_id({**base, "PhysicalResourceId": "", "ResourceStatus": "CREATE_IN_PROGRESS"})
+        )
+        # nested stack done
+        self.assertIsNone(
+            get_nested_stack_id({**base, "PhysicalResourceId": NESTED_STACK_ID, "ResourceStatus": "CREATE_COMPLETE"})
+        )
+        # other resources
+        self.assertIsNone(get_nested_stack_id(_event(1)))
@@ -1121,3 +1121,84 @@ class TestIntrinsicResolverInitialization(TestCase):
 
         resolver.set_intrinsic_key_function_map({"key": lambda_func})
         self.assertTrue(resolver.intrinsic_key_function_map.get("key") == lambda_func)
+
+
+class TestIntrinsicResolverMemoization(TestCase):
+    def setUp(self):
+        self.template = {
+            "Parameters": {"Stage": {"Type": "String", "Default": "prod"}},
+            "Conditions": {
+                "IsProd": {"Fn::Equals": [{"Ref": "Stage"}, "prod"]},
+                "IsNotProd": {"Fn::Not": [{"Condition": "IsProd"}]},
+            },
+            "Resources": {
+                "Function": {
+                    "Type": "AWS::Lambda::Function",
+                    "DependsOn": "Queue",
+                    "Properties": {
+                        "Layers": [{"Ref": "Layer"}],
+                        "Role": {"Fn::GetAtt": ["Role", "Arn"]},
+                        "MemorySize": {"Fn::If": ["IsProd", 1024, {"Fn::If": ["IsNotProd", 128, 256]}]},
+                    },
+                },
+                "Layer": {
+                    "Type": "AWS::Lambda::LayerVersion",
+                    "Properties": {"Description": {"Fn::Sub": "${Bucket.Arn} in ${AWS::Region}"}},
+                },
+                "Role": {"Type": "AWS::IAM::Role", "Properties": {"RoleName": {"Ref": "Stage"}}},
+                "Queue": {"Type": "AWS::SQS::Queue", "Properties": {"QueueName": {"Ref": "Stage"}}},
+                "Bucket": {"Type": "AWS::S3::Bucket", "Properties": {"BucketName": {"Ref": "Stage"}}},
+                "Other": {"Type": "AWS::SNS::Topic", "Properties": {"TopicName": {"Ref": "Stage"}}},
+            },
+        }
+        self.original_template = deepcopy(self.template)
+        self.resolver = IntrinsicResolver(
+            template=self.template, symbol_resolver=IntrinsicsSymbolTable(template=self.template)
+        )
+
+    def test_must_not_modify_template(self):
+        resolved = self.resolver.resolve_template()
+
+        self.assertEqual(resolved["Resources"]["Role"]["Properties"]["RoleName"], "prod")
+        self.assertEqual(self.template, self.original_template)
+        self.assertIsNot(resolved["Parameters"], self.template["Parameters"])
+
+    def test_must_find_referenced_resources(self):
+        self.assertEqual(
+            self.resolver.get_referenced_resources(["Function"]), {"Function", "Layer", "Role", "Queue", "Bucket"}
+        )
+        self.assertEqual(self.resolver.get_referenced_resources(["Other", "Missing"]), {"Other"})
+
+    def test_must_resolve_requested_resources_only(self):
+        resolved = self.resolver.resolve_template(logical_ids=["Layer"])
+
+        self.assertEqual(
+            resolved["Resources"]["Layer"]["Properties"]["Description"],
+            "arn:aws:lambda:us-east-1:123456789012:function:Bucket in us-east-1",
+        )
+        self.assertEqual(resolved["Resources"]["Bucket"]["Properties"]["BucketName"], "prod")
+        self.assertEqual(resolved["Resources"]["Other"], self.template["Resources"]["Other"])
+        self.assertIsNot(resolved["Resources"]["Other"], self.template["Resources"]["Other"])
+
+    def test_must_resolve_single_resource(self):
+        resolved = self.resolver.resolve_resource("Function")
+
+        self.assertEqual(resolved["Properties"]["MemorySize"], 1024)
+        self.assertIs(self.resolver.resolve_resource("Function"), resolved)
+        self.assertIsNone(self.resolver.resolve_resource("Missing"))
+
+    def test_must_evaluate_each_condition_once(self):
+        with patch.object(self.resolver, "handle_fn_equals", wraps=self.resolver.handle_fn_equals) as equals_mock:
+            self.resolver.conditional_key_function_map[IntrinsicResolver.FN_EQUALS] = equals_mock
+            for _ in range(3):
+                self.resolver.intrinsic_property_resolver({"Fn::If": ["IsNotProd", "a", "b"]}, False)
+                self.resolver.intrinsic_property_resolver({"Fn::If": ["IsProd", "a", "b"]}, False)
+
+        equals_mock.assert_called_once()
+
+    def test_must_resolve_selected_value_of_fn_if_only(self):
+        result = self.resolver.intrinsic_property_resolver(
+            {"Fn::If": ["IsProd", "selected", {"Fn::Select": ["not a number", []]}]}, False
+        )
+
+        self.assertEqual(result, "selected")
@@ -0,0 +1,317 @@
+import threading
+import time
+from unittest import TestCase
+from unittest.mock import MagicMock, Mock, patch
+
+import botocore.session
+from botocore.exceptions import ClientError
+from botocore.stub import Stubber
+
+from samcli.lib.observability.cw_logs.cw_log_event import CWLogEvent
+from samcli.lib.observability.cw_logs.cw_log_groups_puller import MAX_FETCH_WORKERS, CWLogGroupsPuller
+from samcli.lib.observability.cw_logs.cw_log_puller import CWLogPuller
+from samcli.lib.utils.time import to_datetime
+
+ARN_PREFIX = "arn:aws:logs:us-east-1:123456789012:log-group:"
+
+
+def _make_logs_client():
+    return botocore.session.get_session().create_client("logs", region_name="us-east-1")
+
+
+def _live_tail_result(log_group_name, timestamp, message):
+    return {
+        "logStreamName": "stream",
+        "logGroupIdentifier": ARN_PREFIX + log_group_name,
+        "message": message,
+        "timestamp": timestamp,
+        "ingestionTime": timestamp,
+    }
+
+
+class TestCWLogGroupsPuller_load_time_period(TestCase):
+    def test_must_merge_events_of_log_groups_in_order(self):
+        consumer = Mock()
+        pullers = []
+        stubbers = []
+        for log_group_name, timestamps in [("group1", [1, 4, 5]), ("group2", [2, 3, 6])]:
+            logs_client = _make_logs_client()
+            stubber = Stubber(logs_client)
+            stubber.add_response(
+                "filter_log_events",
+                {"events": [{"timestamp": timestamp, "message": log_group_name} for timestamp in timestamps]},
+                {"logGroupName": log_group_name, "interleaved": True, "startTime": 1, "endTime": 10},
+            )
+            stubber.activate()
+            stubbers.append(stubber)
+            pullers.append(CWLogPuller(logs_client, consumer, log_group_name))
+
+        puller = CWLogGroupsPuller(Mock(), Mock(), pullers)
+        puller.load_time_period(to_datetime(1), to_datetime(10))
+
+        for stubber in stubbers:
+            stubber.assert_no_pending_responses()
+        consumed = [(args[0].timestamp, args[0].cw_log_group) for (args, _) in consumer.consume.call_args_list]
+        self.assertEqual(
+            consumed,
+            [(1, "group1"), (2, "group2"), (3, "group2"), (4, "group1"), (5, "group1"), (6, "group2")],
+        )
+
+    def test_must_show_events_before_all_of_them_are_fetched(self):
+        consumer = Mock()
+        first_event_consumed = threading.Event()
+        consumer.consume.side_effect = lambda event: first_event_consumed.set()
+
+        def paginated_events(log_group_name, first_page, second_page):
+            yield self._make_events(log_group_name, first_page)
+            # the next page is only fetched once the first events are shown
+            if not first_event_consumed.wait(5):
+                raise TimeoutError("Events were not shown before all of them were fetched")
+            yield self._make_events(log_group_name, second_page)
+
+        pullers = [Mock(cw_log_group="group1", consumer=consumer), Mock(cw_log_group="group2", consumer=consumer)]
+        pullers[0].fetch_pages.return_value = paginated_events("group1", [1, 2], [5])
+        pullers[1].fetch_pages.return_value = paginated_events("group2", [3], [4])
+
+        CWLogGroupsPuller(Mock(), Mock(), pullers).load_time_period(to_datetime(1), to_datetime(10))
+
+        consumed = [(args[0].timestamp, args[0].cw_log_group) for (args, _) in consumer.consume.call_args_list]
+        self.assertEqual(consumed, [(1, "group1"), (2, "group1"), (3, "group2"), (4, "group2"), (5, "group1")])
+
+    def test_must_raise_fetch_errors(self):
+        consumer = Mock()
+
+        def failing_events():
+            yield self._make_events("group1", [1])
+            raise ClientError({"Error": {"Code": "AccessDeniedException"}}, "FilterLogEvents")
+
+        pullers = [Mock(cw_log_group="group1", consumer=consumer), Mock(cw_log_group="group2", consumer=consumer)]
+        pullers[0].fetch_pages.return_value = failing_events()
+        pullers[1].fetch_pages.return_value = iter([self._make_events("group2", [2])])
+
+        with self.assertRaises(ClientError):
+            CWLogGroupsPuller(Mock(), Mock(), pullers).load_time_period(to_datetime(1), to_datetime(10))
+
+        self.assertEqual(consumer.consume.call_args[0][0].timestamp, 1)
+
+    def test_must_fetch_with_fixed_number_of_threads(self):
+        consumer = Mock()
+        pullers = [Mock(cw_log_group=f"group{index}", consumer=consumer) for index in range(100)]
+        fetch_threads = set()
+
+        def pages(log_group_name, timestamp):
+            fetch_threads.add(threading.current_thread().name)
+            yield self._make_events(log_group_name, [timestamp])
+
+        for index, puller in enumerate(pullers):
+            puller.fetch_pages.return_value = pages(puller.cw_log_group, index)
+
+        CWLogGroupsPuller(Mock(), Mock(), pullers).load_time_period(to_datetime(1), to_datetime(200))
+
+        self.assertEqual([args[0].timestamp for (args, _) in consumer.consume.call_args_list], list(range(100)))
+        self.assertLessEqual(len(fetch_threads), MAX_FETCH_WORKERS)
+
+    @staticmethod
+    def _make_events(log_group_name, timestamps):
+        return [CWLogEvent(log_group_name, {"timestamp": timestamp, "message": "message"}) for timestamp in timestamps]
+
+
+class TestCWLogGroupsPuller_tail(TestCase):
+    def setUp(self):
+        self.logs_client = Mock()
+        self.logs_client.meta.region_name = "us-east-1"
+        self.sts_client = Mock()
+        self.sts_client.get_caller_identity.return_value = {
+            "Account": "123456789012",
+            "Arn": "arn:aws:iam::123456789012:user/developer",
+        }
+        self.consumer = Mock()
+        self.log_group_names = [f"/aws/lambda/function{index}" for index in range(12)]
+        self.pullers = [
+            CWLogPuller(Mock(), self.consumer, name, f"Function{index}")
+            for index, name in enumerate(self.log_group_names)
+        ]
+        self.puller = CWLogGroupsPuller(self.logs_client, self.sts_client, self.pullers, live_tail=True)
+        self.now = int(time.time() * 1000)
+
+    def _consumed(self):
+        return [(args[0].timestamp, args[0].resource_name) for (args, _) in self.consumer.consume.call_args_list]
+
+    def test_must_tail_log_groups_through_sessions_in_order(self):
+        first_session = [
+            {"sessionStart": {}},
+            {
+                "sessionUpdate": {
+                    "sessionResults": [
+                        _live_tail_result(self.log_group_names[0], self.now + 1, "a"),
+                        _live_tail_result(self.log_group_names[9], self.now + 4, "d"),
+                    ]
+                }
+            },
+        ]
+        second_session = [
+            {"sessionStart": {}},
+            {
+                "sessionUpdate": {
+                    "sessionResults": [
+                        _live_tail_result(self.log_group_names[11], self.now + 2, "b"),
+                        _live_tail_result(self.log_group_names[10], self.now + 3, "c"),
+                    ]
+                }
+            },
+        ]
+        self.logs_client.start_live_tail.side_effect = [
+            {"responseStream": first_session},
+            {"responseStream": second_session},
+        ]
+
+        self.puller.tail(filter_pattern="ERROR")
+
+        self.assertEqual(
+            [call_args.kwargs for call_args in self.logs_client.start_live_tail.call_args_list],
+            [
+                {
+                    "logGroupIdentifiers": [ARN_PREFIX + name for name in self.log_group_names[:10]],
+                    "logEventFilterPattern": "ERROR",
+                },
+                {
+                    "logGroupIdentifiers": [ARN_PREFIX + name for name in self.log_group_names[10:]],
+                    "logEventFilterPattern": "ERROR",
+                },
+            ],
+        )
+        self.assertEqual(
+            self._consumed(),
+            [
+                (self.now + 1, "Function0"),
+                (self.now + 2, "Function11"),
+                (self.now + 3, "Function10"),
+                (self.now + 4, "Function9"),
+            ],
+        )
+
+    def test_must_restart_session_after_timeout(self):
+        def timed_out_stream():
+            yield {"sessionUpdate": {"sessionResults": [_live_tail_result(self.log_group_names[0], self.now, "a")]}}
+            raise ClientError({"Error": {"Code": "SessionTimeoutException"}}, "StartLiveTail")
+
+        self.puller = CWLogGroupsPuller(self.logs_client, self.sts_client, self.pullers[:1], live_tail=True)
+        self.logs_client.start_live_tail.side_effect = [
+            {"responseStream": timed_out_stream()},
+            {
+                "responseStream": [
+                    {
+                        "sessionUpdate": {
+                            "sessionResults": [_live_tail_result(self.log_group_names[0], self.now + 1, "b")]
+                        }
+                    }
+                ]
+            },
+        ]
+
+        self.puller.tail()
+
+        self.assertEqual(self.logs_client.start_live_tail.call_count, 2)
+        self.assertEqual(self._consumed(), [(self.now, "Function0"), (self.now + 1, "Function0")])
+
+    def test_must_poll_log_groups_if_live_tail_is_not_allowed(self):
+        self.logs_client.start_live_tail.side_effect = ClientError(
+            {"Error": {"Code": "AccessDeniedException"}}, "StartLiveTail"
+        )
+
+        with patch.object(self.puller, "_poll_log_groups") as patched_poll_log_groups:
+            self.puller.tail(filter_pattern="ERROR")
+
+        patched_poll_log_groups.assert_called_once()
+        self.assertEqual(patched_poll_log_groups.call_args[0][1], "ERROR")
+
+    def test_must_poll_log_groups_unless_live_tail_is_enabled(self):
+        self.puller = CWLogGroupsPuller(self.logs_client, self.sts_client, self.pullers)
+
+        with patch.object(self.puller, "_poll_log_groups") as patched_poll_log_groups:
+            self.puller.tail(filter_pattern="ERROR")
+
+        self.logs_client.start_live_tail.assert_not_called()
+        self.sts_client.get_caller_identity.assert_not_called()
+        patched_poll_log_groups.assert_called_once()
+
+    def test_must_poll_log_groups_if_botocore_does_not_support_live_tail(self):
+        del self.logs_client.start_live_tail
+
+        with patch.object(self.puller, "_poll_log_groups") as patched_poll_log_groups:
+            self.puller.tail()
+
+        patched_poll_log_groups.assert_called_once()
+
+    def test_must_poll_log_groups_if_account_is_unknown(self):
+        self.sts_client.get_caller_identity.side_effect = ClientError(
+            {"Error": {"Code": "AccessDenied"}}, "GetCallerIdentity"
+        )
+
+        with patch.object(self.puller, "_poll_log_groups") as patched_poll_log_groups:
+            self.puller.tail()
+
+        self.logs_client.start_live_tail.assert_not_called()
+        patched_poll_log_groups.assert_called_once()
+
+    def test_must_load_past_events_before_polling(self):
+        self.puller = CWLogGroupsPuller(self.logs_client, self.sts_client, self.pullers)
+        start_time = to_datetime(self.now - 1000)
+
+        with patch.object(self.puller, "load_time_period") as patched_load_time_period, patch.object(
+            self.puller, "_poll_log_groups"
+        ) as patched_poll_log_groups:
+            self.puller.tail(start_time)
+
+        self.assertEqual(patched_load_time_period.call_args[0][0], start_time)
+        # polls from the end of the loaded period
+        self.assertEqual(patched_poll_log_groups.call_args[0][0], patched_load_time_period.call_args[0][1])
+
+    def test_must_start_sessions_before_loading_past_events_and_skip_duplicates(self):
+        self.puller = CWLogGroupsPuller(self.logs_client, self.sts_client, self.pullers[:1], live_tail=True)
+        sent_while_starting = _live_tail_result(self.log_group_names[0], self.now, "starting")
+        sent_after_start = _live_tail_result(self.log_group_names[0], self.now + 1, "started")
+        self.logs_client.start_live_tail.return_value = {
+            "responseStream": [{"sessionUpdate": {"sessionResults": [sent_while_starting, sent_after_start]}}]
+        }
+
+        def fetch_pages(start_time, end_time, filter_pattern):
+            # the sessions are already started when the past events are loaded
+            self.logs_client.start_live_tail.assert_called_once()
+            yield [CWLogEvent(self.log_group_names[0], dict(sent_while_starting), "Function0")]
+
+        with patch("samcli.lib.observability.cw_logs.cw_log_groups_puller.time.time", return_value=self.now / 1000):
+            with patch.object(self.pullers[0], "fetch_pages", side_effect=fetch_pages):
+                self.puller.tail(to_datetime(self.now - 1000))
+
+        self.assertEqual(self._consumed(), [(self.now, "Function0"), (self.now + 1, "Function0")])
+
+    def test_must_poll_log_groups_on_fixed_number_of_threads(self):
+        poll_threads = set()
+        pullers = []
+        for index in range(30):
+            puller = Mock(cw_log_group=f"group{index}", consumer=self.consumer)
+            puller.start_tailing.return_value = MagicMock()
+            # each log group is polled twice
+            puller.is_tailing.side_effect = [True, False]
+            puller.poll.side_effect = lambda *args: poll_threads.add(threading.current_thread().name) or 0
+            pullers.append(puller)
+
+        CWLogGroupsPuller(self.logs_client, self.sts_client, pullers)._poll_log_groups(to_datetime(self.now), "ERROR")
+
+        for puller in pullers:
+            puller.start_tailing.assert_called_once_with(to_datetime(self.now))
+            self.assertEqual(puller.poll.call_count, 2)
+            self.assertEqual(puller.poll.call_args[0][1], "ERROR")
+        self.assertLessEqual(len(poll_threads), MAX_FETCH_WORKERS)
+
+    def test_stop_tailing_must_close_streams(self):
+        stream = Mock()
+        stream.__iter__ = Mock(return_value=iter([]))
+        self.logs_client.start_live_tail.return_value = {"responseStream": stream}
+
+        self.puller.tail()
+        self.puller.stop_tailing()
+
+        stream.close.assert_called()
+        self.assertTrue(all(puller.cancelled for puller in self.pullers))
@@ -8,6 +8,7 @@ from botocore.stub import Stubber
 
 from samcli.lib.observability.cw_logs.cw_log_event import CWLogEvent
 from samcli.lib.observability.cw_logs.cw_log_puller import CWLogPuller
+from samcli.lib.observability.poll_scheduler import PollRateBudget
 from samcli.lib.utils.time import to_timestamp, to_datetime
 
 LOG_CLIENT = botocore.session.get_session().create_client("logs", region_name="us-east-1")
@@ -184,6 +185,7 @@ class TestCWLogPuller_tail(TestCWLogPullerBase):
             self.log_group_name,
             max_retries=self.max_retries,
             poll_interval=self.poll_interval,
+            poll_rate_budget=PollRateBudget(),
         )
 
         self.mock_api_empty_response = {"events": []}
@@ -258,8 +260,8 @@ class TestCWLogPuller_tail(TestCWLogPullerBase):
                     call(to_datetime(13), filter_pattern=self.filter_pattern),
                 ]
 
-                # One per poll
-                expected_sleep_calls = [call(self.poll_interval) for _ in expected_load_time_period_calls]
+                # One per poll, the puller polls faster after the fetch that returned data
+                expected_sleep_calls = [call(self.poll_interval / 2)] + [call(self.poll_interval) for _ in range(3)]
 
                 consumer_call_args = [args[0] for (args, _) in self.consumer.consume.call_args_list]
 
@@ -308,8 +310,15 @@ class TestCWLogPuller_tail(TestCWLogPullerBase):
             call(to_datetime(15), filter_pattern=self.filter_pattern),
         ]
 
-        # One per poll
-        expected_sleep_calls = [call(self.poll_interval) for _ in expected_load_time_period_calls]
+        # One per poll, the puller polls faster after the fetches that returned data
+        expected_sleep_calls = [
+            call(self.poll_interval / 2),
+            call(self.poll_interval),
+            call(self.poll_interval / 2),
+            call(self.poll_interval),
+            call(self.poll_interval),
+            call(self.poll_interval),
+        ]
 
         with patch.object(
             self.fetcher, "load_time_period", wraps=self.fetcher.load_time_period
@@ -359,8 +368,10 @@ class TestCWLogPuller_tail(TestCWLogPullerBase):
                 self.assertEqual(expected_load_time_period_calls, patched_load_time_period.call_args_list)
                 self.assertEqual(expected_sleep_calls, time_mock.sleep.call_args_list)
 
+    @patch("samcli.lib.observability.poll_scheduler.random")
     @patch("samcli.lib.observability.cw_logs.cw_log_puller.time")
-    def test_with_throttling(self, time_mock):
+    def test_with_throttling(self, time_mock, random_mock):
+        random_mock.random.return_value = 1
         expected_params = {
             "logGroupName": self.log_group_name,
             "interleaved": True,
@@ -375,7 +386,7 @@ class TestCWLogPuller_tail(TestCWLogPullerBase):
 
         expected_load_time_period_calls = [call(to_datetime(0), filter_pattern=ANY) for _ in range(self.max_retries)]
 
-        expected_time_calls = [call(2), call(4), call(16)]
+        expected_time_calls = [call(2), call(4), call(8)]
 
         with patch.object(
             self.fetcher, "load_time_period", wraps=self.fetcher.load_time_period
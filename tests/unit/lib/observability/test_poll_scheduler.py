@@ -0,0 +1,122 @@
+from unittest import TestCase
+
+from samcli.lib.observability.poll_scheduler import (
+    AdaptivePollInterval,
+    PollRateBudget,
+    get_poll_rate_budget,
+)
+
+
+class TestPollRateBudget(TestCase):
+    def test_must_share_rate_between_pullers(self):
+        budget = PollRateBudget(max_rate=5)
+        self.assertEqual(budget.min_interval(), 0.2)
+
+        for _ in range(10):
+            budget.register()
+        self.assertEqual(budget.min_interval(), 2)
+
+        budget.unregister()
+        self.assertEqual(budget.min_interval(), 1.8)
+
+    def test_must_shrink_when_throttled_and_recover(self):
+        now = [0.0]
+        budget = PollRateBudget(max_rate=4, min_rate=1, clock=lambda: now[0])
+
+        budget.throttled()
+        self.assertEqual(budget.rate, 2)
+        for _ in range(2):
+            now[0] += 10
+            budget.throttled()
+        self.assertEqual(budget.rate, 1)
+
+        for _ in range(100):
+            budget.succeeded()
+        self.assertEqual(budget.rate, 4)
+
+    def test_must_halve_once_per_round_of_polls(self):
+        now = [0.0]
+        budget = PollRateBudget(max_rate=5, clock=lambda: now[0])
+        for _ in range(30):
+            budget.register()
+
+        # all the pullers throttled by the same overload
+        for _ in range(30):
+            budget.throttled()
+        self.assertEqual(budget.rate, 2.5)
+        # 30 pullers sharing 2.5 calls per second poll once every 12 seconds
+        self.assertEqual(budget.min_interval(), 12)
+
+        now[0] += 11
+        budget.throttled()
+        self.assertEqual(budget.rate, 2.5)
+
+        # still throttled after every puller polled at the reduced rate
+        now[0] += 1
+        budget.throttled()
+        self.assertEqual(budget.rate, 1.25)
+
+    def test_must_return_same_budget_per_api(self):
+        self.assertIs(get_poll_rate_budget("logs"), get_poll_rate_budget("logs"))
+        self.assertIsNot(get_poll_rate_budget("logs"), get_poll_rate_budget("xray"))
+
+
+class TestAdaptivePollInterval(TestCase):
+    def setUp(self):
+        self.budget = PollRateBudget(max_rate=5)
+
+    def test_must_speed_up_while_data_is_flowing(self):
+        poll_interval = AdaptivePollInterval(2, self.budget, jitter=lambda: 1)
+
+        self.assertEqual([poll_interval.next_delay(True) for _ in range(4)], [1, 0.5, 0.5, 0.5])
+        self.assertEqual([poll_interval.next_delay(False) for _ in range(3)], [1, 2, 2])
+
+    def test_must_back_off_up_to_ceiling(self):
+        # a budget that does not shrink, to only look at the backoff of the puller
+        budget = PollRateBudget(max_rate=5, min_rate=5)
+        poll_interval = AdaptivePollInterval(1, budget, max_interval=10, jitter=lambda: 1)
+
+        delays = [poll_interval.next_delay_after_throttling() for _ in range(6)]
+        self.assertEqual(delays, [2, 4, 8, 10, 10, 10])
+
+        # recovers progressively once the calls succeed again
+        self.assertEqual([poll_interval.next_delay(False) for _ in range(4)], [5, 2.5, 1.25, 1])
+
+    def test_must_add_jitter_to_backoff(self):
+        poll_interval = AdaptivePollInterval(1, self.budget, jitter=lambda: 0)
+
+        self.assertEqual(poll_interval.next_delay_after_throttling(), 1)
+
+    def test_must_stay_within_budget_share(self):
+        other_pullers = [AdaptivePollInterval(1, self.budget) for _ in range(9)]
+        for other_puller in other_pullers:
+            other_puller.__enter__()
+
+        with AdaptivePollInterval(1, self.budget, jitter=lambda: 0.5) as poll_interval:
+            # 10 pullers sharing 5 calls per second, the next poll is in 2 seconds, the jitter can't shorten it
+            self.assertEqual(poll_interval.next_delay(False), 2)
+
+        for other_puller in other_pullers:
+            other_puller.__exit__()
+        self.assertEqual(self.budget.min_interval(), 0.2)
+
+    def test_jitter_must_never_exceed_budget(self):
+        pullers = [AdaptivePollInterval(1, self.budget, jitter=lambda: 0) for _ in range(30)]
+        for puller in pullers:
+            puller.__enter__()
+
+        # 30 pullers sharing 5 calls per second must each wait at least 6 seconds, whatever the jitter
+        for puller in pullers:
+            self.assertGreaterEqual(puller.next_delay(False), 6)
+            self.assertGreaterEqual(puller.next_delay(True), 6)
+
+        # the budget is halved once by the pullers throttled together, and wins over the ceiling of the backoff
+        for puller in pullers:
+            self.assertGreaterEqual(puller.next_delay_after_throttling(), self.budget.min_interval())
+        self.assertEqual(self.budget.min_interval(), 12)
+        for puller in pullers:
+            self.assertGreaterEqual(puller.next_delay_after_throttling(), self.budget.min_interval())
+            self.assertLessEqual(puller.next_delay_after_throttling(), 30)
+
+        for puller in pullers:
+            puller.__exit__()
@@ -7,6 +7,7 @@ from unittest.mock import patch, mock_open, call, Mock, ANY
 from botocore.exceptions import ClientError
 from parameterized import parameterized
 
+from samcli.lib.observability.poll_scheduler import PollRateBudget
 from samcli.lib.observability.xray_traces.xray_event_puller import XRayTracePuller
 from samcli.lib.observability.xray_traces.xray_service_graph_event_puller import XRayServiceGraphPuller
 
@@ -17,7 +18,9 @@ class TestXRayServiceGraphPuller(TestCase):
         self.consumer = Mock()
 
         self.max_retries = 4
-        self.xray_service_graph_puller = XRayServiceGraphPuller(self.xray_client, self.consumer, self.max_retries)
+        self.xray_service_graph_puller = XRayServiceGraphPuller(
+            self.xray_client, self.consumer, self.max_retries, poll_rate_budget=PollRateBudget()
+        )
 
     @patch("samcli.lib.observability.xray_traces.xray_service_graph_event_puller.XRayServiceGraphEvent")
     @patch("samcli.lib.observability.xray_traces.xray_service_graph_event_puller.to_utc")
@@ -122,14 +125,18 @@ class TestXRayServiceGraphPuller(TestCase):
                 )
                 patched_to_datetime.assert_has_calls([call(given_start_time + 1) for _ in range(self.max_retries)])
 
+                # the puller polls faster after the fetch that returned data
                 patched_time.sleep.assert_has_calls(
-                    [call(self.xray_service_graph_puller._poll_interval) for _ in range(self.max_retries + 1)]
+                    [call(self.xray_service_graph_puller._poll_interval / 2)]
+                    + [call(self.xray_service_graph_puller._poll_interval) for _ in range(self.max_retries)]
                 )
 
                 patched_load_time_period.assert_has_calls([call(ANY, ANY) for _ in range(self.max_retries + 1)])
 
+    @patch("samcli.lib.observability.poll_scheduler.random")
     @patch("samcli.lib.observability.xray_traces.xray_event_puller.time")
-    def test_with_throttling(self, patched_time):
+    def test_with_throttling(self, patched_time, patched_random):
+        patched_random.random.return_value = 1
         with patch.object(
             self.xray_service_graph_puller, "load_time_period", wraps=self.xray_service_graph_puller.load_time_period
         ) as patched_load_time_period:
@@ -141,6 +148,6 @@ class TestXRayServiceGraphPuller(TestCase):
 
             patched_load_time_period.assert_has_calls([call(ANY, ANY) for _ in range(self.max_retries)])
 
-            patched_time.sleep.assert_has_calls([call(2), call(4), call(16), call(256)])
+            patched_time.sleep.assert_has_calls([call(2), call(4), call(8), call(16)])
 
-            self.assertEqual(self.xray_service_graph_puller._poll_interval, 256)
+            self.assertEqual(self.xray_service_graph_puller._poll_interval, 1)
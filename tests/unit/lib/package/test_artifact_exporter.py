@@ -1,5 +1,6 @@
 import functools
 import json
+import threading
 import platform
 import tempfile
 import os
@@ -20,11 +21,19 @@ from samcli.lib.package.permissions import (
     AdditiveDirPermissionPermissionMapper,
 )
 from samcli.lib.package.uploaders import Destination
-from samcli.lib.package.utils import zip_folder, make_zip, make_zip_with_lambda_permissions, make_zip_with_permissions
+from samcli.lib.package.utils import (
+    zip_folder,
+    make_zip,
+    make_zip_artifact,
+    make_zip_artifact_with_lambda_permissions,
+    make_zip_with_lambda_permissions,
+    make_zip_with_permissions,
+)
 from samcli.lib.utils.packagetype import ZIP, IMAGE
 from samcli.lib.utils.resources import LAMBDA_LOCAL_RESOURCES, RESOURCES_WITH_LOCAL_PATHS
 from tests.testing_utils import FileCreator
 from samcli.commands.package import exceptions
+from samcli.lib.package.export_executor import IMAGE_PUSH_LOCK, ExportExecutor
 from samcli.lib.package.artifact_exporter import (
     is_local_folder,
     make_abs_path,
@@ -377,7 +386,9 @@ class TestArtifactExporter(unittest.TestCase):
 
             absolute_artifact_path = make_abs_path(parent_dir, artifact_path)
 
-            zip_and_upload_mock.assert_called_once_with(absolute_artifact_path, mock.ANY, None, zip_method=make_zip)
+            zip_and_upload_mock.assert_called_once_with(
+                absolute_artifact_path, mock.ANY, None, zip_method=make_zip_artifact
+            )
 
     @patch("samcli.lib.package.utils.zip_and_upload")
     def test_upload_local_artifacts_local_folder_lambda_resources(self, zip_and_upload_mock):
@@ -403,12 +414,12 @@ class TestArtifactExporter(unittest.TestCase):
 
                 with self.assertRaises(AssertionError):
                     zip_and_upload_mock.assert_called_once_with(
-                        absolute_artifact_path, mock.ANY, None, zip_method=make_zip
+                        absolute_artifact_path, mock.ANY, None, zip_method=make_zip_artifact
                     )
 
                 # zip_method will be lambda specific.
                 zip_and_upload_mock.assert_called_once_with(
-                    absolute_artifact_path, mock.ANY, None, zip_method=make_zip_with_lambda_permissions
+                    absolute_artifact_path, mock.ANY, None, zip_method=make_zip_artifact_with_lambda_permissions
                 )
                 zip_and_upload_mock.reset_mock()
 
@@ -437,11 +448,13 @@ class TestArtifactExporter(unittest.TestCase):
                 # zip_method will NOT be the specialized zip_method `make_zip_with_lambda_permissions`
                 with self.assertRaises(AssertionError):
                     zip_and_upload_mock.assert_called_once_with(
-                        absolute_artifact_path, mock.ANY, None, zip_method=make_zip_with_lambda_permissions
+                        absolute_artifact_path, mock.ANY, None, zip_method=make_zip_artifact_with_lambda_permissions
                     )
 
                 # zip_method will be the generalized zip_method `make_zip`
-                zip_and_upload_mock.assert_called_once_with(absolute_artifact_path, mock.ANY, None, zip_method=make_zip)
+                zip_and_upload_mock.assert_called_once_with(
+                    absolute_artifact_path, mock.ANY, None, zip_method=make_zip_artifact
+                )
                 zip_and_upload_mock.reset_mock()
 
     @patch("samcli.lib.package.utils.zip_and_upload")
@@ -462,7 +475,7 @@ class TestArtifactExporter(unittest.TestCase):
         )
         self.assertEqual(result, expected_s3_url)
 
-        zip_and_upload_mock.assert_called_once_with(parent_dir, mock.ANY, None, zip_method=make_zip)
+        zip_and_upload_mock.assert_called_once_with(parent_dir, mock.ANY, None, zip_method=make_zip_artifact)
         self.s3_uploader_mock.upload_with_dedup.assert_not_called()
 
     @patch("samcli.lib.package.utils.zip_and_upload")
@@ -702,7 +715,7 @@ class TestArtifactExporter(unittest.TestCase):
 
             resource.export(resource_id, resource_dict, parent_dir)
 
-            zip_and_upload_mock.assert_called_once_with(tmp_dir, mock.ANY, None, zip_method=make_zip)
+            zip_and_upload_mock.assert_called_once_with(tmp_dir, mock.ANY, None, zip_method=make_zip_artifact)
             rmtree_mock.assert_called_once_with(tmp_dir)
             is_zipfile_mock.assert_called_once_with(original_path)
             self.code_signer_mock.should_sign_package.assert_called_once_with(resource_id)
@@ -1009,6 +1022,7 @@ class TestArtifactExporter(unittest.TestCase):
                 normalize_parameters=True,
                 normalize_template=True,
                 parent_stack_id="id",
+                export_executor=None,
             )
             template_instance_mock.export.assert_called_once_with()
             self.s3_uploader_mock.upload.assert_called_once_with(mock.ANY, mock.ANY)
@@ -1185,6 +1199,7 @@ class TestArtifactExporter(unittest.TestCase):
                 normalize_parameters=True,
                 normalize_template=True,
                 parent_stack_id="id",
+                export_executor=None,
             )
             template_instance_mock.export.assert_called_once_with()
             self.s3_uploader_mock.upload.assert_called_once_with(mock.ANY, mock.ANY)
@@ -1351,6 +1366,126 @@ class TestArtifactExporter(unittest.TestCase):
             resource_type2_class.assert_called_once_with(self.uploaders_mock, self.code_signer_mock)
             resource_type2_instance.export.assert_called_once_with("Resource2", mock.ANY, template_dir)
 
+    def _make_resource_class(self, resource_type, export_side_effect=None):
+        resource_class = Mock()
+        resource_class.RESOURCE_TYPE = resource_type
+        resource_class.ARTIFACT_TYPE = ZIP
+        resource_class.EXPORT_DESTINATION = Destination.S3
+        resource_class.return_value.EXPORT_DESTINATION = Destination.S3
+        resource_class.return_value.export.side_effect = export_side_effect
+        return resource_class
+
+    @patch("samcli.lib.package.artifact_exporter.yaml_parse")
+    def test_template_export_with_executor_exports_resources_concurrently(self, yaml_parse_mock):
+        parent_dir = os.path.sep
+        template_dir = os.path.join(parent_dir, "foo", "bar")
+        template_path = os.path.join(template_dir, "path")
+        # both exports need to be running at the same time to get through the barrier
+        barrier = threading.Barrier(2, timeout=5)
+
+        def export(resource_id, resource_dict, parent_dir):
+            barrier.wait()
+            resource_dict["CodeUri"] = "s3://bucket/" + resource_id
+
+        resource_type1_class = self._make_resource_class("resource_type1", export)
+        resource_type2_class = self._make_resource_class("resource_type2", export)
+        template_dict = {
+            "Resources": {
+                "Resource1": {"Type": "resource_type1", "Properties": {"CodeUri": "src1"}},
+                "Resource2": {"Type": "resource_type2", "Properties": {"CodeUri": "src2"}},
+            }
+        }
+        yaml_parse_mock.return_value = template_dict
+
+        with patch("samcli.lib.package.artifact_exporter.open", mock.mock_open(read_data="")), ExportExecutor(
+            2
+        ) as executor:
+            template_exporter = Template(
+                template_path,
+                parent_dir,
+                self.uploaders_mock,
+                self.code_signer_mock,
+                [resource_type1_class, resource_type2_class],
+                export_executor=executor,
+            )
+            exported_template = template_exporter.export()
+
+        self.assertEqual(list(exported_template["Resources"]), ["Resource1", "Resource2"])
+        self.assertEqual(exported_template["Resources"]["Resource1"]["Properties"]["CodeUri"], "s3://bucket/Resource1")
+        self.assertEqual(exported_template["Resources"]["Resource2"]["Properties"]["CodeUri"], "s3://bucket/Resource2")
+        resource_type1_class.return_value.export.assert_called_once_with("Resource1", mock.ANY, template_dir)
+        resource_type2_class.return_value.export.assert_called_once_with("Resource2", mock.ANY, template_dir)
+
+    @patch("samcli.lib.package.artifact_exporter.yaml_parse")
+    def test_template_export_with_executor_pushes_images_one_at_a_time(self, yaml_parse_mock):
+        template_path = os.path.join(os.path.sep, "foo", "bar", "path")
+        lock_states = []
+
+        def export(resource_id, resource_dict, parent_dir):
+            lock_states.append(IMAGE_PUSH_LOCK.locked())
+
+        image_resource_class = self._make_resource_class("resource_type1", export)
+        image_resource_class.ARTIFACT_TYPE = IMAGE
+        image_resource_class.return_value.EXPORT_DESTINATION = Destination.ECR
+        yaml_parse_mock.return_value = {
+            "Resources": {"Resource1": {"Type": "resource_type1", "Properties": {"PackageType": IMAGE}}}
+        }
+
+        with patch("samcli.lib.package.artifact_exporter.open", mock.mock_open(read_data="")), ExportExecutor(
+            2
+        ) as executor:
+            Template(
+                template_path,
+                os.path.sep,
+                self.uploaders_mock,
+                self.code_signer_mock,
+                [image_resource_class],
+                export_executor=executor,
+            ).export()
+
+        # the nested stacks exported on the other threads wait for the lock before pushing their images
+        self.assertEqual(lock_states, [True])
+        self.assertFalse(IMAGE_PUSH_LOCK.locked())
+
+    @patch("samcli.lib.package.artifact_exporter.yaml_parse")
+    def test_template_export_with_executor_raises_first_failure_in_template_order(self, yaml_parse_mock):
+        parent_dir = os.path.sep
+        template_path = os.path.join(parent_dir, "foo", "bar", "path")
+        resource_type1_class = self._make_resource_class("resource_type1", ValueError("first"))
+        resource_type2_class = self._make_resource_class("resource_type2", KeyError("second"))
+        yaml_parse_mock.return_value = {
+            "Resources": {
+                "Resource1": {"Type": "resource_type1", "Properties": {}},
+                "Resource2": {"Type": "resource_type2", "Properties": {}},
+            }
+        }
+
+        with patch("samcli.lib.package.artifact_exporter.open", mock.mock_open(read_data="")), ExportExecutor(
+            2
+        ) as executor:
+            template_exporter = Template(
+                template_path,
+                parent_dir,
+                self.uploaders_mock,
+                self.code_signer_mock,
+                [resource_type1_class, resource_type2_class],
+                export_executor=executor,
+            )
+            with self.assertRaisesRegex(ValueError, "first"):
+                template_exporter.export()
+
+    @patch("samcli.lib.package.artifact_exporter.Template")
+    def test_export_cloudformation_stack_passes_executor_to_nested_template(self, TemplateMock):
+        stack_resource = CloudFormationStackResource(self.uploaders_mock, self.code_signer_mock)
+        stack_resource.export_executor = Mock()
+        TemplateMock.return_value.export.return_value = {}
+        self.s3_uploader_mock.upload.return_value = "s3://hello/world"
+
+        with tempfile.NamedTemporaryFile() as handle:
+            stack_resource.export("id", {stack_resource.PROPERTY_NAME: handle.name}, tempfile.gettempdir())
+
+        self.assertEqual(TemplateMock.call_args.kwargs["export_executor"], stack_resource.export_executor)
+
     @patch("samcli.lib.package.artifact_exporter.yaml_parse")
     def test_cdk_template_export(self, yaml_parse_mock):
         parent_dir = os.path.sep
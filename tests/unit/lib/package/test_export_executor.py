@@ -0,0 +1,88 @@
+import threading
+from concurrent.futures import Future
+from unittest import TestCase
+
+from samcli.lib.package.export_executor import ExportExecutor, wait_for_exports
+
+
+class TestExportExecutor(TestCase):
+    def test_must_not_accept_empty_pool(self):
+        with self.assertRaises(ValueError):
+            ExportExecutor(0)
+
+    def test_artifacts_run_on_worker_threads(self):
+        with ExportExecutor(2) as executor:
+            thread_name = executor.submit_artifact(lambda: threading.current_thread().name).result()
+
+        self.assertTrue(thread_name.startswith("sam-package"))
+
+    def test_nested_stacks_run_on_the_thread_of_their_parent_stack(self):
+        with ExportExecutor(1) as executor:
+
+            def export_parent():
+                # with a single stack worker, this would never complete if it was queued on the stack pool
+                child = executor.submit_stack(lambda: threading.current_thread().name)
+                return threading.current_thread().name, child.result(timeout=5)
+
+            parent_thread, child_thread = executor.submit_stack(export_parent).result(timeout=5)
+
+        self.assertTrue(parent_thread.startswith("sam-package-stack"))
+        self.assertEqual(parent_thread, child_thread)
+
+    def test_nested_stack_can_wait_for_its_artifacts(self):
+        with ExportExecutor(1) as executor:
+
+            def export_stack():
+                artifacts = [executor.submit_artifact(lambda value=value: value) for value in range(3)]
+                return [artifact.result(timeout=5) for artifact in artifacts]
+
+            self.assertEqual(executor.submit_stack(export_stack).result(timeout=5), [0, 1, 2])
+
+    def test_inline_stack_export_keeps_its_error(self):
+        with ExportExecutor(1) as executor:
+
+            def export_parent():
+                def fail():
+                    raise ValueError("nested")
+
+                return executor.submit_stack(fail).exception()
+
+            self.assertIsInstance(executor.submit_stack(export_parent).result(timeout=5), ValueError)
+
+    def test_shutdown_cancels_pending_exports_and_waits_for_running_ones(self):
+        started = threading.Event()
+        release = threading.Event()
+        executor = ExportExecutor(1)
+
+        def block():
+            started.set()
+            release.wait(5)
+            return "done"
+
+        running = executor.submit_artifact(block)
+        pending = executor.submit_artifact(lambda: "never")
+        # the running export only completes once the pending one is cancelled
+        pending.add_done_callback(lambda _: release.set())
+        started.wait(5)
+
+        shutdown = threading.Thread(target=executor.shutdown)
+        shutdown.start()
+        shutdown.join(5)
+
+        self.assertFalse(shutdown.is_alive())
+        self.assertEqual(running.result(timeout=0), "done")
+        self.assertTrue(pending.cancelled())
+
+
+class TestWaitForExports(TestCase):
+    def test_must_raise_first_error_in_order_and_cancel_the_rest(self):
+        failed_first = Future()
+        failed_first.set_exception(ValueError("first"))
+        failed_second = Future()
+        failed_second.set_exception(KeyError("second"))
+        pending = Future()
+
+        with self.assertRaisesRegex(ValueError, "first"):
+            wait_for_exports([failed_first, failed_second, pending])
+
+        self.assertTrue(pending.cancelled())
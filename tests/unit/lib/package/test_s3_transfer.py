@@ -0,0 +1,112 @@
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from parameterized import parameterized
+
+from samcli.lib.package.s3_transfer import (
+    MB,
+    InvalidS3TransferConfigException,
+    S3TransferSettings,
+    SharedTransferManager,
+    get_s3_transfer_settings,
+)
+
+
+def _make_client(region="us-east-1", endpoint="https://s3.us-east-1.amazonaws.com"):
+    client = Mock()
+    client.meta.region_name = region
+    client.meta.endpoint_url = endpoint
+    return client
+
+
+class TestGetS3TransferSettings(TestCase):
+    def test_must_use_defaults(self):
+        self.assertEqual(get_s3_transfer_settings(None, None, None), S3TransferSettings())
+
+    def test_must_convert_sizes_to_bytes(self):
+        settings = get_s3_transfer_settings(32, 64, 16)
+
+        self.assertEqual(settings, S3TransferSettings(32, 64 * MB, 16 * MB))
+        transfer_config = settings.to_transfer_config()
+        self.assertEqual(transfer_config.max_request_concurrency, 32)
+        self.assertEqual(transfer_config.multipart_threshold, 64 * MB)
+        self.assertEqual(transfer_config.multipart_chunksize, 16 * MB)
+
+    @parameterized.expand([(0, None, None), (None, 0, None), (None, None, 4)])
+    def test_must_reject_invalid_settings(self, max_concurrency, threshold, chunksize):
+        with self.assertRaises(InvalidS3TransferConfigException):
+            get_s3_transfer_settings(max_concurrency, threshold, chunksize)
+
+
+@patch("samcli.lib.package.s3_transfer.transfer.create_transfer_manager")
+class TestSharedTransferManager(TestCase):
+    def test_must_share_manager_per_client(self, create_mock):
+        create_mock.side_effect = lambda *args: Mock()
+        shared = SharedTransferManager()
+        client = _make_client()
+
+        first = shared.get(client)
+        second = shared.get(client)
+        other_region = shared.get(_make_client("eu-west-1", "https://s3.eu-west-1.amazonaws.com"))
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, other_region)
+        self.assertEqual(create_mock.call_count, 2)
+
+    def test_must_not_share_manager_between_clients_of_same_region(self, create_mock):
+        create_mock.side_effect = lambda *args: Mock()
+        shared = SharedTransferManager()
+        default_profile_client = _make_client()
+        other_profile_client = _make_client()
+
+        default_profile_manager = shared.get(default_profile_client)
+        other_profile_manager = shared.get(other_profile_client)
+
+        self.assertIsNot(default_profile_manager, other_profile_manager)
+        self.assertIs(create_mock.call_args_list[0][0][0], default_profile_client)
+        self.assertIs(create_mock.call_args_list[1][0][0], other_profile_client)
+
+    def test_must_create_managers_with_settings(self, create_mock):
+        settings = S3TransferSettings(4, 16 * MB, 8 * MB)
+        shared = SharedTransferManager(settings)
+        client = _make_client()
+
+        shared.get(client)
+
+        transfer_config = create_mock.call_args[0][1]
+        self.assertIs(create_mock.call_args[0][0], client)
+        self.assertEqual(transfer_config.max_request_concurrency, 4)
+        self.assertEqual(transfer_config.multipart_threshold, 16 * MB)
+
+    def test_configure_must_shutdown_previous_managers(self, create_mock):
+        create_mock.side_effect = lambda *args: Mock()
+        shared = SharedTransferManager()
+        client = _make_client()
+        previous = shared.get(client)
+
+        shared.configure(S3TransferSettings(max_concurrency=2))
+
+        previous.shutdown.assert_called_once_with()
+        self.assertIsNot(shared.get(client), previous)
+        self.assertEqual(shared.settings.max_concurrency, 2)
+
+    def test_configure_must_keep_managers_with_same_settings(self, create_mock):
+        shared = SharedTransferManager()
+        client = _make_client()
+        previous = shared.get(client)
+
+        shared.configure(S3TransferSettings())
+
+        previous.shutdown.assert_not_called()
+        self.assertIs(shared.get(client), previous)
+
+    def test_must_shutdown_managers_when_command_ends(self, create_mock):
+        create_mock.side_effect = lambda *args: Mock()
+        shared = SharedTransferManager()
+        client = _make_client()
+
+        with shared:
+            manager = shared.get(client)
+
+        manager.shutdown.assert_called_once_with()
+        self.assertIsNot(shared.get(client), manager)
@@ -1,14 +1,17 @@
 import os
 
 from unittest import TestCase
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 import tempfile
 
 from pathlib import Path
+import boto3
 from botocore.exceptions import ClientError
+from botocore.stub import Stubber
 
 from samcli.commands.package.exceptions import NoSuchBucketError, BucketNotSpecifiedError
-from samcli.lib.package.s3_uploader import S3Uploader
+from samcli.lib.package.s3_uploader import MAX_LISTED_KEYS, ProgressPercentage, S3Uploader
+from samcli.lib.package.upload_manifest import UploadManifest
 from samcli.lib.utils.hash import file_checksum
 
 
@@ -313,3 +316,150 @@ class TestS3Uploader(TestCase):
 
         self.s3.get_object_tagging.assert_called_with(Bucket=given_s3_bucket, Key=given_s3_location)
         self.assertEqual(version_id, given_version_id)
+
+
+class TestS3UploaderExistingObjects(TestCase):
+    def setUp(self):
+        # a real client answered by the stubber stands in for S3
+        self.s3 = boto3.client("s3", region_name="us-east-1", aws_access_key_id="key", aws_secret_access_key="secret")
+        self.stubber = Stubber(self.s3)
+        self.stubber.activate()
+        self.addCleanup(self.stubber.deactivate)
+        self.manifest = UploadManifest()
+
+    def _make_uploader(self, **kwargs):
+        return S3Uploader(
+            s3_client=self.s3, bucket_name="bucket", prefix="prefix", upload_manifest=self.manifest, **kwargs
+        )
+
+    def _stub_listing(self, keys, truncated=False):
+        self.stubber.add_response(
+            "list_objects_v2",
+            {"Contents": [{"Key": key} for key in keys], "IsTruncated": truncated},
+            {"Bucket": "bucket", "Prefix": "prefix/", "MaxKeys": MAX_LISTED_KEYS},
+        )
+
+    def _stub_head(self, key, exists=True):
+        if exists:
+            self.stubber.add_response("head_object", {}, {"Bucket": "bucket", "Key": key})
+        else:
+            self.stubber.add_client_error("head_object", "404", expected_params={"Bucket": "bucket", "Key": key})
+
+    def test_must_check_first_keys_one_by_one(self):
+        self._stub_head("prefix/a.zip")
+        self._stub_head("prefix/b.zip", exists=False)
+        uploader = self._make_uploader()
+
+        self.assertTrue(uploader.object_exists("prefix/a.zip"))
+        self.assertFalse(uploader.object_exists("prefix/b.zip"))
+        self.stubber.assert_no_pending_responses()
+
+    def test_must_list_existing_keys_once_after_first_checks(self):
+        with patch("samcli.lib.package.s3_uploader.MIN_CHECKS_BEFORE_LISTING", 1):
+            self._stub_head("prefix/a.zip")
+            self._stub_listing(["prefix/a.zip", "prefix/b.zip"])
+            uploader = self._make_uploader()
+
+            self.assertTrue(uploader.object_exists("prefix/a.zip"))
+            self.assertTrue(uploader.object_exists("prefix/b.zip"))
+            self.assertFalse(uploader.object_exists("prefix/c.zip"))
+            self.stubber.assert_no_pending_responses()
+
+    def test_must_check_keys_one_by_one_when_listing_is_incomplete(self):
+        with patch("samcli.lib.package.s3_uploader.MIN_CHECKS_BEFORE_LISTING", 0):
+            self._stub_listing(["prefix/a.zip"], truncated=True)
+            self._stub_head("prefix/b.zip")
+            uploader = self._make_uploader()
+
+            self.assertTrue(uploader.object_exists("prefix/a.zip"))
+            self.assertTrue(uploader.object_exists("prefix/b.zip"))
+            self.stubber.assert_no_pending_responses()
+
+    def test_must_check_keys_one_by_one_when_listing_is_not_allowed(self):
+        with patch("samcli.lib.package.s3_uploader.MIN_CHECKS_BEFORE_LISTING", 0):
+            self.stubber.add_client_error("list_objects_v2", "AccessDenied")
+            self._stub_head("prefix/a.zip", exists=False)
+            uploader = self._make_uploader()
+
+            self.assertFalse(uploader.object_exists("prefix/a.zip"))
+            self.stubber.assert_no_pending_responses()
+
+    def test_must_confirm_objects_recorded_in_manifest(self):
+        with patch("samcli.lib.package.s3_uploader.MIN_CHECKS_BEFORE_LISTING", 0):
+            self.manifest.add("s3://bucket/prefix/a.zip")
+            self._stub_head("prefix/a.zip")
+            uploader = self._make_uploader()
+
+            # an object recorded in the manifest is confirmed with a single request, without listing the keys
+            self.assertTrue(uploader.object_exists("prefix/a.zip"))
+            self.stubber.assert_no_pending_responses()
+
+    def test_must_forget_objects_recorded_in_manifest_which_no_longer_exist(self):
+        self.manifest.add("s3://bucket/prefix/a.zip")
+        self._stub_head("prefix/a.zip", exists=False)
+        uploader = self._make_uploader()
+
+        self.assertFalse(uploader.object_exists("prefix/a.zip"))
+        self.assertFalse(self.manifest.contains("s3://bucket/prefix/a.zip"))
+
+    def test_must_record_existing_objects_in_manifest(self):
+        self._stub_head("prefix/a.zip")
+        uploader = self._make_uploader()
+
+        uploader.object_exists("prefix/a.zip")
+
+        self.assertTrue(self.manifest.contains("s3://bucket/prefix/a.zip"))
+
+    def test_find_uploaded_returns_url_of_existing_artifact(self):
+        self._stub_head("prefix/md5.zip")
+        self._stub_head("prefix/other.zip", exists=False)
+        uploader = self._make_uploader()
+
+        self.assertEqual(uploader.find_uploaded("md5", "zip"), "s3://bucket/prefix/md5.zip")
+        self.assertIsNone(uploader.find_uploaded("other", "zip"))
+
+    def test_find_uploaded_ignores_existing_artifacts_on_force_upload(self):
+        self.manifest.add("s3://bucket/prefix/md5.zip")
+        uploader = self._make_uploader(force_upload=True)
+
+        self.assertIsNone(uploader.find_uploaded("md5", "zip"))
+
+    def test_delete_artifact_removes_it_from_manifest(self):
+        self.manifest.add("s3://bucket/prefix/a.zip")
+        self.stubber.add_response("head_object", {}, {"Bucket": "bucket", "Key": "prefix/a.zip"})
+        self.stubber.add_response("delete_object", {}, {"Bucket": "bucket", "Key": "prefix/a.zip"})
+        uploader = self._make_uploader()
+
+        self.assertTrue(uploader.delete_artifact("a.zip"))
+        self.assertFalse(self.manifest.contains("s3://bucket/prefix/a.zip"))
+
+
+class TestProgressPercentage(TestCase):
+    def setUp(self):
+        self.temp_file = tempfile.NamedTemporaryFile(delete=False)
+        self.temp_file.write(b"x" * 10)
+        self.temp_file.close()
+
+    def tearDown(self):
+        os.remove(self.temp_file.name)
+
+    @patch("samcli.lib.package.s3_uploader.sys.stderr")
+    def test_must_print_progress_of_each_part(self, stderr_mock):
+        progress = ProgressPercentage(self.temp_file.name, "remote/path")
+
+        progress.on_progress(4)
+        progress.on_progress(6)
+
+        written = "".join(write_call.args[0] for write_call in stderr_mock.write.call_args_list)
+        self.assertIn("(40.00%)", written)
+        self.assertIn("(100.00%)", written)
+
+    @patch("samcli.lib.package.s3_uploader.sys.stderr")
+    def test_must_only_print_completion_of_parallel_uploads(self, stderr_mock):
+        progress = ProgressPercentage(self.temp_file.name, "remote/path", completion_only=True)
+
+        progress.on_progress(4)
+        stderr_mock.write.assert_not_called()
+        progress.on_progress(6)
+
+        stderr_mock.write.assert_called_once_with(f"\tUploaded to remote/path  10 bytes{os.linesep}")
@@ -0,0 +1,75 @@
+import json
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+from samcli.lib.package.upload_manifest import UploadManifest
+
+URL = "s3://bucket/prefix/md5.zip"
+
+
+class TestUploadManifest(TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.manifest_file = os.path.join(self.temp_dir, "cache", "upload-manifest.json")
+        self.now = 1000.0
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _make_manifest(self):
+        return UploadManifest(self.manifest_file, ttl=100, clock=lambda: self.now)
+
+    def test_must_contain_added_objects(self):
+        manifest = self._make_manifest()
+        manifest.add(URL)
+
+        self.assertTrue(manifest.contains(URL))
+        self.assertFalse(manifest.contains("s3://bucket/prefix/other.zip"))
+
+    def test_must_expire_old_entries(self):
+        manifest = self._make_manifest()
+        manifest.add(URL)
+        self.now += 100
+
+        self.assertFalse(manifest.contains(URL))
+
+    def test_must_forget_removed_objects(self):
+        manifest = self._make_manifest()
+        manifest.add(URL)
+        manifest.remove(URL)
+
+        self.assertFalse(manifest.contains(URL))
+
+    def test_must_persist_entries_between_instances(self):
+        manifest = self._make_manifest()
+        manifest.add(URL)
+        manifest.save()
+
+        self.assertTrue(self._make_manifest().contains(URL))
+
+    def test_must_drop_expired_entries_when_saving(self):
+        manifest = self._make_manifest()
+        manifest.add(URL)
+        self.now += 100
+        manifest.add("s3://bucket/prefix/other.zip")
+        manifest.save()
+
+        with open(self.manifest_file) as f:
+            self.assertEqual(list(json.load(f)["objects"]), ["s3://bucket/prefix/other.zip"])
+
+    def test_must_ignore_unreadable_manifest(self):
+        os.makedirs(os.path.dirname(self.manifest_file))
+        with open(self.manifest_file, "w") as f:
+            f.write("not json")
+
+        self.assertFalse(self._make_manifest().contains(URL))
+
+    def test_memory_only_manifest_must_not_write_files(self):
+        manifest = UploadManifest()
+        manifest.add(URL)
+        manifest.save()
+
+        self.assertTrue(manifest.contains(URL))
+        self.assertFalse(os.path.exists(self.manifest_file))
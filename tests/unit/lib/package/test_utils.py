@@ -1,10 +1,22 @@
+import hashlib
+import os
+import shutil
 import tempfile
+import zipfile
 from unittest import TestCase
+from unittest.mock import ANY, Mock
 
 from parameterized import parameterized
 
 from samcli.lib.package import utils
-from samcli.lib.package.utils import zip_folder, make_zip
+from samcli.lib.package.utils import (
+    ZipArtifact,
+    make_zip,
+    make_zip_artifact_with_lambda_permissions,
+    zip_and_upload,
+    zip_folder,
+)
+from samcli.lib.utils.hash import FileChecksumCache, dir_checksum, file_checksum
 
 
 class TestPackageUtils(TestCase):
@@ -61,3 +73,80 @@ class TestPackageUtils(TestCase):
                     previous_md5_hash = md5_hash
                 else:
                     self.assertEqual(previous_md5_hash, md5_hash)
+
+
+class TestMakeZipArtifact(TestCase):
+    def setUp(self):
+        self.source_dir = tempfile.mkdtemp()
+        self.output_dir = tempfile.mkdtemp()
+        os.mkdir(os.path.join(self.source_dir, "lib"))
+        for name, content in (
+            ("index.py", b"def handler(event, context):\n    return event\n"),
+            (os.path.join("lib", "data.bin"), os.urandom(3 * 1024 * 1024)),
+            ("empty.txt", b""),
+        ):
+            with open(os.path.join(self.source_dir, name), "wb") as f:
+                f.write(content)
+
+    def tearDown(self):
+        shutil.rmtree(self.source_dir, ignore_errors=True)
+        shutil.rmtree(self.output_dir, ignore_errors=True)
+
+    def test_must_compute_digests_while_zipping(self):
+        artifact = make_zip_artifact_with_lambda_permissions(os.path.join(self.output_dir, "data"), self.source_dir)
+
+        self.assertIsInstance(artifact, ZipArtifact)
+        self.assertEqual(artifact.path, os.path.join(self.output_dir, "data.zip"))
+        self.assertEqual(artifact.content_md5, dir_checksum(self.source_dir, followlinks=True))
+        self.assertEqual(artifact.sha256, file_checksum(artifact.path, hashlib.sha256()))
+
+    def test_must_zip_all_files_in_sorted_order(self):
+        artifact = make_zip_artifact_with_lambda_permissions(os.path.join(self.output_dir, "data"), self.source_dir)
+
+        with zipfile.ZipFile(artifact.path) as zip_file:
+            self.assertIsNone(zip_file.testzip())
+            self.assertEqual(zip_file.namelist(), ["empty.txt", "index.py", "lib/data.bin"])
+            with open(os.path.join(self.source_dir, "lib", "data.bin"), "rb") as f:
+                self.assertEqual(zip_file.read("lib/data.bin"), f.read())
+            self.assertEqual(zip_file.getinfo("index.py").external_attr >> 16 & 0o444, 0o444)
+
+    def test_same_content_must_produce_same_archive(self):
+        first = make_zip_artifact_with_lambda_permissions(os.path.join(self.output_dir, "first"), self.source_dir)
+        second = make_zip_artifact_with_lambda_permissions(os.path.join(self.output_dir, "second"), self.source_dir)
+
+        self.assertEqual(first.sha256, second.sha256)
+        self.assertEqual(first.content_md5, second.content_md5)
+
+    def test_zip_folder_must_use_content_checksum_of_artifact(self):
+        with zip_folder(self.source_dir, make_zip_artifact_with_lambda_permissions) as (zip_file, md5_hash):
+            self.assertTrue(os.path.exists(zip_file))
+            self.assertEqual(md5_hash, dir_checksum(self.source_dir, followlinks=True))
+
+
+class TestZipAndUpload(TestCase):
+    def setUp(self):
+        self.source_dir = tempfile.mkdtemp()
+        with open(os.path.join(self.source_dir, "index.py"), "w") as f:
+            f.write("content")
+        self.uploader = Mock(checksum_cache=FileChecksumCache(), force_upload=False)
+
+    def tearDown(self):
+        shutil.rmtree(self.source_dir, ignore_errors=True)
+
+    def test_must_not_zip_artifact_which_was_already_uploaded(self):
+        self.uploader.find_uploaded.return_value = "s3://bucket/md5.zip"
+        zip_method = Mock()
+
+        self.assertEqual(zip_and_upload(self.source_dir, self.uploader, "zip", zip_method), "s3://bucket/md5.zip")
+        self.uploader.find_uploaded.assert_called_once_with(dir_checksum(self.source_dir), "zip")
+        zip_method.assert_not_called()
+        self.uploader.upload_with_dedup.assert_not_called()
+
+    def test_must_zip_and_upload_new_artifact(self):
+        self.uploader.find_uploaded.return_value = None
+
+        zip_and_upload(self.source_dir, self.uploader, "zip", make_zip_artifact_with_lambda_permissions)
+
+        self.uploader.upload_with_dedup.assert_called_once_with(
+            ANY, precomputed_md5=dir_checksum(self.source_dir), extension="zip"
+        )
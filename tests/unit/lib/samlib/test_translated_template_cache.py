@@ -0,0 +1,127 @@
+import datetime
+import os
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+from parameterized import parameterized
+
+from samcli.lib.samlib.translated_template_cache import (
+    TEMPLATE_CACHE_ENV_VAR,
+    TranslatedTemplateCache,
+    configure_translated_template_cache,
+    get_translated_template_cache,
+)
+
+
+class TestTranslatedTemplateCache(TestCase):
+    def setUp(self):
+        self.temp_dir = TemporaryDirectory()
+        self.cache = TranslatedTemplateCache(self.temp_dir.name, max_templates=2)
+        self.template = {"Resources": {"Function": {"Type": "AWS::Serverless::Function"}}}
+        self.translated = {"Resources": {"Function": {"Type": "AWS::Lambda::Function", "Properties": {}}}}
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_must_return_cached_template(self):
+        key = self.cache.key(self.template, {"Stage": "dev"})
+
+        self.assertIsNone(self.cache.get(key))
+        self.cache.put(key, self.translated)
+
+        self.assertEqual(self.cache.get(key), self.translated)
+        self.assertIsNot(self.cache.get(key), self.cache.get(key))
+
+    def test_key_must_not_depend_on_order_of_keys(self):
+        reordered_template = {"Resources": self.template["Resources"], "Description": "x"}
+        template = {"Description": "x", "Resources": self.template["Resources"]}
+
+        self.assertEqual(
+            self.cache.key(template, {"A": 1, "B": 2}), self.cache.key(reordered_template, {"B": 2, "A": 1})
+        )
+
+    def test_key_must_change_with_parameter_values(self):
+        self.assertNotEqual(
+            self.cache.key(self.template, {"Stage": "dev"}), self.cache.key(self.template, {"Stage": "prod"})
+        )
+
+    @patch("samcli.lib.samlib.translated_template_cache.samcli_version", "0.0.0")
+    def test_key_must_change_with_version(self):
+        key = self.cache.key(self.template, None)
+
+        with patch("samcli.lib.samlib.translated_template_cache.samcli_version", "0.0.1"):
+            self.assertNotEqual(self.cache.key(self.template, None), key)
+
+    @parameterized.expand([({"Resources": {"Date": datetime.date(2024, 1, 1)}},), ("not a template",)])
+    def test_key_must_be_none_if_template_can_not_be_cached(self, template):
+        self.assertIsNone(self.cache.key(template, None))
+
+    def test_must_not_cache_template_which_changes_in_json(self):
+        key = self.cache.key(self.template, None)
+
+        self.cache.put(key, {"Mappings": {1: "a"}})
+
+        self.assertIsNone(self.cache.get(key))
+
+    def test_must_remove_least_recently_used_templates(self):
+        keys = [self.cache.key({"Resources": {"Index": index}}, None) for index in range(3)]
+        for index, key in enumerate(keys[:2]):
+            self.cache.put(key, self.translated)
+            os.utime(Path(self.temp_dir.name, f"{key}.json"), (index, index))
+
+        self.cache.get(keys[0])
+        self.cache.put(keys[2], self.translated)
+
+        self.assertIsNotNone(self.cache.get(keys[0]))
+        self.assertIsNone(self.cache.get(keys[1]))
+        self.assertIsNotNone(self.cache.get(keys[2]))
+
+    def test_must_ignore_corrupted_cached_template(self):
+        key = self.cache.key(self.template, None)
+        Path(self.temp_dir.name, f"{key}.json").write_text("{", encoding="utf-8")
+
+        self.assertIsNone(self.cache.get(key))
+
+
+class TestGetTranslatedTemplateCache(TestCase):
+    def tearDown(self):
+        configure_translated_template_cache(None)
+
+    def test_must_return_cache_in_build_cache_dir(self):
+        configure_translated_template_cache(os.path.join("project", ".aws-sam", "cache"))
+
+        with patch.dict(os.environ, {TEMPLATE_CACHE_ENV_VAR: "1"}):
+            cache = get_translated_template_cache()
+
+        self.assertIsInstance(cache, TranslatedTemplateCache)
+        self.assertEqual(
+            cache._cache_dir,
+            Path(os.path.abspath(os.path.join("project", ".aws-sam", "cache", "translated-templates"))),
+        )
+
+    def test_must_return_none_unless_command_enables_cache(self):
+        with patch.dict(os.environ, {TEMPLATE_CACHE_ENV_VAR: "1"}):
+            self.assertIsNone(get_translated_template_cache())
+
+    def test_must_return_none_if_disabled(self):
+        configure_translated_template_cache(os.path.join(".aws-sam", "cache"))
+
+        with patch.dict(os.environ, {TEMPLATE_CACHE_ENV_VAR: "0"}):
+            self.assertIsNone(get_translated_template_cache())
+
+    def test_must_use_existing_build_cache_dir_only(self):
+        with TemporaryDirectory() as project_dir:
+            cache_dir = os.path.join(project_dir, ".aws-sam", "cache")
+
+            with patch.dict(os.environ, {TEMPLATE_CACHE_ENV_VAR: "1"}):
+                configure_translated_template_cache(cache_dir, existing_only=True)
+                self.assertIsNone(get_translated_template_cache())
+
+                os.makedirs(cache_dir)
+                configure_translated_template_cache(cache_dir, existing_only=True)
+                self.assertEqual(
+                    get_translated_template_cache()._cache_dir,
+                    Path(cache_dir, "translated-templates"),
+                )
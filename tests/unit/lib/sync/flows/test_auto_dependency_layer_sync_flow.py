@@ -74,8 +74,7 @@ class TestAutoDependencyLayerSyncFlow(TestCase):
             self.sync_flow.gather_resources()
 
     @patch("samcli.lib.sync.flows.auto_dependency_layer_sync_flow.uuid")
-    @patch("samcli.lib.sync.flows.auto_dependency_layer_sync_flow.file_checksum")
-    @patch("samcli.lib.sync.flows.auto_dependency_layer_sync_flow.make_zip_with_lambda_permissions")
+    @patch("samcli.lib.sync.flows.auto_dependency_layer_sync_flow.make_zip_artifact_with_lambda_permissions")
     @patch("samcli.lib.sync.flows.auto_dependency_layer_sync_flow.tempfile")
     @patch("samcli.lib.sync.flows.auto_dependency_layer_sync_flow.NestedStackManager")
     def test_gather_resources(
@@ -83,7 +82,6 @@ class TestAutoDependencyLayerSyncFlow(TestCase):
         patched_nested_stack_manager,
         patched_tempfile,
         patched_make_zip,
-        patched_file_checksum,
         patched_uuid,
     ):
         layer_root_folder = "layer_root_folder"
@@ -96,8 +94,7 @@ class TestAutoDependencyLayerSyncFlow(TestCase):
         patched_nested_stack_manager.update_layer_folder.return_value = layer_root_folder
         patched_tempfile.gettempdir.return_value = tmpdir
         patched_uuid.uuid4.return_value = Mock(hex=uuid_hex)
-        patched_make_zip.return_value = zipfile
-        patched_file_checksum.return_value = "hash"
+        patched_make_zip.return_value = Mock(path=zipfile, sha256="hash")
         self.build_graph.get_function_build_definitions.return_value = [Mock(dependencies_dir=dependencies_dir)]
 
         with patch.object(self.sync_flow, "_get_compatible_runtimes") as patched_comp_runtimes:
@@ -111,7 +108,7 @@ class TestAutoDependencyLayerSyncFlow(TestCase):
             patched_make_zip.assert_called_with(
                 os.path.join(tmpdir, f"data-{uuid_hex}"), self.sync_flow._artifact_folder
             )
-            patched_file_checksum.assert_called_with(zipfile, ANY)
+            self.assertEqual(self.sync_flow._zip_file, zipfile)
             self.assertEqual(self.sync_flow._local_sha, "hash")
 
     def test_empty_gather_dependencies(self):
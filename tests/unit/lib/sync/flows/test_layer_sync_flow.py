@@ -77,15 +77,13 @@ class TestLayerSyncFlow(TestCase):
 
     @patch("samcli.lib.sync.flows.layer_sync_flow.ApplicationBuilder")
     @patch("samcli.lib.sync.flows.layer_sync_flow.tempfile")
-    @patch("samcli.lib.sync.flows.layer_sync_flow.make_zip_with_lambda_permissions")
-    @patch("samcli.lib.sync.flows.layer_sync_flow.file_checksum")
+    @patch("samcli.lib.sync.flows.layer_sync_flow.make_zip_artifact_with_lambda_permissions")
     @patch("samcli.lib.sync.flows.layer_sync_flow.os")
     @patch("samcli.lib.sync.flows.layer_sync_flow.rmtree_if_exists")
     def test_setup_gather_resources(
         self,
         patched_rmtree_if_exists,
         patched_os,
-        patched_file_checksum,
         patched_make_zip,
         patched_tempfile,
         patched_app_builder,
@@ -99,10 +97,8 @@ class TestLayerSyncFlow(TestCase):
         patched_app_builder.return_value = given_app_builder
 
         given_zip_location = Mock()
-        patched_make_zip.return_value = given_zip_location
-
         given_file_checksum = Mock()
-        patched_file_checksum.return_value = given_file_checksum
+        patched_make_zip.return_value = Mock(path=given_zip_location, sha256=given_file_checksum)
 
         self.layer_sync_flow._get_lock_chain = MagicMock()
 
@@ -145,10 +141,9 @@ class TestLayerSyncFlow(TestCase):
         patched_os.path.join.assert_called_with(ANY, ANY)
         patched_make_zip.assert_called_with(ANY, self.layer_sync_flow._artifact_folder)
 
-        patched_file_checksum.assert_called_with(ANY, ANY)
-
         self.assertEqual(self.layer_sync_flow._zip_file, given_zip_location)
         self.assertEqual(self.layer_sync_flow._local_sha, given_file_checksum)
+        self.assertEqual(self.layer_sync_flow._local_sha, given_file_checksum)
 
     @patch("samcli.lib.sync.flows.layer_sync_flow.get_latest_layer_version")
     def test_compare_remote(self, patched_get_latest_layer_version):
@@ -495,16 +490,16 @@ class TestFunctionLayerReferenceSync(TestCase):
 class TestLayerSyncFlowSkipBuild(TestCase):
     build_artifacts = None
 
-    @patch("samcli.lib.sync.flows.layer_sync_flow.make_zip_with_lambda_permissions")
-    @patch("samcli.lib.sync.flows.layer_sync_flow.file_checksum")
-    def test_gather_resources_for_skip_build_directory(self, mock_checksum, mock_make_zip):
+    @patch("samcli.lib.sync.flows.layer_sync_flow.make_zip_artifact_with_lambda_permissions")
+    def test_gather_resources_for_skip_build_directory(self, mock_make_zip):
         layer_sync_flow = LayerSyncFlowSkipBuildDirectory(
             "LayerA", Mock(), Mock(), Mock(), {}, [], self.build_artifacts
         )
         layer_sync_flow.gather_resources()
 
         mock_make_zip.assert_called_with(ANY, layer_sync_flow._layer.codeuri)
-        mock_checksum.assert_called_once()
+        self.assertEqual(layer_sync_flow._zip_file, mock_make_zip.return_value.path)
+        self.assertEqual(layer_sync_flow._local_sha, mock_make_zip.return_value.sha256)
 
     @patch("samcli.lib.sync.flows.layer_sync_flow.shutil")
     @patch("samcli.lib.sync.flows.layer_sync_flow.file_checksum")
@@ -44,10 +44,24 @@ class TestZipFunctionSyncFlow(TestCase):
         client_provider_mock.return_value.assert_any_call("lambda")
         client_provider_mock.return_value.assert_any_call("s3")
 
-    @patch("samcli.lib.sync.flows.zip_function_sync_flow.hashlib.sha256")
+    @patch("samcli.lib.sync.sync_flow.get_boto_client_provider_from_session_with_config")
+    @patch("samcli.lib.sync.sync_flow.Session")
+    def test_set_up_shares_s3_client_per_deploy_context(self, session_mock, client_provider_mock):
+        client_provider_mock.return_value.side_effect = lambda client_name: Mock()
+        deploy_context = MagicMock()
+        flows = [self.create_function_sync_flow() for _ in range(3)]
+        other_deploy_flow = self.create_function_sync_flow()
+        for sync_flow in flows:
+            sync_flow._deploy_context = deploy_context
+            sync_flow.set_up()
+        other_deploy_flow.set_up()
+
+        self.assertIs(flows[0]._s3_client, flows[1]._s3_client)
+        self.assertIs(flows[0]._s3_client, flows[2]._s3_client)
+        self.assertIsNot(flows[0]._s3_client, other_deploy_flow._s3_client)
+
     @patch("samcli.lib.sync.flows.zip_function_sync_flow.uuid.uuid4")
-    @patch("samcli.lib.sync.flows.zip_function_sync_flow.file_checksum")
-    @patch("samcli.lib.sync.flows.zip_function_sync_flow.make_zip_with_lambda_permissions")
+    @patch("samcli.lib.sync.flows.zip_function_sync_flow.make_zip_artifact_with_lambda_permissions")
     @patch("samcli.lib.sync.flows.zip_function_sync_flow.tempfile.gettempdir")
     @patch("samcli.lib.sync.flows.zip_function_sync_flow.ApplicationBuilder")
     @patch("samcli.lib.sync.flows.zip_function_sync_flow.rmtree_if_exists")
@@ -59,17 +73,14 @@ class TestZipFunctionSyncFlow(TestCase):
         builder_mock,
         gettempdir_mock,
         make_zip_mock,
-        file_checksum_mock,
         uuid4_mock,
-        sha256_mock,
     ):
         get_mock = MagicMock()
         get_mock.return_value = "ArtifactFolder1"
         builder_mock.return_value.build.return_value.artifacts.get = get_mock
         uuid4_mock.return_value.hex = "uuid_value"
         gettempdir_mock.return_value = "temp_folder"
-        make_zip_mock.return_value = "zip_file"
-        file_checksum_mock.return_value = "sha256_value"
+        make_zip_mock.return_value = Mock(path="zip_file", sha256="sha256_value")
         sync_flow = self.create_function_sync_flow()
 
         sync_flow._get_lock_chain = MagicMock()
@@ -100,7 +111,7 @@ class TestZipFunctionSyncFlow(TestCase):
             sync_flow._get_lock_chain.return_value.__enter__.assert_called_once()
             sync_flow._get_lock_chain.return_value.__exit__.assert_called_once()
 
-        file_checksum_mock.assert_called_once_with("zip_file", sha256_mock.return_value)
+        self.assertEqual("zip_file", sync_flow._zip_file)
         self.assertEqual("sha256_value", sync_flow._local_sha)
 
     @patch("samcli.lib.sync.flows.zip_function_sync_flow.base64.b64decode")
@@ -1,8 +1,12 @@
+import os
+import tempfile
+from pathlib import Path
 from unittest.case import TestCase
 from unittest.mock import MagicMock, patch, ANY, call
 from samcli.lib.providers.provider import ResourceIdentifier
 from samcli.lib.sync.infra_sync_executor import InfraSyncResult
 from samcli.lib.sync.watch_manager import WatchManager
+from samcli.lib.utils.event_coalescer import EventCoalescer
 from samcli.lib.providers.exceptions import MissingCodeUri, MissingLocalDefinition, InvalidTemplateFile
 from samcli.lib.sync.exceptions import MissingPhysicalResourceError, SyncFlowException
 from parameterized import parameterized
@@ -35,9 +39,11 @@ class TestWatchManager(TestCase):
             False,
             False,
             {},
+            watch_quiet_window=0,
         )
 
     def tearDown(self) -> None:
+        self.watch_manager._change_coalescer.stop()
         self.path_observer_patch.stop()
         self.executor_patch.stop()
         self.colored_patch.stop()
@@ -47,6 +53,11 @@ class TestWatchManager(TestCase):
         self.watch_manager.queue_infra_sync()
         self.assertTrue(self.watch_manager._waiting_infra_sync)
 
+    def test_queue_infra_sync_discards_pending_code_changes(self):
+        self.watch_manager._change_coalescer = MagicMock()
+        self.watch_manager.queue_infra_sync()
+        self.watch_manager._change_coalescer.discard.assert_called_once_with()
+
     @patch("samcli.lib.sync.watch_manager.SamLocalStackProvider.get_stacks")
     @patch("samcli.lib.sync.watch_manager.SyncFlowFactory")
     @patch("samcli.lib.sync.watch_manager.CodeTriggerFactory")
@@ -354,8 +365,102 @@ class TestWatchManager(TestCase):
         callback = self.watch_manager._on_code_change_wrapper(resource_id_mock)
 
         callback()
+        self.watch_manager._change_coalescer.flush_ready()
+
+        self.executor.add_delayed_sync_flow.assert_any_call(flow1, dedup=True)
+
+    def test_on_code_change_wrapper_coalesces_events_per_resource(self):
+        now = [100.0]
+        self.watch_manager._change_coalescer = EventCoalescer(
+            self.watch_manager._on_resource_changes, quiet_window=1, clock=lambda: now[0]
+        )
+        factory_mock = MagicMock()
+        self.watch_manager._sync_flow_factory = factory_mock
+        function1 = ResourceIdentifier("Function1")
+        function2 = ResourceIdentifier("Function2")
+
+        for _ in range(100):
+            self.watch_manager._on_code_change_wrapper(function1)()
+        self.watch_manager._on_code_change_wrapper(function2)()
+        self.watch_manager._change_coalescer.flush_ready()
+        factory_mock.create_sync_flow.assert_not_called()
+
+        now[0] = 101.5
+        self.watch_manager._change_coalescer.flush_ready()
+
+        factory_mock.create_sync_flow.assert_has_calls([call(function1), call(function2)], any_order=True)
+        self.assertEqual(factory_mock.create_sync_flow.call_count, 2)
+        self.assertEqual(self.executor.add_delayed_sync_flow.call_count, 2)
+
+    def test_on_code_change_wrapper_skips_files_with_same_content(self):
+        factory_mock = MagicMock()
+        self.watch_manager._sync_flow_factory = factory_mock
+        callback = self.watch_manager._on_code_change_wrapper(ResourceIdentifier("Function"))
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, "app.py")
+            Path(file_path).write_text("print('hello')")
+            event = MagicMock(event_type="modified", is_directory=False, src_path=file_path)
+
+            callback(event)
+            self.watch_manager._change_coalescer.flush_ready()
+            callback(event)
+            self.watch_manager._change_coalescer.flush_ready()
+            self.assertEqual(factory_mock.create_sync_flow.call_count, 1)
+
+            Path(file_path).write_text("print('world')")
+            callback(event)
+            self.watch_manager._change_coalescer.flush_ready()
+            self.assertEqual(factory_mock.create_sync_flow.call_count, 2)
+
+            os.remove(file_path)
+            callback(event)
+            self.watch_manager._change_coalescer.flush_ready()
+            self.assertEqual(factory_mock.create_sync_flow.call_count, 3)
+
+    def test_on_code_change_wrapper_syncs_same_content_again_after_failed_sync(self):
+        factory_mock = MagicMock()
+        self.watch_manager._sync_flow_factory = factory_mock
+        callback = self.watch_manager._on_code_change_wrapper(ResourceIdentifier("Function"))
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, "app.py")
+            Path(file_path).write_text("print('hello')")
+            event = MagicMock(event_type="modified", is_directory=False, src_path=file_path)
+
+            callback(event)
+            self.watch_manager._change_coalescer.flush_ready()
+            sync_flow_exception = MagicMock(spec=SyncFlowException)
+            sync_flow_exception.exception = ValueError("sync failed")
+            self.watch_manager._watch_sync_flow_exception_handler(sync_flow_exception)
+            callback(event)
+            self.watch_manager._change_coalescer.flush_ready()
+
+            self.assertEqual(factory_mock.create_sync_flow.call_count, 2)
+
+    def test_on_code_change_wrapper_does_not_record_content_which_is_not_synced(self):
+        factory_mock = MagicMock()
+        self.watch_manager._sync_flow_factory = factory_mock
+        self.watch_manager._waiting_infra_sync = True
+        callback = self.watch_manager._on_code_change_wrapper(ResourceIdentifier("Function"))
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, "app.py")
+            Path(file_path).write_text("print('hello')")
+
+            callback(MagicMock(event_type="modified", is_directory=False, src_path=file_path))
+            self.watch_manager._change_coalescer.flush_ready()
+
+        self.executor.add_delayed_sync_flow.assert_not_called()
+        self.assertEqual(self.watch_manager._path_checksums, {})
+
+    @patch("samcli.lib.sync.watch_manager.MAX_PATH_CHECKSUMS", 2)
+    def test_record_checksums_keeps_most_recently_synced_paths(self):
+        self.watch_manager._record_checksums({"a": "1", "b": "2"})
+        self.watch_manager._record_checksums({"a": "3", "c": "4"})
+        self.watch_manager._record_checksums({"d": None})
 
-        self.executor.add_delayed_sync_flow.assert_any_call(flow1, dedup=True, wait_time=ANY)
+        self.assertEqual(self.watch_manager._path_checksums, {"a": "3", "c": "4"})
 
     def test_on_code_change_wrapper_opened_event_not_called(self):
         flow1 = MagicMock()
@@ -393,6 +498,7 @@ class TestWatchManager(TestCase):
 
         self.watch_manager._sync_flow_factory = None
         self.watch_manager._on_code_change_wrapper(resource_id_mock)()
+        self.watch_manager._change_coalescer.flush_ready()
 
         self.executor.add_delayed_sync_flow.assert_not_called()
 
@@ -0,0 +1,254 @@
+import os
+import threading
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import ANY, Mock, patch
+
+import requests
+
+from samcli.lib.telemetry import metrics_sender
+from samcli.lib.telemetry.metrics_sender import (
+    OFFLINE_MARKER_NAME,
+    OFFLINE_RETRY_INTERVAL,
+    MetricsSender,
+    MetricsSpool,
+    flush_metrics,
+    get_metrics_sender,
+)
+
+
+class TestMetricsSpool(TestCase):
+    def setUp(self):
+        self.temp_dir = TemporaryDirectory()
+        self.spool_dir = Path(self.temp_dir.name, "spool")
+        self.spool = MetricsSpool(self.spool_dir, max_batches=2)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_must_save_and_load_batches_in_order(self):
+        self.spool.save([{"a": 1}])
+        self.spool.save([{"b": 2}])
+
+        self.assertEqual([self.spool.load(batch) for batch in self.spool.batches()], [[{"a": 1}], [{"b": 2}]])
+
+    def test_must_drop_oldest_batches_over_the_limit(self):
+        for index in range(3):
+            self.spool.save([{"index": index}])
+
+        self.assertEqual([self.spool.load(batch) for batch in self.spool.batches()], [[{"index": 1}], [{"index": 2}]])
+
+    def test_must_not_save_empty_batch(self):
+        self.spool.save([])
+
+        self.assertFalse(self.spool_dir.exists())
+
+    def test_must_ignore_corrupted_batch(self):
+        self.spool_dir.mkdir()
+        batch = Path(self.spool_dir, "1-batch.json")
+        batch.write_text("{not json", encoding="utf-8")
+
+        self.assertIsNone(self.spool.load(batch))
+
+    def test_must_remove_batch(self):
+        self.spool.save([{"a": 1}])
+
+        self.spool.remove(self.spool.batches()[0])
+        self.spool.remove(Path(self.spool_dir, "missing.json"))
+
+        self.assertEqual(self.spool.batches(), [])
+
+    def test_must_remember_offline_for_retry_interval(self):
+        self.assertFalse(self.spool.is_offline())
+
+        self.spool.set_offline(True)
+        self.assertTrue(self.spool.is_offline())
+
+        failed_at = time.time() - OFFLINE_RETRY_INTERVAL - 1
+        os.utime(Path(self.spool_dir, OFFLINE_MARKER_NAME), (failed_at, failed_at))
+        self.assertFalse(self.spool.is_offline())
+
+        self.spool.set_offline(True)
+        self.spool.set_offline(False)
+        self.assertFalse(self.spool.is_offline())
+
+
+class TestMetricsSender(TestCase):
+    def setUp(self):
+        self.temp_dir = TemporaryDirectory()
+        self.spool = MetricsSpool(Path(self.temp_dir.name))
+        self.url = "https://telemetry"
+
+        self.requests_patcher = patch("samcli.lib.telemetry.metrics_sender.requests")
+        self.requests_mock = self.requests_patcher.start()
+        # keep the real exceptions, so that they can be caught
+        self.requests_mock.exceptions = requests.exceptions
+
+    def tearDown(self):
+        self.requests_patcher.stop()
+        self.temp_dir.cleanup()
+
+    def _spooled_metrics(self):
+        return [metric for batch in self.spool.batches() for metric in self.spool.load(batch)]
+
+    def test_must_send_metrics_in_batches(self):
+        sender = MetricsSender(self.url, self.spool, max_batch_size=2)
+
+        for index in range(3):
+            sender.enqueue({"index": index})
+        sender.flush()
+
+        self.assertEqual(
+            [call_args.kwargs["json"] for call_args in self.requests_mock.post.call_args_list],
+            [{"metrics": [{"index": 0}, {"index": 1}]}, {"metrics": [{"index": 2}]}],
+        )
+        self.requests_mock.post.assert_called_with(self.url, json=ANY, timeout=(2, 0.5))
+
+    def test_must_send_metrics_after_batch_interval(self):
+        sent = threading.Event()
+        self.requests_mock.post.side_effect = lambda *args, **kwargs: sent.set() or Mock()
+        sender = MetricsSender(self.url, self.spool, batch_interval=0.01)
+
+        sender.enqueue({"a": 1})
+
+        self.assertTrue(sent.wait(5))
+        self.requests_mock.post.assert_called_once_with(self.url, json={"metrics": [{"a": 1}]}, timeout=ANY)
+
+    def test_enqueue_must_not_wait_for_the_endpoint(self):
+        released = threading.Event()
+        self.requests_mock.post.side_effect = lambda *args, **kwargs: released.wait(5) and Mock()
+        sender = MetricsSender(self.url, self.spool, max_batch_size=1)
+
+        start = time.monotonic()
+        sender.enqueue({"a": 1})
+        sender.enqueue({"b": 2})
+        self.assertLess(time.monotonic() - start, 1)
+
+        released.set()
+        sender.flush()
+
+    def test_must_spool_metrics_if_endpoint_is_not_reachable(self):
+        self.requests_mock.post.side_effect = requests.exceptions.ConnectTimeout()
+        sender = MetricsSender(self.url, self.spool)
+
+        sender.enqueue({"a": 1})
+        sender.flush()
+
+        self.assertEqual(self._spooled_metrics(), [{"a": 1}])
+        self.assertTrue(self.spool.is_offline())
+
+    def test_must_not_connect_while_offline(self):
+        self.spool.set_offline(True)
+        sender = MetricsSender(self.url, self.spool)
+
+        sender.enqueue({"a": 1})
+        sender.flush()
+
+        self.requests_mock.post.assert_not_called()
+        self.assertEqual(self._spooled_metrics(), [{"a": 1}])
+
+    def test_must_not_spool_metrics_if_response_times_out(self):
+        self.requests_mock.post.side_effect = requests.exceptions.ReadTimeout()
+        sender = MetricsSender(self.url, self.spool)
+
+        sender.enqueue({"a": 1})
+        sender.flush()
+
+        self.assertEqual(self._spooled_metrics(), [])
+
+    def test_must_send_spooled_metrics_once_online(self):
+        self.spool.save([{"old": 1}])
+        sender = MetricsSender(self.url, self.spool)
+
+        sender.enqueue({"new": 1})
+        sender.flush()
+
+        self.assertEqual(
+            [call_args.kwargs["json"] for call_args in self.requests_mock.post.call_args_list],
+            [{"metrics": [{"new": 1}]}, {"metrics": [{"old": 1}]}],
+        )
+        self.assertEqual(self.spool.batches(), [])
+
+    def test_flush_must_spool_metrics_which_are_not_sent_in_time(self):
+        released = threading.Event()
+        self.requests_mock.post.side_effect = lambda *args, **kwargs: released.wait(5) and Mock()
+        sender = MetricsSender(self.url, self.spool, max_batch_size=1)
+
+        sender.enqueue({"a": 1})
+        sender.enqueue({"b": 2})
+        sender.flush(timeout=0.1)
+        sender.enqueue({"c": 3})
+        released.set()
+        sender._thread.join(5)
+
+        # the batch being sent when flush gave up is not spooled, since its request succeeded
+        self.assertEqual(sorted(self._spooled_metrics(), key=str), [{"b": 2}, {"c": 3}])
+        self.requests_mock.post.assert_called_once_with(self.url, json={"metrics": [{"a": 1}]}, timeout=ANY)
+
+    def test_must_spool_batch_being_sent_if_request_fails_after_flush(self):
+        released = threading.Event()
+
+        def post(*args, **kwargs):
+            released.wait(5)
+            raise requests.exceptions.ConnectTimeout()
+
+        self.requests_mock.post.side_effect = post
+        sender = MetricsSender(self.url, self.spool, max_batch_size=1)
+
+        sender.enqueue({"a": 1})
+        sender.flush(timeout=0.1)
+        self.assertEqual(self._spooled_metrics(), [])
+        released.set()
+        sender._thread.join(5)
+
+        self.assertEqual(self._spooled_metrics(), [{"a": 1}])
+
+    def test_flush_must_mark_endpoint_offline_if_request_is_still_running(self):
+        released = threading.Event()
+        self.requests_mock.post.side_effect = lambda *args, **kwargs: released.wait(5) and Mock()
+        sender = MetricsSender(self.url, self.spool, max_batch_size=1)
+
+        sender.enqueue({"a": 1})
+        sender.flush(timeout=0.1)
+
+        self.assertTrue(self.spool.is_offline())
+        # the request still running sends its batch
+        self.assertEqual(self._spooled_metrics(), [])
+        released.set()
+        sender._thread.join(5)
+
+    def test_flush_must_return_if_nothing_was_queued(self):
+        sender = MetricsSender(self.url, self.spool)
+
+        sender.flush()
+
+        self.requests_mock.post.assert_not_called()
+
+
+class TestGetMetricsSender(TestCase):
+    def setUp(self):
+        self.senders_patcher = patch.object(metrics_sender, "_METRICS_SENDERS", {})
+        self.senders_patcher.start()
+
+    def tearDown(self):
+        self.senders_patcher.stop()
+
+    @patch("samcli.lib.telemetry.metrics_sender.GlobalConfig")
+    def test_must_share_sender_of_endpoint(self, global_config_mock):
+        global_config_mock.return_value.config_dir = Path("config")
+
+        sender = get_metrics_sender("url1")
+
+        self.assertIs(get_metrics_sender("url1"), sender)
+        self.assertIsNot(get_metrics_sender("url2"), sender)
+
+    def test_flush_metrics_must_flush_all_senders(self):
+        senders = [Mock(), Mock()]
+        metrics_sender._METRICS_SENDERS.update({"url1": senders[0], "url2": senders[1]})
+
+        flush_metrics()
+
+        for sender in senders:
+            sender.flush.assert_called_once()
@@ -1,6 +1,4 @@
-import requests
-
-from unittest.mock import patch, Mock, ANY
+from unittest.mock import patch, Mock
 from unittest import TestCase
 
 from samcli.lib.telemetry.telemetry import Telemetry
@@ -24,8 +22,8 @@ class TestTelemetry(TestCase):
     def tearDown(self):
         self.global_config_patcher.stop()
 
-    @patch("samcli.lib.telemetry.telemetry.requests")
-    def test_must_add_metric_with_attributes_to_registry(self, requests_mock):
+    @patch("samcli.lib.telemetry.telemetry.get_metrics_sender")
+    def test_must_queue_metric_with_attributes(self, get_metrics_sender_mock):
         telemetry = Telemetry(url=self.url)
 
         metric_name = "mymetric"
@@ -37,60 +35,17 @@ class TestTelemetry(TestCase):
 
         telemetry.emit(metric_mock)
 
-        expected = {"metrics": [{metric_name: {"a": 1, "b": 2}}]}
-        requests_mock.post.assert_called_once_with(ANY, json=expected, timeout=ANY)
-
-    @patch("samcli.lib.telemetry.telemetry.requests")
-    def test_default_request_should_be_fire_and_forget(self, requests_mock):
-        telemetry = Telemetry(url=self.url)
-
-        telemetry.emit(self.metric_mock)
-        requests_mock.post.assert_called_once_with(ANY, json=ANY, timeout=(2, 0.1))  # 100ms response timeout
-
-    @patch("samcli.lib.telemetry.telemetry.requests")
-    def test_request_must_wait_for_2_seconds_for_response(self, requests_mock):
-        telemetry = Telemetry(url=self.url)
-
-        telemetry._send(self.metric_mock, wait_for_response=True)
-        requests_mock.post.assert_called_once_with(ANY, json=ANY, timeout=(2, 2))
-
-    @patch("samcli.lib.telemetry.telemetry.requests")
-    def test_must_swallow_timeout_exception(self, requests_mock):
-        telemetry = Telemetry(url=self.url)
-
-        # If we Mock the entire requests library, this statement will run into issues
-        #   `except requests.exceptions.Timeout`
-        # https://stackoverflow.com/questions/31713054/cant-catch-mocked-exception-because-it-doesnt-inherit-baseexception
-        #
-        # Hence we save the original Timeout object to the Mock, so Python won't complain.
-        #
-
-        requests_mock.exceptions.Timeout = requests.exceptions.Timeout
-        requests_mock.exceptions.ConnectionError = requests.exceptions.ConnectionError
-        requests_mock.post.side_effect = requests.exceptions.Timeout()
-
-        telemetry.emit(self.metric_mock)
+        get_metrics_sender_mock.assert_called_once_with(self.url)
+        get_metrics_sender_mock.return_value.enqueue.assert_called_once_with({metric_name: {"a": 1, "b": 2}})
 
-    @patch("samcli.lib.telemetry.telemetry.requests")
-    def test_must_swallow_connection_error_exception(self, requests_mock):
+    @patch("samcli.lib.telemetry.telemetry.get_metrics_sender")
+    def test_must_not_queue_metric_if_endpoint_is_not_configured(self, get_metrics_sender_mock):
         telemetry = Telemetry(url=self.url)
-
-        requests_mock.exceptions.Timeout = requests.exceptions.Timeout
-        requests_mock.exceptions.ConnectionError = requests.exceptions.ConnectionError
-        requests_mock.post.side_effect = requests.exceptions.ConnectionError()
+        telemetry._url = None
 
         telemetry.emit(self.metric_mock)
 
-    @patch("samcli.lib.telemetry.telemetry.requests")
-    def test_must_raise_on_other_requests_exception(self, requests_mock):
-        telemetry = Telemetry(url=self.url)
-
-        requests_mock.exceptions.Timeout = requests.exceptions.Timeout
-        requests_mock.exceptions.ConnectionError = requests.exceptions.ConnectionError
-        requests_mock.post.side_effect = IOError()
-
-        with self.assertRaises(IOError):
-            telemetry.emit(self.metric_mock)
+        get_metrics_sender_mock.assert_not_called()
 
     @patch("samcli.lib.telemetry.telemetry.DEFAULT_ENDPOINT_URL")
     def test_must_use_default_endpoint_url_if_not_customized(self, default_endpoint_url_mock):
@@ -98,18 +53,18 @@ class TestTelemetry(TestCase):
 
         self.assertEqual(telemetry._url, default_endpoint_url_mock)
 
-    @patch("samcli.lib.telemetry.telemetry.requests")
+    @patch("samcli.lib.telemetry.telemetry.get_metrics_sender")
     @patch("samcli.lib.telemetry.telemetry.GlobalConfig")
-    def test_must_not_send_when_telemetry_disabled(self, gc_mock, requests_mock):
+    def test_must_not_send_when_telemetry_disabled(self, gc_mock, get_metrics_sender_mock):
         telemetry = Telemetry(url=self.url)
         gc_mock.return_value.telemetry_enabled = False
         telemetry.emit(self.metric_mock)
-        requests_mock.post.assert_not_called()
+        get_metrics_sender_mock.return_value.enqueue.assert_not_called()
 
-    @patch("samcli.lib.telemetry.telemetry.requests")
+    @patch("samcli.lib.telemetry.telemetry.get_metrics_sender")
     @patch("samcli.lib.telemetry.telemetry.GlobalConfig")
-    def test_must_send_when_telemetry_disabled_but_forced(self, gc_mock, requests_mock):
+    def test_must_send_when_telemetry_disabled_but_forced(self, gc_mock, get_metrics_sender_mock):
         telemetry = Telemetry(url=self.url)
         gc_mock.return_value.telemetry_enabled = False
         telemetry.emit(self.metric_mock, force_emit=True)
-        requests_mock.post.assert_called()
+        get_metrics_sender_mock.return_value.enqueue.assert_called()
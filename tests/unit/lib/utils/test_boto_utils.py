@@ -61,8 +61,9 @@ class TestBotoUtils(TestCase):
         given_session.client.assert_called_with(given_client_name, config=given_config)
 
     @patch("samcli.lib.utils.boto_utils.get_boto_client_provider_from_session_with_config")
-    @patch("samcli.lib.utils.boto_utils.Session")
-    def test_get_boto_client_provider_with_config(self, patched_session, patched_get_client):
+    @patch("samcli.lib.utils.boto_utils.boto3")
+    def test_get_boto_client_provider_with_config(self, patched_boto3, patched_get_client):
+        patched_session = patched_boto3.Session
         given_session = Mock()
         patched_session.return_value = given_session
 
@@ -82,8 +83,9 @@ class TestBotoUtils(TestCase):
         self.assertEqual(given_client_generator, client_generator)
 
     @patch("samcli.lib.utils.boto_utils.get_boto_resource_provider_from_session_with_config")
-    @patch("samcli.lib.utils.boto_utils.Session")
-    def test_get_boto_resource_provider_with_config(self, patched_session, patched_get_resource):
+    @patch("samcli.lib.utils.boto_utils.boto3")
+    def test_get_boto_resource_provider_with_config(self, patched_boto3, patched_get_resource):
+        patched_session = patched_boto3.Session
         given_session = Mock()
         patched_session.return_value = given_session
 
@@ -0,0 +1,78 @@
+import threading
+from unittest import TestCase
+from unittest.mock import Mock, call
+
+from samcli.lib.utils.event_coalescer import EventCoalescer
+
+
+class TestEventCoalescer(TestCase):
+    def setUp(self):
+        self.now = 100.0
+        self.on_flush = Mock()
+        self.coalescer = EventCoalescer(self.on_flush, quiet_window=1, max_delay=5, clock=lambda: self.now)
+
+    def test_must_not_accept_negative_quiet_window(self):
+        with self.assertRaises(ValueError):
+            EventCoalescer(Mock(), quiet_window=-1)
+
+    def test_must_flush_once_per_key_after_quiet_window(self):
+        self.coalescer.add("function1", "a.py")
+        self.coalescer.add("function1", "b.py")
+        self.coalescer.add("function1", "a.py")
+        self.coalescer.add("function2")
+
+        self.assertEqual(self.coalescer.flush_ready(), 1)
+        self.on_flush.assert_not_called()
+
+        self.now = 101.0
+        self.assertIsNone(self.coalescer.flush_ready())
+
+        self.on_flush.assert_has_calls([call("function1", {"a.py", "b.py"}), call("function2", set())], any_order=True)
+        self.assertEqual(self.on_flush.call_count, 2)
+
+    def test_must_extend_quiet_window_on_new_events(self):
+        self.coalescer.add("function", "a.py")
+        self.now = 100.8
+        self.coalescer.add("function", "b.py")
+        self.now = 101.2
+
+        self.assertAlmostEqual(self.coalescer.flush_ready(), 0.6)
+        self.on_flush.assert_not_called()
+
+    def test_must_flush_continuous_changes_after_max_delay(self):
+        self.coalescer.add("function", "a.py")
+        for _ in range(10):
+            self.now += 0.5
+            self.coalescer.add("function", "a.py")
+            self.coalescer.flush_ready()
+
+        self.on_flush.assert_called_once_with("function", {"a.py"})
+
+    def test_must_keep_flushing_when_callback_fails(self):
+        self.on_flush.side_effect = [Exception("failed"), None]
+        self.coalescer.add("function1")
+        self.coalescer.add("function2")
+        self.now = 102.0
+
+        self.coalescer.flush_ready()
+
+        self.assertEqual(self.on_flush.call_count, 2)
+
+    def test_must_drop_pending_changes_on_discard(self):
+        self.coalescer.add("function", "a.py")
+        self.coalescer.discard()
+        self.now = 102.0
+
+        self.coalescer.flush_ready()
+
+        self.on_flush.assert_not_called()
+
+    def test_must_flush_from_background_thread(self):
+        flushed = threading.Event()
+        coalescer = EventCoalescer(lambda key, paths: flushed.set(), quiet_window=0.01)
+        coalescer.start()
+        try:
+            coalescer.add("function", "a.py")
+            self.assertTrue(flushed.wait(timeout=5))
+        finally:
+            coalescer.stop()
@@ -1,12 +1,22 @@
 import hashlib
+import json
+import mmap
 import os
 import shutil
 import sys
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from unittest import TestCase
 from unittest.mock import patch
 
-from samcli.lib.utils.hash import dir_checksum, str_checksum
+from samcli.lib.utils.hash import (
+    FileChecksumCache,
+    dir_checksum,
+    dir_checksum_manifest,
+    directory_checksum,
+    file_checksum,
+    str_checksum,
+)
 
 
 class TestHash(TestCase):
@@ -120,6 +130,89 @@ class TestHash(TestCase):
             dir_checksum(os.path.dirname(_file.name))
             self.assertIn("Too many levels of symbolic links", ex.message)
 
+    def test_dir_checksum_manifest(self):
+        os.mkdir(os.path.join(self.temp_dir, "nested"))
+        for name, content in (("b.txt", "b"), ("a.txt", "a"), (os.path.join("nested", "c.txt"), "c")):
+            with open(os.path.join(self.temp_dir, name), "w") as f:
+                f.write(content)
+
+        result = dir_checksum_manifest(self.temp_dir)
+
+        self.assertEqual(result.checksum, dir_checksum(self.temp_dir))
+        self.assertEqual(list(result.files), ["a.txt", "b.txt", os.path.join("nested", "c.txt")])
+        self.assertEqual(result.files["a.txt"], str_checksum("a"))
+
+    def test_directory_checksum_from_file_checksums(self):
+        for name, content in (("b.txt", "b"), ("a.txt", "a")):
+            with open(os.path.join(self.temp_dir, name), "w") as f:
+                f.write(content)
+
+        checksum = directory_checksum([("a.txt", str_checksum("a")), ("b.txt", str_checksum("b"))])
+
+        self.assertEqual(checksum, dir_checksum(self.temp_dir))
+
+    def test_dir_checksum_same_with_single_worker(self):
+        for index in range(10):
+            with open(os.path.join(self.temp_dir, f"file-{index}"), "w") as f:
+                f.write(f"content {index}")
+
+        self.assertEqual(
+            dir_checksum_manifest(self.temp_dir, max_workers=1), dir_checksum_manifest(self.temp_dir, max_workers=8)
+        )
+
+    @patch("samcli.lib.utils.hash.ThreadPoolExecutor")
+    def test_dir_checksum_hashes_small_files_without_thread_pool(self, executor_mock):
+        for index in range(10):
+            with open(os.path.join(self.temp_dir, f"file-{index}"), "w") as f:
+                f.write(f"content {index}")
+
+        result = dir_checksum_manifest(self.temp_dir, max_workers=8)
+
+        executor_mock.assert_not_called()
+        self.assertEqual(result.files["file-0"], str_checksum("content 0"))
+
+    @patch("samcli.lib.utils.hash.BLOCK_SIZE", 4)
+    def test_dir_checksum_hashes_large_files_in_thread_pool(self):
+        for name, content in (("large-1", "large content"), ("small", "s"), ("large-2", "other content")):
+            with open(os.path.join(self.temp_dir, name), "w") as f:
+                f.write(content)
+
+        with patch("samcli.lib.utils.hash.ThreadPoolExecutor", wraps=ThreadPoolExecutor) as executor_mock:
+            result = dir_checksum_manifest(self.temp_dir, max_workers=8)
+
+        executor_mock.assert_called_once_with(max_workers=2)
+        self.assertEqual(result, dir_checksum_manifest(self.temp_dir, max_workers=1))
+
+    def test_file_checksum_reads_in_blocks(self):
+        path = os.path.join(self.temp_dir, "file")
+        content = os.urandom(1024 * 1024 * 2 + 10)
+        with open(path, "wb") as f:
+            f.write(content)
+
+        self.assertEqual(file_checksum(path, hashlib.sha256()), hashlib.sha256(content).hexdigest())
+
+    @patch("samcli.lib.utils.hash.BLOCK_SIZE", 1)
+    @patch("samcli.lib.utils.hash.MMAP_THRESHOLD", 1)
+    def test_file_checksum_from_memory_map(self):
+        path = os.path.join(self.temp_dir, "file")
+        with open(path, "wb") as f:
+            f.write(b"Testfile")
+
+        with patch("samcli.lib.utils.hash.mmap.mmap", wraps=mmap.mmap) as mmap_mock:
+            self.assertEqual(file_checksum(path), str_checksum("Testfile"))
+            mmap_mock.assert_called_once()
+
+    @patch("samcli.lib.utils.hash.BLOCK_SIZE", 4)
+    @patch("samcli.lib.utils.hash.MMAP_THRESHOLD", 1)
+    @patch("samcli.lib.utils.hash.mmap.mmap")
+    def test_file_checksum_falls_back_to_reads_when_mapping_fails(self, mmap_mock):
+        mmap_mock.side_effect = OSError("not supported")
+        path = os.path.join(self.temp_dir, "file")
+        with open(path, "wb") as f:
+            f.write(b"Testfile")
+
+        self.assertEqual(file_checksum(path), str_checksum("Testfile"))
+
     def test_str_checksum(self):
         checksum = str_checksum("Hello, World!")
         self.assertEqual(checksum, "65a8e27d8879283831b664bd8b7f0ad4")
@@ -131,3 +224,96 @@ class TestHash(TestCase):
             patched_hashlib.md5.assert_called_with(usedforsecurity=False)
         else:
             patched_hashlib.md5.assert_called_with()
+
+
+class TestFileChecksumCache(TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache_file = os.path.join(self.temp_dir, "cache", "file-checksums.json")
+        self.source_dir = os.path.join(self.temp_dir, "source")
+        os.mkdir(self.source_dir)
+        self.file_path = self._write("app.py", "print('hello')")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _write(self, name, content, age=60):
+        path = os.path.join(self.source_dir, name)
+        with open(path, "w") as f:
+            f.write(content)
+        # make the modification old enough to be indexed
+        modified = os.stat(path).st_mtime_ns - age * 1_000_000_000
+        os.utime(path, ns=(modified, modified))
+        return path
+
+    def test_must_return_same_checksum_as_file_checksum(self):
+        cache = FileChecksumCache(self.cache_file)
+        self.assertEqual(cache.checksum(self.file_path), file_checksum(self.file_path))
+
+    def test_must_not_read_unchanged_file_again(self):
+        cache = FileChecksumCache(self.cache_file)
+        cache.checksum(self.file_path)
+
+        with patch("samcli.lib.utils.hash.file_checksum") as file_checksum_mock:
+            cache.checksum(self.file_path)
+            file_checksum_mock.assert_not_called()
+
+    def test_must_read_file_again_when_it_changes(self):
+        cache = FileChecksumCache(self.cache_file)
+        checksum_before = cache.checksum(self.file_path)
+        self._write("app.py", "print('hello world')", age=30)
+
+        self.assertNotEqual(cache.checksum(self.file_path), checksum_before)
+        self.assertEqual(cache.checksum(self.file_path), file_checksum(self.file_path))
+
+    def test_must_not_index_recently_modified_files(self):
+        cache = FileChecksumCache(self.cache_file)
+        recent_file = self._write("recent.py", "recent", age=0)
+        cache.checksum(recent_file)
+
+        with patch("samcli.lib.utils.hash.file_checksum") as file_checksum_mock:
+            file_checksum_mock.return_value = "checksum"
+            cache.checksum(recent_file)
+            file_checksum_mock.assert_called_once()
+
+    def test_must_persist_index_between_instances(self):
+        cache = FileChecksumCache(self.cache_file)
+        checksum_before = dir_checksum(self.source_dir, checksum_cache=cache)
+        cache.save()
+
+        with patch("samcli.lib.utils.hash.file_checksum") as file_checksum_mock:
+            checksum_after = dir_checksum(self.source_dir, checksum_cache=FileChecksumCache(self.cache_file))
+            file_checksum_mock.assert_not_called()
+
+        self.assertEqual(checksum_before, checksum_after)
+        self.assertEqual(checksum_before, dir_checksum(self.source_dir))
+
+    def test_must_drop_deleted_files_when_saving(self):
+        cache = FileChecksumCache(self.cache_file)
+        other_file = self._write("other.py", "other")
+        cache.checksum(self.file_path)
+        cache.checksum(other_file)
+        os.remove(other_file)
+        cache.save()
+
+        with open(self.cache_file) as f:
+            self.assertEqual(list(json.load(f)["files"]), [os.path.abspath(self.file_path)])
+
+    def test_must_ignore_unreadable_cache_file(self):
+        os.makedirs(os.path.dirname(self.cache_file))
+        with open(self.cache_file, "w") as f:
+            f.write("not json")
+
+        cache = FileChecksumCache(self.cache_file)
+        self.assertEqual(cache.checksum(self.file_path), file_checksum(self.file_path))
+        cache.save()
+
+        with open(self.cache_file) as f:
+            self.assertEqual(json.load(f)["version"], FileChecksumCache.VERSION)
+
+    def test_memory_only_cache_must_not_write_files(self):
+        cache = FileChecksumCache()
+        cache.checksum(self.file_path)
+        cache.save()
+
+        self.assertFalse(os.path.exists(os.path.dirname(self.cache_file)))
@@ -0,0 +1,39 @@
+import importlib
+import sys
+from unittest import TestCase
+from unittest.mock import patch
+
+from samcli.lib.utils.lazy_import import LazyModule, lazy_import
+
+
+class TestLazyImport(TestCase):
+    def test_must_return_module_if_already_imported(self):
+        self.assertIs(lazy_import("json"), sys.modules["json"])
+
+    def test_must_import_module_on_first_use(self):
+        module = lazy_import("some.module")
+
+        self.assertIsInstance(module, LazyModule)
+        self.assertFalse(module.is_loaded)
+
+        # the import module proxy of samdev replaces importlib.import_module after the modules are loaded
+        with patch.object(importlib, "import_module") as patched_import_module:
+            self.assertEqual(module.some_function, patched_import_module.return_value.some_function)
+            self.assertEqual(module.other_function, patched_import_module.return_value.other_function)
+
+        self.assertTrue(module.is_loaded)
+        patched_import_module.assert_called_once_with("some.module")
+
+    def test_must_raise_import_error_on_first_use(self):
+        module = lazy_import("samcli.some_missing_module")
+
+        with self.assertRaises(ModuleNotFoundError):
+            module.some_function
+
+    def test_must_allow_patching_attributes(self):
+        module = LazyModule("json")
+
+        with patch.object(module, "dumps") as patched_dumps:
+            self.assertIs(module.dumps, patched_dumps)
+
+        self.assertIs(module.dumps, sys.modules["json"].dumps)
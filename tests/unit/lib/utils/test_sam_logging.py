@@ -27,7 +27,7 @@ class TestSamCliLogger(TestCase):
     @patch("samcli.lib.utils.sam_logging.logging")
     @patch("samcli.lib.utils.sam_logging.sys")
     @patch("samcli.lib.utils.sam_logging.os")
-    @patch("samcli.lib.utils.sam_logging.RichHandler")
+    @patch("samcli.lib.utils.sam_logging.rich_logging.RichHandler")
     def test_configure_samcli_logger_mock_terminal(self, mock_rich_handler, mock_os, mock_sys, logging_patch):
         mock_sys.stderr.isatty = Mock(return_value=True)
         mock_os.getenv = Mock(return_value=None)
@@ -48,7 +48,7 @@ class TestSamCliLogger(TestCase):
     @patch("samcli.lib.utils.sam_logging.logging")
     @patch("samcli.lib.utils.sam_logging.sys")
     @patch("samcli.lib.utils.sam_logging.os")
-    @patch("samcli.lib.utils.sam_logging.RichHandler")
+    @patch("samcli.lib.utils.sam_logging.rich_logging.RichHandler")
     def test_configure_samcli_logger_mock_terminal_opt_out(self, mock_rich_handler, mock_os, mock_sys, logging_patch):
         mock_sys.stderr.isatty = Mock(return_value=True)
         mock_os.getenv = Mock(return_value="1")
@@ -2,10 +2,11 @@
 Tests for StreamWriter
 """
 
+import threading
 from io import BytesIO, TextIOWrapper
 from unittest import TestCase
 
-from samcli.lib.utils.stream_writer import StreamWriter
+from samcli.lib.utils.stream_writer import ChunkedStreamWriter, StreamWriter
 
 from unittest.mock import Mock
 
@@ -79,3 +80,39 @@ class TestStreamWriter(TestCase):
             writer.write_str(line)
             flush_mock.assert_called_once_with()
             flush_mock.reset_mock()
+
+
+class TestChunkedStreamWriter(TestCase):
+    def test_must_yield_written_chunks_until_closed(self):
+        writer = ChunkedStreamWriter()
+        writer.write_bytes(b"hello")
+        writer.write_str(" wörld")
+        writer.write_bytes(b"")
+        writer.close()
+
+        self.assertEqual(list(writer), [b"hello", " wörld".encode("utf-8")])
+
+    def test_must_hand_over_chunks_between_threads(self):
+        writer = ChunkedStreamWriter(max_pending_chunks=1)
+
+        def produce():
+            for index in range(10):
+                writer.write_bytes(str(index).encode("utf-8"))
+            writer.close()
+
+        producer = threading.Thread(target=produce)
+        producer.start()
+
+        self.assertEqual(b"".join(writer), b"0123456789")
+        producer.join()
+
+    def test_must_not_block_writer_once_aborted(self):
+        writer = ChunkedStreamWriter(max_pending_chunks=1)
+        writer.write_bytes(b"first")
+        writer.abort()
+
+        producer = threading.Thread(target=lambda: (writer.write_bytes(b"second"), writer.close()))
+        producer.start()
+        producer.join(timeout=5)
+
+        self.assertFalse(producer.is_alive())
@@ -53,18 +53,20 @@ class TestVersionChecker(TestCase):
         mock_fetch_and_compare_versions.assert_not_called()
         mock_update_last_check.assert_not_called()
 
-    @patch("samcli.lib.utils.version_checker.get")
+    @patch("samcli.lib.utils.version_checker.requests")
     @patch("samcli.cli.global_config.GlobalConfig._get_value")
-    def test_actual_function_should_return_on_exception(self, get_value_mock, get_mock):
+    def test_actual_function_should_return_on_exception(self, get_value_mock, requests_mock):
+        get_mock = requests_mock.get
         get_value_mock.return_value = None
         get_mock.side_effect = Exception()
         actual = real_fn("Hello", "World")
         self.assertEqual(actual, "Hello World")
 
-    @patch("samcli.lib.utils.version_checker.get")
+    @patch("samcli.lib.utils.version_checker.requests")
     @patch("samcli.lib.utils.version_checker.LOG")
     @patch("samcli.lib.utils.version_checker.installed_version", "1.9.0")
-    def test_compare_invalid_response(self, mock_log, get_mock):
+    def test_compare_invalid_response(self, mock_log, requests_mock):
+        get_mock = requests_mock.get
         get_mock.return_value.json.return_value = {}
         fetch_and_compare_versions()
 
@@ -76,10 +78,11 @@ class TestVersionChecker(TestCase):
             ]
         )
 
-    @patch("samcli.lib.utils.version_checker.get")
+    @patch("samcli.lib.utils.version_checker.requests")
     @patch("samcli.lib.utils.version_checker.LOG")
     @patch("samcli.lib.utils.version_checker.installed_version", "1.9.0")
-    def test_fetch_and_compare_versions_same(self, mock_log, get_mock):
+    def test_fetch_and_compare_versions_same(self, mock_log, requests_mock):
+        get_mock = requests_mock.get
         get_mock.return_value.json.return_value = {"info": {"version": "1.9.0"}}
         fetch_and_compare_versions()
 
@@ -91,10 +94,11 @@ class TestVersionChecker(TestCase):
             ]
         )
 
-    @patch("samcli.lib.utils.version_checker.get")
+    @patch("samcli.lib.utils.version_checker.requests")
     @patch("samcli.lib.utils.version_checker.click")
     @patch("samcli.lib.utils.version_checker.installed_version", "1.9.0")
-    def test_fetch_and_compare_versions_different(self, mock_click, get_mock):
+    def test_fetch_and_compare_versions_different(self, mock_click, requests_mock):
+        get_mock = requests_mock.get
         get_mock.return_value.json.return_value = {"info": {"version": "1.10.0"}}
         fetch_and_compare_versions()
 
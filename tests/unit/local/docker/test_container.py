@@ -10,10 +10,11 @@ from parameterized import parameterized
 
 import docker
 from docker.errors import NotFound, APIError
+import requests
 from requests import RequestException
 
 from samcli.lib.utils.packagetype import IMAGE
-from samcli.lib.utils.stream_writer import StreamWriter
+from samcli.lib.utils.stream_writer import ChunkedStreamWriter, StreamWriter
 from samcli.local.docker.container import (
     Container,
     ContainerResponseException,
@@ -613,7 +614,7 @@ class TestContainer_wait_for_result(TestCase):
         response = Mock()
         response.content = rie_response
         response.headers = resp_headers
-        mock_requests.post.return_value = response
+        mock_requests.Session.return_value.post.return_value = response
 
         patched_socket.return_value = self.socket_mock
 
@@ -634,7 +635,7 @@ class TestContainer_wait_for_result(TestCase):
         host = self.container._container_host
         port = self.container.rapid_port_host
         self.socket_mock.connect_ex.assert_called_with((host, port))
-        mock_requests.post.assert_called_with(
+        mock_requests.Session.return_value.post.assert_called_with(
             self.container.URL.format(host=host, port=port, function_name="function"),
             data=b"{}",
             timeout=(self.container.RAPID_CONNECTION_TIMEOUT, None),
@@ -674,7 +675,7 @@ class TestContainer_wait_for_result(TestCase):
         response = Mock()
         response.content = rie_response
         response.headers = resp_headers
-        mock_requests.post.return_value = response
+        mock_requests.Session.return_value.post.return_value = response
 
         patched_socket.return_value = self.socket_mock
 
@@ -695,7 +696,7 @@ class TestContainer_wait_for_result(TestCase):
         host = self.container._container_host
         port = self.container.rapid_port_host
         self.socket_mock.connect_ex.assert_called_with((host, port))
-        mock_requests.post.assert_called_with(
+        mock_requests.Session.return_value.post.assert_called_with(
             self.container.URL.format(host=host, port=port, function_name="function"),
             data=b"{}",
             timeout=(self.container.RAPID_CONNECTION_TIMEOUT, None),
@@ -721,7 +722,11 @@ class TestContainer_wait_for_result(TestCase):
         stdout_mock = Mock()
         stderr_mock = Mock()
         self.container.rapid_port_host = "7077"
-        mock_requests.post.side_effect = [RequestException(), RequestException(), RequestException()]
+        mock_requests.Session.return_value.post.side_effect = [
+            RequestException(),
+            RequestException(),
+            RequestException(),
+        ]
 
         patched_socket.return_value = self.socket_mock
 
@@ -730,8 +735,8 @@ class TestContainer_wait_for_result(TestCase):
                 event=self.event, full_path=self.name, stdout=stdout_mock, stderr=stderr_mock
             )
 
-        self.assertEqual(mock_requests.post.call_count, 3)
-        calls = mock_requests.post.call_args_list
+        self.assertEqual(mock_requests.Session.return_value.post.call_count, 3)
+        calls = mock_requests.Session.return_value.post.call_args_list
         self.assertEqual(
             calls,
             [
@@ -770,7 +775,7 @@ class TestContainer_wait_for_result(TestCase):
 
         stdout_mock = Mock()
         stderr_mock = Mock()
-        mock_requests.post.side_effect = ContainerResponseException()
+        mock_requests.Session.return_value.post.side_effect = ContainerResponseException()
 
         patched_socket.return_value = self.socket_mock
 
@@ -786,7 +791,7 @@ class TestContainer_wait_for_result(TestCase):
     @patch("time.sleep")
     def test_wait_for_result_waits_for_socket_before_post_request(self, patched_time, mock_requests, patched_socket):
         self.container.is_created.return_value = True
-        mock_requests.post = Mock(return_value=None)
+        mock_requests.Session.return_value.post = Mock(return_value=None)
         real_container_mock = Mock()
         self.mock_docker_client.containers.get.return_value = real_container_mock
 
@@ -806,7 +811,142 @@ class TestContainer_wait_for_result(TestCase):
                 event=self.event, full_path=self.name, stdout=stdout_mock, stderr=stderr_mock
             )
 
-        self.assertEqual(mock_requests.post.call_count, 0)
+        self.assertEqual(mock_requests.Session.return_value.post.call_count, 0)
+
+    @patch("socket.socket")
+    @patch("samcli.local.docker.container.requests")
+    def test_wait_for_result_reuses_connection_between_invokes(self, mock_requests, patched_socket):
+        self.container.is_created.return_value = True
+        self.container._write_container_output = Mock()
+        self.container._create_threading_event = Mock()
+        response = Mock()
+        response.content = b'{"hello":"world"}'
+        response.headers = {}
+        mock_requests.Session.return_value.post.return_value = response
+        patched_socket.return_value = self.socket_mock
+
+        for _ in range(3):
+            self.container.wait_for_result(event=self.event, full_path=self.name, stdout=Mock(), stderr=Mock())
+
+        # the readiness of the runtime interface emulator is only checked once
+        self.socket_mock.connect_ex.assert_called_once()
+        mock_requests.Session.assert_called_once_with()
+        mock_requests.Session.return_value.mount.assert_called_once_with(
+            "http://", mock_requests.adapters.HTTPAdapter.return_value
+        )
+        mock_requests.adapters.HTTPAdapter.assert_called_once_with(pool_connections=1, pool_maxsize=1)
+        self.assertEqual(mock_requests.Session.return_value.post.call_count, 3)
+
+    @patch("socket.socket")
+    @patch("samcli.local.docker.container.requests")
+    def test_wait_for_result_streams_response_to_chunked_writer(self, mock_requests, patched_socket):
+        self.container.is_created.return_value = True
+        self.container._write_container_output = Mock()
+        self.container._create_threading_event = Mock()
+        response = MagicMock()
+        response.__enter__.return_value = response
+        response.iter_content.return_value = iter([b"first", b"second"])
+        mock_requests.Session.return_value.post.return_value = response
+        patched_socket.return_value = self.socket_mock
+
+        stdout = Mock(spec=ChunkedStreamWriter)
+        self.container.wait_for_result(event=self.event, full_path=self.name, stdout=stdout, stderr=Mock())
+
+        host = self.container._container_host
+        port = self.container.rapid_port_host
+        mock_requests.Session.return_value.post.assert_called_with(
+            self.container.URL.format(host=host, port=port, function_name="function"),
+            data=b"{}",
+            timeout=(self.container.RAPID_CONNECTION_TIMEOUT, None),
+            stream=True,
+        )
+        stdout.write_bytes.assert_has_calls([call(b"first"), call(b"second")])
+        stdout.write_str.assert_not_called()
+        response.__exit__.assert_called_once()
+
+    @patch("socket.socket")
+    @patch("samcli.local.docker.container.requests")
+    @patch("time.sleep")
+    def test_wait_for_result_retries_streamed_invocation_before_response(
+        self, patched_sleep, mock_requests, patched_socket
+    ):
+        self.container.is_created.return_value = True
+        self.container._write_container_output = Mock()
+        self.container._create_threading_event = Mock()
+        response = MagicMock()
+        response.__enter__.return_value = response
+        response.iter_content.return_value = iter([b"response"])
+        mock_requests.Session.return_value.post.side_effect = [requests.exceptions.ConnectionError(), response]
+        patched_socket.return_value = self.socket_mock
+
+        stdout = Mock(spec=ChunkedStreamWriter)
+        self.container.wait_for_result(event=self.event, full_path=self.name, stdout=stdout, stderr=Mock())
+
+        self.assertEqual(mock_requests.Session.return_value.post.call_count, 2)
+        stdout.write_bytes.assert_called_once_with(b"response")
+
+    @patch("socket.socket")
+    @patch("samcli.local.docker.container.requests")
+    @patch("time.sleep")
+    def test_wait_for_result_streamed_invocation_errors(self, patched_sleep, mock_requests, patched_socket):
+        self.container.is_created.return_value = True
+        self.container._write_container_output = Mock()
+        self.container._create_threading_event = Mock()
+        patched_socket.return_value = self.socket_mock
+        response = MagicMock()
+        response.__enter__.return_value = response
+
+        def broken_stream(chunk_size):
+            yield b"first"
+            raise requests.exceptions.ChunkedEncodingError("connection reset")
+
+        response.iter_content.side_effect = broken_stream
+
+        for post_side_effect in (requests.exceptions.ConnectionError(), [response]):
+            mock_requests.Session.return_value.post.side_effect = post_side_effect
+            stdout = Mock(spec=ChunkedStreamWriter)
+            with self.assertRaises(ContainerResponseException):
+                self.container.wait_for_result(event=self.event, full_path=self.name, stdout=stdout, stderr=Mock())
+
+    @patch("socket.socket")
+    @patch("samcli.local.docker.container.requests")
+    def test_wait_for_result_waits_again_after_container_is_stopped(self, mock_requests, patched_socket):
+        self.container.is_created.return_value = True
+        self.container._write_container_output = Mock()
+        self.container._create_threading_event = Mock()
+        response = Mock()
+        response.content = b"{}"
+        response.headers = {}
+        mock_requests.Session.return_value.post.return_value = response
+        patched_socket.return_value = self.socket_mock
+
+        self.container.wait_for_result(event=self.event, full_path=self.name, stdout=Mock(), stderr=Mock())
+        self.container.stop()
+        self.container.wait_for_result(event=self.event, full_path=self.name, stdout=Mock(), stderr=Mock())
+
+        self.assertEqual(self.socket_mock.connect_ex.call_count, 2)
+        mock_requests.Session.return_value.close.assert_called_once_with()
+        self.assertEqual(mock_requests.Session.call_count, 2)
+
+    @patch("socket.socket")
+    @patch("samcli.local.docker.container.requests")
+    def test_wait_for_result_waits_again_after_container_is_restarted(self, mock_requests, patched_socket):
+        self.container.is_created.return_value = True
+        self.container._write_container_output = Mock()
+        self.container._create_threading_event = Mock()
+        response = Mock()
+        response.content = b"{}"
+        response.headers = {}
+        mock_requests.Session.return_value.post.return_value = response
+        patched_socket.return_value = self.socket_mock
+
+        for _ in range(2):
+            self.container.start()
+            self.container.wait_for_result(event=self.event, full_path=self.name, stdout=Mock(), stderr=Mock())
+
+        self.assertEqual(self.socket_mock.connect_ex.call_count, 2)
+        mock_requests.Session.return_value.close.assert_called_once_with()
+        self.assertEqual(mock_requests.Session.call_count, 2)
 
     def test_write_container_output_successful(self):
         stdout_mock = Mock(spec=StreamWriter)
@@ -945,6 +1085,36 @@ class TestContainer_wait_for_socket_connection(TestCase):
 
         self.container._wait_for_socket_connection()
 
+    @patch("samcli.local.docker.container.time.sleep")
+    @patch("socket.socket")
+    def test_retries_with_exponential_backoff(self, patched_socket, patched_sleep):
+        socket_mock = Mock()
+        socket_mock.connect_ex.side_effect = [22] * 10 + [0]
+        patched_socket.return_value = socket_mock
+
+        with patch("samcli.local.docker.container.LOG") as log_mock:
+            self.container._wait_for_socket_connection()
+
+        self.assertEqual(
+            [sleep_call.args[0] for sleep_call in patched_sleep.call_args_list],
+            [0.0005, 0.001, 0.002, 0.004, 0.008, 0.016, 0.032, 0.064, 0.1, 0.1],
+        )
+        self.assertEqual(log_mock.debug.call_args.args[-1], 11)
+
+    @patch("samcli.local.docker.container.CONTAINER_CONNECTION_TIMEOUT", 0.05)
+    @patch("samcli.local.docker.container.time")
+    @patch("socket.socket")
+    def test_does_not_sleep_past_the_timeout(self, patched_socket, patched_time):
+        socket_mock = Mock()
+        socket_mock.connect_ex.side_effect = [22, 22, 0]
+        patched_socket.return_value = socket_mock
+        patched_time.monotonic.side_effect = [0, 0, 0.0498, 0.0498]
+
+        self.container._wait_for_socket_connection()
+
+        self.assertEqual(patched_time.sleep.call_count, 2)
+        self.assertAlmostEqual(patched_time.sleep.call_args.args[0], 0.0002)
+
 
 class TestContainer_image(TestCase):
     def test_must_return_image_value(self):
@@ -1,10 +1,14 @@
+import json
 from unittest import TestCase
 from unittest.mock import Mock, patch, ANY, call
 
+from botocore.eventstream import EventStreamBuffer
+
 from samcli.local.docker.exceptions import DockerContainerCreationFailedException
 from samcli.local.lambda_service import local_lambda_invoke_service
 from samcli.local.lambda_service.local_lambda_invoke_service import LocalLambdaInvokeService, FunctionNamePathConverter
 from samcli.local.lambdafn.exceptions import FunctionNotFound
+from samcli.local.services.server_config import ServerConfig, ServerEngine
 from samcli.commands.local.lib.exceptions import UnsupportedInlineCodeError
 
 
@@ -40,19 +44,28 @@ class TestLocalLambdaService(TestCase):
 
         service.create()
 
-        app_mock.add_url_rule.assert_called_once_with(
-            "/2015-03-31/functions/<function_path:function_name>/invocations",
-            endpoint="/2015-03-31/functions/<function_path:function_name>/invocations",
-            view_func=service._invoke_request_handler,
-            methods=["POST"],
-            provide_automatic_options=False,
+        app_mock.add_url_rule.assert_has_calls(
+            [
+                call(
+                    "/2015-03-31/functions/<function_path:function_name>/invocations",
+                    endpoint="/2015-03-31/functions/<function_path:function_name>/invocations",
+                    view_func=service._invoke_request_handler,
+                    methods=["POST"],
+                    provide_automatic_options=False,
+                ),
+                call(
+                    "/2021-11-15/functions/<function_path:function_name>/response-streaming-invocations",
+                    endpoint="/2021-11-15/functions/<function_path:function_name>/response-streaming-invocations",
+                    view_func=service._invoke_with_response_stream_request_handler,
+                    methods=["POST"],
+                    provide_automatic_options=False,
+                ),
+            ]
         )
         self.assertEqual({"function_path": FunctionNamePathConverter}, app_mock.url_map.converters)
 
     @patch("samcli.local.lambda_service.local_lambda_invoke_service.LocalLambdaInvokeService.service_response")
-    @patch("samcli.local.lambda_service.local_lambda_invoke_service.LambdaOutputParser")
-    def test_invoke_request_handler(self, lambda_output_parser_mock, service_response_mock):
-        lambda_output_parser_mock.get_lambda_output.return_value = "hello world", False
+    def test_invoke_request_handler(self, service_response_mock):
         service_response_mock.return_value = "request response"
 
         request_mock = Mock()
@@ -61,6 +74,7 @@ class TestLocalLambdaService(TestCase):
         local_lambda_invoke_service.request = request_mock
 
         lambda_runner_mock = Mock()
+        lambda_runner_mock.invoke.side_effect = _write_output(b"hello ", b"world")
         service = LocalLambdaInvokeService(lambda_runner=lambda_runner_mock, port=3000, host="localhost")
 
         response = service._invoke_request_handler(function_name="HelloWorld")
@@ -68,7 +82,7 @@ class TestLocalLambdaService(TestCase):
         self.assertEqual(response, "request response")
 
         lambda_runner_mock.invoke.assert_called_once_with("HelloWorld", "{}", stdout=ANY, stderr=None)
-        service_response_mock.assert_called_once_with("hello world", {"Content-Type": "application/json"}, 200)
+        service_response_mock.assert_called_once_with(b"hello world", {"Content-Type": "application/json"}, 200)
 
     @patch("samcli.local.lambda_service.local_lambda_invoke_service.LambdaErrorResponses")
     def test_invoke_request_handler_on_incorrect_path(self, lambda_error_responses_mock):
@@ -144,13 +158,12 @@ class TestLocalLambdaService(TestCase):
         request_mock.get_data.return_value = b"{}"
         local_lambda_invoke_service.request = request_mock
 
-        lambda_response = "response"
-        is_customer_error = False
-        lambda_output_parser_mock.get_lambda_output.return_value = lambda_response, is_customer_error
+        lambda_output_parser_mock.is_lambda_error_response.return_value = False
 
         service_response_mock.return_value = "request response"
 
         lambda_runner_mock = Mock()
+        lambda_runner_mock.invoke.side_effect = _write_output(b"response")
         stderr_mock = Mock()
         service = LocalLambdaInvokeService(
             lambda_runner=lambda_runner_mock, port=3000, host="localhost", stderr=stderr_mock
@@ -159,7 +172,8 @@ class TestLocalLambdaService(TestCase):
         result = service._invoke_request_handler(function_name="HelloWorld")
 
         self.assertEqual(result, "request response")
-        lambda_output_parser_mock.get_lambda_output.assert_called_with(ANY, ANY)
+        lambda_output_parser_mock.is_lambda_error_response.assert_called_with(b"response")
+        service_response_mock.assert_called_once_with(b"response", {"Content-Type": "application/json"}, 200)
 
     @patch("samcli.local.lambda_service.local_lambda_invoke_service.LambdaErrorResponses")
     def test_construct_error_handling(self, lambda_error_response_mock):
@@ -178,15 +192,15 @@ class TestLocalLambdaService(TestCase):
         )
 
     @patch("samcli.local.lambda_service.local_lambda_invoke_service.LocalLambdaInvokeService.service_response")
-    @patch("samcli.local.lambda_service.local_lambda_invoke_service.LambdaOutputParser")
-    def test_invoke_request_handler_with_lambda_that_errors(self, lambda_output_parser_mock, service_response_mock):
-        lambda_output_parser_mock.get_lambda_output.return_value = "hello world", True
+    def test_invoke_request_handler_with_lambda_that_errors(self, service_response_mock):
         service_response_mock.return_value = "request response"
         request_mock = Mock()
         request_mock.get_data.return_value = b"{}"
         local_lambda_invoke_service.request = request_mock
 
+        error = b'{"errorMessage": "hello world", "errorType": "Exception"}'
         lambda_runner_mock = Mock()
+        lambda_runner_mock.invoke.side_effect = _write_output(error)
         service = LocalLambdaInvokeService(lambda_runner=lambda_runner_mock, port=3000, host="localhost")
 
         response = service._invoke_request_handler(function_name="HelloWorld")
@@ -195,13 +209,11 @@ class TestLocalLambdaService(TestCase):
 
         lambda_runner_mock.invoke.assert_called_once_with("HelloWorld", "{}", stdout=ANY, stderr=None)
         service_response_mock.assert_called_once_with(
-            "hello world", {"Content-Type": "application/json", "x-amz-function-error": "Unhandled"}, 200
+            error.decode(), {"Content-Type": "application/json", "x-amz-function-error": "Unhandled"}, 200
         )
 
     @patch("samcli.local.lambda_service.local_lambda_invoke_service.LocalLambdaInvokeService.service_response")
-    @patch("samcli.local.lambda_service.local_lambda_invoke_service.LambdaOutputParser")
-    def test_invoke_request_handler_with_no_data(self, lambda_output_parser_mock, service_response_mock):
-        lambda_output_parser_mock.get_lambda_output.return_value = "hello world", False
+    def test_invoke_request_handler_with_no_data(self, service_response_mock):
         service_response_mock.return_value = "request response"
 
         request_mock = Mock()
@@ -209,6 +221,7 @@ class TestLocalLambdaService(TestCase):
         local_lambda_invoke_service.request = request_mock
 
         lambda_runner_mock = Mock()
+        lambda_runner_mock.invoke.side_effect = _write_output(b"hello world")
         service = LocalLambdaInvokeService(lambda_runner=lambda_runner_mock, port=3000, host="localhost")
 
         response = service._invoke_request_handler(function_name="HelloWorld")
@@ -216,7 +229,161 @@ class TestLocalLambdaService(TestCase):
         self.assertEqual(response, "request response")
 
         lambda_runner_mock.invoke.assert_called_once_with("HelloWorld", "{}", stdout=ANY, stderr=None)
-        service_response_mock.assert_called_once_with("hello world", {"Content-Type": "application/json"}, 200)
+        service_response_mock.assert_called_once_with(b"hello world", {"Content-Type": "application/json"}, 200)
+
+    @patch("samcli.local.lambda_service.local_lambda_invoke_service.RESPONSE_BUFFER_THRESHOLD", 4)
+    def test_invoke_request_handler_streams_large_responses(self):
+        request_mock = Mock()
+        request_mock.get_data.return_value = b"{}"
+        local_lambda_invoke_service.request = request_mock
+
+        lambda_runner_mock = Mock()
+        lambda_runner_mock.invoke.side_effect = _write_output(b'{"data"', b': "', b"x" * 10, b'"}')
+        service = LocalLambdaInvokeService(lambda_runner=lambda_runner_mock, port=3000, host="localhost")
+
+        response = service._invoke_request_handler(function_name="HelloWorld")
+
+        self.assertTrue(response.is_streamed)
+        self.assertEqual(response.headers["Content-Type"], "application/json")
+        self.assertEqual(b"".join(response.response), b'{"data": "xxxxxxxxxx"}')
+
+    @patch("samcli.local.lambda_service.local_lambda_invoke_service.RESPONSE_BUFFER_THRESHOLD", 4)
+    def test_invoke_request_handler_keeps_error_header_of_large_errors(self):
+        request_mock = Mock()
+        request_mock.get_data.return_value = b"{}"
+        local_lambda_invoke_service.request = request_mock
+
+        lambda_runner_mock = Mock()
+        lambda_runner_mock.invoke.side_effect = _write_output(
+            b'{"errorMessage":', b' "' + b"x" * 10 + b'",', b' "errorType": "Exception"}'
+        )
+        service = LocalLambdaInvokeService(lambda_runner=lambda_runner_mock, port=3000, host="localhost")
+
+        response = service._invoke_request_handler(function_name="HelloWorld")
+
+        self.assertFalse(response.is_streamed)
+        self.assertEqual(response.headers["x-amz-function-error"], "Unhandled")
+        self.assertEqual(json.loads(response.get_data()), {"errorMessage": "x" * 10, "errorType": "Exception"})
+
+    def test_invoke_request_handler_normalizes_json_responses(self):
+        request_mock = Mock()
+        request_mock.get_data.return_value = b"{}"
+        local_lambda_invoke_service.request = request_mock
+
+        lambda_runner_mock = Mock()
+        lambda_runner_mock.invoke.side_effect = _write_output(b'{"name":"caf\\u00e9"}')
+        service = LocalLambdaInvokeService(lambda_runner=lambda_runner_mock, port=3000, host="localhost")
+
+        response = service._invoke_request_handler(function_name="HelloWorld")
+
+        self.assertEqual(response.get_data(as_text=True), '{"name": "caf\u00e9"}')
+
+    @patch("samcli.local.lambda_service.local_lambda_invoke_service.threading.Thread")
+    def test_invoke_request_handler_bounds_concurrent_invocations(self, thread_mock):
+        request_mock = Mock()
+        request_mock.get_data.return_value = b"{}"
+        local_lambda_invoke_service.request = request_mock
+        service = LocalLambdaInvokeService(
+            lambda_runner=Mock(),
+            port=3000,
+            host="localhost",
+            server_config=ServerConfig(engine=ServerEngine.POOLED, threads=2),
+        )
+
+        invocations = [
+            local_lambda_invoke_service._BackgroundInvocation(
+                Mock(), "HelloWorld", "{}", None, service._invocation_slots
+            )
+            for _ in range(2)
+        ]
+
+        # the threads were not started, so no slot is left until one of the invocations completes
+        self.assertFalse(service._invocation_slots.acquire(blocking=False))
+        invocations[0]._invoke(Mock(), "HelloWorld", "{}", None, service._invocation_slots)
+        self.assertTrue(service._invocation_slots.acquire(blocking=False))
+        self.assertEqual(thread_mock.return_value.start.call_count, 2)
+
+    @patch("samcli.local.lambda_service.local_lambda_invoke_service.threading.Thread")
+    def test_invoke_request_handler_does_not_bound_invocations_of_dev_server(self, thread_mock):
+        service = LocalLambdaInvokeService(
+            lambda_runner=Mock(), port=3000, host="localhost", server_config=ServerConfig(threads=2)
+        )
+
+        for _ in range(4):
+            local_lambda_invoke_service._BackgroundInvocation(
+                Mock(), "HelloWorld", "{}", None, service._invocation_slots
+            )
+
+        self.assertIsNone(service._invocation_slots)
+        self.assertEqual(thread_mock.return_value.start.call_count, 4)
+
+    def test_invoke_with_response_stream_request_handler(self):
+        request_mock = Mock()
+        request_mock.get_data.return_value = b"{}"
+        local_lambda_invoke_service.request = request_mock
+
+        lambda_runner_mock = Mock()
+        lambda_runner_mock.invoke.side_effect = _write_output(b"hello ", b"world")
+        service = LocalLambdaInvokeService(lambda_runner=lambda_runner_mock, port=3000, host="localhost")
+
+        response = service._invoke_with_response_stream_request_handler(function_name="HelloWorld")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["Content-Type"], "application/vnd.amazon.eventstream")
+        events = _decode_events(b"".join(response.response))
+        self.assertEqual(
+            events,
+            [("PayloadChunk", b"hello "), ("PayloadChunk", b"world"), ("InvokeComplete", b"{}")],
+        )
+
+    def test_invoke_with_response_stream_reports_error_raised_while_streaming(self):
+        request_mock = Mock()
+        request_mock.get_data.return_value = b"{}"
+        local_lambda_invoke_service.request = request_mock
+
+        def invoke(function_name, event, stdout, stderr):
+            stdout.write_bytes(b"partial")
+            raise ValueError("connection reset")
+
+        lambda_runner_mock = Mock()
+        lambda_runner_mock.invoke.side_effect = invoke
+        service = LocalLambdaInvokeService(lambda_runner=lambda_runner_mock, port=3000, host="localhost")
+
+        response = service._invoke_with_response_stream_request_handler(function_name="HelloWorld")
+
+        events = _decode_events(b"".join(response.response))
+        self.assertEqual(events[0], ("PayloadChunk", b"partial"))
+        self.assertEqual(events[1][0], "InvokeComplete")
+        self.assertEqual(json.loads(events[1][1]), {"ErrorCode": "Unhandled", "ErrorDetails": "connection reset"})
+
+    @patch("samcli.local.lambda_service.local_lambda_invoke_service.LambdaErrorResponses")
+    def test_invoke_with_response_stream_on_incorrect_path(self, lambda_error_responses_mock):
+        request_mock = Mock()
+        request_mock.get_data.return_value = b"{}"
+        local_lambda_invoke_service.request = request_mock
+
+        lambda_runner_mock = Mock()
+        lambda_runner_mock.invoke.side_effect = FunctionNotFound
+        lambda_error_responses_mock.resource_not_found.return_value = "Couldn't find Lambda"
+        service = LocalLambdaInvokeService(lambda_runner=lambda_runner_mock, port=3000, host="localhost")
+
+        response = service._invoke_with_response_stream_request_handler(function_name="NotFound")
+
+        self.assertEqual(response, "Couldn't find Lambda")
+
+
+def _write_output(*chunks):
+    def invoke(function_name, event, stdout, stderr):
+        for chunk in chunks:
+            stdout.write_bytes(chunk)
+
+    return invoke
+
+
+def _decode_events(data):
+    event_buffer = EventStreamBuffer()
+    event_buffer.add_data(data)
+    return [(message.headers[":event-type"], message.payload) for message in event_buffer]
 
 
 class TestValidateRequestHandling(TestCase):
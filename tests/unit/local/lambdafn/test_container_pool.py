@@ -0,0 +1,114 @@
+"""
+Unit tests for the warm container pool
+"""
+
+from unittest import TestCase
+from unittest.mock import Mock
+
+from samcli.local.lambdafn.container_pool import WarmContainerPool
+
+
+class TestWarmContainerPool(TestCase):
+    def setUp(self):
+        self.now = 100.0
+        self.pool = WarmContainerPool(max_size=2, idle_ttl=10, clock=lambda: self.now)
+
+    def test_must_not_accept_empty_pool(self):
+        with self.assertRaises(ValueError):
+            WarmContainerPool(max_size=0)
+
+    def test_must_reserve_slot_when_pool_is_empty(self):
+        self.assertIsNone(self.pool.checkout())
+        self.assertEqual(len(self.pool), 0)
+
+    def test_must_prefer_idle_container(self):
+        container = Mock()
+        self.pool.checkout()
+        self.pool.add(container)
+        self.pool.release(container)
+
+        self.assertEqual(self.pool.checkout(), container)
+
+    def test_must_reserve_new_slot_when_all_containers_are_busy(self):
+        container = Mock()
+        self.pool.checkout()
+        self.pool.add(container)
+
+        self.assertIsNone(self.pool.checkout())
+
+    def test_must_dispatch_to_least_busy_container_when_pool_is_full(self):
+        container1 = Mock()
+        container2 = Mock()
+        self.pool.checkout()
+        self.pool.add(container1)
+        self.pool.checkout()
+        self.pool.add(container2)
+
+        self.assertEqual(self.pool.checkout(), container1)
+        self.assertEqual(self.pool.checkout(), container2)
+        self.pool.release(container2)
+        self.pool.release(container2)
+        self.assertEqual(self.pool.checkout(), container2)
+
+    def test_cancel_reservation_must_free_the_slot(self):
+        container = Mock()
+        self.pool.checkout()
+        self.pool.add(container)
+        self.assertIsNone(self.pool.checkout())
+        self.pool.cancel_reservation()
+
+        self.assertIsNone(self.pool.checkout())
+
+    def test_must_evict_idle_containers_but_keep_the_most_recent_one(self):
+        container1 = Mock()
+        container2 = Mock()
+        self.pool.checkout()
+        self.pool.add(container1)
+        self.pool.checkout()
+        self.pool.add(container2)
+        self.pool.release(container1)
+        self.now = 105.0
+        self.pool.release(container2)
+
+        self.now = 112.0
+        self.assertEqual(self.pool.evict_idle(), [container1])
+        self.now = 200.0
+        self.assertEqual(self.pool.evict_idle(), [])
+        self.assertEqual(self.pool.containers, [container2])
+
+    def test_must_not_evict_busy_containers(self):
+        container1 = Mock()
+        container2 = Mock()
+        self.pool.checkout()
+        self.pool.add(container1)
+        self.pool.checkout()
+        self.pool.add(container2)
+
+        self.now = 200.0
+        self.assertEqual(self.pool.evict_idle(), [])
+        self.assertEqual(self.pool.containers, [container1, container2])
+
+    def test_must_not_evict_without_ttl(self):
+        pool = WarmContainerPool(max_size=2)
+        for container in (Mock(), Mock()):
+            pool.checkout()
+            pool.add(container)
+            pool.release(container)
+
+        self.assertEqual(pool.evict_idle(), [])
+
+    def test_drain_must_remove_all_containers(self):
+        container = Mock()
+        self.pool.checkout()
+        self.pool.add(container)
+
+        self.assertEqual(self.pool.drain(), [container])
+        self.assertEqual(self.pool.containers, [])
+
+    def test_remove_must_drop_the_container(self):
+        container = Mock()
+        self.pool.checkout()
+        self.pool.add(container)
+        self.pool.remove(container)
+
+        self.assertEqual(self.pool.containers, [])
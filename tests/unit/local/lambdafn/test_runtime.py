@@ -8,9 +8,20 @@ from parameterized import parameterized
 
 from samcli.lib.utils.packagetype import ZIP, IMAGE
 from samcli.lib.providers.provider import LayerVersion
+from samcli.local.docker.exceptions import DockerContainerCreationFailedException
 from samcli.local.lambdafn.env_vars import EnvironmentVariables
 from samcli.local.lambdafn.runtime import LambdaRuntime, _unzip_file, WarmLambdaRuntime, _require_container_reloading
 from samcli.local.lambdafn.config import FunctionConfig
+from samcli.local.lambdafn.container_pool import WarmContainerPool
+
+
+def _pool_of(*containers):
+    pool = WarmContainerPool(max_size=len(containers))
+    for container in containers:
+        pool.checkout()
+        pool.add(container)
+        pool.release(container)
+    return pool
 
 
 class LambdaRuntime_create(TestCase):
@@ -816,7 +827,7 @@ class TestWarmLambdaRuntime_create(TestCase):
 
         self.manager_mock.create.assert_called_with(container)
         # validate that the created container got cached
-        self.assertEqual(self.runtime._containers[self.full_path], container)
+        self.assertEqual(self.runtime._containers[self.full_path].containers, [container])
         lambda_function_observer_mock.watch.assert_called_with(self.func_config)
         lambda_function_observer_mock.start.assert_called_with()
 
@@ -884,7 +895,7 @@ class TestWarmLambdaRuntime_create(TestCase):
         self.manager_mock.create.assert_has_calls([call(container), call(container2)])
         self.manager_mock.stop.assert_called_with(container)
         # validate that the created container got cached
-        self.assertEqual(self.runtime._containers[self.full_path], container2)
+        self.assertEqual(self.runtime._containers[self.full_path].containers, [container2])
         self.assertEqual(result, container2)
 
     @patch("samcli.local.lambdafn.runtime.LambdaFunctionObserver")
@@ -952,7 +963,100 @@ class TestWarmLambdaRuntime_create(TestCase):
         )
         self.manager_mock.create.assert_called_with(container)
         # validate that the created container got cached
-        self.assertEqual(self.runtime._containers[self.full_path], container)
+        self.assertEqual(self.runtime._containers[self.full_path].containers, [container])
+
+    @patch("samcli.local.lambdafn.runtime.LambdaFunctionObserver")
+    @patch("samcli.local.lambdafn.runtime.LambdaContainer")
+    def test_must_create_new_container_when_pooled_containers_are_busy(
+        self, LambdaContainerMock, LambdaFunctionObserverMock
+    ):
+        container1 = Mock()
+        container2 = Mock()
+        LambdaContainerMock.side_effect = [container1, container2]
+
+        self.runtime = WarmLambdaRuntime(self.manager_mock, Mock(), pool_size=2)
+        self.runtime._get_code_dir = MagicMock(return_value="some code dir")
+
+        first = self.runtime.create(self.func_config)
+        second = self.runtime.create(self.func_config)
+        # the pool is full, so the next invocation goes to the least busy container
+        self.runtime._on_invoke_done(second)
+        third = self.runtime.create(self.func_config)
+
+        self.assertEqual(first, container1)
+        self.assertEqual(second, container2)
+        self.assertEqual(third, container2)
+        self.manager_mock.create.assert_has_calls([call(container1), call(container2)])
+        self.assertEqual(self.manager_mock.create.call_count, 2)
+        self.assertEqual(self.runtime._containers[self.full_path].containers, [container1, container2])
+        # the function should be observed only once whatever the number of its containers
+        LambdaFunctionObserverMock.return_value.watch.assert_called_once_with(self.func_config)
+
+    @patch("samcli.local.lambdafn.runtime.LambdaFunctionObserver")
+    @patch("samcli.local.lambdafn.runtime.LambdaContainer")
+    def test_must_reuse_released_container(self, LambdaContainerMock, LambdaFunctionObserverMock):
+        container = Mock()
+        LambdaContainerMock.return_value = container
+
+        self.runtime = WarmLambdaRuntime(self.manager_mock, Mock(), pool_size=3)
+        self.runtime._get_code_dir = MagicMock(return_value="some code dir")
+
+        self.runtime._on_invoke_done(self.runtime.create(self.func_config))
+        result = self.runtime.create(self.func_config)
+
+        self.manager_mock.create.assert_called_once_with(container)
+        self.assertEqual(result, container)
+
+    @patch("samcli.local.lambdafn.runtime.LambdaFunctionObserver")
+    @patch("samcli.local.lambdafn.runtime.LambdaContainer")
+    def test_must_keep_single_container_for_debugged_function(self, LambdaContainerMock, LambdaFunctionObserverMock):
+        container = Mock()
+        LambdaContainerMock.return_value = container
+        debug_options = Mock()
+        debug_options.debug_function = self.name
+
+        self.runtime = WarmLambdaRuntime(self.manager_mock, Mock(), pool_size=3)
+        self.runtime._get_code_dir = MagicMock(return_value="some code dir")
+
+        self.runtime.create(self.func_config, debug_context=debug_options)
+        result = self.runtime.create(self.func_config, debug_context=debug_options)
+
+        self.manager_mock.create.assert_called_once_with(container)
+        self.assertEqual(result, container)
+
+    @patch("samcli.local.lambdafn.runtime.LambdaFunctionObserver")
+    @patch("samcli.local.lambdafn.runtime.LambdaContainer")
+    def test_must_release_slot_if_container_creation_failed(self, LambdaContainerMock, LambdaFunctionObserverMock):
+        container = Mock()
+        LambdaContainerMock.return_value = container
+        self.manager_mock.create.side_effect = [DockerContainerCreationFailedException("failed"), None]
+
+        self.runtime = WarmLambdaRuntime(self.manager_mock, Mock(), pool_size=1)
+        self.runtime._get_code_dir = MagicMock(return_value="some code dir")
+
+        with self.assertRaises(DockerContainerCreationFailedException):
+            self.runtime.create(self.func_config)
+        result = self.runtime.create(self.func_config)
+
+        self.assertEqual(result, container)
+        self.assertEqual(self.runtime._containers[self.full_path].containers, [container])
+
+    @patch("samcli.local.lambdafn.runtime.LambdaFunctionObserver")
+    @patch("samcli.local.lambdafn.runtime.LambdaContainer")
+    def test_run_must_give_container_back_to_pool(self, LambdaContainerMock, LambdaFunctionObserverMock):
+        container = Mock()
+        container.is_running.return_value = False
+        LambdaContainerMock.return_value = container
+
+        self.runtime = WarmLambdaRuntime(self.manager_mock, Mock(), pool_size=2)
+        self.runtime._get_code_dir = MagicMock(return_value="some code dir")
+
+        self.runtime.run(None, self.func_config, None)
+        result = self.runtime.create(self.func_config)
+
+        self.manager_mock.run.assert_called_once_with(container)
+        self.manager_mock.create.assert_called_once_with(container)
+        self.assertEqual(result, container)
 
 
 class TestWarmLambdaRuntime_get_code_dir(TestCase):
@@ -998,8 +1102,8 @@ class TestWarmLambdaRuntime_clean_warm_containers_related_resources(TestCase):
         self.func1_container_mock = Mock()
         self.func2_container_mock = Mock()
         self.runtime._containers = {
-            "func_name1": self.func1_container_mock,
-            "func_name2": self.func2_container_mock,
+            "func_name1": _pool_of(self.func1_container_mock),
+            "func_name2": _pool_of(self.func2_container_mock),
         }
         self.runtime._temp_uncompressed_paths_to_be_cleaned = ["path1", "path2"]
         self.runtime._lock = MagicMock()
@@ -1078,9 +1182,10 @@ class TestWarmLambdaRuntime_on_code_change(TestCase):
 
         self.func1_container_mock = Mock()
         self.func2_container_mock = Mock()
+        self.func2_pool = _pool_of(self.func2_container_mock)
         self.runtime._containers = {
-            self.func1_full_path: self.func1_container_mock,
-            self.func2_full_path: self.func2_container_mock,
+            self.func1_full_path: _pool_of(self.func1_container_mock),
+            self.func2_full_path: self.func2_pool,
         }
 
     def test_only_one_container_get_stopped_when_its_code_dir_got_changed(self):
@@ -1090,7 +1195,7 @@ class TestWarmLambdaRuntime_on_code_change(TestCase):
         self.assertEqual(
             self.runtime._containers,
             {
-                self.func2_full_path: self.func2_container_mock,
+                self.func2_full_path: self.func2_pool,
             },
         )
 
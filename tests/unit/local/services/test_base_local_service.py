@@ -5,6 +5,7 @@ from unittest.mock import Mock, patch, ANY
 from parameterized import parameterized, param
 
 from samcli.local.services.base_local_service import BaseLocalService, LambdaOutputParser
+from samcli.local.services.server_config import ServerConfig, ServerEngine
 
 
 class TestLocalHostRunner(TestCase):
@@ -70,6 +71,38 @@ class TestLocalHostRunner(TestCase):
 
         app_run_mock.assert_called_once_with(threaded=True, host="127.0.0.1", port=3000, ssl_context=None)
 
+    @patch("samcli.local.services.pooled_wsgi_server.PooledWSGIServer")
+    def test_run_starts_pooled_server(self, pooled_server_mock):
+        server_config = ServerConfig(engine=ServerEngine.POOLED, threads=4, backlog=64, client_timeout=2)
+        service = BaseLocalService(
+            is_debugging=False, port=3000, host="127.0.0.1", ssl_context=None, server_config=server_config
+        )
+        service._app = Mock()
+
+        service.run()
+
+        pooled_server_mock.assert_called_once_with(
+            "127.0.0.1", 3000, service._app, threads=4, backlog=64, ssl_context=None, client_timeout=2
+        )
+        pooled_server_mock.return_value.serve_forever.assert_called_once_with()
+        service._app.run.assert_not_called()
+
+    @patch("samcli.local.services.pooled_wsgi_server.PooledWSGIServer")
+    def test_run_uses_single_threaded_dev_server_when_debugging(self, pooled_server_mock):
+        service = BaseLocalService(
+            is_debugging=True,
+            port=3000,
+            host="127.0.0.1",
+            ssl_context=None,
+            server_config=ServerConfig(engine=ServerEngine.POOLED),
+        )
+        service._app = Mock()
+
+        service.run()
+
+        pooled_server_mock.assert_not_called()
+        service._app.run.assert_called_once_with(threaded=False, host="127.0.0.1", port=3000, ssl_context=None)
+
     def test_create_returns_not_implemented(self):
         is_debugging = False
         service = BaseLocalService(is_debugging=is_debugging, port=3000, host="127.0.0.1", ssl_context=None)
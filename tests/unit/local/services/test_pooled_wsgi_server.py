@@ -0,0 +1,88 @@
+import http.client
+import threading
+from unittest import TestCase
+
+from samcli.local.services.pooled_wsgi_server import PooledWSGIServer
+
+
+def _hello_app(environ, start_response):
+    body = b"hello"
+    start_response("200 OK", [("Content-Type", "text/plain"), ("Content-Length", str(len(body)))])
+    return [body]
+
+
+class TestPooledWSGIServer(TestCase):
+    def setUp(self):
+        self.server = PooledWSGIServer("127.0.0.1", 0, _hello_app, threads=2, backlog=16, client_timeout=1)
+        self.server_thread = threading.Thread(target=self.server.serve_forever, kwargs={"poll_interval": 0.05})
+        self.server_thread.start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server_thread.join()
+
+    def test_must_listen_with_configured_backlog(self):
+        self.assertEqual(self.server.request_queue_size, 16)
+
+    def test_must_serve_request(self):
+        connection = http.client.HTTPConnection("127.0.0.1", self.server.port, timeout=5)
+        try:
+            connection.request("GET", "/")
+            response = connection.getresponse()
+            self.assertEqual(response.status, 200)
+            self.assertEqual(response.read(), b"hello")
+        finally:
+            connection.close()
+
+    def test_must_apply_client_timeout(self):
+        self.assertEqual(self.server.RequestHandlerClass.timeout, 1)
+
+    def test_must_serve_concurrent_clients(self):
+        results = []
+
+        def call():
+            connection = http.client.HTTPConnection("127.0.0.1", self.server.port, timeout=5)
+            try:
+                connection.request("GET", "/", headers={"Connection": "close"})
+                results.append(connection.getresponse().read())
+            finally:
+                connection.close()
+
+        clients = [threading.Thread(target=call) for _ in range(6)]
+        for client in clients:
+            client.start()
+        for client in clients:
+            client.join()
+
+        self.assertEqual(results, [b"hello"] * 6)
+
+    def test_must_not_let_persistent_connection_hold_the_only_worker(self):
+        server = PooledWSGIServer("127.0.0.1", 0, _hello_app, threads=1, backlog=16, client_timeout=30)
+        server_thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05})
+        server_thread.start()
+        self.addCleanup(server_thread.join)
+        self.addCleanup(server.shutdown)
+
+        # both clients ask to keep their connection open, the second one is served while the first one stays idle
+        connections = [http.client.HTTPConnection("127.0.0.1", server.port, timeout=5) for _ in range(2)]
+        try:
+            for connection in connections:
+                connection.request("GET", "/")
+                response = connection.getresponse()
+                self.assertEqual(response.read(), b"hello")
+                self.assertEqual(response.version, 10)
+        finally:
+            for connection in connections:
+                connection.close()
+
+    def test_must_require_at_least_one_thread(self):
+        with self.assertRaises(ValueError):
+            PooledWSGIServer("127.0.0.1", 0, _hello_app, threads=0, backlog=16)
+
+    def test_must_close_with_its_worker_pool(self):
+        server = PooledWSGIServer("127.0.0.1", 0, _hello_app, threads=1, backlog=16)
+
+        server.server_close()
+
+        with self.assertRaises(RuntimeError):
+            server._executor.submit(lambda: None)
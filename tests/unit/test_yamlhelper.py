@@ -10,12 +10,15 @@
 # distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
+import datetime
 import json
 
+import yaml
 from botocore.compat import OrderedDict
 
-from unittest import TestCase
-from samcli.yamlhelper import yaml_parse, yaml_dump
+from unittest import TestCase, skipIf
+from unittest.mock import patch
+from samcli.yamlhelper import CfnCSafeLoader, CfnSafeLoader, yaml_parse, yaml_dump
 
 
 class TestYaml(TestCase):
@@ -183,3 +186,60 @@ class TestYaml(TestCase):
         # Raises a `TypeError` if an unquoted `AWSTemplateFormatVersion` value has been parsed to a
         # `datetime` object and not a string by `yaml_parse` when using `--use-json` argument.
         json.dumps(output)
+
+
+@skipIf(CfnCSafeLoader is None, "PyYAML is installed without the libyaml bindings")
+class TestYamlLibyamlLoader(TestCase):
+    template = """
+    AWSTemplateFormatVersion: 2010-09-09
+    Conditions:
+        IsProd: !Equals [!Ref Stage, prod]
+    x-defaults: &defaults
+        Runtime: python3.12
+        Timeout: 30
+    Resources:
+        Function:
+            Type: AWS::Serverless::Function
+            Properties:
+                <<: *defaults
+                Role: !GetAtt Role.Arn
+                Name: !Sub "${AWS::StackName}-function"
+                Stage: !If [IsProd, !Ref "AWS::NoValue", !Select [0, !Split ["-", !Ref Stage]]]
+                Description: >
+                    Folded
+                    description
+                Code: |
+                    def handler(event, context):
+                        return "é"
+                Memory: 0o17
+                Enabled: yes
+                Nothing: ~
+    """
+
+    def test_must_return_same_template_as_pure_python_loader(self):
+        expected = yaml.load(self.template, Loader=CfnSafeLoader)
+
+        output = yaml_parse(self.template)
+
+        self.assertEqual(repr(output), repr(expected))
+
+    def test_must_report_same_error_as_pure_python_loader(self):
+        invalid_template = "Resources:\n  Function: [\n"
+        with self.assertRaises(yaml.YAMLError) as expected:
+            yaml.load(invalid_template, Loader=CfnSafeLoader)
+
+        with self.assertRaises(yaml.YAMLError) as actual:
+            yaml_parse(invalid_template)
+
+        self.assertEqual(str(actual.exception), str(expected.exception))
+
+    @patch("samcli.yamlhelper.CfnCSafeLoader", None)
+    def test_must_parse_without_libyaml(self):
+        output = yaml_parse(self.template)
+
+        self.assertEqual(output["Resources"]["Function"]["Properties"]["Role"], {"Fn::GetAtt": ["Role", "Arn"]})
+
+    def test_must_not_change_default_safe_loader(self):
+        yaml_parse(self.template)
+
+        self.assertEqual(yaml.safe_load("date: 2010-09-09"), {"date": datetime.date(2010, 9, 9)})